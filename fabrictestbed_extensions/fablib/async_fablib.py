@@ -0,0 +1,643 @@
+#!/usr/bin/env python3
+# MIT License
+#
+# Copyright (c) 2020 FABRIC Testbed
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+"""
+Asyncio interface to fablib.
+
+:class:`AsyncFablibManager` and :class:`AsyncSlice` wrap a
+:class:`FablibManager` and its slices.  Orchestrator, resource and artifact
+calls and SSH operations are coroutines that run the blocking fablib calls
+on two bounded thread pools, one for API calls and one for SSH.  When a
+pool is busy, further calls wait in the event loop instead of queueing up
+threads, so one event loop can drive hundreds of slices::
+
+    async with await AsyncFablibManager.create() as fablib:
+        slices = [fablib.new_slice(name=f"exp-{i}") for i in range(100)]
+        for s in slices:
+            s.add_node(name="node1", site="RENC")
+        await asyncio.gather(*(s.submit() for s in slices))
+        results = await slices[0].execute_all("hostname")
+
+Waiting for a slice polls from the event loop, so cancelling ``submit()``,
+``wait()`` or ``wait_ssh()`` stops it promptly.  Cancelling a call that is
+already running on a pool thread returns immediately; the thread finishes
+in the background and keeps its slot in the pool until it does.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import contextvars
+import functools
+import logging
+import threading
+import time
+import weakref
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, List, Optional, Union
+
+from fabrictestbed_extensions.fablib.exceptions import SliceTimeoutError
+from fabrictestbed_extensions.fablib.fablib import FablibManager
+from fabrictestbed_extensions.fablib.node import Node
+from fabrictestbed_extensions.fablib.slice import Slice
+
+log = logging.getLogger("fablib")
+
+
+class BoundedExecutor:
+    """
+    Runs blocking functions on a thread pool from coroutines, with at most
+    ``max_workers`` calls in flight per pool.
+    """
+
+    def __init__(self, max_workers: int, thread_name_prefix: str = "fablib-async"):
+        """
+        :param max_workers: maximum number of concurrent calls
+        :type max_workers: int
+        :param thread_name_prefix: name prefix of the pool threads
+        :type thread_name_prefix: str
+        """
+        if max_workers < 1:
+            raise ValueError("max_workers must be at least 1")
+        self.max_workers = max_workers
+        self.executor = ThreadPoolExecutor(
+            max_workers=max_workers, thread_name_prefix=thread_name_prefix
+        )
+        # One semaphore per event loop; asyncio primitives are bound to a loop
+        self._semaphores = weakref.WeakKeyDictionary()
+        self._lock = threading.Lock()
+
+    def _semaphore(self, loop: asyncio.AbstractEventLoop) -> asyncio.Semaphore:
+        with self._lock:
+            semaphore = self._semaphores.get(loop)
+            if semaphore is None:
+                semaphore = asyncio.Semaphore(self.max_workers)
+                self._semaphores[loop] = semaphore
+            return semaphore
+
+    async def run(self, func: Callable, *args, **kwargs) -> Any:
+        """
+        Run a blocking function on the pool and wait for its result.
+
+        Waits for a free slot first.  A slot is released when the function
+        returns, even if the awaiting coroutine was cancelled earlier.
+
+        :param func: function to run
+        :type func: Callable
+        :return: the function's return value
+        """
+        loop = asyncio.get_running_loop()
+        semaphore = self._semaphore(loop)
+        await semaphore.acquire()
+
+        def release(_):
+            try:
+                loop.call_soon_threadsafe(semaphore.release)
+            except RuntimeError:
+                # Event loop already closed
+                pass
+
+        context = contextvars.copy_context()
+        call = functools.partial(context.run, func, *args, **kwargs)
+        try:
+            future = self.executor.submit(call)
+        except BaseException:
+            semaphore.release()
+            raise
+        future.add_done_callback(release)
+        return await asyncio.wrap_future(future, loop=loop)
+
+    def shutdown(self):
+        """
+        Stop the pool; calls not yet started are cancelled.
+        """
+        self.executor.shutdown(wait=False, cancel_futures=True)
+
+
+def _awaitable(name: str, pool: str = "api"):
+    """
+    Build a coroutine method that runs the FablibManager method ``name``.
+    """
+
+    async def method(self, *args, **kwargs):
+        func = getattr(self.get_fablib_manager(), name)
+        return await getattr(self, f"_{pool}").run(func, *args, **kwargs)
+
+    method.__name__ = name
+    method.__qualname__ = f"AsyncFablibManager.{name}"
+    method.__doc__ = (
+        f"Awaitable :py:meth:`FablibManager.{name}`; accepts the same arguments."
+    )
+    return method
+
+
+class AsyncFablibManager:
+    """
+    Asyncio interface to a :class:`FablibManager`.
+
+    Calls that reach FABRIC services or nodes are coroutines.  Other
+    attributes (configuration getters, ``new_slice`` and so on) are those
+    of the wrapped manager and are called directly.
+    """
+
+    def __init__(
+        self,
+        fablib_manager: Optional[FablibManager] = None,
+        max_workers: int = 16,
+        ssh_max_workers: int = 64,
+        **kwargs,
+    ):
+        """
+        :param fablib_manager: manager to wrap; when not given, a new
+            ``FablibManager(**kwargs)`` is created (which blocks; see
+            :py:meth:`create`)
+        :type fablib_manager: FablibManager
+        :param max_workers: maximum number of concurrent orchestrator,
+            resource and artifact calls
+        :type max_workers: int
+        :param ssh_max_workers: maximum number of concurrent SSH operations
+        :type ssh_max_workers: int
+        """
+        if fablib_manager is None:
+            fablib_manager = FablibManager(**kwargs)
+        self._fablib_manager = fablib_manager
+        self._api = BoundedExecutor(max_workers, thread_name_prefix="fablib-api")
+        self._ssh = BoundedExecutor(ssh_max_workers, thread_name_prefix="fablib-ssh")
+
+    @classmethod
+    async def create(
+        cls, max_workers: int = 16, ssh_max_workers: int = 64, **kwargs
+    ) -> AsyncFablibManager:
+        """
+        Create a :class:`FablibManager` without blocking the event loop
+        and wrap it.
+
+        :param max_workers: maximum number of concurrent API calls
+        :type max_workers: int
+        :param ssh_max_workers: maximum number of concurrent SSH operations
+        :type ssh_max_workers: int
+        :param kwargs: arguments of :class:`FablibManager`
+        :return: the asyncio manager
+        :rtype: AsyncFablibManager
+        """
+        fablib_manager = await asyncio.to_thread(FablibManager, **kwargs)
+        return cls(
+            fablib_manager=fablib_manager,
+            max_workers=max_workers,
+            ssh_max_workers=ssh_max_workers,
+        )
+
+    def __getattr__(self, name: str) -> Any:
+        if name.startswith("__") or name == "_fablib_manager":
+            raise AttributeError(name)
+        return getattr(self._fablib_manager, name)
+
+    async def __aenter__(self) -> AsyncFablibManager:
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+    def close(self):
+        """
+        Stop the thread pools and close the wrapped manager.
+        """
+        self._api.shutdown()
+        self._ssh.shutdown()
+        self._fablib_manager.close()
+
+    def get_fablib_manager(self) -> FablibManager:
+        """
+        Get the wrapped manager.
+
+        :return: the wrapped manager
+        :rtype: FablibManager
+        """
+        return self._fablib_manager
+
+    async def run(self, func: Callable, *args, ssh: bool = False, **kwargs) -> Any:
+        """
+        Run any blocking fablib call on one of the bounded pools.
+
+        :param func: function to run
+        :type func: Callable
+        :param ssh: run on the SSH pool instead of the API pool
+        :type ssh: bool
+        :return: the function's return value
+        """
+        pool = self._ssh if ssh else self._api
+        return await pool.run(func, *args, **kwargs)
+
+    def wrap(self, slice_object: Slice) -> AsyncSlice:
+        """
+        Wrap a slice of the wrapped manager.
+
+        :param slice_object: slice to wrap
+        :type slice_object: Slice
+        :return: the asyncio slice
+        :rtype: AsyncSlice
+        """
+        return AsyncSlice(self, slice_object)
+
+    def new_slice(self, name: str, **kwargs) -> AsyncSlice:
+        """
+        Create a new, unsubmitted slice.  Does not contact FABRIC.
+
+        :param name: the name to give the slice
+        :type name: str
+        :param kwargs: other arguments of :py:meth:`FablibManager.new_slice`
+        :return: the new slice
+        :rtype: AsyncSlice
+        """
+        return self.wrap(self._fablib_manager.new_slice(name=name, **kwargs))
+
+    async def get_slice(self, *args, **kwargs) -> AsyncSlice:
+        """
+        Awaitable :py:meth:`FablibManager.get_slice`; accepts the same arguments.
+
+        :return: the slice
+        :rtype: AsyncSlice
+        """
+        return self.wrap(
+            await self._api.run(self._fablib_manager.get_slice, *args, **kwargs)
+        )
+
+    async def get_slices(self, *args, **kwargs) -> List[AsyncSlice]:
+        """
+        Awaitable :py:meth:`FablibManager.get_slices`; accepts the same
+        arguments.
+
+        :return: the slices
+        :rtype: List[AsyncSlice]
+        """
+        slices = await self._api.run(self._fablib_manager.get_slices, *args, **kwargs)
+        return [self.wrap(s) for s in slices]
+
+    # Orchestrator
+    delete_slice = _awaitable("delete_slice")
+    delete_all = _awaitable("delete_all")
+    delete_slices = _awaitable("delete_slices")
+    renew_slices = _awaitable("renew_slices")
+    list_slices = _awaitable("list_slices")
+
+    # Resources
+    get_resources = _awaitable("get_resources")
+    get_available_resources = _awaitable("get_available_resources")
+    find_resource_slot = _awaitable("find_resource_slot")
+    resources_calendar = _awaitable("resources_calendar")
+    get_site_names = _awaitable("get_site_names")
+    get_random_site = _awaitable("get_random_site")
+    get_random_sites = _awaitable("get_random_sites")
+    list_sites = _awaitable("list_sites")
+    list_hosts = _awaitable("list_hosts")
+    list_links = _awaitable("list_links")
+    list_facility_ports = _awaitable("list_facility_ports")
+
+    # User, project and artifacts
+    get_user_info = _awaitable("get_user_info")
+    get_project_tags = _awaitable("get_project_tags")
+    create_artifact = _awaitable("create_artifact")
+    get_artifacts = _awaitable("get_artifacts")
+    list_artifacts = _awaitable("list_artifacts")
+    delete_artifact = _awaitable("delete_artifact")
+    get_tags = _awaitable("get_tags")
+    upload_file_to_artifact = _awaitable("upload_file_to_artifact")
+    download_artifact = _awaitable("download_artifact")
+
+    # SSH
+    probe_bastion_host = _awaitable("probe_bastion_host", pool="ssh")
+
+
+class AsyncSlice:
+    """
+    Asyncio interface to a :class:`Slice`.
+
+    Orchestrator and SSH operations are coroutines.  Other attributes
+    (``add_node``, ``get_nodes``, ``get_name`` and so on) are those of the
+    wrapped slice and are called directly.
+    """
+
+    def __init__(self, fablib_manager: AsyncFablibManager, slice_object: Slice):
+        """
+        :param fablib_manager: the asyncio manager that owns the pools
+        :type fablib_manager: AsyncFablibManager
+        :param slice_object: the slice to wrap
+        :type slice_object: Slice
+        """
+        self._fablib_manager = fablib_manager
+        self._slice = slice_object
+
+    def __getattr__(self, name: str) -> Any:
+        if name.startswith("__") or name == "_slice":
+            raise AttributeError(name)
+        return getattr(self._slice, name)
+
+    def __repr__(self) -> str:
+        return f"AsyncSlice({self._slice.get_name()!r})"
+
+    def get_slice(self) -> Slice:
+        """
+        Get the wrapped slice.
+
+        :return: the wrapped slice
+        :rtype: Slice
+        """
+        return self._slice
+
+    def get_fablib_manager(self) -> AsyncFablibManager:
+        """
+        Get the asyncio manager of this slice.
+
+        :return: the asyncio manager
+        :rtype: AsyncFablibManager
+        """
+        return self._fablib_manager
+
+    async def _api(self, func: Callable, *args, **kwargs) -> Any:
+        return await self._fablib_manager.run(func, *args, **kwargs)
+
+    async def _ssh(self, func: Callable, *args, **kwargs) -> Any:
+        return await self._fablib_manager.run(func, *args, ssh=True, **kwargs)
+
+    def _get_node(self, node: Union[str, Node]) -> Node:
+        return self._slice.get_node(name=node) if isinstance(node, str) else node
+
+    async def update(self):
+        """
+        Awaitable :py:meth:`Slice.update`.
+        """
+        await self._api(self._slice.update)
+
+    async def delete(self):
+        """
+        Awaitable :py:meth:`Slice.delete`.
+        """
+        await self._api(self._slice.delete)
+
+    async def submit(
+        self,
+        wait: bool = True,
+        wait_timeout: int = 1800,
+        wait_interval: int = 20,
+        post_boot_config: bool = True,
+        wait_ssh: bool = True,
+        **kwargs,
+    ) -> str:
+        """
+        Submit the slice and, optionally, wait for it to become stable,
+        wait for SSH and run post boot configuration.
+
+        :param wait: wait for the slice's resources to be active
+        :type wait: bool
+        :param wait_timeout: how many seconds to wait on the slice resources
+        :type wait_timeout: int
+        :param wait_interval: how often to check on the slice resources
+        :type wait_interval: int
+        :param post_boot_config: run post boot configuration
+        :type post_boot_config: bool
+        :param wait_ssh: wait for all nodes to be accessible via SSH
+        :type wait_ssh: bool
+        :param kwargs: other arguments of :py:meth:`Slice.submit`
+            (``extra_ssh_keys``, ``lease_in_hours``, ``validate``, ...);
+            ``progress`` is ignored, no progress is printed while waiting
+        :return: slice_id
+        :rtype: str
+        """
+        kwargs.pop("progress", None)
+        slice_id = await self._api(
+            self._slice.submit, wait=False, progress=False, **kwargs
+        )
+        if not wait:
+            return slice_id
+
+        await self.wait(timeout=wait_timeout, interval=wait_interval)
+
+        if self._slice.get_fablib_manager().get_no_ssh():
+            return slice_id
+
+        if wait_ssh:
+            await self.wait_ssh(timeout=wait_timeout, interval=wait_interval)
+        if post_boot_config and not self._slice.is_advanced_allocation():
+            await self.post_boot_config()
+        return slice_id
+
+    async def modify(self, **kwargs) -> str:
+        """
+        Submit changes to a running slice; same as :py:meth:`submit`.
+
+        :return: slice_id
+        :rtype: str
+        """
+        return await self.submit(**kwargs)
+
+    async def renew(
+        self,
+        end_date: str = None,
+        days: int = None,
+        wait: bool = True,
+        wait_timeout: int = 1800,
+        wait_interval: int = 20,
+    ):
+        """
+        Renew the slice's lease; see :py:meth:`Slice.renew`.
+
+        :param end_date: new end date, "%Y-%m-%d %H:%M:%S %z"
+        :type end_date: str
+        :param days: number of days from now
+        :type days: int
+        :param wait: wait for the slice to be stable again
+        :type wait: bool
+        :param wait_timeout: how many seconds to wait on the slice
+        :type wait_timeout: int
+        :param wait_interval: how often to check on the slice
+        :type wait_interval: int
+        """
+        await self._api(self._slice.renew, end_date=end_date, days=days, wait=False)
+        if wait:
+            await self.wait(timeout=wait_timeout, interval=wait_interval)
+
+    async def wait(self, timeout: int = 360, interval: int = 10):
+        """
+        Wait for the slice to be in a stable, running state.
+
+        :param timeout: how many seconds to wait on the slice
+        :type timeout: int
+        :param interval: how often in seconds to check on slice state
+        :type interval: int
+
+        :raises SliceStateError: if the slice has failed
+        :raises SliceTimeoutError: if waiting times out
+
+        :return: the stable slice on the slice manager
+        :rtype: SliceDTO
+        """
+        deadline = time.monotonic() + timeout
+        sm_slice = self._slice.sm_slice
+        while True:
+            polled, stable = await self._api(self._slice._poll_state)
+            sm_slice = polled or sm_slice
+            if stable:
+                break
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                raise SliceTimeoutError(
+                    f" Timeout exceeded ({timeout} sec). Slice: "
+                    f"{self._slice.get_name()} "
+                    f"({sm_slice.state if sm_slice else None})"
+                )
+            await asyncio.sleep(min(interval, remaining))
+
+        await self.update()
+        return sm_slice
+
+    async def test_ssh(self) -> bool:
+        """
+        Test that all nodes of the slice are accessible via SSH; nodes are
+        tested concurrently.
+
+        :return: whether all nodes are accessible
+        :rtype: bool
+        """
+        results = await asyncio.gather(
+            *(self._ssh(node.test_ssh) for node in self._slice.get_nodes())
+        )
+        return all(results)
+
+    async def wait_ssh(self, timeout: int = 1800, interval: int = 20) -> bool:
+        """
+        Wait for the slice to be stable and all nodes to be accessible via
+        SSH.
+
+        :param timeout: how many seconds to wait
+        :type timeout: int
+        :param interval: how often in seconds to check
+        :type interval: int
+
+        :raises RuntimeError: if no_ssh mode is enabled
+        :raises SliceTimeoutError: if waiting times out
+
+        :return: True when all nodes are accessible
+        :rtype: bool
+        """
+        if self._slice.get_fablib_manager().get_no_ssh():
+            raise RuntimeError(
+                "SSH operations are disabled (no_ssh=True). "
+                "This fablib instance is configured for API-only operations."
+            )
+
+        deadline = time.monotonic() + timeout
+        await self._ssh(self._slice.get_fablib_manager().probe_bastion_host)
+        await self.wait(timeout=timeout, interval=interval)
+
+        while True:
+            try:
+                if await self.test_ssh():
+                    return True
+            except Exception as e:
+                if time.monotonic() >= deadline:
+                    raise e
+                log.warning(f"wait ssh retrying: {e}")
+
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                raise SliceTimeoutError(
+                    f" Timeout exceeded ({timeout} sec). Slice: "
+                    f"{self._slice.get_name()} ({self._slice.get_state()})"
+                )
+            await asyncio.sleep(min(interval, remaining))
+            await self.update()
+
+    async def post_boot_config(self):
+        """
+        Awaitable :py:meth:`Slice.post_boot_config`.
+        """
+        await self._ssh(self._slice.post_boot_config, progress=False)
+
+    async def execute(self, node: Union[str, Node], command: str, **kwargs):
+        """
+        Awaitable :py:meth:`Node.execute`.
+
+        :param node: node name or node
+        :type node: Union[str, Node]
+        :param command: command(s) to run
+        :param kwargs: other arguments of :py:meth:`Node.execute`
+        :return: (stdout, stderr)
+        """
+        return await self._ssh(self._get_node(node).execute, command, **kwargs)
+
+    async def execute_all(
+        self, command: str, nodes: List[Union[str, Node]] = None, **kwargs
+    ) -> Dict[str, Any]:
+        """
+        Run a command on several nodes concurrently.
+
+        :param command: command(s) to run
+        :param nodes: nodes or node names; all nodes of the slice by default
+        :type nodes: List[Union[str, Node]]
+        :param kwargs: other arguments of :py:meth:`Node.execute`
+        :return: (stdout, stderr) by node name; an exception raised on a
+            node is returned in place of its result
+        :rtype: Dict[str, Any]
+        """
+        nodes = [self._get_node(n) for n in (nodes or self._slice.get_nodes())]
+        results = await asyncio.gather(
+            *(self._ssh(node.execute, command, **kwargs) for node in nodes),
+            return_exceptions=True,
+        )
+        return {node.get_name(): result for node, result in zip(nodes, results)}
+
+    async def upload_file(self, node: Union[str, Node], *args, **kwargs):
+        """
+        Awaitable :py:meth:`Node.upload_file`.
+
+        :param node: node name or node
+        :type node: Union[str, Node]
+        """
+        return await self._ssh(self._get_node(node).upload_file, *args, **kwargs)
+
+    async def download_file(self, node: Union[str, Node], *args, **kwargs):
+        """
+        Awaitable :py:meth:`Node.download_file`.
+
+        :param node: node name or node
+        :type node: Union[str, Node]
+        """
+        return await self._ssh(self._get_node(node).download_file, *args, **kwargs)
+
+    async def upload_directory(self, node: Union[str, Node], *args, **kwargs):
+        """
+        Awaitable :py:meth:`Node.upload_directory`.
+
+        :param node: node name or node
+        :type node: Union[str, Node]
+        """
+        return await self._ssh(self._get_node(node).upload_directory, *args, **kwargs)
+
+    async def download_directory(self, node: Union[str, Node], *args, **kwargs):
+        """
+        Awaitable :py:meth:`Node.download_directory`.
+
+        :param node: node name or node
+        :type node: Union[str, Node]
+        """
+        return await self._ssh(self._get_node(node).download_directory, *args, **kwargs)
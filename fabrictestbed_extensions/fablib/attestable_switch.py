@@ -409,18 +409,10 @@ class Attestable_Switch(Node):
         r["ports"] = "Switch ports"
         return r
 
-    def toDict(self, skip=[]):
-        """
-        Returns the node attributes as a dictionary
-
-        :return: slice attributes as dictionary
-        :rtype: dict
-        """
-        rtn_dict = super().toDict(skip)
-        if "ports" not in skip:
-            rtn_dict["ports"] = str(self.get_port_names())
-
-        return rtn_dict
+    # Columns of toDict(), computed on demand (see TemplateMixin._columns_dict)
+    _dict_columns = dict(
+        Node._dict_columns, ports=lambda switch: str(switch.get_port_names())
+    )
 
     def switch_config(self, log_dir="."):
         """
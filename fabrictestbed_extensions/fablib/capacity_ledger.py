@@ -0,0 +1,258 @@
+#!/usr/bin/env python3
+# MIT License
+#
+# Copyright (c) 2020 FABRIC Testbed
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+"""
+Capacity planning for many draft slices against one resources snapshot.
+
+Validating each slice on its own checks it against the untouched
+snapshot, so slices planned together (e.g. one per student of a class)
+can each pass while oversubscribing their sites jointly.
+:class:`CapacityLedger` reserves the host resources of every slice it
+accepts, so each slice is validated against what the previous ones left::
+
+    ledger = fablib.get_capacity_ledger()
+    ledger.plan(slices)
+    ledger.list_reservations()
+
+A slice is reserved completely or not at all.  Reservations can be
+released per slice (e.g. after changing it) and the slice reserved again
+without validating the others.
+"""
+
+from __future__ import annotations
+
+import logging
+import threading
+from typing import Any, Dict, List, Optional, Tuple
+
+from fabrictestbed_extensions.fablib.placement import PlacementEngine
+from fabrictestbed_extensions.fablib.validator import NodeValidator
+from fabrictestbed_extensions.utils.utils import Utils
+
+log = logging.getLogger("fablib")
+
+
+class CapacityLedger:
+    """
+    Host resources reserved by draft slices, by slice.
+    """
+
+    def __init__(
+        self,
+        resources,
+        project_tags: Optional[frozenset] = None,
+        placement: Optional[PlacementEngine] = None,
+    ):
+        """
+        :param resources: resources snapshot to plan against
+        :type resources: ResourcesV2
+        :param project_tags: permission tags of the project, see
+            :py:meth:`NodeValidator.validate_nodes`
+        :type project_tags: frozenset
+        :param placement: engine assigning nodes to hosts; best-fit
+            decreasing by default
+        :type placement: PlacementEngine
+        """
+        self.resources = resources
+        self.project_tags = project_tags
+        self.placement = placement
+        self.lock = threading.Lock()
+        # Resources reserved on each host by all slices, in the format of
+        # the allocated dict of NodeValidator.validate_nodes()
+        self.allocated: Dict[str, Dict[str, int]] = {}
+        # Resources reserved on each host by each slice
+        self._reservations: Dict[str, Dict[str, Dict[str, int]]] = {}
+        # Validation errors of each slice planned, empty if it fits
+        self._results: Dict[str, Dict[str, str]] = {}
+        # Slices planned, in order
+        self._slices: Dict[str, Any] = {}
+
+    def reserve(self, slice) -> Tuple[bool, Dict[str, str]]:
+        """
+        Validate a slice against the remaining capacity and reserve its
+        resources if all its nodes fit.
+
+        A slice reserved before is released first.  Nodes of a slice that
+        does not fit are left unchanged (unlike :py:meth:`Slice.validate`,
+        which deletes them).
+
+        :param slice: the draft slice
+        :type slice: Slice
+        :return: whether the slice fits, and the errors of its nodes
+        :rtype: Tuple[bool, Dict[str, str]]
+        """
+        name = slice.get_name()
+        nodes = slice.get_nodes()
+        with self.lock:
+            self._release(name)
+            self._slices[name] = slice
+
+            # Only the hosts of the slice's sites can change
+            trial: Dict[str, Dict[str, int]] = {}
+            for site in dict.fromkeys(n.get_site() for n in nodes):
+                for host in self.resources.get_hosts_by_site(site_name=site) or {}:
+                    if host in self.allocated:
+                        trial[host] = dict(self.allocated[host])
+
+            all_valid, errors = NodeValidator.validate_nodes(
+                nodes=nodes,
+                resources=self.resources,
+                project_tags=self.project_tags,
+                allocated=trial,
+                placement=self.placement,
+            )
+            self._results[name] = errors
+            if not all_valid:
+                log.info(f"Slice {name} does not fit: {errors}")
+                return False, errors
+
+            reservation = {}
+            for host, counts in trial.items():
+                before = self.allocated.get(host, {})
+                delta = {k: v - before.get(k, 0) for k, v in counts.items()}
+                delta = {k: v for k, v in delta.items() if v}
+                if delta:
+                    reservation[host] = delta
+                    self.allocated[host] = counts
+            self._reservations[name] = reservation
+            return True, errors
+
+    def release(self, slice_name: str):
+        """
+        Release the resources reserved by a slice and forget the slice.
+
+        :param slice_name: slice name
+        :type slice_name: str
+        """
+        with self.lock:
+            self._release(slice_name)
+            self._results.pop(slice_name, None)
+            self._slices.pop(slice_name, None)
+
+    def _release(self, slice_name: str):
+        for host, delta in self._reservations.pop(slice_name, {}).items():
+            counts = self.allocated[host]
+            for key, value in delta.items():
+                counts[key] -= value
+            if not any(counts.values()):
+                del self.allocated[host]
+
+    def plan(self, slices: List) -> Dict[str, Dict[str, str]]:
+        """
+        Reserve several slices in order.
+
+        :param slices: draft slices
+        :type slices: List[Slice]
+        :return: validation errors by slice name; empty for slices that fit
+        :rtype: Dict[str, Dict[str, str]]
+        """
+        return {s.get_name(): self.reserve(s)[1] for s in slices}
+
+    def replan(self) -> Dict[str, Dict[str, str]]:
+        """
+        Release all reservations and reserve the planned slices again, in
+        the order they were first planned.
+
+        :return: validation errors by slice name; empty for slices that fit
+        :rtype: Dict[str, Dict[str, str]]
+        """
+        with self.lock:
+            slices = list(self._slices.values())
+            self.allocated = {}
+            self._reservations = {}
+            self._results = {}
+            self._slices = {}
+        return self.plan(slices)
+
+    def fits(self, slice_name: str) -> bool:
+        """
+        Whether a planned slice has its resources reserved.
+
+        :param slice_name: slice name
+        :type slice_name: str
+        :rtype: bool
+        """
+        return slice_name in self._reservations
+
+    def get_results(self) -> Dict[str, Dict[str, str]]:
+        """
+        Validation errors of the planned slices, by slice name; empty for
+        slices that fit.
+
+        :rtype: Dict[str, Dict[str, str]]
+        """
+        return dict(self._results)
+
+    def get_reservation(self, slice_name: str) -> Dict[str, Dict[str, int]]:
+        """
+        Resources reserved by a slice on each host.
+
+        :param slice_name: slice name
+        :type slice_name: str
+        :return: counts (``core``, ``ram``, ``disk`` and components) by host
+        :rtype: Dict[str, Dict[str, int]]
+        """
+        return {h: dict(c) for h, c in self._reservations.get(slice_name, {}).items()}
+
+    def list_reservations(
+        self,
+        output: Optional[str] = None,
+        fields: Optional[List[str]] = None,
+        quiet: bool = False,
+        filter_function=None,
+    ):
+        """
+        List the planned slices, whether they fit and what they reserve.
+
+        :param output: output format
+        :type output: str
+        :param fields: list of fields (table columns) to show
+        :type fields: List[str]
+        :param quiet: True to suppress printing/display
+        :type quiet: bool
+        :param filter_function: lambda function to filter rows
+        :type filter_function: callable
+        :return: table in format specified by output parameter
+        """
+        rows = []
+        for name, errors in self._results.items():
+            reservation = self._reservations.get(name, {})
+            rows.append(
+                {
+                    "Slice": name,
+                    "Fits": not errors,
+                    "Hosts": len(reservation),
+                    "Cores": sum(c.get("core", 0) for c in reservation.values()),
+                    "RAM": sum(c.get("ram", 0) for c in reservation.values()),
+                    "Disk": sum(c.get("disk", 0) for c in reservation.values()),
+                    "Errors": "; ".join(f"{n}: {e}" for n, e in errors.items()),
+                }
+            )
+        return Utils.list_table(
+            rows,
+            fields=fields,
+            title="Capacity Reservations",
+            output=output,
+            quiet=quiet,
+            filter_function=filter_function,
+        )
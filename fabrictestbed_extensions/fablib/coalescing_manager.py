@@ -0,0 +1,287 @@
+#!/usr/bin/env python3
+# MIT License
+#
+# Copyright (c) 2020 FABRIC Testbed
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+"""
+Request coalescing for :class:`FabricManagerV2`.
+
+Several fablib code paths issue the same read-only request concurrently or
+back-to-back (e.g. threads calling ``get_resources()``, or ``Slice.update()``
+and ``Slice.wait()`` both listing the same slice).
+:class:`CoalescingFabricManager` routes read-only calls through a
+:class:`SingleFlight` so identical in-flight requests share one HTTP call,
+optionally caching responses for a short TTL.  Calls that change state
+invalidate the cache.  The orchestrator and credential manager clients
+share one pooled HTTP session.
+"""
+
+from __future__ import annotations
+
+import copy
+import functools
+import logging
+import threading
+import time
+from typing import Any, Callable, Dict, Hashable, Optional, Tuple
+
+from fabrictestbed.external_api.credmgr_client import CredmgrClient
+from fabrictestbed.fabric_manager_v2 import FabricManagerV2
+from requests.adapters import HTTPAdapter
+
+from fabrictestbed_extensions.fablib.token_cache import TokenInfoCache
+
+log = logging.getLogger("fablib")
+
+
+class _Call:
+    """An in-flight call whose result is shared with concurrent callers."""
+
+    def __init__(self):
+        self.event = threading.Event()
+        self.result: Any = None
+        self.error: Optional[BaseException] = None
+        # Number of callers waiting for the result
+        self.followers = 0
+
+
+class SingleFlight:
+    """
+    Collapses concurrent calls with the same key into a single call.
+
+    The first caller for a key runs the function; callers arriving while
+    it runs wait for and receive the same result (or exception).  When
+    ``ttl`` is greater than zero, successful results are also served from
+    memory for ``ttl`` seconds.
+
+    Results received by more than one caller (cached results, and results
+    of calls others waited for) are passed through ``copy`` for each
+    caller; the caller that ran ``func`` alone gets its result as is.
+    """
+
+    def __init__(self, ttl: float = 0.0, copy: Optional[Callable[[Any], Any]] = None):
+        """
+        :param ttl: seconds to cache successful results; 0 disables caching
+        :type ttl: float
+        :param copy: copies a shared result for one caller; by default
+            callers share the result object
+        :type copy: Callable
+        """
+        self.ttl = ttl
+        self.copy = copy or (lambda result: result)
+        self.lock = threading.Lock()
+        self._in_flight: Dict[Hashable, _Call] = {}
+        self._cache: Dict[Hashable, Tuple[float, Any]] = {}
+        # Bumped on invalidate() so results of calls started before an
+        # invalidation are not cached
+        self._generation = 0
+
+    def call(self, key: Hashable, func: Callable[[], Any], cacheable: bool = True):
+        """
+        Run ``func`` unless an identical call is in flight or cached.
+
+        :param key: identifies identical calls
+        :type key: Hashable
+        :param func: function to run
+        :type func: Callable
+        :param cacheable: whether the result may be served from the TTL cache
+        :type cacheable: bool
+        :return: result of ``func``
+        """
+        use_cache = cacheable and self.ttl > 0
+        with self.lock:
+            if use_cache:
+                cached = self._cache.get(key)
+                if cached and cached[0] > time.monotonic():
+                    return self.copy(cached[1])
+
+            call = self._in_flight.get(key)
+            leader = call is None
+            if leader:
+                call = _Call()
+                self._in_flight[key] = call
+                generation = self._generation
+            else:
+                call.followers += 1
+
+        if not leader:
+            call.event.wait()
+            if call.error is not None:
+                raise call.error
+            return self.copy(call.result)
+
+        try:
+            call.result = func()
+        except BaseException as e:
+            call.error = e
+            raise
+        finally:
+            with self.lock:
+                del self._in_flight[key]
+                shared = call.followers > 0
+                if use_cache and call.error is None and generation == self._generation:
+                    self._cache[key] = (time.monotonic() + self.ttl, call.result)
+                    shared = True
+            call.event.set()
+
+        return self.copy(call.result) if shared else call.result
+
+    def invalidate(self):
+        """
+        Drop all cached results.
+        """
+        with self.lock:
+            self._cache.clear()
+            self._generation += 1
+
+
+def _coalesced(name: str):
+    """
+    Build a read-only FabricManagerV2 method routed through SingleFlight.
+    """
+
+    def method(self, *args, **kwargs):
+        parent = getattr(super(CoalescingFabricManager, self), name)
+        key = (name, repr(args), repr(sorted(kwargs.items())))
+        return self.single_flight.call(
+            key,
+            lambda: parent(*args, **kwargs),
+            cacheable=not kwargs.get("force_refresh", False),
+        )
+
+    method.__name__ = name
+    method.__doc__ = getattr(FabricManagerV2, name).__doc__
+    return method
+
+
+def _invalidating(name: str):
+    """
+    Build a state-changing FabricManagerV2 method that invalidates the cache.
+    """
+
+    def method(self, *args, **kwargs):
+        try:
+            return getattr(super(CoalescingFabricManager, self), name)(*args, **kwargs)
+        finally:
+            self.single_flight.invalidate()
+
+    method.__name__ = name
+    method.__doc__ = getattr(FabricManagerV2, name).__doc__
+    return method
+
+
+class CoalescingFabricManager(FabricManagerV2):
+    """
+    :class:`FabricManagerV2` with single-flight read-only calls and a
+    shared, pooled HTTP session.
+
+    Callers of a read-only call that share a response (because their
+    calls were collapsed or the response was cached) each receive their
+    own deep copy of it.
+    """
+
+    def __init__(
+        self,
+        *args,
+        response_ttl: float = 0.0,
+        pool_maxsize: int = 20,
+        token_cache: Optional[TokenInfoCache] = None,
+        **kwargs,
+    ):
+        """
+        Accepts the same arguments as :class:`FabricManagerV2`, plus:
+
+        :param response_ttl: seconds to cache responses of read-only calls;
+            0 (default) only collapses concurrent identical calls
+        :type response_ttl: float
+        :param pool_maxsize: maximum number of pooled connections per host
+        :type pool_maxsize: int
+        :param token_cache: persistent cache used for token validation
+        :type token_cache: TokenInfoCache
+        """
+        # Must be set before FabricManagerV2.__init__ decodes the token
+        self.token_cache = token_cache
+        super().__init__(*args, **kwargs)
+        # Hand out private copies of shared responses so callers may
+        # change the returned objects
+        self.single_flight = SingleFlight(ttl=response_ttl, copy=copy.deepcopy)
+
+        # Share one session (and connection pools) across the REST clients,
+        # sized for the number of threads fablib may run concurrently.
+        session = self.orch.session
+        retries = session.get_adapter("https://").max_retries
+        adapter = HTTPAdapter(
+            max_retries=retries, pool_connections=10, pool_maxsize=pool_maxsize
+        )
+        session.mount("https://", adapter)
+        session.mount("http://", adapter)
+        self.credmgr.session = session
+
+    @property
+    def credmgr(self) -> CredmgrClient:
+        """
+        Credential manager client.
+        """
+        return self._credmgr
+
+    @credmgr.setter
+    def credmgr(self, client: CredmgrClient):
+        # Serve token decoding (project/user info, expiry, project tags)
+        # from the persistent token cache
+        if self.token_cache is not None:
+            client.validate = functools.partial(
+                self.token_cache.validate, client.validate
+            )
+        self._credmgr = client
+
+    # Read-only calls
+    list_slices = _coalesced("list_slices")
+    get_slice = _coalesced("get_slice")
+    list_slivers = _coalesced("list_slivers")
+    get_sliver = _coalesced("get_sliver")
+    resources_summary = _coalesced("resources_summary")
+    resources_calendar = _coalesced("resources_calendar")
+    find_resource_slot = _coalesced("find_resource_slot")
+    get_user_info = _coalesced("get_user_info")
+    get_project_info = _coalesced("get_project_info")
+    list_storage = _coalesced("list_storage")
+    get_storage = _coalesced("get_storage")
+    list_artifacts = _coalesced("list_artifacts")
+
+    # State-changing calls
+    create_slice = _invalidating("create_slice")
+    modify_slice = _invalidating("modify_slice")
+    accept_modify = _invalidating("accept_modify")
+    renew_slice = _invalidating("renew_slice")
+    delete_slice = _invalidating("delete_slice")
+    poa = _invalidating("poa")
+    poa_create = _invalidating("poa_create")
+    os_reboot = _invalidating("os_reboot")
+    add_public_key = _invalidating("add_public_key")
+    create_ssh_keys = _invalidating("create_ssh_keys")
+    remove_public_key = _invalidating("remove_public_key")
+    create_artifact = _invalidating("create_artifact")
+    delete_artifact = _invalidating("delete_artifact")
+    upload_file_to_artifact = _invalidating("upload_file_to_artifact")
+    tokens_create = _invalidating("tokens_create")
+    tokens_delete = _invalidating("tokens_delete")
+    tokens_delete_all = _invalidating("tokens_delete_all")
+    tokens_revoke = _invalidating("tokens_revoke")
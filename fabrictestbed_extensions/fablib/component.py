@@ -82,6 +82,22 @@ class Component(TemplateMixin):
 
     _show_title = "Component"
 
+    __slots__ = (
+        "fim_component",
+        "fim_model",
+        "node",
+        "interfaces",
+        "dict",
+        "_cached_details",
+        "_cached_numa_node",
+        "_cached_disk",
+        "_cached_unit",
+        "_cached_bdf",
+        "_cached_fim_model",
+        "_cached_fim_type",
+        "_cached_device_name",
+    )
+
     component_model_map = {
         Constants.CMP_NIC_Basic: ComponentModelType.SharedNIC_ConnectX_6,
         Constants.CMP_NIC_BlueField2_ConnectX_6: ComponentModelType.SmartNIC_BlueField_2_ConnectX_6,
@@ -158,39 +174,40 @@ class Component(TemplateMixin):
             "numa": "Numa Node",
         }
 
-    def toDict(self, skip: Optional[List[str]] = None):
+    # Columns of toDict(), computed on demand (see TemplateMixin._columns_dict)
+    _dict_columns = {
+        "name": lambda component: str(component.get_name()),
+        "short_name": lambda component: str(component.get_short_name()),
+        "details": lambda component: str(component.get_details()),
+        "disk": lambda component: str(component.get_disk()),
+        "units": lambda component: str(component.get_unit()),
+        "pci_address": lambda component: str(component.get_pci_addr()),
+        "model": lambda component: str(component.get_model()),
+        "type": lambda component: str(component.get_type()),
+        "dev": lambda component: str(component.get_device_name()),
+        "node": lambda component: (
+            str(component.get_node().get_name()) if component.get_node() else ""
+        ),
+        "numa": lambda component: str(component.get_numa_node()),
+    }
+
+    def toDict(
+        self, skip: Optional[List[str]] = None, fields: Optional[List[str]] = None
+    ):
         """
         Returns the component attributes as a dictionary.
 
-        Results are cached. Cache is invalidated when ``_invalidate_cache()``
-        is called.
+        Only the requested attributes are computed. Results are cached.
+        Cache is invalidated when ``_invalidate_cache()`` is called.
 
         :param skip: list of keys to exclude
         :type skip: List[str]
+        :param fields: list of keys to include; all by default
+        :type fields: List[str]
         :return: component attributes as dictionary
         :rtype: dict
         """
-        if skip is None:
-            skip = []
-
-        if self._cached_dict is None:
-            d = {}
-            d["name"] = str(self.get_name())
-            d["short_name"] = str(self.get_short_name())
-            d["details"] = str(self.get_details())
-            d["disk"] = str(self.get_disk())
-            d["units"] = str(self.get_unit())
-            d["pci_address"] = str(self.get_pci_addr())
-            d["model"] = str(self.get_model())
-            d["type"] = str(self.get_type())
-            d["dev"] = str(self.get_device_name())
-            d["node"] = str(self.get_node().get_name()) if self.get_node() else ""
-            d["numa"] = str(self.get_numa_node())
-            self._cached_dict = d
-
-        if not skip:
-            return dict(self._cached_dict)
-        return {k: v for k, v in self._cached_dict.items() if k not in skip}
+        return self._columns_dict(skip=skip, fields=fields)
 
     def generate_template_context(self, skip: Optional[List[str]] = None):
         """
@@ -417,18 +434,19 @@ class Component(TemplateMixin):
                 return self.interfaces
             return list(self.interfaces.values())
 
-        self.interfaces = {}
+        interfaces = {}
         for fim_interface in self.get_fim().interface_list:
             iface = Interface(component=self, fim_interface=fim_interface)
-            self.interfaces[iface.get_name()] = iface
+            interfaces[iface.get_name()] = iface
             if include_subs:
                 child_interfaces = iface.get_interfaces(refresh=refresh, output="dict")
                 if child_interfaces and len(child_interfaces):
-                    self.interfaces.update(child_interfaces)
+                    interfaces.update(child_interfaces)
+        self.interfaces = interfaces
 
         if output == "dict":
-            return self.interfaces
-        return list(self.interfaces.values())
+            return interfaces
+        return list(interfaces.values())
 
     def get_interface(
         self, name: str = None, network_name: str = None, refresh: bool = False
@@ -91,6 +91,8 @@ class Constants:
     DEFAULT_LOG_FILE = "/tmp/fablib/fablib.log"
     DEFAULT_LOG_PROPAGATE = False
     DEFAULT_DATA_DIR = "/tmp/fablib"
+    REACHABILITY_CACHE_FILE = "reachability.json"
+    REACHABILITY_CACHE_TTL = 300
     DEFAULT_WORK_DIR = f"{os.environ['HOME']}/work"
     DEFAULT_FABRIC_CONFIG_DIR = f"{DEFAULT_WORK_DIR}/fabric_config"
     DEFAULT_FABRIC_RC = f"{DEFAULT_FABRIC_CONFIG_DIR}/fabric_rc"
@@ -78,19 +78,26 @@ from fabrictestbed.fabric_manager_v2 import FabricManagerV2
 from fss_utils.sshkey import FABRICSSHKey
 
 from fabrictestbed_extensions.fablib.artifact import Artifact
+from fabrictestbed_extensions.fablib.coalescing_manager import CoalescingFabricManager
 from fabrictestbed_extensions.utils.ceph_fs_utils import CephFsUtils
 
 warnings.filterwarnings("always", category=DeprecationWarning)
 
+import concurrent.futures
 from concurrent.futures import ThreadPoolExecutor
 from ipaddress import IPv4Network, IPv6Network
-from typing import TYPE_CHECKING, Any, Dict, List, Optional, Tuple
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Tuple, Union
 
 import paramiko
 
 from fabrictestbed_extensions.fablib.config.config import Config, ConfigException
 from fabrictestbed_extensions.fablib.constants import Constants
-from fabrictestbed_extensions.fablib.exceptions import SliceNotFoundError
+from fabrictestbed_extensions.fablib.exceptions import (
+    SliceNotFoundError,
+    SliceStateError,
+    SliceTimeoutError,
+    ValidationError,
+)
 from fabrictestbed_extensions.utils.utils import Utils
 
 if TYPE_CHECKING:
@@ -98,9 +105,18 @@ if TYPE_CHECKING:
 
 from fabrictestbed.slice_manager import SliceState
 
+from fabrictestbed_extensions.fablib.capacity_ledger import CapacityLedger
 from fabrictestbed_extensions.fablib.crease.crinkle import CrinkleSlice
+from fabrictestbed_extensions.fablib.placement import PlacementRequest
+from fabrictestbed_extensions.fablib.resource_calendar import ResourceCalendar
+from fabrictestbed_extensions.fablib.resources_cache import ResourcesSummaryCache
 from fabrictestbed_extensions.fablib.resources_v2 import ResourcesV2
+from fabrictestbed_extensions.fablib.site_selection import SiteSelector
 from fabrictestbed_extensions.fablib.slice import Slice
+from fabrictestbed_extensions.fablib.slice_cache import SliceCache
+from fabrictestbed_extensions.fablib.slot_finder import SlotFinder
+from fabrictestbed_extensions.fablib.token_cache import TokenInfoCache
+from fabrictestbed_extensions.fablib.topology_cache import TopologyCache
 
 log = logging.getLogger("fablib")
 
@@ -140,6 +156,13 @@ class FablibManager(Config):
         validate_config: bool = True,
         no_ssh: bool = False,
         raise_on_not_found: bool = False,
+        topology_cache: bool = False,
+        topology_cache_max_age: Optional[float] = TopologyCache.DEFAULT_MAX_AGE,
+        request_cache_ttl: float = 0.0,
+        token_cache: bool = False,
+        resources_cache_max_age: float = 0.0,
+        slice_cache_size: Optional[int] = None,
+        slice_cache_weak: bool = False,
         **kwargs,
     ):
         """
@@ -210,6 +233,35 @@ class FablibManager(Config):
             methods raise ``ResourceNotFoundError`` if the resource is not found;
             when ``False`` (default), they return ``None``.  Individual calls
             can override this via their ``raise_exception`` parameter.
+        :param topology_cache: Persist the graph model and slivers of stable
+            slices under ``data_dir`` so that re-opening a slice in a new
+            process does not re-download them while its state and lease are
+            unchanged.  Defaults to ``False``.
+        :param topology_cache_max_age: Seconds for which a persisted graph
+            model or sliver list is reused.  Modifications made by other
+            clients do not change the slice state or lease, so they are only
+            seen once the entry has expired.  ``None`` reuses entries until
+            the state or lease changes.  Defaults to 600.
+        :param request_cache_ttl: Seconds for which responses of read-only
+            FABRIC API calls (slice/sliver listings, resource summaries, ...)
+            are reused.  Identical concurrent calls are always collapsed into
+            one request; ``0`` (default) disables reuse of completed responses.
+        :param token_cache: Persist information derived from the ID token
+            (decoded token, project and bastion username) under ``data_dir``,
+            keyed by a hash of the token and expiring with it, so that new
+            processes do not look it up again.  Cached tokens are not
+            validated with the credential manager again.  Defaults to
+            ``False``.
+        :param resources_cache_max_age: Persist resource summaries under
+            ``data_dir`` and serve those younger than this many seconds
+            immediately, refreshing them in the background.  Validation
+            before submit always uses a freshly fetched summary.  ``0``
+            (default) disables the cache.
+        :param slice_cache_size: Maximum number of ``Slice`` objects kept for
+            reuse by this manager; least recently used slices are dropped
+            first.  ``None`` (default) keeps all of them.
+        :param slice_cache_weak: Only keep cached ``Slice`` objects while the
+            application still references them.  Defaults to ``False``.
         """
         # If id_token is provided, disable auto_token_refresh
         if id_token is not None:
@@ -247,6 +299,24 @@ class FablibManager(Config):
         self._manager_built = False
         self._project_tags_cache: Optional[frozenset] = None
         self._execute_thread_pool_size = execute_thread_pool_size
+        self._request_cache_ttl = request_cache_ttl
+        self._topology_cache: Optional[TopologyCache] = None
+        if topology_cache:
+            self._topology_cache = TopologyCache(
+                cache_dir=os.path.join(self.get_data_dir(), "topology_cache"),
+                max_age=topology_cache_max_age,
+            )
+        self._token_cache: Optional[TokenInfoCache] = None
+        if token_cache:
+            self._token_cache = TokenInfoCache(
+                cache_dir=os.path.join(self.get_data_dir(), "token_cache")
+            )
+        self._resources_cache: Optional[ResourcesSummaryCache] = None
+        if resources_cache_max_age > 0:
+            self._resources_cache = ResourcesSummaryCache(
+                cache_dir=os.path.join(self.get_data_dir(), "resources_cache"),
+                max_age=resources_cache_max_age,
+            )
 
         if not offline:
             if not self.get_no_ssh():
@@ -255,41 +325,25 @@ class FablibManager(Config):
                 )
         self.required_check()
         self.lock = threading.Lock()
-        # These dictionaries are maintained to keep cache of the slice objects created
+        # Cache of the slice objects created
         # Use the same objects when user queries for slices
         # This was added to address the concerns for
         # https://github.com/fabric-testbed/fabrictestbed-extensions/issues/379
-        self.__slices_by_name = {}
-        self.__slices_by_id = {}
+        self.__slice_cache = SliceCache(
+            max_size=slice_cache_size, weak=slice_cache_weak
+        )
 
     def cache_slice(self, slice_object: Slice):
         """
         Caches a Slice object by its name and ID.
 
-        Adds the given slice object to both the `__slices_by_name` and `__slices_by_id`
-        dictionaries for quick retrieval based on either its name or its ID.
-
         If a slice with the same name already exists in cache, it will be replaced.
         This ensures that the cache always contains the most recent slice object.
 
         :param slice_object: The Slice object to be cached.
         :type slice_object: Slice
         """
-        with self.lock:
-            name = slice_object.get_name()
-            slice_id = slice_object.get_slice_id()
-
-            # Check if there's an existing entry with this name but different ID
-            # and clean up the old ID mapping
-            if name in self.__slices_by_name:
-                old_slice = self.__slices_by_name[name]
-                old_id = old_slice.get_slice_id()
-                if old_id and old_id != slice_id and old_id in self.__slices_by_id:
-                    del self.__slices_by_id[old_id]
-
-            self.__slices_by_name[name] = slice_object
-            if slice_id:
-                self.__slices_by_id[slice_id] = slice_object
+        self.__slice_cache.put(slice_object)
 
     def update_slice_cache_id(self, slice_object: Slice):
         """
@@ -300,31 +354,46 @@ class FablibManager(Config):
         :param slice_object: The Slice object whose ID was updated.
         :type slice_object: Slice
         """
-        with self.lock:
-            slice_id = slice_object.get_slice_id()
-            if slice_id and slice_id not in self.__slices_by_id:
-                self.__slices_by_id[slice_id] = slice_object
+        self.__slice_cache.update_id(slice_object)
 
     def remove_slice_from_cache(self, slice_object: Slice):
         """
         Removes a Slice object from the cache by its name and ID.
 
-        Removes the slice from both `__slices_by_name` and `__slices_by_id` if present.
-
         :param slice_object: The Slice object to be removed from the cache.
         :type slice_object: Slice
         """
-        with self.lock:
-            if (
-                slice_object.get_slice_id()
-                and slice_object.get_slice_id() in self.__slices_by_id
-            ):
-                self.__slices_by_id.pop(slice_object.get_slice_id())
-            if (
-                slice_object.get_name()
-                and slice_object.get_name() in self.__slices_by_name
-            ):
-                self.__slices_by_name.pop(slice_object.get_name())
+        self.__slice_cache.remove(slice_object)
+
+    def get_slice_cache(self) -> SliceCache:
+        """
+        Gets the cache of Slice objects reused by this manager.
+
+        Use :meth:`SliceCache.memory_usage` to see the approximate memory
+        held by each cached slice.
+
+        :return: the slice cache
+        :rtype: SliceCache
+        """
+        return self.__slice_cache
+
+    def get_topology_cache(self) -> Optional[TopologyCache]:
+        """
+        Gets the persistent slice topology cache.
+
+        :return: the topology cache, or None if not enabled
+        :rtype: TopologyCache
+        """
+        return self._topology_cache
+
+    def get_resources_cache(self) -> Optional[ResourcesSummaryCache]:
+        """
+        Gets the persistent resource summary cache.
+
+        :return: the resources cache, or None if not enabled
+        :rtype: ResourcesSummaryCache
+        """
+        return self._resources_cache
 
     def _get_slice_from_cache(
         self, slice_id: str = None, slice_name: str = None
@@ -339,11 +408,7 @@ class FablibManager(Config):
         :return: The Slice object if found, or None.
         :rtype: Slice
         """
-        with self.lock:
-            if slice_id:
-                return self.__slices_by_id.get(slice_id)
-            elif slice_name:
-                return self.__slices_by_name.get(slice_name)
+        return self.__slice_cache.get(slice_id=slice_id, slice_name=slice_name)
 
     def close(self):
         """
@@ -474,10 +539,14 @@ class FablibManager(Config):
 
         :raises Exception if the configuration is invalid
         """
-        Utils.is_reachable(hostname=self.get_credmgr_host(), port=443)
-        Utils.is_reachable(hostname=self.get_orchestrator_host(), port=443)
-        Utils.is_reachable(hostname=self.get_core_api_host(), port=443)
-        Utils.is_reachable(hostname=self.get_bastion_host(), port=22)
+        self.__check_reachable(
+            hosts=[
+                (self.get_credmgr_host(), 443),
+                (self.get_orchestrator_host(), 443),
+                (self.get_core_api_host(), 443),
+                (self.get_bastion_host(), 22),
+            ]
+        )
 
         if (
             self.get_default_slice_private_key_file() is not None
@@ -532,12 +601,26 @@ class FablibManager(Config):
         if self.get_bastion_username() is not None:
             return
 
+        id_token = self.manager.get_id_token() if self.manager else None
+        if self._token_cache is not None:
+            bastion_username = self._token_cache.get(id_token).get(
+                Constants.BASTION_LOGIN
+            )
+            if bastion_username is not None:
+                log.debug("Using cached Bastion User Name")
+                self.set_bastion_username(bastion_username=bastion_username)
+                return
+
         log.info("Fetching User's information")
         user_info = self.get_user_info()
         log.debug("Updating Bastion User Name")
         self.set_bastion_username(
             bastion_username=user_info.get(Constants.BASTION_LOGIN)
         )
+        if self._token_cache is not None and self.get_bastion_username():
+            self._token_cache.put(
+                id_token, **{Constants.BASTION_LOGIN: self.get_bastion_username()}
+            )
 
     def create_ssh_tunnel_config(self, overwrite: bool = False):
         """
@@ -893,6 +976,27 @@ Host * !bastion.fabric-testbed.net
         """
         return self.ssh_thread_pool_executor
 
+    def __check_reachable(self, hosts: List[Tuple[str, int]]):
+        """
+        Not a user facing API call.
+
+        Checks FABRIC service hosts concurrently, skipping hosts that were
+        found reachable within the last few minutes by any process sharing
+        ``data_dir``.
+
+        :param hosts: ``(hostname, port)`` pairs to check
+        :type hosts: List[Tuple[str, int]]
+
+        :raises ConnectionError: if any host is not reachable
+        """
+        Utils.are_reachable(
+            hosts=hosts,
+            cache_file=os.path.join(
+                self.get_data_dir(), Constants.REACHABILITY_CACHE_FILE
+            ),
+            ttl=Constants.REACHABILITY_CACHE_TTL,
+        )
+
     def __build_manager(self) -> FabricManagerV2:
         """
         Not a user facing API call.
@@ -913,13 +1017,20 @@ Host * !bastion.fabric-testbed.net
                 f"initialize=True,"
                 f"scope='all'"
             )
-            Utils.is_reachable(hostname=self.get_credmgr_host())
-            Utils.is_reachable(hostname=self.get_orchestrator_host())
-            Utils.is_reachable(hostname=self.get_core_api_host())
+            self.__check_reachable(
+                hosts=[
+                    (self.get_credmgr_host(), 443),
+                    (self.get_orchestrator_host(), 443),
+                    (self.get_core_api_host(), 443),
+                ]
+            )
+
+            # Size the shared HTTP connection pool for fablib's worker threads
+            pool_maxsize = max(20, self._execute_thread_pool_size)
 
             # Use id_token if provided, otherwise use token_location
             if self.get_id_token():
-                self.manager = FabricManagerV2(
+                self.manager = CoalescingFabricManager(
                     credmgr_host=self.get_credmgr_host(),
                     orchestrator_host=self.get_orchestrator_host(),
                     core_api_host=self.get_core_api_host(),
@@ -928,9 +1039,12 @@ Host * !bastion.fabric-testbed.net
                     project_id=self.get_project_id(),
                     auto_refresh=False,
                     no_write=True,
+                    response_ttl=self._request_cache_ttl,
+                    pool_maxsize=pool_maxsize,
+                    token_cache=self._token_cache,
                 )
             else:
-                self.manager = FabricManagerV2(
+                self.manager = CoalescingFabricManager(
                     credmgr_host=self.get_credmgr_host(),
                     orchestrator_host=self.get_orchestrator_host(),
                     core_api_host=self.get_core_api_host(),
@@ -938,6 +1052,9 @@ Host * !bastion.fabric-testbed.net
                     token_location=self.get_token_location(),
                     project_id=self.get_project_id(),
                     auto_refresh=self.auto_token_refresh,
+                    response_ttl=self._request_cache_ttl,
+                    pool_maxsize=pool_maxsize,
+                    token_cache=self._token_cache,
                 )
             log.debug("Fabric manager initialized!")
             # Update Project ID to be same as in Slice Manager
@@ -1358,6 +1475,7 @@ Host * !bastion.fabric-testbed.net
         end: Optional[datetime] = None,
         avoid: Optional[List[str]] = None,
         includes: Optional[List[str]] = None,
+        max_age: Optional[float] = None,
     ) -> ResourcesV2:
         """
         Get a reference to the resources object. The resources object
@@ -1381,6 +1499,10 @@ Host * !bastion.fabric-testbed.net
         :param includes: list of sites to include
         :type: list of string
 
+        :param max_age: with the resources cache enabled, serve summaries
+            cached up to this many seconds ago; ``0`` requires a fresh one
+        :type max_age: float
+
         :return: the resources object
         :rtype: ResourcesV2
         """
@@ -1399,6 +1521,7 @@ Host * !bastion.fabric-testbed.net
             end=end,
             avoid=avoid,
             includes=includes,
+            max_age=max_age,
         )
 
     @staticmethod
@@ -1630,6 +1753,61 @@ Host * !bastion.fabric-testbed.net
         :type filter_function: callable
         :return: table in format specified by output parameter
         """
+        calendar = self.get_resources_calendar(
+            start=start,
+            end=end,
+            interval=interval,
+            site=site,
+            host=host,
+            exclude_site=exclude_site,
+            exclude_host=exclude_host,
+        )
+
+        return Utils.show_calendar(
+            calendar,
+            show=show,
+            fields=fields,
+            output=output,
+            quiet=quiet,
+            filter_function=filter_function,
+        )
+
+    def get_resources_calendar(
+        self,
+        start: datetime.datetime,
+        end: datetime.datetime,
+        interval: str = "day",
+        site: Optional[List[str]] = None,
+        host: Optional[List[str]] = None,
+        exclude_site: Optional[List[str]] = None,
+        exclude_host: Optional[List[str]] = None,
+    ) -> ResourceCalendar:
+        """
+        Fetch the resource availability calendar as arrays.
+
+        Unlike :py:meth:`resources_calendar`, which formats the calendar
+        for display, the returned :class:`ResourceCalendar` keeps the
+        available resources and capacities per slot, site or host and
+        resource as NumPy arrays for analysis (earliest windows,
+        utilization, export to pandas).
+
+        :param start: start of the calendar window (UTC)
+        :type start: datetime.datetime
+        :param end: end of the calendar window (UTC)
+        :type end: datetime.datetime
+        :param interval: time slot granularity: hour, day, or week
+        :type interval: str
+        :param site: list of site names to include
+        :type site: list[str]
+        :param host: list of host names to include
+        :type host: list[str]
+        :param exclude_site: list of site names to exclude
+        :type exclude_site: list[str]
+        :param exclude_host: list of host names to exclude
+        :type exclude_host: list[str]
+        :return: the calendar
+        :rtype: ResourceCalendar
+        """
         if start and end and start >= end:
             raise ValueError("start must be before end")
 
@@ -1648,15 +1826,51 @@ Host * !bastion.fabric-testbed.net
             exclude_site=exclude_site,
             exclude_host=exclude_host,
         )
+        return ResourceCalendar(calendar_data)
 
-        return Utils.show_calendar(
-            calendar_data,
-            show=show,
-            fields=fields,
-            output=output,
-            quiet=quiet,
-            filter_function=filter_function,
+    def get_slot_finder(
+        self,
+        start: datetime.datetime,
+        end: datetime.datetime,
+        site: Optional[List[str]] = None,
+        exclude_site: Optional[List[str]] = None,
+    ) -> SlotFinder:
+        """
+        Fetch an hourly resources calendar once and search it locally.
+
+        The returned :class:`SlotFinder` answers
+        :py:meth:`find_resource_slot` style queries (varying duration, sites
+        or components) without contacting the orchestrator; use
+        :py:meth:`SlotFinder.confirm` to check the slot finally chosen.
+
+        :param start: start of the search window (UTC)
+        :type start: datetime.datetime
+        :param end: end of the search window (UTC)
+        :type end: datetime.datetime
+        :param site: list of site names to include
+        :type site: list[str]
+        :param exclude_site: list of site names to exclude
+        :type exclude_site: list[str]
+        :return: the slot finder
+        :rtype: SlotFinder
+        """
+        if start and end and start >= end:
+            raise ValueError("start must be before end")
+
+        if start and end and (end - start) < datetime.timedelta(minutes=60):
+            raise Exception("Time range should be at least 60 minutes long!")
+
+        if start and end and (end - start).days > 30:
+            raise Exception("Search range must not exceed 30 days")
+
+        calendar_data = self.get_manager().resources_calendar(
+            start=start,
+            end=end,
+            interval="hour",
+            site=site,
+            exclude_site=exclude_site,
         )
+        return SlotFinder(calendar_data)
 
     def get_random_site(
         self,
@@ -1755,6 +1969,119 @@ Host * !bastion.fabric-testbed.net
                 rtn_sites.append(None)
         return rtn_sites
 
+    def get_capacity_ledger(
+        self,
+        update: bool = False,
+        placement=None,
+    ) -> CapacityLedger:
+        """
+        Get a ledger for planning several draft slices against one
+        resources snapshot.
+
+        Each slice reserved in the ledger is validated against the
+        resources left by the slices reserved before it, so slices planned
+        together cannot jointly oversubscribe a site (see
+        :class:`CapacityLedger`).
+
+        :param update: fetch the latest resources first
+        :type update: bool
+        :param placement: engine assigning nodes to hosts; best-fit
+            decreasing by default
+        :type placement: PlacementEngine
+        :return: an empty ledger
+        :rtype: CapacityLedger
+        """
+        return CapacityLedger(
+            self.get_resources(update=update),
+            project_tags=self.get_project_tags(),
+            placement=placement,
+        )
+
+    def suggest_sites(
+        self,
+        slice: Slice,
+        nodes: Optional[List[str]] = None,
+        count: int = 3,
+        sites: Optional[List[str]] = None,
+        avoid: Optional[List[str]] = None,
+        update: bool = False,
+        max_steps: int = 100000,
+    ) -> List[Dict[str, Any]]:
+        """
+        Suggest sites for the nodes of a draft slice.
+
+        Unlike :py:meth:`get_random_sites`, sites are chosen for all nodes
+        together: nodes must fit on the hosts and in the available
+        resources of their sites, nodes on a layer 2 bridge share a site,
+        and the two sites of a layer 2 site-to-site network must be
+        connected by links with the requested bandwidth available.
+        Assignments are ranked by the smallest relative headroom they
+        leave (see :class:`SiteSelector`).
+
+        Example: ``best = fablib.suggest_sites(slice)[0]["sites"]`` then
+        ``slice.get_node(name).set_site(site)`` for each entry.
+
+        :param slice: the slice; it is not modified
+        :type slice: Slice
+        :param nodes: names of the nodes to choose sites for; by default
+            all nodes not pinned to a host.  Other nodes keep their site.
+        :type nodes: List[str]
+        :param count: number of assignments to return
+        :type count: int
+        :param sites: candidate sites; all active sites by default
+        :type sites: List[str]
+        :param avoid: sites not to choose, in addition to
+            :py:meth:`get_avoid`
+        :type avoid: List[str]
+        :param update: fetch the latest resources first
+        :type update: bool
+        :param max_steps: maximum number of partial assignments explored
+        :type max_steps: int
+        :return: ``{"sites": {node name: site}, "score": headroom}`` dicts,
+            best first; empty if no assignment is feasible
+        :rtype: List[Dict[str, Any]]
+        """
+        selector = SiteSelector(
+            self.get_resources(update=update),
+            sites=sites,
+            avoid=list(avoid or []) + list(self.get_avoid()),
+            max_steps=max_steps,
+        )
+
+        requests, fixed = [], {}
+        for node in slice.get_nodes():
+            name = node.get_name()
+            requests.append(PlacementRequest.from_node(node))
+            if (nodes is not None and name not in nodes) or (
+                nodes is None and node.get_host()
+            ):
+                fixed[name] = node.get_site()
+
+        node_names = {r.name for r in requests}
+        same_site, networks = [], []
+        for net in slice.get_network_services():
+            members = []
+            for iface in net.get_interfaces():
+                endpoint = iface.get_node()
+                name = endpoint.get_name()
+                if name not in node_names:
+                    # Facility port; its site is given
+                    fixed[name] = iface.get_site()
+                members.append(name)
+            net_type = str(net.get_type())
+            if net_type == "L2Bridge":
+                same_site.append(members)
+            elif net_type in ("L2PTP", "L2STS"):
+                networks.append((members, net.get_bandwidth() or 0))
+
+        return selector.suggest(
+            requests,
+            fixed=fixed,
+            same_site=same_site,
+            networks=networks,
+            count=count,
+        )
+
     def probe_bastion_host(self) -> Optional[bool]:
         """
         See if bastion will admit us with our configuration.
@@ -1902,6 +2229,7 @@ Host * !bastion.fabric-testbed.net
         end: Optional[datetime] = None,
         avoid: Optional[List[str]] = None,
         includes: Optional[List[str]] = None,
+        max_age: Optional[float] = None,
     ) -> ResourcesV2:
         """
         Get the available resources.
@@ -1928,6 +2256,10 @@ Host * !bastion.fabric-testbed.net
         :param includes: list of sites to include
         :type: list of string
 
+        :param max_age: with the resources cache enabled, serve summaries
+            cached up to this many seconds ago; ``0`` requires a fresh one
+        :type max_age: float
+
         :return: Available ResourcesV2Wrapper object
         """
         if start and end and (end - start) < datetime.timedelta(minutes=60):
@@ -1941,6 +2273,7 @@ Host * !bastion.fabric-testbed.net
                 end=end,
                 avoid=avoid,
                 includes=includes,
+                max_age=max_age,
             )
         elif update:
             self.resources.update(
@@ -1949,6 +2282,7 @@ Host * !bastion.fabric-testbed.net
                 end=end,
                 avoid=avoid,
                 includes=includes,
+                max_age=max_age,
             )
 
         return self.resources
@@ -1997,16 +2331,21 @@ Host * !bastion.fabric-testbed.net
         :type pretty_names: bool
         :param user_only: True indicates return own slices; False indicates return project slices
         :type user_only: bool
-        :param show_un_submitted: True indicates to also show unsubmitted slices
+        :param show_un_submitted: True indicates to also show the unsubmitted
+            slices created by this manager
         :type show_un_submitted: bool
         :rtype: Object
         """
         table = []
-        for slice in self.get_slices(
-            excludes=excludes, user_only=user_only, show_un_submitted=show_un_submitted
-        ):
+        # Listing only needs slice metadata; lazy handles avoid fetching topologies
+        for slice in self.iter_slices(excludes=excludes, user_only=user_only):
             table.append(slice.toDict())
 
+        if show_un_submitted:
+            for slice in self.__slice_cache.slices():
+                if not slice.get_slice_id():
+                    table.append(slice.toDict())
+
         if pretty_names:
             pretty_names_dict = Slice.get_pretty_names_dict()
         else:
@@ -2125,17 +2464,14 @@ Host * !bastion.fabric-testbed.net
             return_slices = [existing_slice]
             return return_slices
 
-        excludes_states = []
-        for exclude in excludes:
-            excludes_states.append(str(exclude))
-
-        slices = self.get_manager().list_slices(
-            exclude_states=excludes_states,
-            name=slice_name,
-            slice_id=slice_id,
-            limit=200,
-            as_self=user_only,
-            return_fmt="dto",
+        return_slices = list(
+            self.iter_slices(
+                excludes=excludes,
+                slice_name=slice_name,
+                slice_id=slice_id,
+                user_only=user_only,
+                lazy=False,
+            )
         )
 
         if self.get_log_level() == logging.DEBUG:
@@ -2144,12 +2480,108 @@ Host * !bastion.fabric-testbed.net
                 f"Running self.get_slice_manager().slices(): elapsed time: {end - start} seconds"
             )
 
-        return_slices = []
-        for slice in slices:
-            slice_object = Slice.get_slice(self, sm_slice=slice, user_only=user_only)
-            return_slices.append(slice_object)
         return return_slices
 
+    def iter_slices(
+        self,
+        excludes: Optional[List[SliceState]] = None,
+        slice_name: Optional[str] = None,
+        slice_id: Optional[str] = None,
+        user_only: Optional[bool] = True,
+        page_size: int = 200,
+        lazy: bool = True,
+    ):
+        """
+        Iterates over all slices known to the orchestrator, one page at a time.
+
+        Slice metadata is requested without graph models, and the next page
+        is fetched in the background while the current one is consumed, so
+        walking thousands of slices is not limited by a single page size.
+
+        By default the yielded slices are lightweight handles: their
+        topology and slivers are only fetched from the orchestrator the
+        first time they are accessed (e.g. via ``get_nodes()``).  Metadata
+        such as name, state and lease times is available immediately.
+
+        :param excludes: A list of slice states to exclude.
+            Defaults to [SliceState.Dead, SliceState.Closing].
+        :type excludes: List[SliceState]
+        :param slice_name: Filter by slice name
+        :type slice_name: str
+        :param slice_id: Filter by slice ID
+        :type slice_id: str
+        :param user_only: True indicates return own slices; False indicates return project slices
+        :type user_only: bool
+        :param page_size: number of slices requested per orchestrator call
+        :type page_size: int
+        :param lazy: True to defer loading topology and slivers until
+            accessed; False to load them before each slice is yielded
+        :type lazy: bool
+        :return: generator of slices
+        :rtype: Iterator[Slice]
+        """
+        if excludes is None:
+            excludes = [SliceState.Dead, SliceState.Closing]
+        if page_size < 1:
+            raise ValueError("page_size must be at least 1")
+
+        for sm_slice in self._iter_slice_dtos(
+            excludes=excludes,
+            slice_name=slice_name,
+            slice_id=slice_id,
+            user_only=user_only,
+            page_size=page_size,
+        ):
+            yield Slice.get_slice(
+                self, sm_slice=sm_slice, user_only=user_only, lazy=lazy
+            )
+
+    def _iter_slice_dtos(
+        self,
+        excludes: List[SliceState],
+        slice_name: Optional[str] = None,
+        slice_id: Optional[str] = None,
+        user_only: bool = True,
+        page_size: int = 200,
+    ):
+        """
+        Not intended for API use.
+
+        Generator over slice metadata (without graph models) from the
+        orchestrator, prefetching the next page in the background.
+        """
+        excludes_states = [str(exclude) for exclude in excludes]
+        manager = self.get_manager()
+
+        def fetch_page(offset: int) -> List:
+            return manager.list_slices(
+                exclude_states=excludes_states,
+                name=slice_name,
+                slice_id=slice_id,
+                graph_format="NONE",
+                limit=page_size,
+                offset=offset,
+                as_self=user_only,
+                return_fmt="dto",
+            )
+
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            offset = 0
+            future = executor.submit(fetch_page, offset)
+            while future is not None:
+                page = future.result()
+                if not page:
+                    break
+
+                offset += len(page)
+                # Fewer results than requested means this was the last page
+                if len(page) < page_size:
+                    future = None
+                else:
+                    future = executor.submit(fetch_page, offset)
+
+                yield from page
+
     def get_slice(
         self,
         name: str = None,
@@ -2381,19 +2813,552 @@ Host * !bastion.fabric-testbed.net
         :param progress: optional progress printing to stdout
         :type progress: Bool
         """
-        slices = self.get_slices(show_un_submitted=True)
+        slices = list(self.iter_slices())
+        results = self.delete_slices(slices)
 
+        if progress:
+            for slice_obj in slices:
+                error = results.get(self._slice_key(slice_obj))
+                status = "Failed!" if error else "Success!"
+                print(f"Deleting slice {slice_obj.get_name()}, {status}")
+
+    def delete_slices(
+        self,
+        slices: List[Union[Slice, str]],
+        max_workers: int = 8,
+        wait: bool = False,
+        timeout: int = 360,
+        interval: int = 10,
+        progress: bool = False,
+    ) -> Dict[str, Optional[Exception]]:
+        """
+        Deletes several slices concurrently.
+
+        Delete requests are issued on a bounded thread pool.  A failure to
+        delete one slice does not stop the others; it is reported in the
+        returned dictionary instead.
+
+        If ``wait`` is True, a single poller lists the remaining slices
+        every ``interval`` seconds until all deleted slices are ``Dead``
+        or ``timeout`` is reached.
+
+        :param slices: slices to delete, as Slice objects or slice names
+        :type slices: List[Union[Slice, str]]
+        :param max_workers: maximum number of concurrent delete requests
+        :type max_workers: int
+        :param wait: wait for the slices to reach the Dead state
+        :type wait: bool
+        :param timeout: how many seconds to wait
+        :type timeout: int
+        :param interval: how often in seconds to poll the slice states
+        :type interval: int
+        :param progress: print wait progress
+        :type progress: bool
+        :return: dictionary mapping each slice ID (or name, for slices
+            without an ID) to ``None`` on success or the exception raised
+            for that slice
+        :rtype: Dict[str, Optional[Exception]]
+        """
+        slice_objects, results = self._resolve_slices(slices)
+
+        def delete(slice_obj: Slice):
+            slice_obj.delete()
+            self.remove_slice_from_cache(slice_obj)
+
+        results.update(
+            self._run_on_slices(delete, slice_objects, max_workers=max_workers)
+        )
+
+        if wait:
+            pending = {
+                s.get_slice_id(): s
+                for s in slice_objects
+                if s.get_slice_id() and results.get(self._slice_key(s)) is None
+            }
+            results.update(
+                self._wait_for_slices(
+                    pending,
+                    # Dead slices are excluded from the listing
+                    is_done=lambda slice_obj, sm_slice: sm_slice is None,
+                    excludes=[SliceState.Dead],
+                    timeout=timeout,
+                    interval=interval,
+                    progress=progress,
+                )
+            )
+
+        return results
+
+    def renew_slices(
+        self,
+        slices: List[Union[Slice, str]],
+        end_date: str = None,
+        days: int = None,
+        max_workers: int = 8,
+        wait: bool = False,
+        timeout: int = 360,
+        interval: int = 10,
+        progress: bool = False,
+    ) -> Dict[str, Optional[Exception]]:
+        """
+        Renews the leases of several slices concurrently.
+
+        Unlike :py:meth:`Slice.renew`, this issues only the renew request
+        for each slice (no slice submit/update round trips), on a bounded
+        thread pool.  A failure to renew one slice does not stop the
+        others; it is reported in the returned dictionary instead.
+
+        Date is in UTC and of the form: "%Y-%m-%d %H:%M:%S %z"
+
+        If ``wait`` is True, a single poller lists the slices every
+        ``interval`` seconds until each reports the requested lease end
+        time (or a lease end the orchestrator changed otherwise, e.g.
+        capped to the maximum lease) or ``timeout`` is reached.
+
+        :param slices: slices to renew, as Slice objects or slice names
+        :type slices: List[Union[Slice, str]]
+        :param end_date: new lease end date
+        :type end_date: str
+        :param days: number of days from now for the new lease end
+        :type days: int
+        :param max_workers: maximum number of concurrent renew requests
+        :type max_workers: int
+        :param wait: wait for all slices to report the new lease end time
+        :type wait: bool
+        :param timeout: how many seconds to wait
+        :type timeout: int
+        :param interval: how often in seconds to poll the slice states
+        :type interval: int
+        :param progress: print wait progress
+        :type progress: bool
+        :return: dictionary mapping each slice ID (or name, for slices
+            without an ID) to ``None`` on success or the exception raised
+            for that slice
+        :rtype: Dict[str, Optional[Exception]]
+        :raises ValidationError: if neither end_date nor days is specified
+        """
+        if end_date is None and days is None:
+            raise ValidationError("Either end_date or days must be specified!")
+
+        if end_date is not None:
+            # Validate the format once rather than per slice
+            datetime.datetime.strptime(end_date, Constants.LEASE_TIME_FORMAT)
+            lease_end_time = end_date
+        else:
+            lease_end_time = (
+                datetime.datetime.now(datetime.timezone.utc)
+                + datetime.timedelta(days=days)
+            ).strftime(Constants.LEASE_TIME_FORMAT)
+
+        slice_objects, results = self._resolve_slices(slices)
+        requested_end = self._parse_lease_time(lease_end_time)
+        previous_ends = {
+            self._slice_key(s): self._parse_lease_time(s.get_lease_end())
+            for s in slice_objects
+        }
+        manager = self.get_manager()
+
+        def renew(slice_obj: Slice):
+            if not slice_obj.get_slice_id():
+                raise SliceStateError(
+                    f"Slice {slice_obj.get_name()} has not been submitted"
+                )
+            manager.renew_slice(
+                slice_id=slice_obj.get_slice_id(), lease_end_time=lease_end_time
+            )
+
+        results.update(
+            self._run_on_slices(renew, slice_objects, max_workers=max_workers)
+        )
+
+        def renewed(slice_obj: Slice, sm_slice) -> bool:
+            if sm_slice is None:
+                return False
+            lease_end = self._parse_lease_time(sm_slice.lease_end_time)
+            return lease_end == requested_end or (
+                lease_end != previous_ends[self._slice_key(slice_obj)]
+            )
+
+        if wait:
+            pending = {
+                s.get_slice_id(): s
+                for s in slice_objects
+                if results.get(self._slice_key(s)) is None
+            }
+            results.update(
+                self._wait_for_slices(
+                    pending,
+                    is_done=renewed,
+                    excludes=[SliceState.Dead, SliceState.Closing],
+                    timeout=timeout,
+                    interval=interval,
+                    progress=progress,
+                )
+            )
+
+        return results
+
+    def submit_slices(
+        self,
+        slices: List[Slice],
+        wait: bool = True,
+        wait_timeout: int = 1800,
+        wait_interval: int = 20,
+        progress: bool = True,
+        post_boot_config: bool = True,
+        wait_ssh: bool = True,
+        extra_ssh_keys: List[str] = None,
+        lease_start_time: datetime.datetime = None,
+        lease_end_time: datetime.datetime = None,
+        lease_in_hours: int = None,
+        validate: bool = False,
+        max_workers: int = 8,
+    ) -> Dict[str, Optional[Exception]]:
+        """
+        Submits several new slices concurrently.
+
+        This is the bulk equivalent of calling :py:meth:`Slice.submit` on
+        each slice:
+
+        - if ``validate`` is True, all slices are validated against a single
+          resources snapshot, so nodes of different slices cannot claim the
+          same host capacity; the slices' sites are re-fetched if the
+          snapshot came from the resources cache;
+        - create requests are issued on a bounded thread pool;
+        - if ``wait`` is True, one poller waits for all slices to become
+          stable, then each slice is driven through SSH checks and post boot
+          configuration on the same bounded pool.
+
+        Progress is reported as one line per phase and one line per
+        finished slice.  A failure of one slice does not stop the others;
+        it is reported in the returned dictionary instead.
+
+        :param slices: new slices to submit
+        :type slices: List[Slice]
+        :param wait: wait for the slices' resources to be active
+        :type wait: bool
+        :param wait_timeout: how many seconds to wait on the slice resources
+        :type wait_timeout: int
+        :param wait_interval: how often to check on the slice resources
+        :type wait_interval: int
+        :param progress: print progress
+        :type progress: bool
+        :param post_boot_config: run post boot configuration
+        :type post_boot_config: bool
+        :param wait_ssh: wait for all nodes to be accessible via ssh
+        :type wait_ssh: bool
+        :param extra_ssh_keys: Optional list of additional SSH public keys
+        :type extra_ssh_keys: List[str]
+        :param lease_start_time: Optional lease start time
+        :type lease_start_time: datetime
+        :param lease_end_time: Optional lease end time
+        :type lease_end_time: datetime
+        :param lease_in_hours: Optional lease duration in hours
+        :type lease_in_hours: int
+        :param validate: Validate nodes can be allocated w.r.t available resources
+        :type validate: bool
+        :param max_workers: maximum number of slices processed concurrently
+        :type max_workers: int
+        :return: dictionary mapping each slice ID (or name, for slices that
+            were not created) to ``None`` on success or the exception raised
+            for that slice
+        :rtype: Dict[str, Optional[Exception]]
+        """
+        import copy
+        import time
+
+        results = {}
+        deadline = time.time() + wait_timeout
+
+        # When no_ssh is set, force SSH-dependent options off
+        if self.get_no_ssh():
+            wait_ssh = False
+            post_boot_config = False
+
+        pending = list(slices)
+
+        if validate:
+            resources = self.get_resources()
+            # Validate against current resources, not a cached summary
+            cached = [
+                site
+                for site in dict.fromkeys(
+                    node.get_site() for s in pending for node in s.get_nodes()
+                )
+                if resources.is_from_cache(site)
+            ]
+            if cached:
+                resources.refresh_sites(cached)
+            allocated = {}
+            valid = []
+            for slice_obj in pending:
+                # Only commit the allocations of slices that validate
+                trial = copy.deepcopy(allocated)
+                try:
+                    slice_obj.validate(resources=resources, allocated=trial)
+                    allocated = trial
+                    valid.append(slice_obj)
+                except Exception as e:
+                    results[self._slice_key(slice_obj)] = e
+            pending = valid
+
+        def create(slice_obj: Slice):
+            slice_obj.submit(
+                wait=False,
+                progress=False,
+                post_boot_config=False,
+                wait_ssh=False,
+                extra_ssh_keys=extra_ssh_keys,
+                lease_start_time=lease_start_time,
+                lease_end_time=lease_end_time,
+                lease_in_hours=lease_in_hours,
+            )
+
+        if progress:
+            print(f"Submitting {len(pending)} slices ... ", end="")
+        submitted = self._run_on_slices(create, pending, max_workers=max_workers)
+        results.update(submitted)
+        pending = [s for s in pending if submitted[self._slice_key(s)] is None]
+        if progress:
+            print(f"{len(pending)} submitted")
+
+        if not wait or not pending:
+            return results
+
+        stable_states = ("StableOK", "ModifyOK", "StableError", "ModifyError")
+        waited = self._wait_for_slices(
+            {s.get_slice_id(): s for s in pending},
+            # Slices missing from the listing went to Closing/Dead
+            is_done=lambda slice_obj, sm_slice: sm_slice is None
+            or sm_slice.state in stable_states,
+            excludes=[SliceState.Dead, SliceState.Closing],
+            timeout=wait_timeout,
+            interval=wait_interval,
+            progress=progress,
+        )
+        results.update(waited)
+        pending = [s for s in pending if waited[self._slice_key(s)] is None]
+
+        if wait_ssh and pending:
+            self.probe_bastion_host()
+
+        def finish(slice_obj: Slice):
+            slice_obj.update()
+            if slice_obj.get_state() not in ("StableOK", "ModifyOK"):
+                try:
+                    exception_string = slice_obj.build_error_exception_string()
+                except Exception:
+                    exception_string = "Exception while getting error messages"
+                raise SliceStateError(
+                    str(exception_string), payload=slice_obj.get_error_messages()
+                )
+
+            if wait_ssh:
+                while not slice_obj.test_ssh():
+                    if time.time() >= deadline:
+                        raise SliceTimeoutError(
+                            f"Timeout exceeded ({wait_timeout} sec) waiting for ssh. "
+                            f"Slice: {slice_obj.get_name()}"
+                        )
+                    time.sleep(wait_interval)
+                    slice_obj.update()
+
+            if post_boot_config and not slice_obj.is_advanced_allocation():
+                slice_obj.post_boot_config(progress=False)
+
+            if progress:
+                print(f"Slice {slice_obj.get_name()}, Done!")
+
+        if progress and pending:
+            print(f"Configuring {len(pending)} slices ...")
+        configured = self._run_on_slices(finish, pending, max_workers=max_workers)
+        results.update(configured)
+
+        if progress:
+            for slice_obj in pending:
+                error = configured.get(self._slice_key(slice_obj))
+                if error:
+                    print(f"Slice {slice_obj.get_name()}, Failed! {error}")
+            failed = sum(1 for error in results.values() if error)
+            print(f"Done! {len(results) - failed} succeeded, {failed} failed")
+
+        return results
+
+    def _resolve_slices(
+        self, slices: List[Union[Slice, str]]
+    ) -> Tuple[List[Slice], Dict[str, Optional[Exception]]]:
+        """
+        Not intended for API use.
+
+        Maps a list of Slice objects and/or slice names to Slice objects.
+        Names are looked up in the slice cache first, then with a single
+        paged listing of the remaining names.
+
+        :return: the resolved slices, and a dictionary of errors for names
+            that could not be found
+        """
+        slice_objects = []
+        errors = {}
+        unresolved = []
         for slice_obj in slices:
-            try:
-                if progress:
-                    print(f"Deleting slice {slice_obj.get_name()}", end="")
-                slice_obj.delete()
-                self.remove_slice_from_cache(slice_obj)
-                if progress:
-                    print(", Success!")
-            except Exception as e:
-                if progress:
-                    print(", Failed!")
+            if isinstance(slice_obj, Slice):
+                slice_objects.append(slice_obj)
+                continue
+            cached = self._get_slice_from_cache(slice_name=slice_obj)
+            if cached:
+                slice_objects.append(cached)
+            else:
+                unresolved.append(slice_obj)
+
+        if unresolved:
+            found = {}
+            wanted = set(unresolved)
+            for sm_slice in self._iter_slice_dtos(
+                excludes=[SliceState.Dead, SliceState.Closing]
+            ):
+                if sm_slice.name in wanted and sm_slice.name not in found:
+                    found[sm_slice.name] = sm_slice
+            for slice_name in unresolved:
+                if slice_name in found:
+                    slice_objects.append(
+                        Slice.get_slice(self, sm_slice=found[slice_name], lazy=True)
+                    )
+                else:
+                    errors[slice_name] = SliceNotFoundError(
+                        f"Slice not found: {slice_name}"
+                    )
+
+        return slice_objects, errors
+
+    @staticmethod
+    def _slice_key(slice_obj: Slice) -> str:
+        """
+        Not intended for API use.
+
+        Key of a slice in the results of bulk operations: its ID, as names
+        are not unique, or its name if it has no ID.
+        """
+        return slice_obj.get_slice_id() or slice_obj.get_name()
+
+    @staticmethod
+    def _parse_lease_time(lease_time) -> Optional[datetime.datetime]:
+        """
+        Not intended for API use.
+
+        Parse a lease time as returned by the orchestrator or passed to
+        renew, or return None if it cannot be parsed.
+        """
+        if isinstance(lease_time, datetime.datetime) or lease_time is None:
+            return lease_time
+        try:
+            return datetime.datetime.strptime(
+                str(lease_time), Constants.LEASE_TIME_FORMAT
+            )
+        except ValueError:
+            pass
+        try:
+            return datetime.datetime.fromisoformat(str(lease_time))
+        except ValueError:
+            return None
+
+    @staticmethod
+    def _run_on_slices(
+        func, slice_objects: List[Slice], max_workers: int
+    ) -> Dict[str, Optional[Exception]]:
+        """
+        Not intended for API use.
+
+        Runs ``func(slice)`` for every slice on a bounded thread pool and
+        collects ``None`` or the raised exception per slice, keyed as by
+        :py:meth:`_slice_key` once ``func`` has returned.
+        """
+        results = {}
+        if not slice_objects:
+            return results
+
+        with ThreadPoolExecutor(
+            max_workers=max(1, min(max_workers, len(slice_objects)))
+        ) as executor:
+            futures = {
+                executor.submit(func, slice_obj): slice_obj
+                for slice_obj in slice_objects
+            }
+            for future in concurrent.futures.as_completed(futures):
+                slice_obj = futures[future]
+                try:
+                    future.result()
+                    results[FablibManager._slice_key(slice_obj)] = None
+                except Exception as e:
+                    log.error(f"Operation failed for slice {slice_obj.get_name()}: {e}")
+                    results[FablibManager._slice_key(slice_obj)] = e
+
+        return results
+
+    def _wait_for_slices(
+        self,
+        pending: Dict[str, Slice],
+        is_done,
+        excludes: List[SliceState],
+        timeout: int,
+        interval: int,
+        progress: bool = False,
+    ) -> Dict[str, Optional[Exception]]:
+        """
+        Not intended for API use.
+
+        Polls the state of several slices with one paged listing per
+        interval instead of one request per slice.
+
+        :param pending: slices to wait on keyed by slice ID
+        :param is_done: callable ``(slice, sm_slice)`` returning True once a
+            slice is done; ``sm_slice`` is None if the slice was not listed
+        :return: ``None`` per finished slice ID, ``SliceTimeoutError``
+            for slices still pending at the timeout
+        """
+        import time
+
+        results = {}
+        pending = dict(pending)
+        user_only = all(s.user_only for s in pending.values())
+        deadline = time.time() + timeout
+
+        if progress and pending:
+            print(f"Waiting for {len(pending)} slices .", end="")
+
+        while pending:
+            current = {
+                sm_slice.slice_id: sm_slice
+                for sm_slice in self._iter_slice_dtos(
+                    excludes=excludes, user_only=user_only
+                )
+            }
+            for slice_id, slice_obj in list(pending.items()):
+                sm_slice = current.get(slice_id)
+                if is_done(slice_obj, sm_slice):
+                    if sm_slice is not None:
+                        slice_obj.sm_slice = sm_slice
+                    results[slice_id] = None
+                    del pending[slice_id]
+
+            if not pending:
+                break
+
+            if time.time() >= deadline:
+                for slice_id, slice_obj in pending.items():
+                    results[slice_id] = SliceTimeoutError(
+                        f"Timeout exceeded ({timeout} sec). Slice: "
+                        f"{slice_obj.get_name()} ({slice_obj.get_slice_id()})"
+                    )
+                break
+
+            if progress:
+                print(".", end="")
+            time.sleep(interval)
+
+        if progress and results:
+            print(" Done!")
+
+        return results
 
     def get_project_tags(self) -> frozenset:
         """Return the set of permission tags for the current project from the token.
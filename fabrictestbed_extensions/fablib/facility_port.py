@@ -332,16 +332,46 @@ class FacilityPort(TemplateMixin):
         :type fim_node: FimNode
         """
         if fim_node:
-            self.fim_object = fim_node
-            self._invalidate_cache()
-            try:
-                self.get_interfaces(refresh=True)
-            except Exception as e:
-                log.debug(
-                    f"FacilityPort {self.get_name()}: error refreshing "
-                    f"caches during update: {e}"
-                )
-            self._fim_dirty = False
+            self._apply_update(self._prepare_update(fim_node))
+
+    def _prepare_update(self, fim_node: FimNode) -> tuple:
+        """
+        Build the interfaces of a new FIM node without modifying this
+        facility port; see :py:meth:`_apply_update`.
+
+        :param fim_node: the new FIM node
+        :type fim_node: FimNode
+        :return: state for :py:meth:`_apply_update`
+        :rtype: tuple
+        """
+        from fabrictestbed_extensions.fablib.interface import Interface
+
+        interfaces = {}
+        try:
+            for iface in fim_node.interfaces.values():
+                interface = Interface(fim_interface=iface, node=self)
+                interfaces[interface.get_name()] = interface
+        except Exception as e:
+            log.debug(
+                f"FacilityPort {self.get_name()}: error refreshing "
+                f"caches during update: {e}"
+            )
+            interfaces = {}
+        return fim_node, interfaces
+
+    def _apply_update(self, state: tuple):
+        """
+        Point this facility port at the FIM node prepared by
+        :py:meth:`_prepare_update`, replacing its caches by assignment.
+
+        :param state: state returned by :py:meth:`_prepare_update`
+        :type state: tuple
+        """
+        fim_node, interfaces = state
+        self.fim_object = fim_node
+        self._invalidate_cache()
+        self._interfaces_cache = interfaces
+        self._fim_dirty = False
 
     def delete(self):
         """
@@ -35,7 +35,7 @@ import logging
 import re
 import warnings
 from ipaddress import IPv4Address, IPv6Address
-from typing import TYPE_CHECKING, Any, List, Optional, Union
+from typing import TYPE_CHECKING, Any, Callable, List, Optional, Union
 
 from fabrictestbed.slice_editor import Flags
 from fim.user import Capacities, InterfaceType, Labels
@@ -71,6 +71,32 @@ class Interface(TemplateMixin):
     ADDR = "addr"
     CONFIG = "config"
 
+    __slots__ = (
+        "fim_interface",
+        "component",
+        "network",
+        "dev",
+        "node",
+        "model",
+        "interfaces",
+        "parent",
+        "_cached_mac",
+        "_cached_vlan",
+        "_cached_bandwidth",
+        "_cached_site",
+        "_cached_physical_os_interface",
+        "_cached_switch_port",
+        "_cached_flag",
+        "_cached_peer_port_name",
+        "_cached_fim_type",
+        "_cached_peer_account_id",
+        "_cached_peer_bgp_key",
+        "_cached_peer_asn",
+        "_cached_peer_subnet",
+        "_cached_subnet",
+        "_cached_peer_port_vlan",
+    )
+
     def __init__(
         self,
         component: Component = None,
@@ -224,86 +250,74 @@ class Interface(TemplateMixin):
             "switch_port": "Switch Port",
         }
 
-    def toDict(self, skip: Optional[List[str]] = None) -> dict[str, str]:
+    def _active_dict_value(self, getter: Callable[[], Any], ssh: bool = False) -> str:
+        """
+        Value of a ``toDict()`` column that is only known once the node is
+        active.
+
+        :param getter: method returning the value
+        :type getter: Callable
+        :param ssh: True if the value is read from the node over SSH
+        :type ssh: bool
+        :return: the value, or an empty string
+        :rtype: str
+        """
+        from fabrictestbed_extensions.fablib.node import Node
+
+        node = self.get_node()
+        if not (
+            node
+            and isinstance(node, Node)
+            and str(node.get_reservation_state()) == "Active"
+        ):
+            return ""
+        if ssh:
+            fablib_mgr = self.get_fablib_manager()
+            if fablib_mgr and fablib_mgr.get_no_ssh():
+                return ""
+        return str(getter())
+
+    # Columns of toDict(), computed on demand (see TemplateMixin._columns_dict)
+    _dict_columns = {
+        "name": lambda iface: str(iface.get_name()),
+        "short_name": lambda iface: str(iface.get_short_name()),
+        "node": lambda iface: (
+            str(iface.get_node().get_name()) if iface.get_node() else "None"
+        ),
+        "network": lambda iface: (
+            str(iface.get_network().get_name()) if iface.get_network() else "None"
+        ),
+        "bandwidth": lambda iface: str(iface.get_bandwidth()),
+        "mode": lambda iface: str(iface.get_mode()),
+        "vlan": lambda iface: str(iface.get_vlan()) if iface.get_vlan() else "",
+        "mac": lambda iface: iface._active_dict_value(iface.get_mac),
+        "physical_dev": lambda iface: iface._active_dict_value(
+            iface.get_physical_os_interface_name, ssh=True
+        ),
+        "dev": lambda iface: iface._active_dict_value(iface.get_device_name, ssh=True),
+        "ip_addr": lambda iface: iface._active_dict_value(iface.get_ip_addr, ssh=True),
+        "numa": lambda iface: iface._active_dict_value(iface.get_numa_node),
+        "switch_port": lambda iface: str(iface.get_switch_port()),
+    }
+
+    def toDict(
+        self, skip: Optional[List[str]] = None, fields: Optional[List[str]] = None
+    ) -> dict[str, str]:
         """
         Returns the interface attributes as a dictionary.
 
-        Results are cached. Cache is invalidated when ``_invalidate_cache()``
-        is called.
+        Only the requested attributes are computed; attributes read over
+        SSH are not read unless requested. Results are cached. Cache is
+        invalidated when ``_invalidate_cache()`` is called.
 
         :param skip: list of keys to exclude
         :type skip: List[str]
+        :param fields: list of keys to include; all by default
+        :type fields: List[str]
         :return: interface attributes as dictionary
         :rtype: dict
         """
-        if skip is None:
-            skip = []
-
-        if self._cached_dict is None:
-            if self.get_network():
-                log.info(
-                    f"Getting results from get network name thread for iface {self.get_name()} "
-                )
-                network_name = self.get_network().get_name()
-            else:
-                network_name = None
-
-            if self.get_node():
-                log.info(
-                    f"Getting results from get node name thread for iface {self.get_name()} "
-                )
-                node_name = self.get_node().get_name()
-            else:
-                node_name = None
-
-            from fabrictestbed_extensions.fablib.node import Node
-
-            no_ssh = False
-            fablib_mgr = self.get_fablib_manager()
-            if fablib_mgr:
-                no_ssh = fablib_mgr.get_no_ssh()
-
-            if (
-                self.get_node()
-                and isinstance(self.get_node(), Node)
-                and str(self.get_node().get_reservation_state()) == "Active"
-            ):
-                mac = str(self.get_mac())
-                if no_ssh:
-                    physical_dev = ""
-                    dev = ""
-                    ip_addr = ""
-                else:
-                    physical_dev = str(self.get_physical_os_interface_name())
-                    dev = str(self.get_device_name())
-                    ip_addr = str(self.get_ip_addr())
-                numa = str(self.get_numa_node())
-            else:
-                mac = ""
-                physical_dev = ""
-                dev = ""
-                ip_addr = ""
-                numa = ""
-
-            d = {}
-            d["name"] = str(self.get_name())
-            d["short_name"] = str(self.get_short_name())
-            d["node"] = str(node_name)
-            d["network"] = str(network_name)
-            d["bandwidth"] = str(self.get_bandwidth())
-            d["mode"] = str(self.get_mode())
-            d["vlan"] = str(self.get_vlan()) if self.get_vlan() else ""
-            d["mac"] = mac
-            d["physical_dev"] = physical_dev
-            d["dev"] = dev
-            d["ip_addr"] = ip_addr
-            d["numa"] = numa
-            d["switch_port"] = str(self.get_switch_port())
-            self._cached_dict = d
-
-        if not skip:
-            return dict(self._cached_dict)
-        return {k: v for k, v in self._cached_dict.items() if k not in skip}
+        return self._columns_dict(skip=skip, fields=fields)
 
     def get_switch_port(self) -> Optional[str]:
         """
@@ -933,15 +947,68 @@ class Interface(TemplateMixin):
             if dev is None:
                 return addrs
 
-            for addr in addrs:
-                if addr["ifname"] == dev:
-                    return str(ipaddress.ip_address(addr["addr_info"][0]["local"]))
-
-            return None
+            return self._find_ip_addr(addrs, dev)
         except Exception as e:
             log.warning(f"{e}")
             return None
 
+    @staticmethod
+    def _find_ip_addr(addrs: List[dict], dev: str) -> Optional[str]:
+        """
+        Find the first IP address of a device in ``ip -j addr list`` output.
+
+        :param addrs: parsed ``ip -j addr list`` output
+        :type addrs: List[dict]
+        :param dev: device name
+        :type dev: str
+        :return: the address, or None if the device is not found
+        :rtype: Optional[str]
+        """
+        for addr in addrs:
+            if addr["ifname"] == dev:
+                return str(ipaddress.ip_address(addr["addr_info"][0]["local"]))
+        return None
+
+    def _discover(self, addrs: Optional[List[dict]]):
+        """
+        Not intended for API use.
+
+        Resolve the OS device names and the IP address of this interface
+        from its node's ``ip -j addr list`` output, without further SSH
+        calls, and cache them as ``toDict()`` columns.  See
+        :py:meth:`Node.discover_interfaces`.
+
+        :param addrs: parsed ``ip -j addr list`` output of the node, or
+            None if it could not be read
+        :type addrs: Optional[List[dict]]
+        """
+        if addrs is not None and not self.dev:
+            mac = self.get_mac().upper()
+            for dev in addrs:
+                if mac and str(dev.get("address", "")).upper() == mac:
+                    self.dev = dev
+                    break
+
+        physical_dev = ""
+        if self.dev or self._cached_physical_os_interface:
+            physical_dev = self.get_physical_os_interface_name()
+
+        fablib_data = self.get_fablib_data()
+        dev = ""
+        if physical_dev or fablib_data.get("dev"):
+            dev = self.get_device_name()
+
+        if self.ADDR in fablib_data:
+            ip_addr = self.get_ip_addr()
+        elif addrs is not None and dev:
+            ip_addr = self._find_ip_addr(addrs, dev)
+        else:
+            ip_addr = None
+
+        self._cache_dict_columns(
+            physical_dev=str(physical_dev), dev=str(dev), ip_addr=str(ip_addr)
+        )
+
     # fablib.Interface.get_ip_addr()
     def get_ips(self, family=None):
         """
@@ -0,0 +1,239 @@
+#!/usr/bin/env python3
+# MIT License
+#
+# Copyright (c) 2020 FABRIC Testbed
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+"""
+IP address allocation for network services.
+
+:class:`IPAllocator` records allocated addresses as sorted, merged ranges
+of integers.  Finding the lowest free address is a binary search, and
+allocating sequential addresses only extends a range, so neither the size
+of the subnet (e.g. an IPv6 /64) nor the number of allocated addresses
+matters.  Ranges are persisted in fablib data as strings such as
+``"10.0.0.1-10.0.0.20"``.
+"""
+
+from __future__ import annotations
+
+import bisect
+import ipaddress
+from ipaddress import IPv4Address, IPv4Network, IPv6Address, IPv6Network
+from typing import Iterable, Iterator, List, Optional, Union
+
+from fabrictestbed_extensions.fablib.exceptions import FablibException
+
+IPAddress = Union[IPv4Address, IPv6Address]
+
+
+class IPAllocator:
+    """
+    Allocator of the host addresses of one subnet.
+
+    Addresses outside the subnet may be recorded as allocated too (e.g.
+    addresses requested explicitly), but are never handed out.
+    """
+
+    def __init__(self, subnet: Optional[Union[IPv4Network, IPv6Network]]):
+        """
+        :param subnet: subnet to allocate from; if None, only explicitly
+            requested addresses can be allocated
+        :type subnet: IPv4Network or IPv6Network
+        """
+        self.subnet = subnet
+        self._version = subnet.version if subnet is not None else None
+        if subnet is None:
+            self._low, self._high = 1, 0
+        else:
+            network = int(subnet.network_address)
+            broadcast = int(subnet.broadcast_address)
+            if subnet.num_addresses <= 2:
+                # /31, /32, /127 and /128: every address is a host address
+                self._low, self._high = network, broadcast
+            else:
+                self._low = network + 1
+                self._high = broadcast - 1 if subnet.version == 4 else broadcast
+        # Allocated ranges [start, end], sorted, disjoint and not adjacent
+        self._starts: List[int] = []
+        self._ends: List[int] = []
+
+    @classmethod
+    def from_ranges(
+        cls, subnet: Optional[Union[IPv4Network, IPv6Network]], ranges: Iterable[str]
+    ) -> IPAllocator:
+        """
+        Create an allocator from persisted ranges.
+
+        :param subnet: subnet to allocate from
+        :type subnet: IPv4Network or IPv6Network
+        :param ranges: ranges as returned by :py:meth:`to_ranges`; single
+            addresses are accepted too
+        :type ranges: Iterable[str]
+        :return: the allocator
+        :rtype: IPAllocator
+        """
+        allocator = cls(subnet)
+        for item in ranges:
+            first, _, last = str(item).partition("-")
+            first = ipaddress.ip_address(first)
+            allocator._version = allocator._version or first.version
+            start = int(first)
+            end = int(ipaddress.ip_address(last)) if last else start
+            allocator._add(start, end)
+        return allocator
+
+    def to_ranges(self) -> List[str]:
+        """
+        Allocated addresses as a compact list of ranges.
+
+        :return: ranges, e.g. ``["10.0.0.1-10.0.0.20", "10.0.0.31"]``
+        :rtype: List[str]
+        """
+        ranges = []
+        for start, end in zip(self._starts, self._ends):
+            first = self._address(start)
+            ranges.append(
+                str(first) if start == end else f"{first}-{self._address(end)}"
+            )
+        return ranges
+
+    def _address(self, value: int) -> IPAddress:
+        if self._version == 4:
+            return IPv4Address(value)
+        return IPv6Address(value)
+
+    def __len__(self) -> int:
+        return sum(end - start + 1 for start, end in zip(self._starts, self._ends))
+
+    def __iter__(self) -> Iterator[IPAddress]:
+        for start, end in zip(self._starts, self._ends):
+            for value in range(start, end + 1):
+                yield self._address(value)
+
+    def __contains__(self, addr: IPAddress) -> bool:
+        value = int(addr)
+        i = bisect.bisect_right(self._starts, value) - 1
+        return i >= 0 and self._ends[i] >= value
+
+    def _add(self, start: int, end: int):
+        """
+        Mark [start, end] allocated, merging with neighbouring ranges.
+        """
+        i = bisect.bisect_left(self._starts, start)
+        # Merge with a range on the left that overlaps or touches
+        if i > 0 and self._ends[i - 1] >= start - 1:
+            i -= 1
+            start = self._starts[i]
+        j = i
+        while j < len(self._starts) and self._starts[j] <= end + 1:
+            end = max(end, self._ends[j])
+            j += 1
+        self._starts[i:j] = [start]
+        self._ends[i:j] = [end]
+
+    def _lowest_free(self) -> Optional[int]:
+        candidate = self._low
+        i = bisect.bisect_right(self._starts, candidate) - 1
+        if i >= 0 and self._ends[i] >= candidate:
+            candidate = self._ends[i] + 1
+        return candidate if candidate <= self._high else None
+
+    def allocate(self, addr: Optional[IPAddress] = None) -> Optional[IPAddress]:
+        """
+        Allocate the given address, or the lowest free host address.
+
+        :param addr: address to allocate
+        :type addr: IPv4Address or IPv6Address
+        :return: the allocated address; None if ``addr`` is already
+            allocated or the subnet is full
+        :rtype: IPv4Address or IPv6Address
+        """
+        if addr is not None:
+            if addr in self:
+                return None
+            self._version = self._version or addr.version
+            self._add(int(addr), int(addr))
+            return addr
+
+        value = self._lowest_free()
+        if value is None:
+            return None
+        self._add(value, value)
+        return self._address(value)
+
+    def allocate_many(self, count: int) -> List[IPAddress]:
+        """
+        Allocate the ``count`` lowest free host addresses.
+
+        :param count: number of addresses
+        :type count: int
+        :raises FablibException: if fewer than ``count`` addresses are free;
+            nothing is allocated in that case
+        :return: the allocated addresses, in ascending order
+        :rtype: List[IPAddress]
+        """
+        gaps = []
+        needed = count
+        candidate = self._low
+        i = bisect.bisect_right(self._starts, candidate) - 1
+        if i >= 0 and self._ends[i] >= candidate:
+            candidate = self._ends[i] + 1
+        i += 1
+        while needed > 0 and candidate <= self._high:
+            gap_end = self._high
+            if i < len(self._starts):
+                gap_end = min(gap_end, self._starts[i] - 1)
+            take = min(needed, gap_end - candidate + 1)
+            if take > 0:
+                gaps.append((candidate, candidate + take - 1))
+                needed -= take
+            if i >= len(self._starts):
+                break
+            candidate = self._ends[i] + 1
+            i += 1
+
+        if needed > 0:
+            raise FablibException(
+                f"Cannot allocate {count} addresses in {self.subnet}: "
+                f"only {count - needed} free"
+            )
+
+        addresses = []
+        for start, end in gaps:
+            self._add(start, end)
+            addresses.extend(self._address(v) for v in range(start, end + 1))
+        return addresses
+
+    def free(self, addr: IPAddress):
+        """
+        Release an address; does nothing if it is not allocated.
+
+        :param addr: address to release
+        :type addr: IPv4Address or IPv6Address
+        """
+        value = int(addr)
+        i = bisect.bisect_right(self._starts, value) - 1
+        if i < 0 or self._ends[i] < value:
+            return
+        start, end = self._starts[i], self._ends[i]
+        pieces = [(s, e) for s, e in ((start, value - 1), (value + 1, end)) if s <= e]
+        self._starts[i : i + 1] = [s for s, _ in pieces]
+        self._ends[i : i + 1] = [e for _, e in pieces]
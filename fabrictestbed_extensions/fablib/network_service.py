@@ -33,7 +33,7 @@ from __future__ import annotations
 
 import logging
 import threading
-from typing import TYPE_CHECKING, Dict, List, Optional, Union
+from typing import TYPE_CHECKING, Dict, List, Optional, Tuple, Union
 
 from fabrictestbed.external_api.orchestrator_client import SliverDTO
 from fim.slivers.path_info import Path
@@ -48,6 +48,7 @@ if TYPE_CHECKING:
     from fabrictestbed_extensions.fablib.interface import Interface
 
 import ipaddress
+import itertools
 import json
 from ipaddress import IPv4Address, IPv4Network, IPv6Address, IPv6Network
 
@@ -57,6 +58,7 @@ from fabrictestbed.slice_editor import ServiceType, UserData
 from fim.slivers.network_service import NetworkServiceSliver, NSLayer, ServiceType
 from fim.user.network_service import MirrorDirection
 
+from fabrictestbed_extensions.fablib.ip_allocator import IPAllocator
 from fabrictestbed_extensions.fablib.template_mixin import TemplateMixin
 
 log = logging.getLogger("fablib")
@@ -69,6 +71,28 @@ class NetworkService(TemplateMixin):
 
     _show_title = "Network"
 
+    __slots__ = (
+        "fim_network_service",
+        "slice",
+        "interfaces",
+        "sliver",
+        "_cached_type",
+        "_cached_layer",
+        "_cached_subnet",
+        "_cached_gateway",
+        "_interfaces_cache",
+        "_ip_allocator",
+    )
+
+    # Guards IP allocation.  Shared by all network services so that two
+    # wrappers of the same network cannot hand out the same address.
+    lock = threading.Lock()
+
+    # Allocated addresses are also written as a plain list for older fablib
+    # versions; the list is cut to this many addresses to stay within the
+    # user_data size limit, the complete set is kept as ranges.
+    max_legacy_allocated_ips = 32
+
     network_service_map = {
         "L2Bridge": ServiceType.L2Bridge,
         "L2PTP": ServiceType.L2PTP,
@@ -744,8 +768,6 @@ class NetworkService(TemplateMixin):
         except Exception:
             pass
 
-        self.lock = threading.Lock()
-
         # Caching support
         self._cached_type: Optional[str] = None
         self._cached_layer: Optional[str] = None
@@ -753,6 +775,9 @@ class NetworkService(TemplateMixin):
         self._cached_gateway: Optional[Union[IPv4Address, IPv6Address]] = None
 
         self._interfaces_cache: Dict[str, Interface] = {}
+        self._ip_allocator: Optional[
+            Tuple[Optional[list], Optional[int], IPAllocator]
+        ] = None
 
     def _invalidate_cache(self):
         """Invalidate all cached properties."""
@@ -764,6 +789,7 @@ class NetworkService(TemplateMixin):
         self._cached_gateway = None
 
         self._interfaces_cache = {}
+        self._ip_allocator = None
         self.interfaces = None
 
     def update(self, fim_network_service: FimNetworkService = None):
@@ -774,9 +800,30 @@ class NetworkService(TemplateMixin):
         :type fim_network_service: FimNetworkService
         """
         if fim_network_service:
-            self.fim_network_service = fim_network_service
-            self._invalidate_cache()
-            self._fim_dirty = False
+            self._apply_update(self._prepare_update(fim_network_service))
+
+    def _prepare_update(self, fim_network_service: FimNetworkService) -> tuple:
+        """
+        State for :py:meth:`_apply_update`.  Interfaces of a network
+        service are looked up in the slice on first access, so there is
+        nothing to build ahead.
+
+        :param fim_network_service: the new FIM network service
+        :type fim_network_service: FimNetworkService
+        :rtype: tuple
+        """
+        return (fim_network_service,)
+
+    def _apply_update(self, state: tuple):
+        """
+        Point this network service at a new FIM network service.
+
+        :param state: state returned by :py:meth:`_prepare_update`
+        :type state: tuple
+        """
+        (self.fim_network_service,) = state
+        self._invalidate_cache()
+        self._fim_dirty = False
 
     def __str__(self):
         """
@@ -820,37 +867,34 @@ class NetworkService(TemplateMixin):
             "error": "Error",
         }
 
-    def toDict(self, skip: List[str] = None):
+    # Columns of toDict(), computed on demand (see TemplateMixin._columns_dict)
+    _dict_columns = {
+        "id": lambda network: str(network.get_reservation_id()),
+        "name": lambda network: str(network.get_name()),
+        "layer": lambda network: str(network.get_layer()),
+        "type": lambda network: str(network.get_type()),
+        "site": lambda network: str(network.get_site()),
+        "subnet": lambda network: str(network.get_subnet()),
+        "gateway": lambda network: str(network.get_gateway()),
+        "state": lambda network: str(network.get_reservation_state()),
+        "error": lambda network: str(network.get_error_message()),
+    }
+
+    def toDict(self, skip: List[str] = None, fields: List[str] = None):
         """
         Returns the network attributes as a dictionary.
 
-        Results are cached. Cache is invalidated when ``_invalidate_cache()``
-        is called.
+        Only the requested attributes are computed. Results are cached.
+        Cache is invalidated when ``_invalidate_cache()`` is called.
 
         :param skip: list of keys to skip
         :type skip: List[str]
+        :param fields: list of keys to include; all by default
+        :type fields: List[str]
         :return: network attributes as dictionary
         :rtype: dict
         """
-        if skip is None:
-            skip = []
-
-        if self._cached_dict is None:
-            d = {}
-            d["id"] = str(self.get_reservation_id())
-            d["name"] = str(self.get_name())
-            d["layer"] = str(self.get_layer())
-            d["type"] = str(self.get_type())
-            d["site"] = str(self.get_site())
-            d["subnet"] = str(self.get_subnet())
-            d["gateway"] = str(self.get_gateway())
-            d["state"] = str(self.get_reservation_state())
-            d["error"] = str(self.get_error_message())
-            self._cached_dict = d
-
-        if not skip:
-            return dict(self._cached_dict)
-        return {k: v for k, v in self._cached_dict.items() if k not in skip}
+        return self._columns_dict(skip=skip, fields=fields)
 
     def generate_template_context(self, skip: List[str] = None):
         """Build a Jinja2 template context dict for this network service."""
@@ -1361,8 +1405,10 @@ class NetworkService(TemplateMixin):
             fablib_data["subnet"] = {}
         fablib_data["subnet"]["subnet"] = str(subnet)
         fablib_data["subnet"]["allocated_ips"] = []
+        fablib_data["subnet"]["allocated_ranges"] = []
         self.set_fablib_data(fablib_data)
         self._cached_subnet = None
+        self._ip_allocator = None
 
     def set_gateway(self, gateway: Union[IPv4Address, IPv6Address]):
         """
@@ -1375,16 +1421,83 @@ class NetworkService(TemplateMixin):
         self.set_fablib_data(fablib_data)
         self._cached_gateway = None
 
-    def get_allocated_ips(self):
+    def _get_ip_allocator(self, fablib_data: dict) -> IPAllocator:
+        """
+        Get the allocator of the network's addresses.
+
+        Allocated addresses are stored in ``fablib_data`` as ranges
+        (``allocated_ranges``) and as the list older fablib versions read
+        and update (``allocated_ips``), which holds at most the first
+        :py:attr:`max_legacy_allocated_ips` addresses.  Addresses in either
+        are treated as allocated, so addresses added by older versions are
+        honored; addresses they free stay allocated.
+
+        The allocator is rebuilt only when the stored ranges or the length
+        of the stored list have changed, e.g. through another wrapper of
+        this network or an older fablib version.
+
+        :param fablib_data: fablib data of the network
+        :type fablib_data: dict
+        :return: the allocator
+        :rtype: IPAllocator
+        """
+        subnet_data = fablib_data.get("subnet", {})
+        ranges = subnet_data.get("allocated_ranges")
+        allocated_ips = subnet_data.get("allocated_ips")
+        legacy_count = None if allocated_ips is None else len(allocated_ips)
+        if (
+            self._ip_allocator is not None
+            and self._ip_allocator[0] == ranges
+            and self._ip_allocator[1] == legacy_count
+        ):
+            return self._ip_allocator[2]
+
+        allocator = IPAllocator.from_ranges(
+            self._get_allocation_subnet(), (ranges or []) + (allocated_ips or [])
+        )
+        self._ip_allocator = (ranges, legacy_count, allocator)
+        return allocator
+
+    def _get_allocation_subnet(self) -> Optional[Union[IPv4Network, IPv6Network]]:
+        """
+        Get the subnet addresses are allocated from.
+
+        :return: the subnet, or None if the network has no subnet yet (e.g.
+            an L3 network that has not been submitted)
+        :rtype: IPv4Network or IPv6Network
+        """
+        subnet = self.get_subnet()
+        if isinstance(subnet, (IPv4Network, IPv6Network)):
+            return subnet
+        return None
+
+    def _store_ip_allocator(self, fablib_data: dict, allocator: IPAllocator):
+        """
+        Save the allocated addresses in ``fablib_data``.
+
+        :param fablib_data: fablib data of the network
+        :type fablib_data: dict
+        :param allocator: the allocator
+        :type allocator: IPAllocator
+        """
+        ranges = allocator.to_ranges()
+        subnet_data = fablib_data.setdefault("subnet", {})
+        subnet_data["allocated_ranges"] = ranges
+        allocated_ips = [
+            str(addr)
+            for addr in itertools.islice(allocator, self.max_legacy_allocated_ips)
+        ]
+        subnet_data["allocated_ips"] = allocated_ips
+        legacy_count = len(allocated_ips)
+        self.set_fablib_data(fablib_data)
+        self._ip_allocator = (ranges, legacy_count, allocator)
+
+    def get_allocated_ips(self) -> List[Union[IPv4Address, IPv6Address]]:
         """
         Get the list of IP addesses allocated for the network service.
         """
         try:
-            allocated_ips = []
-            for addr in self.get_fablib_data()["subnet"]["allocated_ips"]:
-                allocated_ips.append(ipaddress.ip_address(addr))
-
-            return allocated_ips
+            return list(self._get_ip_allocator(self.get_fablib_data()))
         except Exception as e:
             return []
 
@@ -1393,66 +1506,68 @@ class NetworkService(TemplateMixin):
         Add ``addr`` to the list of allocated IPs.
         """
         fablib_data = self.get_fablib_data()
-        if "subnet" not in fablib_data:
-            fablib_data["subnet"] = {}
-        allocated_ips = fablib_data["subnet"]["allocated_ips"]
-        allocated_ips.append(str(addr))
-        self.set_fablib_data(fablib_data)
+        allocator = self._get_ip_allocator(fablib_data)
+        allocator.allocate(addr)
+        self._store_ip_allocator(fablib_data, allocator)
 
     def allocate_ip(self, addr: Optional[Union[IPv4Address, IPv6Address]] = None):
         """
         Allocate an IP for the network service.
-        """
-        try:
-            self.lock.acquire()
-            subnet = self.get_subnet()
-            allocated_ips = self.get_allocated_ips()
 
-            if addr:
-                # if addr != subnet.network_address and addr not in allocated_ips:
-                if addr not in allocated_ips:
-                    self.set_allocated_ip(addr)
-                    return addr
-            elif (
-                type(subnet) == ipaddress.IPv4Network
-                or type(subnet) == ipaddress.IPv6Network
-            ):
-                for host in subnet:
-                    if host != subnet.network_address and host not in allocated_ips:
-                        self.set_allocated_ip(host)
-
-                        return host
-            return None
-        finally:
-            self.lock.release()
+        :param addr: address to allocate; by default the lowest free host
+            address of the subnet
+        :type addr: IPv4Address or IPv6Address
+        :return: the allocated address, or None if ``addr`` is already
+            allocated or no address is free
+        :rtype: IPv4Address or IPv6Address
+        """
+        with self.lock:
+            fablib_data = self.get_fablib_data()
+            allocator = self._get_ip_allocator(fablib_data)
+            host = allocator.allocate(addr)
+            if host is not None:
+                self._store_ip_allocator(fablib_data, allocator)
+            return host
+
+    def allocate_ips(self, count: int) -> List[Union[IPv4Address, IPv6Address]]:
+        """
+        Allocate several IPs for the network service at once.
+
+        :param count: number of addresses
+        :type count: int
+        :raises FablibException: if fewer than ``count`` addresses are free;
+            nothing is allocated in that case
+        :return: the lowest ``count`` free host addresses of the subnet
+        :rtype: List[IPv4Address] or List[IPv6Address]
+        """
+        with self.lock:
+            fablib_data = self.get_fablib_data()
+            allocator = self._get_ip_allocator(fablib_data)
+            hosts = allocator.allocate_many(count)
+            if hosts:
+                self._store_ip_allocator(fablib_data, allocator)
+            return hosts
 
     def set_allocated_ips(self, allocated_ips: list[Union[IPv4Address, IPv6Address]]):
         """
         Set a list of IPs to be "allocated IPs".
         """
         fablib_data = self.get_fablib_data()
-        allocated_ips_strs = []
+        allocator = IPAllocator(self._get_allocation_subnet())
         for ip in allocated_ips:
-            allocated_ips_strs.append(str(ip))
-
-        if "subnet" not in fablib_data:
-            fablib_data["subnet"] = {}
-
-        fablib_data["subnet"]["allocated_ips"] = allocated_ips_strs
-        self.set_fablib_data(fablib_data)
+            allocator.allocate(ipaddress.ip_address(ip))
+        self._store_ip_allocator(fablib_data, allocator)
 
     def free_ip(self, addr: Union[IPv4Address, IPv6Address]):
         """
         Remove an IP from the list of allocated IPs.
         """
-        try:
-            self.lock.acquire()
-            allocated_ips = self.get_allocated_ips()
-            if addr in allocated_ips:
-                allocated_ips.remove(addr)
-            self.set_allocated_ips(allocated_ips)
-        finally:
-            self.lock.release()
+        with self.lock:
+            fablib_data = self.get_fablib_data()
+            allocator = self._get_ip_allocator(fablib_data)
+            if addr in allocator:
+                allocator.free(addr)
+                self._store_ip_allocator(fablib_data, allocator)
 
     def make_ip_publicly_routable(self, ipv6: list[str] = None, ipv4: list[str] = None):
         """
@@ -104,6 +104,45 @@ class Node(TemplateMixin):
     default_disk = 10
     default_image = "default_rocky_9"
 
+    __slots__ = (
+        "fim_node",
+        "slice",
+        "ip_addr_list_json",
+        "validate",
+        "raise_exception",
+        "node_type",
+        "components",
+        "interfaces",
+        "sliver",
+        "username",
+        "reservation_id",
+        "cores",
+        "ram",
+        "disk",
+        "image",
+        "image_type",
+        "host",
+        "site",
+        "management_ip",
+        "_cached_site",
+        "_cached_management_ip",
+        "_cached_image_type",
+        "_cached_image_ref",
+        "_cached_requested_disk",
+        "_cached_allocated_disk",
+        "_cached_requested_ram",
+        "_cached_allocated_ram",
+        "_cached_requested_cores",
+        "_cached_allocated_cores",
+        "_cached_instance_name",
+        "_cached_type",
+        "_net_config_backend",
+        "_persistent_config",
+        "_ssh_bastion",
+        "_ssh_client",
+        "_ssh_lock",
+    )
+
     def __init__(
         self,
         slice: Slice,
@@ -341,55 +380,54 @@ class Node(TemplateMixin):
             "private_ssh_key_file": "Private SSH Key File",
         }
 
-    def toDict(self, skip: Optional[List[str]] = None):
+    # Columns of toDict(), computed on demand (see TemplateMixin._columns_dict)
+    _dict_columns = {
+        "id": lambda node: str(node.get_reservation_id()),
+        "name": lambda node: str(node.get_name()),
+        "cores": lambda node: str(node.get_cores()),
+        "ram": lambda node: str(node.get_ram()),
+        "disk": lambda node: str(node.get_disk()),
+        "image": lambda node: str(node.get_image()),
+        "image_type": lambda node: str(node.get_image_type()),
+        "host": lambda node: str(node.get_host()),
+        "site": lambda node: str(node.get_site()),
+        "username": lambda node: str(node.get_username()),
+        "management_ip": lambda node: (
+            str(node.get_management_ip()).strip()
+            if str(node.get_reservation_state()) == "Active"
+            and node.get_management_ip()
+            else ""
+        ),
+        "state": lambda node: str(node.get_reservation_state()),
+        "error": lambda node: str(node.get_error_message()),
+        # get_ssh_command() renders a template whose context includes this
+        # node's dictionary without ssh_command, so there is no recursion.
+        "ssh_command": lambda node: (
+            str(node.get_ssh_command())
+            if str(node.get_reservation_state()) == "Active"
+            else ""
+        ),
+        "public_ssh_key_file": lambda node: str(node.get_public_key_file()),
+        "private_ssh_key_file": lambda node: str(node.get_private_key_file()),
+    }
+
+    def toDict(
+        self, skip: Optional[List[str]] = None, fields: Optional[List[str]] = None
+    ):
         """
         Returns the node attributes as a dictionary.
 
-        Results are cached. Cache is invalidated when ``_invalidate_cache()``
-        is called.
+        Only the requested attributes are computed. Results are cached.
+        Cache is invalidated when ``_invalidate_cache()`` is called.
 
         :param skip: list of keys to exclude
         :type skip: List[str]
+        :param fields: list of keys to include; all by default
+        :type fields: List[str]
         :return: node attributes as dictionary
         :rtype: dict
         """
-        if skip is None:
-            skip = []
-
-        if self._cached_dict is None:
-            d = {}
-            d["id"] = str(self.get_reservation_id())
-            d["name"] = str(self.get_name())
-            d["cores"] = str(self.get_cores())
-            d["ram"] = str(self.get_ram())
-            d["disk"] = str(self.get_disk())
-            d["image"] = str(self.get_image())
-            d["image_type"] = str(self.get_image_type())
-            d["host"] = str(self.get_host())
-            d["site"] = str(self.get_site())
-            d["username"] = str(self.get_username())
-            d["management_ip"] = (
-                str(self.get_management_ip()).strip()
-                if str(self.get_reservation_state()) == "Active"
-                and self.get_management_ip()
-                else ""
-            )
-            d["state"] = str(self.get_reservation_state())
-            d["error"] = str(self.get_error_message())
-            # ssh_command is deferred to avoid recursion: get_ssh_command()
-            # calls render_template() which calls toDict() again.
-            d["ssh_command"] = ""
-            d["public_ssh_key_file"] = str(self.get_public_key_file())
-            d["private_ssh_key_file"] = str(self.get_private_key_file())
-            self._cached_dict = d
-            # Now that _cached_dict exists, render_template can use it
-            # without recursion.
-            if str(self.get_reservation_state()) == "Active":
-                self._cached_dict["ssh_command"] = str(self.get_ssh_command())
-
-        if not skip:
-            return dict(self._cached_dict)
-        return {k: v for k, v in self._cached_dict.items() if k not in skip}
+        return self._columns_dict(skip=skip, fields=fields)
 
     def generate_template_context(self, skip: List[str] = None):
         """Build a Jinja2 template context dict for this node."""
@@ -1289,24 +1327,18 @@ class Node(TemplateMixin):
         # Get components from FIM (single access)
         fim_components = self.fim_node.components
 
-        if refresh or not self.components:
-            self.components.clear()
-
-        # Update or create component objects
+        # Build a new dictionary and replace the cache with it, so concurrent
+        # readers never see a partially rebuilt cache
+        previous = {} if refresh else self.components
+        components = {}
         for component_name, fim_component in fim_components.items():
-            if component_name not in self.components:
-                self.components[component_name] = Component(self, fim_component)
-            elif refresh:
-                # Update existing component's FIM reference
-                self.components[component_name].fim_component = fim_component
-
-        # Remove components no longer in FIM
-        current_names = set(fim_components.keys())
-        to_remove = [name for name in self.components if name not in current_names]
-        for name in to_remove:
-            del self.components[name]
+            if component_name in previous:
+                components[component_name] = previous[component_name]
+            else:
+                components[component_name] = Component(self, fim_component)
 
-        return list(self.components.values())
+        self.components = components
+        return list(components.values())
 
     def get_component(self, name: str, refresh: bool = False) -> Component:
         """
@@ -1371,17 +1403,18 @@ class Node(TemplateMixin):
                 return self.interfaces
             return list(self.interfaces.values())
 
-        # Rebuild interface cache from components
-        self.interfaces.clear()
+        # Rebuild interface cache from components and replace it
+        interfaces = {}
         for component in self.get_components(refresh=refresh):
             c_interfaces = component.get_interfaces(
                 include_subs=include_subs, refresh=refresh, output="dict"
             )
-            self.interfaces.update(c_interfaces)
+            interfaces.update(c_interfaces)
+        self.interfaces = interfaces
 
         if output == "dict":
-            return self.interfaces
-        return list(self.interfaces.values())
+            return interfaces
+        return list(interfaces.values())
 
     def get_interface(
         self,
@@ -3104,6 +3137,28 @@ class Node(TemplateMixin):
             log.debug(f"Failed to get ip addr list: {e}")
             raise e
 
+    def discover_interfaces(self, interfaces: Optional[List[Interface]] = None):
+        """
+        Resolve the OS device names and IP addresses of interfaces with a
+        single ``ip -j addr list`` on this node.
+
+        The results are cached like those of
+        :py:meth:`Interface.get_device_name` and used by
+        :py:meth:`Interface.toDict`.
+
+        :param interfaces: interfaces of this node; all by default
+        :type interfaces: List[Interface]
+        """
+        if interfaces is None:
+            interfaces = self.get_interfaces()
+        try:
+            addrs = self.ip_addr_list(output="json", update=True)
+        except Exception as e:
+            log.warning(f"Failed to discover interfaces of {self.get_name()}: {e}")
+            addrs = None
+        for interface in interfaces:
+            interface._discover(addrs)
+
     def ip_route_add(
         self,
         subnet: Union[IPv4Network, IPv6Network],
@@ -4859,17 +4914,47 @@ class Node(TemplateMixin):
     def update(self, fim_node: FimNode):
         """Update this node with a new FIM node and refresh components/interfaces."""
         if fim_node:
-            self.fim_node = fim_node
-            self._invalidate_cache()
-            try:
-                self.get_components(refresh=True)
-                self.get_interfaces(refresh=True)
-            except Exception as e:
-                # Component/interface queries may fail if the topology is in
-                # a transitional state (e.g. mid-modify).  The FIM reference
-                # is already updated; caches will rebuild on next access.
-                log.debug(
-                    f"Node {self.get_name()}: error refreshing caches "
-                    f"during update: {e}"
-                )
-            self._fim_dirty = False
+            self._apply_update(self._prepare_update(fim_node))
+
+    def _prepare_update(self, fim_node: FimNode) -> tuple:
+        """
+        Build the components and interfaces of a new FIM node without
+        modifying this node; see :py:meth:`_apply_update`.
+
+        :param fim_node: the new FIM node
+        :type fim_node: FimNode
+        :return: state for :py:meth:`_apply_update`
+        :rtype: tuple
+        """
+        components = {}
+        interfaces = {}
+        try:
+            for component_name, fim_component in fim_node.components.items():
+                component = Component(self, fim_component)
+                components[component_name] = component
+                interfaces.update(component.get_interfaces(output="dict"))
+        except Exception as e:
+            # Component/interface queries may fail if the topology is in
+            # a transitional state (e.g. mid-modify).  Caches will rebuild
+            # on next access.
+            log.debug(
+                f"Node {self.get_name()}: error refreshing caches during update: {e}"
+            )
+            components = interfaces = {}
+        return fim_node, components, interfaces
+
+    def _apply_update(self, state: tuple):
+        """
+        Point this node at the FIM node prepared by
+        :py:meth:`_prepare_update`, replacing its caches by assignment.
+
+        :param state: state returned by :py:meth:`_prepare_update`
+        :type state: tuple
+        """
+        fim_node, components, interfaces = state
+        self.fim_node = fim_node
+        self.components = components
+        self.interfaces = interfaces
+        # Readers in between rebuild the caches from the new FIM node
+        self._invalidate_cache()
+        self._fim_dirty = False
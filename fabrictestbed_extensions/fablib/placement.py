@@ -0,0 +1,403 @@
+#!/usr/bin/env python3
+# MIT License
+#
+# Copyright (c) 2020 FABRIC Testbed
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+"""
+Placement of the nodes of a slice on the hosts of a site.
+
+:class:`NodeValidator.validate_nodes` uses a :class:`PlacementEngine` to
+assign all nodes of a site to hosts jointly, rather than putting each node
+on the first host it fits on.  Engines work on plain demand and capacity
+records, so they can be used and tested without resources or nodes:
+
+* :class:`FirstFitPlacement` – the former behaviour, nodes in slice order.
+* :class:`BestFitDecreasingPlacement` – the default; nodes needing the most
+  (components first) are placed first, each on the host it leaves the least
+  spare capacity on.  Hosts with components a node does not need are
+  avoided, so they remain available to nodes that need them.
+* :class:`ExactPlacement` – searches all assignments of small requests
+  when best-fit-decreasing cannot place every node.
+
+Other engines can be passed to ``Slice.validate(placement=...)``.
+"""
+
+from __future__ import annotations
+
+import logging
+from abc import ABC, abstractmethod
+from collections import Counter
+from typing import Any, Dict, List, Optional
+
+from fim.user import ComponentType
+
+log = logging.getLogger("fablib")
+
+
+class PlacementRequest:
+    """
+    Resources requested by one node.
+    """
+
+    __slots__ = ("name", "cores", "ram", "disk", "components")
+
+    def __init__(
+        self,
+        name: str,
+        cores: int = 0,
+        ram: int = 0,
+        disk: int = 0,
+        components: Optional[Dict[str, int]] = None,
+    ):
+        """
+        :param name: node name
+        :type name: str
+        :param cores: requested cores
+        :type cores: int
+        :param ram: requested RAM (GB)
+        :type ram: int
+        :param disk: requested disk (GB)
+        :type disk: int
+        :param components: requested component counts, by
+            ``"<type>-<model>"`` as in ``resources_summary``
+        :type components: Dict[str, int]
+        """
+        self.name = name
+        self.cores = cores or 0
+        self.ram = ram or 0
+        self.disk = disk or 0
+        self.components = dict(components or {})
+
+    @classmethod
+    def from_node(cls, node) -> PlacementRequest:
+        """
+        Build the request of a fablib node.
+
+        :param node: the node
+        :type node: Node
+        :return: the request
+        :rtype: PlacementRequest
+        """
+        components = Counter()
+        for c in node.get_components():
+            # NAS storage is provisioned at the site level
+            if c.get_type() == ComponentType.Storage:
+                continue
+            components[f"{c.get_type()}-{c.get_fim_model()}"] += 1
+        return cls(
+            name=node.get_name(),
+            cores=node.get_requested_cores(),
+            ram=node.get_requested_ram(),
+            disk=node.get_requested_disk(),
+            components=components,
+        )
+
+    def size(self) -> tuple:
+        """
+        Sort key of best-fit-decreasing: component units, then cores, RAM
+        and disk.
+        """
+        return (sum(self.components.values()), self.cores, self.ram, self.disk)
+
+
+class HostCapacity:
+    """
+    Free resources of one host.
+    """
+
+    __slots__ = ("name", "cores", "ram", "disk", "components", "_scale")
+
+    def __init__(
+        self,
+        name: str,
+        cores: int = 0,
+        ram: int = 0,
+        disk: int = 0,
+        components: Optional[Dict[str, int]] = None,
+    ):
+        """
+        :param name: host name
+        :type name: str
+        :param cores: free cores
+        :type cores: int
+        :param ram: free RAM (GB)
+        :type ram: int
+        :param disk: free disk (GB)
+        :type disk: int
+        :param components: free component counts, by ``"<type>-<model>"``
+        :type components: Dict[str, int]
+        """
+        self.name = name
+        self.cores = cores
+        self.ram = ram
+        self.disk = disk
+        self.components = dict(components or {})
+        # Leftover capacity is compared relative to the free capacity
+        self._scale = (max(cores, 1), max(ram, 1), max(disk, 1))
+
+    @classmethod
+    def from_host(
+        cls, host: Dict[str, Any], allocated: dict, name: Optional[str] = None
+    ) -> HostCapacity:
+        """
+        Build the free capacity of a ``resources_summary`` host.
+
+        :param host: host dict (keys: name, cores_available,
+            ram_available, disk_available, components)
+        :type host: Dict[str, Any]
+        :param allocated: resources already claimed on the host, as kept by
+            :py:meth:`NodeValidator.can_allocate_node_in_host`
+        :type allocated: dict
+        :param name: host name; defaults to the name in ``host``
+        :type name: str
+        :return: the free capacity
+        :rtype: HostCapacity
+        """
+        components = {}
+        for component, data in (host.get("components") or {}).items():
+            free = (
+                (data.get("capacity", 0) or 0)
+                - (data.get("allocated", 0) or 0)
+                - allocated.get(component, 0)
+            )
+            components[component] = max(free, 0)
+        return cls(
+            name=name or host.get("name", ""),
+            cores=(host.get("cores_available", 0) or 0) - allocated.get("core", 0),
+            ram=(host.get("ram_available", 0) or 0) - allocated.get("ram", 0),
+            disk=(host.get("disk_available", 0) or 0) - allocated.get("disk", 0),
+            components=components,
+        )
+
+    def fits(self, request: PlacementRequest) -> bool:
+        """
+        Whether the request fits in the free resources.
+        """
+        if (
+            request.cores > self.cores
+            or request.ram > self.ram
+            or request.disk > self.disk
+        ):
+            return False
+        for name, count in request.components.items():
+            if self.components.get(name, 0) < count:
+                return False
+        return True
+
+    def add(self, request: PlacementRequest, sign: int = -1):
+        """
+        Claim (or with ``sign=1`` release) the resources of a request.
+        """
+        self.cores += sign * request.cores
+        self.ram += sign * request.ram
+        self.disk += sign * request.disk
+        for name, count in request.components.items():
+            self.components[name] += sign * count
+
+    def leftover(self, request: PlacementRequest) -> tuple:
+        """
+        Best-fit score of placing a request here; lower is better.
+
+        Components the request leaves free come first: using a host with
+        spare GPUs or NICs for a node that needs none would take them away
+        from nodes that do.  Then the relative core, RAM and disk left.
+        """
+        spare_components = sum(self.components.values()) - sum(
+            request.components.values()
+        )
+        spare = (
+            (self.cores - request.cores) / self._scale[0]
+            + (self.ram - request.ram) / self._scale[1]
+            + (self.disk - request.disk) / self._scale[2]
+        )
+        return spare_components, spare
+
+    def state(self) -> tuple:
+        """
+        Free resources, used to skip equivalent hosts when searching.
+        """
+        return (
+            self.cores,
+            self.ram,
+            self.disk,
+            tuple(sorted(self.components.items())),
+        )
+
+
+class PlacementEngine(ABC):
+    """
+    Assigns node requests to hosts.
+    """
+
+    @abstractmethod
+    def place(
+        self, requests: List[PlacementRequest], hosts: List[HostCapacity]
+    ) -> Dict[str, str]:
+        """
+        Place requests on hosts.
+
+        Engines claim the resources of placed requests on the given
+        ``hosts``.
+
+        :param requests: requests to place
+        :type requests: List[PlacementRequest]
+        :param hosts: free capacity of candidate hosts; updated in place
+        :type hosts: List[HostCapacity]
+        :return: host name by request name, for the requests placed
+        :rtype: Dict[str, str]
+        """
+
+
+class FirstFitPlacement(PlacementEngine):
+    """
+    Place each request, in order, on the first host it fits on.
+    """
+
+    def place(
+        self, requests: List[PlacementRequest], hosts: List[HostCapacity]
+    ) -> Dict[str, str]:
+        placement = {}
+        for request in requests:
+            for host in hosts:
+                if host.fits(request):
+                    host.add(request)
+                    placement[request.name] = host.name
+                    break
+        return placement
+
+
+class BestFitDecreasingPlacement(PlacementEngine):
+    """
+    Place the largest requests first, each on the host it fits best.
+    """
+
+    def place(
+        self, requests: List[PlacementRequest], hosts: List[HostCapacity]
+    ) -> Dict[str, str]:
+        placement = {}
+        for request in sorted(requests, key=PlacementRequest.size, reverse=True):
+            best = None
+            best_score = None
+            for host in hosts:
+                if not host.fits(request):
+                    continue
+                score = host.leftover(request)
+                if best is None or score < best_score:
+                    best, best_score = host, score
+            if best is not None:
+                best.add(request)
+                placement[request.name] = best.name
+        return placement
+
+
+class ExactPlacement(PlacementEngine):
+    """
+    Best-fit-decreasing, falling back to a search of all assignments when
+    it cannot place every request.
+
+    The search is depth first over requests in decreasing size, trying
+    hosts in best-fit order and skipping hosts whose free resources equal
+    those of a host already tried.  It is limited to ``max_requests``
+    requests and ``max_steps`` assignments; beyond that the best placement
+    found (the one placing the most requests) is returned.
+    """
+
+    def __init__(self, max_requests: int = 16, max_steps: int = 100000):
+        """
+        :param max_requests: largest number of requests searched exactly
+        :type max_requests: int
+        :param max_steps: largest number of assignments tried
+        :type max_steps: int
+        """
+        self.max_requests = max_requests
+        self.max_steps = max_steps
+        self.heuristic = BestFitDecreasingPlacement()
+
+    def place(
+        self, requests: List[PlacementRequest], hosts: List[HostCapacity]
+    ) -> Dict[str, str]:
+        trial = [
+            HostCapacity(h.name, h.cores, h.ram, h.disk, h.components) for h in hosts
+        ]
+        placement = self.heuristic.place(requests, trial)
+        if len(placement) < len(requests) and len(requests) <= self.max_requests:
+            log.debug(
+                f"Best fit placed {len(placement)} of {len(requests)} nodes, "
+                f"searching"
+            )
+            placement = self._search(
+                sorted(requests, key=PlacementRequest.size, reverse=True),
+                hosts,
+                placement,
+            )
+
+        by_name = {h.name: h for h in hosts}
+        requests_by_name = {r.name: r for r in requests}
+        for name, host_name in placement.items():
+            by_name[host_name].add(requests_by_name[name])
+        return placement
+
+    def _search(
+        self,
+        requests: List[PlacementRequest],
+        hosts: List[HostCapacity],
+        best: Dict[str, str],
+    ) -> Dict[str, str]:
+        hosts = [
+            HostCapacity(h.name, h.cores, h.ram, h.disk, h.components) for h in hosts
+        ]
+        current: Dict[str, str] = {}
+        result = {"best": dict(best), "steps": 0}
+
+        def visit(index: int, unplaced: int) -> bool:
+            if len(current) > len(result["best"]):
+                result["best"] = dict(current)
+            if index == len(requests):
+                return unplaced == 0
+            # Not enough requests left to beat the best placement
+            if len(requests) - unplaced <= len(result["best"]):
+                return False
+            if result["steps"] >= self.max_steps:
+                return False
+
+            request = requests[index]
+            candidates = sorted(
+                (h for h in hosts if h.fits(request)),
+                key=lambda h: h.leftover(request),
+            )
+            tried = set()
+            for host in candidates:
+                state = host.state()
+                if state in tried:
+                    continue
+                tried.add(state)
+                result["steps"] += 1
+                host.add(request)
+                current[request.name] = host.name
+                if visit(index + 1, unplaced):
+                    return True
+                del current[request.name]
+                host.add(request, sign=1)
+            # Leave this request unplaced
+            return visit(index + 1, unplaced + 1)
+
+        visit(0, 0)
+        return result["best"]
@@ -0,0 +1,481 @@
+#!/usr/bin/env python3
+# MIT License
+#
+# Copyright (c) 2020 FABRIC Testbed
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+"""
+Columnar representation of a ``resources_calendar()`` response.
+
+:class:`ResourceCalendar` holds the available resources and capacities of
+every site and host in every time slot as NumPy arrays indexed by
+(slot, entity, resource), where resources are cores, RAM, disk and then
+each component model.  Aggregations such as the earliest window with
+enough cores at a site or a utilization heatmap are array operations, and
+:py:meth:`ResourceCalendar.to_pandas` exports the arrays without copying::
+
+    calendar = fablib.get_resources_calendar(start=start, end=end,
+                                             interval="hour")
+    calendar.earliest_window("RENC", duration=4, cores=32)
+    calendar.utilization("cores")
+
+The ``"avail/cap"`` strings shown by ``resources_calendar()`` are only
+formatted when rows are displayed (:py:meth:`ResourceCalendar.to_rows`).
+"""
+
+from __future__ import annotations
+
+import datetime
+import re
+from typing import Any, Dict, Iterator, List, Optional
+
+import numpy as np
+import pandas as pd
+from numpy.lib.stride_tricks import sliding_window_view
+
+from fabrictestbed_extensions.fablib.resource_index import BASE_COLUMNS
+
+# Display column labels of the base resources
+BASE_LABELS = {
+    "cores": "Cores (avail/cap)",
+    "ram": "RAM GB (avail/cap)",
+    "disk": "Disk GB (avail/cap)",
+}
+
+# Entity kinds, in the order rows are listed within a slot
+KINDS = ("site", "host")
+
+# Slot length in hours by interval, for slots without usable times
+INTERVAL_HOURS = {"hour": 1, "day": 24, "week": 168}
+
+
+def parse_time(value: Optional[str]) -> Optional[datetime.datetime]:
+    """
+    Parse a calendar slot time; times without a zone are UTC.
+
+    :param value: ISO time as sent in the calendar
+    :type value: str
+    :return: the time, or None if missing or invalid
+    :rtype: datetime.datetime
+    """
+    try:
+        parsed = datetime.datetime.fromisoformat(value.replace("Z", "+00:00"))
+    except (AttributeError, TypeError, ValueError):
+        return None
+    if parsed.tzinfo is None:
+        parsed = parsed.replace(tzinfo=datetime.timezone.utc)
+    return parsed
+
+
+def _number(value: Any) -> float:
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return 0.0
+
+
+def component_key(name: str) -> str:
+    """
+    Canonical component model name; the calendar and the summary differ in
+    separators (``"GPU Tesla T4"`` vs ``"GPU-Tesla T4"``).
+
+    :param name: component model name
+    :type name: str
+    :rtype: str
+    """
+    return re.sub(r"[^a-z0-9]", "", name.lower())
+
+
+class ResourceCalendar:
+    """
+    Available resources and capacities of sites and hosts over time.
+
+    ``available`` and ``capacity`` are float64 arrays of shape
+    (slots, entities, columns); ``present`` tells which entities are part
+    of each slot.  Values missing from the response are 0 and flagged in
+    ``has_available``/``has_capacity``.  Values that are not plain integers
+    (fractions, None) are also kept as sent so rows show them unchanged.
+    """
+
+    def __init__(self, calendar_data: Dict[str, Any]):
+        """
+        :param calendar_data: ``resources_calendar`` response from the
+            orchestrator
+        :type calendar_data: dict
+        """
+        self.interval: str = calendar_data.get("interval", "day")
+        self.query_start: str = calendar_data.get("query_start", "") or ""
+        self.query_end: str = calendar_data.get("query_end", "") or ""
+
+        slots = calendar_data.get("data") or []
+        # Start and end strings as sent, for display
+        self.start_labels: List[str] = [s.get("start") or "" for s in slots]
+        self.end_labels: List[str] = [s.get("end") or "" for s in slots]
+        self._start_times = [parse_time(s) for s in self.start_labels]
+
+        # Entities and component columns in order of first appearance
+        entities: Dict[tuple, int] = {}
+        components: Dict[str, int] = {}
+        for slot in slots:
+            for kind in KINDS:
+                for entity in slot.get(f"{kind}s") or []:
+                    entities.setdefault((kind, entity.get("name", "")), len(entities))
+                    for name in entity.get("components") or {}:
+                        components.setdefault(name, len(components))
+        self.kinds: List[str] = [kind for kind, _ in entities]
+        self.names: List[str] = [name for _, name in entities]
+        self._entity_ids = entities
+        self.columns: List[str] = list(BASE_COLUMNS) + list(components)
+        self._column_ids = {name: i for i, name in enumerate(self.columns)}
+
+        shape = (len(slots), len(entities), len(self.columns))
+        self.available = np.zeros(shape, dtype=np.float64)
+        self.capacity = np.zeros(shape, dtype=np.float64)
+        self.has_available = np.zeros(shape, dtype=bool)
+        self.has_capacity = np.zeros(shape, dtype=bool)
+        self.present = np.zeros(shape[:2], dtype=bool)
+        # Entities in the order each slot lists them
+        self._listed: List[List[int]] = []
+        # Values as sent, by (array name, slot, entity, column), for those
+        # an integer in the array would not show faithfully
+        self._raw: Dict[tuple, Any] = {}
+
+        base = len(BASE_COLUMNS)
+        for t, slot in enumerate(slots):
+            listed: Dict[int, None] = {}
+            for kind in KINDS:
+                for entity in slot.get(f"{kind}s") or []:
+                    e = entities[(kind, entity.get("name", ""))]
+                    listed[e] = None
+                    self.present[t, e] = True
+                    for col, key in enumerate(BASE_COLUMNS):
+                        for values, has, suffix in (
+                            (self.available, self.has_available, "available"),
+                            (self.capacity, self.has_capacity, "capacity"),
+                        ):
+                            field = f"{key}_{suffix}"
+                            if field in entity:
+                                self._set(values, has, t, e, col, entity[field])
+                    for name, comp in (entity.get("components") or {}).items():
+                        col = base + components[name]
+                        self._set(
+                            self.available,
+                            self.has_available,
+                            t,
+                            e,
+                            col,
+                            comp.get("available", 0),
+                        )
+                        self._set(
+                            self.capacity,
+                            self.has_capacity,
+                            t,
+                            e,
+                            col,
+                            comp.get("capacity", 0),
+                        )
+            self._listed.append(list(listed))
+
+        self.starts = np.array(
+            [
+                None if start is None else start.replace(tzinfo=None)
+                for start in self._start_times
+            ],
+            dtype="datetime64[s]",
+        )
+
+    def _set(
+        self,
+        values: np.ndarray,
+        has: np.ndarray,
+        t: int,
+        e: int,
+        col: int,
+        value: Any,
+    ):
+        values[t, e, col] = number = _number(value)
+        has[t, e, col] = True
+        if not (type(value) is int and number == value):
+            self._raw[(values is self.available, t, e, col)] = value
+
+    def _display(self, t: int, e: int, col: int, available: bool) -> str:
+        values, has = (
+            (self.available, self.has_available)
+            if available
+            else (self.capacity, self.has_capacity)
+        )
+        if not has[t, e, col]:
+            return "—"
+        key = (available, t, e, col)
+        if key in self._raw:
+            return str(self._raw[key])
+        return str(int(values[t, e, col]))
+
+    def __len__(self) -> int:
+        return len(self.start_labels)
+
+    @property
+    def allocated(self) -> np.ndarray:
+        """
+        Allocated resources: capacity minus available.
+
+        :rtype: np.ndarray
+        """
+        return self.capacity - self.available
+
+    def entity(self, name: str, kind: str = "site") -> int:
+        """
+        Index of a site or host along the entity axis.
+
+        :param name: site or host name
+        :type name: str
+        :param kind: ``"site"`` or ``"host"``
+        :type kind: str
+        :rtype: int
+        :raises KeyError: if the calendar has no such entity
+        """
+        return self._entity_ids[(kind, name)]
+
+    def column(self, resource: str) -> int:
+        """
+        Index of a resource along the column axis.
+
+        Component models match regardless of case and separators, so
+        ``"GPU-Tesla T4"`` finds the ``"GPU Tesla T4"`` column.
+
+        :param resource: ``cores``, ``ram``, ``disk`` or a component model
+        :type resource: str
+        :rtype: int
+        :raises KeyError: if the calendar has no such resource
+        """
+        col = self._column_ids.get(resource)
+        if col is None:
+            canonical = component_key(resource)
+            for name, i in self._column_ids.items():
+                if component_key(name) == canonical:
+                    return i
+            raise KeyError(resource)
+        return col
+
+    def entities(self, kind: Optional[str] = None) -> np.ndarray:
+        """
+        Entity indices of one kind.
+
+        :param kind: ``"site"``, ``"host"``, or None for all
+        :type kind: str
+        :rtype: np.ndarray
+        """
+        return np.array(
+            [i for i, k in enumerate(self.kinds) if kind is None or k == kind],
+            dtype=np.int64,
+        )
+
+    def window_slots(self, duration: float) -> int:
+        """
+        Number of slots covering ``duration`` hours.
+
+        :param duration: hours
+        :type duration: float
+        :rtype: int
+        """
+        hours = INTERVAL_HOURS.get(self.interval, 24)
+        if len(self):
+            start, end = self._start_times[0], parse_time(self.end_labels[0])
+            if start is not None and end is not None and end > start:
+                hours = (end - start).total_seconds() / 3600
+        return max(1, int(np.ceil(duration / hours - 1e-9)))
+
+    def earliest_window(
+        self,
+        name: str,
+        duration: float = 1,
+        cores: int = 0,
+        ram: int = 0,
+        disk: int = 0,
+        components: Optional[Dict[str, int]] = None,
+        kind: str = "site",
+        after: Optional[datetime.datetime] = None,
+    ) -> Optional[datetime.datetime]:
+        """
+        Earliest start of a window in which a site or host has the
+        requested resources available throughout.
+
+        :param name: site or host name
+        :type name: str
+        :param duration: window length in hours
+        :type duration: float
+        :param cores: cores required
+        :type cores: int
+        :param ram: RAM required (GB)
+        :type ram: int
+        :param disk: disk required (GB)
+        :type disk: int
+        :param components: components required, by model
+        :type components: Dict[str, int]
+        :param kind: ``"site"`` or ``"host"``
+        :type kind: str
+        :param after: earliest acceptable start
+        :type after: datetime.datetime
+        :return: start of the window (UTC), or None if there is none
+        :rtype: datetime.datetime
+        """
+        slots = self.window_slots(duration)
+        if (kind, name) not in self._entity_ids or slots > len(self):
+            return None
+        demand = np.zeros(len(self.columns), dtype=np.float64)
+        demand[: len(BASE_COLUMNS)] = (cores or 0, ram or 0, disk or 0)
+        for model, count in (components or {}).items():
+            if not count:
+                continue
+            try:
+                demand[self.column(model)] += count
+            except KeyError:
+                return None
+
+        e = self.entity(name, kind)
+        series = np.where(self.present[:, e, None], self.available[:, e], -1)
+        minimums = sliding_window_view(series, slots, axis=0).min(axis=-1)
+        ok = (minimums >= demand).all(axis=1)
+        ok &= ~np.isnat(self.starts[: len(ok)])
+        if after is not None:
+            after = np.datetime64(
+                after.astimezone(datetime.timezone.utc).replace(tzinfo=None), "s"
+            )
+            ok &= self.starts[: len(ok)] >= after
+        matches = np.flatnonzero(ok)
+        if not len(matches):
+            return None
+        return self._start_times[matches[0]]
+
+    def utilization(self, resource: str = "cores", kind: str = "site") -> pd.DataFrame:
+        """
+        Fraction of a resource allocated, by slot and site or host.
+
+        Suitable for heatmaps, e.g. ``calendar.utilization("cores").T``
+        with ``DataFrame.style.background_gradient()``.
+
+        :param resource: ``cores``, ``ram``, ``disk`` or a component model
+        :type resource: str
+        :param kind: ``"site"``, ``"host"``, or None for both
+        :type kind: str
+        :return: one row per slot start and one column per entity; NaN
+            where the entity is absent or has no capacity
+        :rtype: pd.DataFrame
+        """
+        col = self.column(resource)
+        rows = self.entities(kind)
+        capacity = self.capacity[:, rows, col].astype(float)
+        available = self.available[:, rows, col]
+        valid = self.present[:, rows] & (capacity > 0)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            used = np.where(valid, 1 - available / capacity, np.nan)
+        return pd.DataFrame(
+            used,
+            index=pd.Index(self.starts, name="start"),
+            columns=pd.Index([self.names[e] for e in rows], name=kind or "name"),
+        )
+
+    def to_pandas(self, values: str = "available") -> pd.DataFrame:
+        """
+        Export one of the arrays as a DataFrame.
+
+        The DataFrame has one row per (slot start, kind, name) and one
+        column per resource.  For ``available`` and ``capacity`` it is a
+        view of the array, not a copy.  Entities absent from a slot have
+        zeros; select ``calendar.present.ravel()`` to drop them.
+
+        :param values: ``"available"``, ``"capacity"`` or ``"allocated"``
+        :type values: str
+        :rtype: pd.DataFrame
+        """
+        if values not in ("available", "capacity", "allocated"):
+            raise ValueError(f"Unknown calendar values: {values}")
+        data = getattr(self, values)
+        slots, entities, columns = data.shape
+        index = pd.MultiIndex.from_arrays(
+            [
+                np.repeat(self.starts, entities),
+                np.tile(np.array(self.kinds, dtype=object), slots),
+                np.tile(np.array(self.names, dtype=object), slots),
+            ],
+            names=["start", "kind", "name"],
+        )
+        return pd.DataFrame(
+            data.reshape(slots * entities, columns),
+            index=index,
+            columns=self.columns,
+            copy=False,
+        )
+
+    def _label(self, t: int) -> str:
+        start = self.start_labels[t]
+        # Show date only for day/week, datetime for hour
+        if self.interval in ("day", "week"):
+            return start[:10] if len(start) >= 10 else start
+        return start[:16] if len(start) >= 16 else start
+
+    def to_rows(
+        self, show: str = "all", fields: Optional[List[str]] = None
+    ) -> Iterator[Dict[str, str]]:
+        """
+        Rows for display, formatted as they are produced.
+
+        Each row is one (slot, site or host) with the date, type, name,
+        ``"available/capacity"`` strings for cores, RAM and disk, and one
+        column per component model with capacity in that slot.
+
+        :param show: which entities to include: ``"sites"``, ``"hosts"``
+            or ``"all"``
+        :type show: str
+        :param fields: columns to format; all by default
+        :type fields: List[str]
+        :return: row dicts in slot order, sites before hosts
+        :rtype: Iterator[Dict[str, str]]
+        """
+        wanted = None if fields is None else set(fields)
+        kinds = [k for k in KINDS if show in ("all", f"{k}s")]
+        base = len(BASE_COLUMNS)
+        for t in range(len(self)):
+            label = self._label(t)
+            for e in self._listed[t]:
+                if self.kinds[e] not in kinds:
+                    continue
+                row: Dict[str, str] = {
+                    "Date": label,
+                    "Type": self.kinds[e],
+                    "Name": self.names[e],
+                }
+                for col, key in enumerate(BASE_COLUMNS):
+                    if wanted is not None and BASE_LABELS[key] not in wanted:
+                        continue
+                    row[BASE_LABELS[key]] = (
+                        f"{self._display(t, e, col, True)}/"
+                        f"{self._display(t, e, col, False)}"
+                    )
+                for col in np.flatnonzero(self.capacity[t, e, base:] > 0) + base:
+                    name = self.columns[col]
+                    if wanted is None or name in wanted:
+                        row[name] = (
+                            f"{self._display(t, e, col, True)}/"
+                            f"{self._display(t, e, col, False)}"
+                        )
+                if wanted is not None:
+                    row = {k: v for k, v in row.items() if k in wanted}
+                yield row
@@ -0,0 +1,316 @@
+#!/usr/bin/env python3
+# MIT License
+#
+# Copyright (c) 2020 FABRIC Testbed
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+"""
+Array-backed index of the hosts in a ``resources_summary``.
+
+:class:`ResourceIndex` holds the capacity, allocated and available
+resources of every host as NumPy matrices with one row per host and one
+column per resource: cores, RAM, disk, then each component model (e.g.
+``GPU-Tesla T4``).  Each host row is tagged with the index of its site, so
+per-site totals and searches for hosts that fit a node are vectorized
+rather than walking the host dicts.
+
+:class:`ResourcesV2` builds an index on each ``update()``; use
+:py:meth:`ResourcesV2.query` to search it.
+"""
+
+from __future__ import annotations
+
+from typing import Any, Dict, Iterable, List, Optional
+
+import numpy as np
+
+# Host dict key prefixes of the resource columns before the components
+BASE_COLUMNS = ("cores", "ram", "disk")
+
+
+class ResourceIndex:
+    """
+    Capacity, allocated and available resources of hosts, by site.
+    """
+
+    def __init__(
+        self,
+        hosts: List[Dict[str, Any]],
+        sites: Optional[List[Dict[str, Any]]] = None,
+    ):
+        """
+        :param hosts: host dicts from ``resources_summary``
+        :type hosts: List[Dict[str, Any]]
+        :param sites: site dicts from ``resources_summary``; hosts of other
+            sites are indexed but never match a query
+        :type sites: List[Dict[str, Any]]
+        """
+        self.sites: List[str] = [s.get("name") for s in sites or []]
+        self._site_ids = {name: i for i, name in enumerate(self.sites)}
+        self.site_active = np.array(
+            [s.get("state", "") == "Active" for s in sites or []], dtype=bool
+        )
+
+        self.hosts: List[str] = [h.get("name") for h in hosts]
+
+        components = sorted(
+            {name for h in hosts for name in (h.get("components") or {})}
+        )
+        self.columns: List[str] = list(BASE_COLUMNS) + components
+        self._column_ids = {name: i for i, name in enumerate(self.columns)}
+
+        shape = (len(hosts), len(self.columns))
+        self.capacity = np.zeros(shape, dtype=np.int64)
+        self.allocated = np.zeros(shape, dtype=np.int64)
+        self.available = np.zeros(shape, dtype=np.int64)
+        # Whether the host reports the resource at all
+        self.reported = np.zeros(shape, dtype=bool)
+        self.reported[:, : len(BASE_COLUMNS)] = True
+        for row, host in enumerate(hosts):
+            for col, key in enumerate(BASE_COLUMNS):
+                self.capacity[row, col] = host.get(f"{key}_capacity", 0) or 0
+                self.allocated[row, col] = host.get(f"{key}_allocated", 0) or 0
+                self.available[row, col] = host.get(f"{key}_available", 0) or 0
+            for name, data in (host.get("components") or {}).items():
+                if not isinstance(data, dict):
+                    continue
+                col = self._column_ids[name]
+                self.reported[row, col] = True
+                capacity = data.get("capacity", 0) or 0
+                allocated = data.get("allocated", 0) or 0
+                self.capacity[row, col] = capacity
+                self.allocated[row, col] = allocated
+                available = data.get("available")
+                self.available[row, col] = (
+                    capacity - allocated if available is None else available
+                )
+
+        # Site membership: site index of each host, -1 if not indexed
+        self.host_sites = np.array(
+            [self._site_ids.get(h.get("site"), -1) for h in hosts], dtype=np.int64
+        )
+        # Hosts that are active themselves; see host_active for their sites
+        self.host_up = np.array(
+            [h.get("state", "") == "Active" for h in hosts], dtype=bool
+        )
+        self._update_host_active()
+
+    def _update_host_active(self):
+        known = self.host_sites >= 0
+        self.host_active = self.host_up & known
+        if len(self.site_active):
+            self.host_active[known] &= self.site_active[self.host_sites[known]]
+
+    def __len__(self) -> int:
+        return len(self.hosts)
+
+    def replace_sites(
+        self,
+        hosts: List[Dict[str, Any]],
+        sites: List[Dict[str, Any]],
+        site_names: Iterable[str] = (),
+    ) -> ResourceIndex:
+        """
+        Index with the hosts of some sites replaced.
+
+        The rows of other sites are copied as they are; the hosts of
+        ``sites`` and ``site_names`` are dropped and ``hosts`` appended.
+        Sites not indexed yet are added.  Sites in ``site_names`` but not
+        in ``sites`` are no longer available and are marked inactive.
+
+        :param hosts: current host dicts of ``sites``
+        :type hosts: List[Dict[str, Any]]
+        :param sites: current site dicts
+        :type sites: List[Dict[str, Any]]
+        :param site_names: all sites being replaced, including those
+            missing from ``sites``
+        :type site_names: Iterable[str]
+        :return: the new index, rows in the order kept rows then ``hosts``
+        :rtype: ResourceIndex
+        """
+        update = ResourceIndex(hosts, sites)
+        removed = [
+            self._site_ids[n]
+            for n in site_names
+            if n in self._site_ids and n not in update._site_ids
+        ]
+        replaced = [
+            self._site_ids[n] for n in update.sites if n in self._site_ids
+        ] + removed
+        keep = ~np.isin(self.host_sites, replaced)
+
+        merged = ResourceIndex([], [])
+        merged.sites = self.sites + [n for n in update.sites if n not in self._site_ids]
+        merged._site_ids = {name: i for i, name in enumerate(merged.sites)}
+        merged.site_active = np.zeros(len(merged.sites), dtype=bool)
+        merged.site_active[: len(self.sites)] = self.site_active
+        site_map = np.array([merged._site_ids[n] for n in update.sites], dtype=np.int64)
+        merged.site_active[site_map] = update.site_active
+        merged.site_active[removed] = False
+
+        merged.hosts = [h for h, k in zip(self.hosts, keep) if k] + update.hosts
+        components = sorted(
+            set(self.columns[len(BASE_COLUMNS) :])
+            | set(update.columns[len(BASE_COLUMNS) :])
+        )
+        merged.columns = list(BASE_COLUMNS) + components
+        merged._column_ids = {name: i for i, name in enumerate(merged.columns)}
+
+        old_cols = [merged._column_ids[c] for c in self.columns]
+        new_cols = [merged._column_ids[c] for c in update.columns]
+        kept = int(keep.sum())
+        for attr in ("capacity", "allocated", "available", "reported"):
+            source, rows = getattr(self, attr), getattr(update, attr)
+            matrix = np.zeros((kept + len(rows), len(merged.columns)), source.dtype)
+            matrix[:kept, old_cols] = source[keep]
+            matrix[kept:, new_cols] = rows
+            setattr(merged, attr, matrix)
+
+        host_sites = np.full(len(update.hosts), -1, dtype=np.int64)
+        known = update.host_sites >= 0
+        host_sites[known] = site_map[update.host_sites[known]]
+        merged.host_sites = np.concatenate([self.host_sites[keep], host_sites])
+        merged.host_up = np.concatenate([self.host_up[keep], update.host_up])
+        merged._update_host_active()
+        return merged
+
+    def site_hosts(self, site_name: str) -> np.ndarray:
+        """
+        Row indices of the hosts of a site.
+
+        :param site_name: site name
+        :type site_name: str
+        :rtype: np.ndarray
+        """
+        site = self._site_ids.get(site_name)
+        if site is None:
+            return np.zeros(0, dtype=np.int64)
+        return np.flatnonzero(self.host_sites == site)
+
+    def site_totals(self, matrix: np.ndarray) -> np.ndarray:
+        """
+        Sum the rows of one of the host matrices by site.
+
+        :param matrix: ``capacity``, ``allocated``, ``available`` or
+            ``reported``
+        :type matrix: np.ndarray
+        :return: matrix with one row per site, in the order of ``sites``
+        :rtype: np.ndarray
+        """
+        totals = np.zeros((len(self.sites), len(self.columns)), dtype=np.int64)
+        known = self.host_sites >= 0
+        np.add.at(totals, self.host_sites[known], matrix[known].astype(np.int64))
+        return totals
+
+    def demand(
+        self,
+        cores: int = 0,
+        ram: int = 0,
+        disk: int = 0,
+        components: Optional[Dict[str, int]] = None,
+    ) -> Optional[np.ndarray]:
+        """
+        Resources requested by one node as a row of the index.
+
+        :return: the row; None if a component model is on no host
+        :rtype: np.ndarray
+        """
+        row = np.zeros(len(self.columns), dtype=np.int64)
+        row[: len(BASE_COLUMNS)] = (cores or 0, ram or 0, disk or 0)
+        for name, count in (components or {}).items():
+            if not count:
+                continue
+            col = self._column_ids.get(name)
+            if col is None:
+                return None
+            row[col] = count
+        return row
+
+    def fits(self, demand: np.ndarray) -> np.ndarray:
+        """
+        Number of nodes of a shape that fit on each active host.
+
+        :param demand: row from :py:meth:`demand`
+        :type demand: np.ndarray
+        :return: node count per host; hosts that are not active get 0
+        :rtype: np.ndarray
+        """
+        requested = demand > 0
+        if not requested.any():
+            # A node requesting nothing fits anywhere, once per host
+            counts = np.ones(len(self.hosts), dtype=np.int64)
+        else:
+            counts = (
+                np.maximum(self.available[:, requested], 0) // demand[requested]
+            ).min(axis=1)
+        return np.where(self.host_active, counts, 0)
+
+    def query(
+        self,
+        cores: int = 0,
+        ram: int = 0,
+        disk: int = 0,
+        components: Optional[Dict[str, int]] = None,
+        count: int = 1,
+        sites: Optional[Iterable[str]] = None,
+    ) -> Dict[str, List[str]]:
+        """
+        Find the sites that can host ``count`` nodes of a shape.
+
+        :param cores: cores per node
+        :type cores: int
+        :param ram: RAM per node (GB)
+        :type ram: int
+        :param disk: disk per node (GB)
+        :type disk: int
+        :param components: components per node, by ``"<type>-<model>"``
+            (e.g. ``{"GPU-Tesla T4": 1}``)
+        :type components: Dict[str, int]
+        :param count: number of nodes
+        :type count: int
+        :param sites: sites to consider; all by default
+        :type sites: Iterable[str]
+        :return: the hosts each node fits on, by site; hosts that fit the
+            most nodes come first and sites with the most room first
+        :rtype: Dict[str, List[str]]
+        """
+        demand = self.demand(cores=cores, ram=ram, disk=disk, components=components)
+        if demand is None or not len(self.sites):
+            return {}
+        per_host = self.fits(demand)
+        if sites is not None:
+            allowed = np.zeros(len(self.sites), dtype=bool)
+            allowed[[self._site_ids[s] for s in sites if s in self._site_ids]] = True
+            per_host = np.where(allowed[self.host_sites], per_host, 0)
+
+        fitting = np.flatnonzero(per_host > 0)
+        per_site = np.bincount(
+            self.host_sites[fitting],
+            weights=per_host[fitting],
+            minlength=len(self.sites),
+        )
+        result = {}
+        for site in np.argsort(-per_site, kind="stable"):
+            if per_site[site] < max(count, 1):
+                break
+            rows = fitting[self.host_sites[fitting] == site]
+            rows = rows[np.argsort(-per_host[rows], kind="stable")]
+            result[self.sites[site]] = [self.hosts[row] for row in rows]
+        return result
@@ -0,0 +1,232 @@
+#!/usr/bin/env python3
+# MIT License
+#
+# Copyright (c) 2020 FABRIC Testbed
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+"""
+Persistent on-disk cache of ``resources_summary`` responses.
+
+Every new process fetches the resource summary on first use, and every
+``update=True`` fetches it again.  :class:`ResourcesSummaryCache` keeps the
+last summary for each set of query parameters under
+``<data_dir>/resources_cache``.  A summary younger than ``max_age`` is
+returned immediately and refreshed on disk by a background thread
+(stale-while-revalidate), so the next reader gets newer data; older
+summaries are fetched synchronously.  Pass ``max_age=0`` to require a
+summary fetched now.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+import os
+import threading
+import time
+from datetime import datetime
+from typing import Any, Callable, Dict, Optional, Tuple
+
+from atomicwrites import atomic_write
+
+log = logging.getLogger("fablib")
+
+
+class ResourcesSummaryCache:
+    """
+    On-disk cache of resource summaries keyed by query parameters.
+    """
+
+    def __init__(self, cache_dir: str, max_age: float):
+        """
+        :param cache_dir: directory holding one JSON file per query
+        :type cache_dir: str
+        :param max_age: default age in seconds up to which a cached summary
+            is served
+        :type max_age: float
+        """
+        self.cache_dir = cache_dir
+        self.max_age = max_age
+        self.lock = threading.Lock()
+        # Keys being revalidated in the background, with their threads
+        self._revalidating: Dict[str, threading.Thread] = {}
+
+    @staticmethod
+    def key(**params) -> str:
+        """
+        Key identifying a query.
+
+        :param params: query parameters (host, project, level, start, end,
+            includes, excludes, ...)
+        :return: hex digest
+        :rtype: str
+        """
+
+        def normalize(value):
+            if isinstance(value, datetime):
+                return value.isoformat()
+            if isinstance(value, (list, tuple, set)):
+                return sorted(str(v) for v in value)
+            return value
+
+        canonical = {k: normalize(v) for k, v in params.items() if v is not None}
+        data = json.dumps(canonical, sort_keys=True, default=str)
+        return hashlib.sha256(data.encode("utf-8")).hexdigest()
+
+    def _path(self, key: str) -> str:
+        return os.path.join(self.cache_dir, f"{key}.json")
+
+    def get(self, key: str) -> Optional[Tuple[float, Dict[str, Any]]]:
+        """
+        Get the cached summary for a query.
+
+        :param key: query key
+        :type key: str
+        :return: (time fetched, summary), or None if not cached
+        :rtype: Tuple[float, dict]
+        """
+        path = self._path(key)
+        try:
+            with open(path, "r") as f:
+                entry = json.load(f)
+            fetched_at = entry.get("fetched_at", 0)
+            summary = entry.get("summary")
+            if not isinstance(fetched_at, (int, float)) or not isinstance(
+                summary, dict
+            ):
+                raise ValueError("malformed entry")
+        except FileNotFoundError:
+            return None
+        except Exception as e:
+            log.warning(f"Ignoring unreadable resources cache entry {path}: {e}")
+            return None
+        return fetched_at, summary
+
+    def put(self, key: str, summary: Dict[str, Any], fetched_at: float = None):
+        """
+        Store the summary of a query.
+
+        :param key: query key
+        :type key: str
+        :param summary: ``resources_summary`` response
+        :type summary: dict
+        :param fetched_at: time the summary was fetched; now by default
+        :type fetched_at: float
+        """
+        entry = {
+            "fetched_at": time.time() if fetched_at is None else fetched_at,
+            "summary": summary,
+        }
+        path = self._path(key)
+        with self.lock:
+            current = self.get(key)
+            if current is not None and current[0] > entry["fetched_at"]:
+                # A newer summary was stored meanwhile
+                return
+            try:
+                os.makedirs(self.cache_dir, exist_ok=True)
+                with atomic_write(path, overwrite=True) as f:
+                    json.dump(entry, f)
+            except Exception as e:
+                log.warning(f"Failed to write resources cache entry {path}: {e}")
+
+    def fetch(
+        self,
+        key: str,
+        fetch: Callable[[], Dict[str, Any]],
+        max_age: Optional[float] = None,
+    ) -> Tuple[Dict[str, Any], float]:
+        """
+        Get the summary of a query, from the cache when fresh enough.
+
+        :param key: query key
+        :type key: str
+        :param fetch: function fetching the summary from FABRIC
+        :type fetch: Callable
+        :param max_age: age in seconds up to which a cached summary is
+            served; ``0`` always fetches.  Defaults to the cache's max age.
+        :type max_age: float
+        :return: (summary, time it was fetched)
+        :rtype: Tuple[dict, float]
+        """
+        if max_age is None:
+            max_age = self.max_age
+
+        if max_age > 0:
+            cached = self.get(key)
+            if cached is not None and cached[1]:
+                fetched_at, summary = cached
+                age = time.time() - fetched_at
+                if 0 <= age <= max_age:
+                    log.debug(f"Using resources summary cached {age:.0f}s ago")
+                    self.revalidate(key, fetch)
+                    return summary, fetched_at
+
+        fetched_at = time.time()
+        summary = fetch()
+        if summary:
+            self.put(key, summary, fetched_at=fetched_at)
+        return summary, fetched_at
+
+    def revalidate(self, key: str, fetch: Callable[[], Dict[str, Any]]):
+        """
+        Refresh the cached summary of a query in a background thread.
+
+        Does nothing if the query is already being refreshed.
+
+        :param key: query key
+        :type key: str
+        :param fetch: function fetching the summary from FABRIC
+        :type fetch: Callable
+        """
+
+        def run():
+            try:
+                fetched_at = time.time()
+                summary = fetch()
+                if summary:
+                    self.put(key, summary, fetched_at=fetched_at)
+            except Exception as e:
+                log.warning(f"Failed to revalidate resources summary: {e}")
+            finally:
+                with self.lock:
+                    self._revalidating.pop(key, None)
+
+        with self.lock:
+            if key in self._revalidating:
+                return
+            thread = threading.Thread(
+                target=run, name="fablib-resources-revalidate", daemon=True
+            )
+            self._revalidating[key] = thread
+        thread.start()
+
+    def wait(self, timeout: Optional[float] = None):
+        """
+        Wait for background revalidations to finish.
+
+        :param timeout: seconds to wait for each revalidation
+        :type timeout: float
+        """
+        with self.lock:
+            threads = list(self._revalidating.values())
+        for thread in threads:
+            thread.join(timeout)
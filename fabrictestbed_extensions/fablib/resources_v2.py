@@ -30,21 +30,29 @@ Provides :class:`ResourcesV2Wrapper` with list/show helpers for sites,
 hosts, links, and facility ports.  All tabular output goes through
 ``Utils.list_table`` / ``Utils.show_table``.
 
-The ``resources_summary`` JSON API is the **primary** data source.
-A full FIM topology is loaded lazily only when ERO path validation is
-required.
+The ``resources_summary`` JSON API is the **primary** data source.  Host
+resources are also held in a :class:`ResourceIndex` (NumPy matrices) for
+per-site totals and :py:meth:`ResourcesV2.query`.
+ERO paths are validated on a :class:`SiteGraph` built from the summary
+links; a full FIM topology is loaded lazily only when the summary has no
+links or it is requested explicitly.
 """
 
 from __future__ import annotations
 
 import logging
+import threading
+import time
 from datetime import datetime
 from typing import Any, Callable, Dict, List, Optional, Tuple
 
+import numpy as np
 from fabrictestbed.slice_editor import AdvertisedTopology
 
 from fabrictestbed_extensions.fablib.constants import Constants
+from fabrictestbed_extensions.fablib.resource_index import BASE_COLUMNS, ResourceIndex
 from fabrictestbed_extensions.fablib.site import ResourceConstants
+from fabrictestbed_extensions.fablib.site_graph import SiteGraph
 from fabrictestbed_extensions.utils.utils import Utils
 
 log = logging.getLogger("fablib")
@@ -221,6 +229,53 @@ def _host_summary_to_v1_dict(host_data: Dict[str, Any]) -> Dict[str, Any]:
     return d
 
 
+class _SummaryState:
+    """
+    Data derived from one ``resources_summary``, published as a whole.
+
+    :class:`ResourcesV2` replaces its state with a single assignment, so
+    concurrent readers see either the old or the new data of all sites,
+    hosts, totals and the index, never a mix.  A published state is not
+    changed, except for the site graph built on first use.
+    """
+
+    def __init__(
+        self,
+        sites_data: List[Dict[str, Any]],
+        hosts_data: List[Dict[str, Any]],
+        links_data: List[Dict[str, Any]],
+        facility_ports_data: List[Dict[str, Any]],
+        index: Optional[ResourceIndex] = None,
+        fetched_at: Optional[float] = None,
+        from_cache: bool = False,
+        site_fetched_at: Optional[Dict[str, float]] = None,
+        cached_sites: Optional[set] = None,
+    ):
+        self.sites_data = sites_data
+        self.sites_by_name: Dict[str, Dict[str, Any]] = {
+            s["name"]: s for s in sites_data
+        }
+        self.hosts_data = hosts_data
+        self.hosts_by_name: Dict[str, Dict[str, Any]] = {}
+        self.hosts_by_site: Dict[str, Dict[str, Dict[str, Any]]] = {}
+        for h in hosts_data:
+            if h.get("name"):
+                self.hosts_by_name.setdefault(h["name"], h)
+                self.hosts_by_site.setdefault(h.get("site"), {})[h["name"]] = h
+        self.links_data = links_data
+        self.facility_ports_data = facility_ports_data
+        self.index = index
+        # When the summary was fetched, and whether it came from the
+        # persistent resources cache
+        self.fetched_at = fetched_at
+        self.from_cache = from_cache
+        # Per site: when its data was fetched, and which came from the cache
+        self.site_fetched_at = site_fetched_at or {}
+        self.cached_sites = cached_sites or set()
+        # Site adjacency built from the links, on first use
+        self.site_graph: Optional[SiteGraph] = None
+
+
 # ==================================================================
 # ResourcesV2Wrapper — sites + hosts (main entry point)
 # ==================================================================
@@ -231,7 +286,8 @@ class ResourcesV2:
 
     Uses ``FabricManagerV2.resources_summary()`` to fetch sites, hosts,
     links, and facility ports as plain dicts.  The full FIM topology is
-    loaded **lazily** only when ERO path validation is needed.
+    loaded **lazily** only when requested, or for ERO path validation when
+    the summary has no links.
     """
 
     def __init__(
@@ -242,19 +298,18 @@ class ResourcesV2:
         end: Optional[datetime] = None,
         avoid: Optional[List[str]] = None,
         includes: Optional[List[str]] = None,
+        max_age: Optional[float] = None,
     ):
         self.fablib_manager = fablib_manager
 
-        # Summary-derived caches (lists of plain dicts)
-        self._sites_data: List[Dict[str, Any]] = []
-        self._hosts_data: List[Dict[str, Any]] = []
-        self._links_data: List[Dict[str, Any]] = []
-        self._facility_ports_data: List[Dict[str, Any]] = []
+        # Summary-derived data (plain dicts and the array index), replaced
+        # as a whole by update() and refresh_sites()
+        self._state = _SummaryState([], [], [], [])
+        # Serializes fetching, building and publishing new states, so a
+        # state is never replaced by one built from older data
+        self._state_lock = threading.Lock()
 
-        # Keyed lookup for sites
-        self._sites_by_name: Dict[str, Dict[str, Any]] = {}
-
-        # FIM topology — loaded lazily for ERO validation only
+        # FIM topology — loaded lazily when the summary has no links
         self._topology: Optional[AdvertisedTopology] = None
         self._lazy_params: Dict[str, Any] = {}
 
@@ -264,6 +319,7 @@ class ResourcesV2:
             end=end,
             avoid=avoid,
             includes=includes,
+            max_age=max_age,
         )
 
     # ----------------------------------------------------------
@@ -277,10 +333,41 @@ class ResourcesV2:
         end: Optional[datetime] = None,
         avoid: Optional[List[str]] = None,
         includes: Optional[List[str]] = None,
+        max_age: Optional[float] = None,
     ) -> None:
-        """Refresh resource data via ``resources_summary``."""
+        """Refresh resource data via ``resources_summary``.
+
+        When the fablib manager has a resources cache, a summary cached
+        less than ``max_age`` seconds ago is used (and refreshed in the
+        background); ``max_age=0`` or ``force_refresh`` fetches it now.
+        """
         log.info("ResourcesV2Wrapper: updating resources via resources_summary")
 
+        with self._state_lock:
+            self._update_locked(
+                force_refresh=force_refresh,
+                start=start,
+                end=end,
+                avoid=avoid,
+                includes=includes,
+                max_age=max_age,
+            )
+
+    def _update_locked(
+        self,
+        force_refresh: bool,
+        start: Optional[datetime],
+        end: Optional[datetime],
+        avoid: Optional[List[str]],
+        includes: Optional[List[str]],
+        max_age: Optional[float],
+    ) -> None:
+        """Fetch the summary and publish its state.
+
+        Called with ``_state_lock`` held, so a concurrent
+        :py:meth:`refresh_sites` cannot publish a merge based on the
+        replaced state afterwards.
+        """
         self._lazy_params = {
             "force_refresh": force_refresh,
             "start_date": start,
@@ -299,125 +386,211 @@ class ResourcesV2:
                 "ResourcesV2Wrapper requires FabricManagerV2 as the manager"
             )
 
-        summary = manager.resources_summary(
-            level=2,
-            start=start,
-            end=end,
-            includes=includes,
-            excludes=avoid,
-            force_refresh=force_refresh,
-        )
+        def fetch():
+            return manager.resources_summary(
+                level=2,
+                start=start,
+                end=end,
+                includes=includes,
+                excludes=avoid,
+                force_refresh=force_refresh,
+            )
+
+        cache = self.fablib_manager.get_resources_cache()
+        if cache is None:
+            summary, summary_fetched_at = fetch(), time.time()
+            from_cache = False
+        else:
+            key = cache.key(
+                host=self.fablib_manager.get_orchestrator_host(),
+                project=self.fablib_manager.get_project_id(),
+                level=2,
+                start=start,
+                end=end,
+                includes=includes,
+                excludes=avoid,
+            )
+            fetched_at = time.time()
+            summary, summary_fetched_at = cache.fetch(
+                key, fetch, max_age=0 if force_refresh else max_age
+            )
+            from_cache = summary_fetched_at < fetched_at
         if not summary:
             raise Exception(
                 "resources_summary returned None — endpoint may be unavailable"
             )
 
         # ---- sites ----
-        raw_sites = summary.get("sites") or []
-        self._sites_data = []
-        self._sites_by_name = {}
-        for s in raw_sites:
-            name = s.get("name")
+        sites_data = []
+        for site in summary.get("sites") or []:
+            name = site.get("name")
             if not name:
                 continue
             if avoid and name in avoid:
                 continue
             if includes and name not in includes:
                 continue
-            self._sites_data.append(s)
-            self._sites_by_name[name] = s
+            sites_data.append(site)
 
         # ---- hosts ----
-        self._hosts_data = summary.get("hosts") or []
+        hosts_data = summary.get("hosts") or []
         # Filter hosts to only those belonging to non-excluded sites
         if avoid or includes:
-            valid = set(self._sites_by_name.keys())
-            self._hosts_data = [h for h in self._hosts_data if h.get("site") in valid]
+            valid = {site["name"] for site in sites_data}
+            hosts_data = [h for h in hosts_data if h.get("site") in valid]
+
+        state = _SummaryState(
+            sites_data,
+            hosts_data,
+            links_data=summary.get("links") or [],
+            facility_ports_data=summary.get("facility_ports") or [],
+            index=ResourceIndex(hosts_data, sites_data),
+            fetched_at=summary_fetched_at,
+            from_cache=from_cache,
+        )
+        state.site_fetched_at = dict.fromkeys(state.sites_by_name, summary_fetched_at)
+        state.cached_sites = set(state.sites_by_name) if from_cache else set()
 
         # ---- recompute site-level totals from host data ----
         # The orchestrator's site-level aggregates can be inaccurate
         # (e.g. reporting 0 cores_available while hosts have cores).
         # Recompute from hosts which have accurate per-node data.
-        if self._hosts_data:
-            self._recompute_site_totals_from_hosts()
+        if hosts_data:
+            self._recompute_site_totals_from_hosts(state)
+
+        self._state = state
+
+    def refresh_sites(self, site_names: List[str], force_refresh: bool = False) -> None:
+        """Fetch the current resources of some sites only.
+
+        The sites and their hosts are replaced and only their totals are
+        recomputed; the data of other sites, links and facility ports is
+        kept.  The new data is published at once, so concurrent readers
+        never see a partial refresh.  Sites missing from the response are
+        no longer available and are dropped.  The time window and site
+        filters of the last :py:meth:`update` are applied.
+
+        :param site_names: sites to refresh
+        :type site_names: List[str]
+        :param force_refresh: bypass the orchestrator's resource cache
+        :type force_refresh: bool
+        """
+        avoid = self._lazy_params.get("avoid") or []
+        includes = self._lazy_params.get("includes")
+        names = [
+            n
+            for n in dict.fromkeys(site_names)
+            if n not in avoid and (not includes or n in includes)
+        ]
+        if not names:
+            return
+        log.info(f"ResourcesV2Wrapper: refreshing sites {names}")
+
+        with self._state_lock:
+            fetched_at = time.time()
+            summary = self.fablib_manager.get_manager().resources_summary(
+                level=2,
+                start=self._lazy_params.get("start_date"),
+                end=self._lazy_params.get("end_date"),
+                includes=names,
+                force_refresh=force_refresh,
+            )
+            if not summary:
+                raise Exception(
+                    "resources_summary returned None — endpoint may be unavailable"
+                )
 
-        # ---- links ----
-        self._links_data = summary.get("links") or []
+            wanted = set(names)
+            sites = [s for s in summary.get("sites") or [] if s.get("name") in wanted]
+            hosts = [h for h in summary.get("hosts") or [] if h.get("site") in wanted]
+
+            current = self._state
+            # Sites missing from the response are no longer available
+            refreshed = {s["name"]: s for s in sites}
+            sites_data = [
+                refreshed.pop(s["name"], s)
+                for s in current.sites_data
+                if s["name"] not in wanted or s["name"] in refreshed
+            ] + list(refreshed.values())
+            hosts_data = [
+                h for h in current.hosts_data if h.get("site") not in wanted
+            ] + hosts
+
+            state = _SummaryState(
+                sites_data,
+                hosts_data,
+                links_data=current.links_data,
+                facility_ports_data=current.facility_ports_data,
+                index=current.index.replace_sites(hosts, sites, site_names=names),
+                fetched_at=current.fetched_at,
+                from_cache=current.from_cache,
+                site_fetched_at=dict(current.site_fetched_at),
+                cached_sites=current.cached_sites - wanted,
+            )
+            self._recompute_site_totals_from_hosts(
+                state, site_names=[s["name"] for s in sites]
+            )
+            for name in names:
+                if name in state.sites_by_name:
+                    state.site_fetched_at[name] = fetched_at
+                else:
+                    state.site_fetched_at.pop(name, None)
 
-        # ---- facility ports ----
-        self._facility_ports_data = summary.get("facility_ports") or []
+            self._state = state
 
-    def _recompute_site_totals_from_hosts(self) -> None:
+    @staticmethod
+    def _recompute_site_totals_from_hosts(
+        state: _SummaryState, site_names: Optional[List[str]] = None
+    ) -> None:
         """Recompute site-level resource totals by aggregating from host data.
 
         The orchestrator's site-level aggregates can be inaccurate (e.g.
         reporting ``cores_available=0`` while individual hosts have cores).
         This method sums host-level values for each site and patches the
-        site dicts in-place so all downstream accessors return correct data.
+        site dicts of a state in-place, before it is published, so all
+        downstream accessors return correct data.
+
+        :param state: state to patch
+        :param site_names: only recompute these sites; all by default
         """
-        from collections import defaultdict
-
-        # Group hosts by site
-        hosts_by_site: dict = defaultdict(list)
-        for h in self._hosts_data:
-            site_name = h.get("site")
-            if site_name:
-                hosts_by_site[site_name].append(h)
-
-        for site_name, site_hosts in hosts_by_site.items():
-            site = self._sites_by_name.get(site_name)
-            if site is None:
-                continue
+        index = state.index
+        capacity = index.site_totals(index.capacity)
+        allocated = index.site_totals(index.allocated)
+        available = index.site_totals(index.available)
+        reported = index.site_totals(index.reported)
+        host_counts = np.bincount(
+            index.host_sites[index.host_sites >= 0], minlength=len(index.sites)
+        )
 
-            # Sum host-level resources
-            cores_cap = sum((h.get("cores_capacity", 0) or 0) for h in site_hosts)
-            cores_alloc = sum((h.get("cores_allocated", 0) or 0) for h in site_hosts)
-            cores_avail = sum((h.get("cores_available", 0) or 0) for h in site_hosts)
-            ram_cap = sum((h.get("ram_capacity", 0) or 0) for h in site_hosts)
-            ram_alloc = sum((h.get("ram_allocated", 0) or 0) for h in site_hosts)
-            ram_avail = sum((h.get("ram_available", 0) or 0) for h in site_hosts)
-            disk_cap = sum((h.get("disk_capacity", 0) or 0) for h in site_hosts)
-            disk_alloc = sum((h.get("disk_allocated", 0) or 0) for h in site_hosts)
-            disk_avail = sum((h.get("disk_available", 0) or 0) for h in site_hosts)
-
-            # Aggregate components from hosts
-            comp_agg: dict = defaultdict(
-                lambda: {"capacity": 0, "allocated": 0, "available": 0}
-            )
-            for h in site_hosts:
-                for comp_key, comp_val in (h.get("components") or {}).items():
-                    if isinstance(comp_val, dict):
-                        comp_agg[comp_key]["capacity"] += (
-                            comp_val.get("capacity", 0) or 0
-                        )
-                        comp_agg[comp_key]["allocated"] += (
-                            comp_val.get("allocated", 0) or 0
-                        )
-                        comp_agg[comp_key]["available"] += (
-                            comp_val.get("available", 0) or 0
-                        )
+        for i, site_name in enumerate(index.sites):
+            if not host_counts[i]:
+                continue
+            if site_names is not None and site_name not in site_names:
+                continue
+            site = state.sites_by_name[site_name]
 
             # Patch site dict in-place
-            site["cores_capacity"] = cores_cap
-            site["cores_allocated"] = cores_alloc
-            site["cores_available"] = cores_avail
-            site["ram_capacity"] = ram_cap
-            site["ram_allocated"] = ram_alloc
-            site["ram_available"] = ram_avail
-            site["disk_capacity"] = disk_cap
-            site["disk_allocated"] = disk_alloc
-            site["disk_available"] = disk_avail
+            for col, key in enumerate(BASE_COLUMNS):
+                site[f"{key}_capacity"] = int(capacity[i, col])
+                site[f"{key}_allocated"] = int(allocated[i, col])
+                site[f"{key}_available"] = int(available[i, col])
 
             # Merge component data: host-aggregated values take precedence
-            existing_comps = site.get("components") or {}
-            merged = dict(comp_agg)
-            for ck, cv in existing_comps.items():
+            merged = {}
+            for col in range(len(BASE_COLUMNS), len(index.columns)):
+                if reported[i, col]:
+                    merged[index.columns[col]] = {
+                        "capacity": int(capacity[i, col]),
+                        "allocated": int(allocated[i, col]),
+                        "available": int(available[i, col]),
+                    }
+            for ck, cv in (site.get("components") or {}).items():
                 if ck not in merged and isinstance(cv, dict):
                     merged[ck] = cv
-            site["components"] = dict(merged)
+            site["components"] = merged
 
     # ----------------------------------------------------------
-    # Lazy FIM topology (for ERO validation only)
+    # Lazy FIM topology
     # ----------------------------------------------------------
 
     def _ensure_topology_loaded(self) -> None:
@@ -444,6 +617,27 @@ class ResourcesV2:
         """Return the associated FablibManager instance."""
         return self.fablib_manager
 
+    def get_fetched_at(self, site_name: Optional[str] = None) -> Optional[float]:
+        """Return when the resource summary, or the data of one site, was
+        fetched (UNIX time)."""
+        if site_name is not None:
+            return self._state.site_fetched_at.get(site_name)
+        return self._state.fetched_at
+
+    def is_from_cache(self, site_name: Optional[str] = None) -> bool:
+        """Return whether the summary, or the data of one site, was served
+        from the resources cache and not refreshed since."""
+        if site_name is not None:
+            return site_name in self._state.cached_sites
+        return self._state.from_cache
+
+    def get_site_graph(self) -> SiteGraph:
+        """Return the adjacency graph of sites connected by links."""
+        state = self._state
+        if state.site_graph is None:
+            state.site_graph = SiteGraph(state.links_data, state.sites_data)
+        return state.site_graph
+
     def get_topology(self) -> AdvertisedTopology:
         """Return the FIM advertised topology, loading lazily if needed."""
         self._ensure_topology_loaded()
@@ -460,11 +654,11 @@ class ResourcesV2:
 
     def get_site_names(self) -> List[str]:
         """Return a list of all available site names."""
-        return list(self._sites_by_name.keys())
+        return list(self._state.sites_by_name.keys())
 
     def get_site(self, site_name: str) -> Optional[Dict[str, Any]]:
         """Return the site data dict for the given site name, or None."""
-        return self._sites_by_name.get(site_name)
+        return self._state.sites_by_name.get(site_name)
 
     # ----------------------------------------------------------
     # Site helpers: capacity / allocated / available
@@ -472,7 +666,7 @@ class ResourcesV2:
 
     def _site_val(self, site_name: str, key: str, default: Any = 0) -> Any:
         """Return a value from a site's data dict, or the default."""
-        s = self._sites_by_name.get(site_name)
+        s = self._state.sites_by_name.get(site_name)
         if not s:
             return default
         return s.get(key, default)
@@ -515,7 +709,7 @@ class ResourcesV2:
 
     def get_component_capacity(self, site_name: str, component_model_name: str) -> int:
         """Return total capacity of a component type at the given site."""
-        s = self._sites_by_name.get(site_name)
+        s = self._state.sites_by_name.get(site_name)
         if not s:
             return 0
         return (
@@ -524,7 +718,7 @@ class ResourcesV2:
 
     def get_component_allocated(self, site_name: str, component_model_name: str) -> int:
         """Return allocated count of a component type at the given site."""
-        s = self._sites_by_name.get(site_name)
+        s = self._state.sites_by_name.get(site_name)
         if not s:
             return 0
         return (
@@ -535,7 +729,7 @@ class ResourcesV2:
 
     def get_component_available(self, site_name: str, component_model_name: str) -> int:
         """Return available count of a component type at the given site."""
-        s = self._sites_by_name.get(site_name)
+        s = self._state.sites_by_name.get(site_name)
         if not s:
             return 0
         return (
@@ -565,18 +759,50 @@ class ResourcesV2:
 
     def get_hosts_by_site(self, site_name: str) -> Dict[str, Dict[str, Any]]:
         """Return hosts for a given site as a dict keyed by host name."""
-        return {
-            h["name"]: h
-            for h in self._hosts_data
-            if h.get("site") == site_name and h.get("name")
-        }
+        return dict(self._state.hosts_by_site.get(site_name, {}))
 
     def get_host(self, host_name: str) -> Optional[Dict[str, Any]]:
         """Return a single host dict by name, or None."""
-        for h in self._hosts_data:
-            if h.get("name") == host_name:
-                return h
-        return None
+        return self._state.hosts_by_name.get(host_name)
+
+    def get_index(self) -> ResourceIndex:
+        """Return the array index of the hosts, rebuilt by ``update()``."""
+        return self._state.index
+
+    def query(
+        self,
+        cores: int = 0,
+        ram: int = 0,
+        disk: int = 0,
+        components: Optional[Dict[str, int]] = None,
+        count: int = 1,
+        sites: Optional[List[str]] = None,
+    ) -> Dict[str, List[str]]:
+        """Find the sites and hosts that can take ``count`` nodes of a shape.
+
+        Only active hosts of active sites are considered.  For example,
+        three nodes with 8 cores and a Tesla T4 GPU each::
+
+            resources.query(cores=8, components={"GPU-Tesla T4": 1}, count=3)
+
+        :param cores: minimum cores per node
+        :param ram: minimum RAM (GB) per node
+        :param disk: minimum disk (GB) per node
+        :param components: components per node, keyed as in
+            ``resources_summary`` (``"<type>-<model>"``)
+        :param count: number of nodes the site must fit
+        :param sites: restrict the search to these sites
+        :return: candidate host names by site name; sites with the most
+            room first
+        """
+        return self._state.index.query(
+            cores=cores,
+            ram=ram,
+            disk=disk,
+            components=components,
+            count=count,
+            sites=sites,
+        )
 
     # ----------------------------------------------------------
     # list / show — sites
@@ -596,7 +822,7 @@ class ResourcesV2:
     ) -> object:
         """List all sites as a table."""
         table = []
-        for site_data in self._sites_data:
+        for site_data in self._state.sites_data:
             row = _site_summary_to_v1_dict(site_data)
             if row.get("hosts") or row.get("hosts_count"):
                 table.append(row)
@@ -620,7 +846,7 @@ class ResourcesV2:
         pretty_names: bool = True,
     ) -> object:
         """Show detailed information for a single site."""
-        site_data = self._sites_by_name.get(site_name)
+        site_data = self._state.sites_by_name.get(site_name)
         if not site_data:
             return f"Site '{site_name}' not found."
 
@@ -647,7 +873,7 @@ class ResourcesV2:
         pretty_names: bool = True,
     ) -> object:
         """List all hosts as a table."""
-        table = [_host_summary_to_v1_dict(h) for h in self._hosts_data]
+        table = [_host_summary_to_v1_dict(h) for h in self._state.hosts_data]
 
         return Utils.list_table(
             table,
@@ -670,20 +896,20 @@ class ResourcesV2:
         pretty_names: bool = True,
     ) -> object:
         """Show detailed information for a single host."""
-        for h in self._hosts_data:
-            if h.get("name") == host_name:
-                data = _host_summary_to_v1_dict(h)
-                return Utils.show_table(
-                    data,
-                    fields=fields,
-                    title=f"Host: {host_name}",
-                    output=output,
-                    quiet=quiet,
-                    pretty_names_dict=(
-                        ResourceConstants.pretty_names_hosts if pretty_names else {}
-                    ),
-                )
-        return f"Host '{host_name}' not found."
+        h = self._state.hosts_by_name.get(host_name)
+        if h is None:
+            return f"Host '{host_name}' not found."
+        data = _host_summary_to_v1_dict(h)
+        return Utils.show_table(
+            data,
+            fields=fields,
+            title=f"Host: {host_name}",
+            output=output,
+            quiet=quiet,
+            pretty_names_dict=(
+                ResourceConstants.pretty_names_hosts if pretty_names else {}
+            ),
+        )
 
     # ----------------------------------------------------------
     # list / show — links
@@ -699,7 +925,7 @@ class ResourcesV2:
     ) -> object:
         """List all inter-site links as a table."""
         return Utils.list_table(
-            self._links_data,
+            self._state.links_data,
             fields=fields,
             title="Links",
             output=output,
@@ -717,7 +943,7 @@ class ResourcesV2:
         pretty_names: bool = True,
     ) -> object:
         """Show detailed information for a single link."""
-        for link in self._links_data:
+        for link in self._state.links_data:
             if link.get("name") == link_name:
                 return Utils.show_table(
                     link,
@@ -731,7 +957,7 @@ class ResourcesV2:
 
     def get_link_list(self) -> List[str]:
         """Return a list of all link names."""
-        return [l.get("name") for l in self._links_data if l.get("name")]
+        return [l.get("name") for l in self._state.links_data if l.get("name")]
 
     # ----------------------------------------------------------
     # list / show — facility ports
@@ -747,7 +973,7 @@ class ResourcesV2:
     ) -> object:
         """List all facility ports as a table."""
         return Utils.list_table(
-            self._facility_ports_data,
+            self._state.facility_ports_data,
             fields=fields,
             title="Facility Ports",
             output=output,
@@ -765,7 +991,7 @@ class ResourcesV2:
         pretty_names: bool = True,
     ) -> object:
         """Show detailed information for a single facility port."""
-        for fp in self._facility_ports_data:
+        for fp in self._state.facility_ports_data:
             if fp.get("name") == fp_name:
                 return Utils.show_table(
                     fp,
@@ -780,13 +1006,36 @@ class ResourcesV2:
         return f"Facility port '{fp_name}' not found."
 
     # ----------------------------------------------------------
-    # ERO path validation (requires full FIM topology)
+    # ERO path validation
     # ----------------------------------------------------------
 
     def validate_requested_ero_path(
         self, source: str, end: str, hops: List[str]
     ) -> None:
-        """Validate an ERO path between source and end via the given hops."""
+        """Validate an ERO path between source and end via the given hops.
+
+        The path is searched on the site graph built from the summary
+        links; the FIM topology is only loaded if the summary has no links.
+        """
+        if self._state.links_data:
+            graph = self.get_site_graph()
+            for hop in hops:
+                if hop not in graph:
+                    raise Exception(f"Hop: {hop} is not found in the available sites!")
+            if source not in graph or end not in graph:
+                raise Exception(f"Source {source} or End: {end} is not found!")
+            path = graph.find_path(source=source, end=end, hops=hops)
+            if path is None:
+                raise Exception(
+                    f"Requested path via {hops} between {source} and {end} could "
+                    f"not be validated; try specifying fewer hops!"
+                )
+            if not path:
+                raise Exception(
+                    f"Requested path via {hops} between {source} and {end} is invalid!"
+                )
+            return
+
         self._ensure_topology_loaded()
 
         hop_sites_node_ids = []
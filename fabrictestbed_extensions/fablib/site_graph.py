@@ -0,0 +1,292 @@
+#!/usr/bin/env python3
+# MIT License
+#
+# Copyright (c) 2020 FABRIC Testbed
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+"""
+Site adjacency graph built from the ``links`` of a ``resources_summary``.
+
+Validating an explicit route (ERO) only needs to know which sites are
+directly connected.  :class:`SiteGraph` holds that adjacency, computes the
+hop distance between every pair of sites once (breadth-first, on the
+adjacency matrix), and searches for loop-free paths through required hops
+using those distances to prune, without loading the advertised FIM
+topology.  The search is bounded by a step limit so an infeasible request
+on a large graph cannot hang the caller.
+"""
+
+from __future__ import annotations
+
+from typing import Any, Dict, Iterable, List, Optional
+
+import numpy as np
+
+
+class SiteGraph:
+    """
+    Undirected graph of sites connected by links.
+    """
+
+    def __init__(
+        self,
+        links: List[Dict[str, Any]],
+        sites: Optional[List[Dict[str, Any]]] = None,
+    ):
+        """
+        :param links: link dicts from ``resources_summary``, each with the
+            names of the two sites it connects in ``sites``
+        :type links: List[Dict[str, Any]]
+        :param sites: site dicts from ``resources_summary``; sites without
+            links are included as isolated sites
+        :type sites: List[Dict[str, Any]]
+        """
+        names = [s.get("name") for s in sites or [] if s.get("name")]
+        pairs = []
+        for link in links:
+            ends = link.get("sites")
+            if not isinstance(ends, (list, tuple)) or len(ends) != 2:
+                continue
+            if ends[0] == ends[1]:
+                continue
+            pairs.append((ends[0], ends[1], link))
+            names.extend(ends)
+
+        self.sites: List[str] = list(dict.fromkeys(names))
+        self._site_ids = {name: i for i, name in enumerate(self.sites)}
+        # Site names by upper case name; hops are matched case-insensitively
+        self._site_names = {name.upper(): name for name in self.sites}
+
+        self.adjacency = np.zeros((len(self.sites), len(self.sites)), dtype=bool)
+        self._links: Dict[tuple, List[Dict[str, Any]]] = {}
+        for a, b, link in pairs:
+            i, j = self._site_ids[a], self._site_ids[b]
+            self.adjacency[i, j] = self.adjacency[j, i] = True
+            self._links.setdefault((min(i, j), max(i, j)), []).append(link)
+        self._neighbors = [np.flatnonzero(row).tolist() for row in self.adjacency]
+
+        self._distances: Optional[np.ndarray] = None
+
+    def __len__(self) -> int:
+        return len(self.sites)
+
+    def __contains__(self, site_name: str) -> bool:
+        return self.resolve(site_name) is not None
+
+    def resolve(self, site_name: str) -> Optional[str]:
+        """
+        Name of a site as found in the links, matched regardless of case.
+
+        :param site_name: site name
+        :type site_name: str
+        :return: the site name, or None if the site is unknown
+        :rtype: str
+        """
+        if site_name in self._site_ids:
+            return site_name
+        return self._site_names.get(str(site_name).upper())
+
+    def neighbors(self, site_name: str) -> List[str]:
+        """
+        Sites directly linked to a site.
+
+        :param site_name: site name
+        :type site_name: str
+        :rtype: List[str]
+        """
+        name = self.resolve(site_name)
+        if name is None:
+            return []
+        return [self.sites[j] for j in self._neighbors[self._site_ids[name]]]
+
+    def links_between(self, site_a: str, site_b: str) -> List[Dict[str, Any]]:
+        """
+        Links directly connecting two sites.
+
+        :rtype: List[Dict[str, Any]]
+        """
+        a, b = self.resolve(site_a), self.resolve(site_b)
+        if a is None or b is None:
+            return []
+        i, j = self._site_ids[a], self._site_ids[b]
+        return self._links.get((min(i, j), max(i, j)), [])
+
+    @property
+    def distances(self) -> np.ndarray:
+        """
+        Hop distance between every pair of sites, -1 if unreachable.
+
+        Computed on first use by a breadth-first search from all sites at
+        once, then cached.
+
+        :rtype: np.ndarray
+        """
+        if self._distances is None:
+            n = len(self.sites)
+            distances = np.full((n, n), -1, dtype=np.int64)
+            np.fill_diagonal(distances, 0)
+            reached = np.eye(n, dtype=bool)
+            frontier = reached.copy()
+            hops = 0
+            while frontier.any():
+                hops += 1
+                # Sites one hop beyond the frontier of each source site
+                frontier = (frontier.astype(np.int64) @ self.adjacency) > 0
+                frontier &= ~reached
+                distances[frontier] = hops
+                reached |= frontier
+            self._distances = distances
+        return self._distances
+
+    def reachable(self, site_a: str, site_b: str) -> bool:
+        """
+        Whether a path connects two sites.
+
+        :rtype: bool
+        """
+        return self.hop_distance(site_a, site_b) is not None
+
+    def hop_distance(self, site_a: str, site_b: str) -> Optional[int]:
+        """
+        Number of links on the shortest path between two sites.
+
+        :return: the distance, or None if the sites are not connected
+        :rtype: int
+        """
+        a, b = self.resolve(site_a), self.resolve(site_b)
+        if a is None or b is None:
+            return None
+        distance = self.distances[self._site_ids[a], self._site_ids[b]]
+        return None if distance < 0 else int(distance)
+
+    def find_path(
+        self,
+        source: str,
+        end: str,
+        hops: Iterable[str] = (),
+        max_hops: Optional[int] = None,
+        max_steps: Optional[int] = 10000,
+    ) -> Optional[List[str]]:
+        """
+        Shortest loop-free path between two sites through some sites.
+
+        Like ``get_nodes_on_path_with_hops`` on the FIM topology, the
+        required sites may be visited in any order.  Requests that cannot
+        be met are mostly rejected without searching (e.g. a required site
+        with a single link); otherwise branches are pruned when the end or
+        a required site can no longer be reached without revisiting a site.
+        Finding a path through several sites is NP-hard in general, so the
+        search is abandoned after ``max_steps`` partial paths.
+
+        :param source: first site
+        :type source: str
+        :param end: last site
+        :type end: str
+        :param hops: sites the path must go through
+        :type hops: Iterable[str]
+        :param max_hops: maximum number of links on the path
+        :type max_hops: int
+        :param max_steps: maximum number of partial paths explored; None
+            for no limit
+        :type max_steps: int
+        :return: site names from ``source`` to ``end``, an empty list if
+            there is no such path, or None if the search was abandoned
+            before finding a path or proving there is none
+        :rtype: List[str]
+        """
+        names = [self.resolve(s) for s in (source, end, *hops)]
+        if any(name is None for name in names) or names[0] == names[1]:
+            return []
+        start, stop = self._site_ids[names[0]], self._site_ids[names[1]]
+        required = frozenset(self._site_ids[n] for n in names[2:]) - {start}
+
+        # A site passed through needs a link in and a link out
+        if any(r != stop and len(self._neighbors[r]) < 2 for r in required):
+            return []
+
+        distances = self.distances.astype(float)
+        distances[distances < 0] = np.inf
+        limit = len(self.sites) - 1 if max_hops is None else max_hops
+        best: List[int] = []
+        steps = 0
+
+        def lower_bound(node: int, remaining: frozenset) -> float:
+            # Links still needed: to the farthest required site, then on
+            # to the end
+            if not remaining:
+                return distances[node, stop]
+            return max(distances[node, r] + distances[r, stop] for r in remaining)
+
+        def reachable(node: int, visited: set) -> Dict[int, int]:
+            # Hop distances from node to the sites reachable without
+            # revisiting a site or passing through the end
+            found = {node: 0}
+            frontier = [node]
+            while frontier:
+                following = []
+                for i in frontier:
+                    if i == stop and i != node:
+                        continue
+                    for j in self._neighbors[i]:
+                        if j not in found and j not in visited:
+                            found[j] = found[i] + 1
+                            following.append(j)
+                frontier = following
+            return found
+
+        def search(path: List[int], visited: set, remaining: frozenset):
+            nonlocal best, steps
+            steps += 1
+            if max_steps is not None and steps > max_steps:
+                raise _SearchAbandoned()
+            node = path[-1]
+            if node == stop:
+                if not remaining:
+                    best = list(path)
+                return
+            residual = reachable(node, visited)
+            if stop not in residual or not remaining <= residual.keys():
+                return
+            needed = max(
+                (residual[r] + distances[r, stop] for r in remaining),
+                default=residual[stop],
+            )
+            bound = len(path) - 1 + needed
+            if bound > limit or (best and bound >= len(best) - 1):
+                return
+            candidates = [j for j in self._neighbors[node] if j not in visited]
+            candidates.sort(key=lambda j: lower_bound(j, remaining - {j}))
+            for j in candidates:
+                visited.add(j)
+                path.append(j)
+                search(path, visited, remaining - {j})
+                path.pop()
+                visited.discard(j)
+
+        try:
+            search([start], {start}, required)
+        except _SearchAbandoned:
+            if not best:
+                return None
+        return [self.sites[i] for i in best]
+
+
+class _SearchAbandoned(Exception):
+    """Raised to stop a path search that exceeded its step limit."""
@@ -0,0 +1,359 @@
+#!/usr/bin/env python3
+# MIT License
+#
+# Copyright (c) 2020 FABRIC Testbed
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+"""
+Choice of sites for all nodes of a slice at once.
+
+:class:`SiteSelector` scores assignments of nodes to sites against one
+``ResourcesV2`` snapshot and returns the best ones.  An assignment is
+feasible when every node fits on some active host of its site, the nodes
+of each site fit in the site's available resources, the nodes of a layer 2
+bridge share a site, and the sites of every layer 2 site-to-site network
+are connected by links with enough available bandwidth.  Its score is the
+smallest relative headroom left: over the requested resources of every
+site used and the bandwidth of every link used, so higher is better.
+
+The search assigns the largest nodes first and stops exploring partial
+assignments that cannot beat the assignments already kept (branch and
+bound: headroom only shrinks as nodes are added).  Site capacities and
+host fits come from the :class:`ResourceIndex` of the resources.
+"""
+
+from __future__ import annotations
+
+import logging
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+import numpy as np
+
+from fabrictestbed_extensions.fablib.placement import PlacementRequest
+
+log = logging.getLogger("fablib")
+
+
+class SiteSelector:
+    """
+    Finds the best sites for the nodes of a slice.
+    """
+
+    def __init__(
+        self,
+        resources,
+        sites: Optional[Iterable[str]] = None,
+        avoid: Optional[Iterable[str]] = None,
+        max_steps: int = 100000,
+    ):
+        """
+        :param resources: resources snapshot to plan against
+        :type resources: ResourcesV2
+        :param sites: candidate sites; all active sites by default
+        :type sites: Iterable[str]
+        :param avoid: sites never chosen
+        :type avoid: Iterable[str]
+        :param max_steps: maximum number of partial assignments explored;
+            the best assignments found so far are returned when reached
+        :type max_steps: int
+        """
+        self.index = resources.get_index()
+        self.graph = resources.get_site_graph()
+        self.max_steps = max_steps
+
+        index = self.index
+        # Available resources of the active hosts of each site
+        available = np.where(
+            index.host_active[:, None], np.maximum(index.available, 0), 0
+        )
+        self.site_available = index.site_totals(available)
+
+        allowed = set(index.sites if sites is None else sites) - set(avoid or [])
+        has_hosts = np.bincount(
+            index.host_sites[index.host_active], minlength=len(index.sites)
+        )
+        self.candidates = [
+            i
+            for i, name in enumerate(index.sites)
+            if name in allowed and index.site_active[i] and has_hosts[i]
+        ]
+        # Available bandwidth between pairs of sites
+        self._bandwidth: Dict[Tuple[int, int], Optional[float]] = {}
+
+    def bandwidth(self, site_a: int, site_b: int) -> Optional[float]:
+        """
+        Bandwidth available between two sites: on the link between them or
+        the bottleneck of the shortest path.
+
+        :param site_a: site index
+        :type site_a: int
+        :param site_b: site index
+        :type site_b: int
+        :return: Gbps; ``inf`` if the links do not report bandwidth or
+            there are no links at all, None if the sites are not connected
+        :rtype: float
+        """
+        key = (min(site_a, site_b), max(site_a, site_b))
+        if key not in self._bandwidth:
+            names = [self.index.sites[i] for i in key]
+            if not np.any(self.graph.adjacency):
+                # Summary without links; connectivity cannot be checked
+                value = np.inf
+            else:
+                path = self.graph.find_path(names[0], names[1])
+                value = None
+                if path:
+                    value = min(
+                        self._link_bandwidth(a, b) for a, b in zip(path, path[1:])
+                    )
+            self._bandwidth[key] = value
+        return self._bandwidth[key]
+
+    def _link_bandwidth(self, site_a: str, site_b: str) -> float:
+        best = None
+        for link in self.graph.links_between(site_a, site_b):
+            available = link.get("available_bandwidth")
+            if available is None and isinstance(link.get("bandwidth"), (int, float)):
+                available = link["bandwidth"] - (link.get("allocated_bandwidth") or 0)
+            if isinstance(available, (int, float)):
+                best = available if best is None else max(best, available)
+        return np.inf if best is None else best
+
+    def suggest(
+        self,
+        requests: List[PlacementRequest],
+        fixed: Optional[Dict[str, str]] = None,
+        same_site: Iterable[Iterable[str]] = (),
+        networks: Iterable[Tuple[Iterable[str], int]] = (),
+        count: int = 3,
+    ) -> List[Dict[str, Any]]:
+        """
+        Best assignments of nodes to sites.
+
+        :param requests: resources of all nodes
+        :type requests: List[PlacementRequest]
+        :param fixed: sites of the nodes (and other network endpoints,
+            e.g. facility ports) that must not move
+        :type fixed: Dict[str, str]
+        :param same_site: groups of names that must be on one site
+        :type same_site: Iterable[Iterable[str]]
+        :param networks: layer 2 site-to-site networks as (endpoint
+            names, bandwidth in Gbps); their endpoints may span at most two
+            sites
+        :type networks: Iterable[Tuple[Iterable[str], int]]
+        :param count: number of assignments to return
+        :type count: int
+        :return: ``{"sites": {node: site}, "score": headroom}`` dicts, best
+            first; empty if no assignment is feasible
+        :rtype: List[Dict[str, Any]]
+        """
+        index = self.index
+        fixed = dict(fixed or {})
+        same_site = [list(group) for group in same_site]
+        networks = [(list(names), bw or 0) for names, bw in networks]
+
+        # Merge names that must share a site into units
+        parent: Dict[str, str] = {}
+
+        def find(name):
+            parent.setdefault(name, name)
+            while parent[name] != name:
+                parent[name] = parent[parent[name]]
+                name = parent[name]
+            return name
+
+        names = [r.name for r in requests] + list(fixed)
+        names += [n for group in same_site for n in group]
+        names += [n for members, _ in networks for n in members]
+        for name in names:
+            find(name)
+        for group in same_site:
+            for name in group[1:]:
+                parent[find(name)] = find(group[0])
+
+        units = sorted({find(n) for n in names})
+        unit_ids = {u: i for i, u in enumerate(units)}
+        unit_of = {n: unit_ids[find(n)] for n in names}
+
+        # Demand of each unit and the sites each can go to
+        demand = np.zeros((len(units), len(index.columns)), dtype=np.int64)
+        allowed = np.zeros((len(units), len(index.sites)), dtype=bool)
+        allowed[:, self.candidates] = True
+        for request in requests:
+            row = index.demand(
+                cores=request.cores,
+                ram=request.ram,
+                disk=request.disk,
+                components=request.components,
+            )
+            if row is None:
+                log.info(f"No site has the components of node {request.name}")
+                return []
+            u = unit_of[request.name]
+            demand[u] += row
+            fits = index.fits(row) > 0
+            on_site = np.zeros(len(index.sites), dtype=bool)
+            on_site[index.host_sites[fits]] = True
+            allowed[u] &= on_site
+
+        unit_site = np.full(len(units), -1, dtype=np.int64)
+        for name, site in fixed.items():
+            site_id = index.sites.index(site) if site in index.sites else -1
+            u = unit_of[name]
+            if site_id < 0 or unit_site[u] not in (-1, site_id):
+                log.info(f"Fixed site {site} of {name} cannot be used")
+                return []
+            unit_site[u] = site_id
+
+        # Units without a fixed site, largest first
+        free = [u for u in range(len(units)) if unit_site[u] < 0]
+        free.sort(key=lambda u: tuple(-demand[u]))
+        depth_of = {u: d for d, u in enumerate(free)}
+        # Networks are checked once all their endpoints are placed
+        by_depth: Dict[int, List[Tuple[List[int], int]]] = {}
+        for members, bw in networks:
+            member_units = sorted({unit_of[n] for n in members})
+            depth = max((depth_of.get(u, -1) for u in member_units), default=-1)
+            by_depth.setdefault(depth, []).append((member_units, bw))
+
+        # Candidate sites of each free unit, most room first
+        room = self.site_available.astype(float)
+
+        def order(u):
+            requested = demand[u] > 0
+            sites = np.flatnonzero(allowed[u])
+            if not requested.any():
+                return sites.tolist()
+            score = (room[sites][:, requested] / demand[u][requested]).min(axis=1)
+            return sites[np.argsort(-score, kind="stable")].tolist()
+
+        orders = [order(u) for u in free]
+        # Identical units with no networks may be placed in any order; only
+        # consider them in non-decreasing candidate position
+        linked = {unit_of[n] for members, _ in networks for n in members}
+        twins = [
+            d > 0
+            and free[d] not in linked
+            and free[d - 1] not in linked
+            and np.array_equal(demand[free[d]], demand[free[d - 1]])
+            and orders[d] == orders[d - 1]
+            for d in range(len(free))
+        ]
+
+        used = np.zeros_like(self.site_available)
+        site_score = np.full(len(index.sites), np.inf)
+        pair_used: Dict[Tuple[int, int], float] = {}
+        pair_score: Dict[Tuple[int, int], float] = {}
+        results: List[Tuple[float, List[int]]] = []
+        steps = 0
+
+        def update_site(s) -> bool:
+            requested = used[s] > 0
+            if not requested.any():
+                site_score[s] = np.inf
+                return True
+            have = self.site_available[s][requested]
+            need = used[s][requested]
+            if (need > have).any():
+                return False
+            site_score[s] = ((have - need) / have).min()
+            return True
+
+        def add_networks(depth, undo) -> bool:
+            for member_units, bw in by_depth.get(depth, []):
+                sites = sorted({int(unit_site[u]) for u in member_units})
+                if len(sites) > 2:
+                    return False
+                if len(sites) < 2:
+                    continue
+                pair = (sites[0], sites[1])
+                available = self.bandwidth(*pair)
+                if available is None:
+                    return False
+                undo.append((pair, pair_used.get(pair), pair_score.get(pair)))
+                pair_used[pair] = pair_used.get(pair, 0) + bw
+                if pair_used[pair] > available:
+                    return False
+                if pair_used[pair] > 0 and np.isfinite(available):
+                    pair_score[pair] = (available - pair_used[pair]) / available
+            return True
+
+        def undo_networks(undo):
+            for pair, used_before, score_before in reversed(undo):
+                for store, value in (
+                    (pair_used, used_before),
+                    (pair_score, score_before),
+                ):
+                    if value is None:
+                        store.pop(pair, None)
+                    else:
+                        store[pair] = value
+
+        def score() -> float:
+            value = min(site_score.min(), min(pair_score.values(), default=np.inf))
+            return 1.0 if np.isinf(value) else float(value)
+
+        def bound() -> float:
+            return results[-1][0] if len(results) >= count else -np.inf
+
+        def search(depth: int, start: int):
+            nonlocal steps
+            if depth == len(free):
+                current = score()
+                if current > bound():
+                    results.append((current, unit_site.copy()))
+                    results.sort(key=lambda r: -r[0])
+                    del results[count:]
+                return
+            u = free[depth]
+            for position in range(start if twins[depth] else 0, len(orders[depth])):
+                steps += 1
+                if steps > self.max_steps:
+                    return
+                s = orders[depth][position]
+                unit_site[u] = s
+                used[s] += demand[u]
+                before = site_score[s]
+                undo: List[tuple] = []
+                if update_site(s) and add_networks(depth, undo) and score() > bound():
+                    search(depth + 1, position)
+                undo_networks(undo)
+                used[s] -= demand[u]
+                site_score[s] = before
+                unit_site[u] = -1
+
+        for s in set(unit_site[unit_site >= 0].tolist()):
+            used[s] += demand[unit_site == s].sum(axis=0)
+            if not update_site(s):
+                return []
+        if not add_networks(-1, []):
+            return []
+        search(0, 0)
+        if steps > self.max_steps:
+            log.info(f"Site search stopped after {self.max_steps} steps")
+
+        node_names = [r.name for r in requests]
+        return [
+            {
+                "sites": {n: index.sites[assignment[unit_of[n]]] for n in node_names},
+                "score": value,
+            }
+            for value, assignment in results
+        ]
@@ -53,7 +53,11 @@ import ipaddress
 import json
 import logging
 import sys
+import threading
 import time
+import uuid
+import weakref
+from collections import deque
 from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta, timezone
 from typing import TYPE_CHECKING, Optional, Tuple
@@ -72,10 +76,13 @@ from fabrictestbed_extensions.fablib.exceptions import (
     ValidationError,
 )
 from fabrictestbed_extensions.fablib.switch import Switch
+from fabrictestbed_extensions.fablib.topology_cache import TopologyCache
+from fabrictestbed_extensions.fablib.user_data_cache import UserDataCache
 from fabrictestbed_extensions.utils.utils import Utils
 
 if TYPE_CHECKING:
     from fabrictestbed_extensions.fablib.fablib import FablibManager
+    from fabrictestbed_extensions.fablib.resources_v2 import ResourcesV2
 
 import concurrent.futures
 import os
@@ -111,6 +118,55 @@ def _setup_ceph_on_node(node, bundle: dict):
         log.warning(f"CephFS mount stderr on {node.get_name()}: {stderr.strip()}")
 
 
+class _SliceSnapshot:
+    """
+    A slice's FIM topology together with the fablib objects wrapping it.
+
+    :py:meth:`Slice.update_topology` builds a new snapshot off to the side
+    and publishes it with a single reference assignment, so threads reading
+    the slice concurrently see either the previous or the new topology and
+    object dictionaries, never a partially updated mix.  Published
+    snapshots and their dictionaries are replaced rather than modified in
+    place.
+
+    Node, FacilityPort and NetworkService objects are shared between
+    snapshots (issue #380).  Their state for the new topology is prepared
+    while the snapshot is built and only assigned to them once it has been
+    published, so they are not modified while the previous snapshot is
+    current.
+    """
+
+    __slots__ = ("topology", "nodes", "facilities", "network_services", "interfaces")
+
+    def __init__(self, topology: Optional[ExperimentTopology] = None):
+        self.topology = topology
+        self.nodes: Dict[str, Node] = {}
+        self.facilities: Dict[str, FacilityPort] = {}
+        self.network_services: Dict[str, NetworkService] = {}
+        self.interfaces: Dict[str, Interface] = {}
+
+
+# Graph models of snapshot topologies no longer referenced.  They are
+# deleted from FIM's graph store on the next update rather than by the
+# finalizer, which may run while the store's (non-reentrant) lock is held.
+_released_graphs = deque()
+
+
+def _delete_released_graphs():
+    """
+    Delete the graphs of released snapshot topologies from FIM's store.
+    """
+    while True:
+        try:
+            graph_model = _released_graphs.popleft()
+        except IndexError:
+            return
+        try:
+            graph_model.delete_graph()
+        except Exception as e:
+            log.debug(f"Failed to delete graph {graph_model.graph_id}: {e}")
+
+
 class Slice:
     """An experiment container on the FABRIC testbed.
 
@@ -136,6 +192,21 @@ class Slice:
     to check if the slice is being removed.
     """
 
+    # Set on slice handles returned by FablibManager.iter_slices(); the
+    # topology and slivers are fetched the first time the topology is read.
+    _deferred_load: bool = False
+    # Currently published topology and fablib objects (see _SliceSnapshot)
+    _snapshot: Optional[_SliceSnapshot] = None
+    # Serializes topology updates; replaced per slice in __init__
+    _update_lock = threading.RLock()
+    # Persistent topology/sliver cache shared with the FablibManager (opt-in)
+    _topology_cache: Optional[TopologyCache] = None
+    # Template contexts by skip list, with the topology and slice they were
+    # built from (see _get_shared_template_context)
+    _template_contexts: Optional[Tuple[ExperimentTopology, SliceDTO, dict]] = None
+    # Rows of list_slivers() with the sliver list they were built from
+    _sliver_rows: Optional[Tuple[List[SliverDTO], List[Dict[str, str]]]] = None
+
     def __init__(
         self,
         fablib_manager: FablibManager,
@@ -151,7 +222,11 @@ class Slice:
         """
         super().__init__()
 
+        # Serializes topology updates; readers never take it
+        self._update_lock = threading.RLock()
         self.fablib_manager: FablibManager = fablib_manager
+        if fablib_manager:
+            self._topology_cache = fablib_manager.get_topology_cache()
         self.network_iface_map = None
         self.sm_slice: Optional[SliceDTO] = sm_slice
         self.slice_name = sm_slice.name if sm_slice else name
@@ -226,7 +301,10 @@ class Slice:
         self.sm_slice = None
         self.slice_id = None
 
-        self.get_fim_topology().load(file_name=filename)
+        cache = UserDataCache.for_topology(self.topology)
+        if cache is not None:
+            cache.clear()
+        self.topology.load(file_name=filename)
 
     def show(
         self, fields=None, output=None, quiet=False, colors=False, pretty_names=True
@@ -313,6 +391,51 @@ class Slice:
 
         return slice_table
 
+    @staticmethod
+    def _list_columns(
+        cls: type,
+        fields: Optional[List[str]],
+        output: Optional[str],
+        filter_function,
+        pretty_names_dict: Dict[str, str],
+        required: Tuple[str, ...] = (),
+    ) -> Optional[List[str]]:
+        """
+        Not intended for API use.
+
+        Get the ``toDict()`` columns that a ``list_*`` call displays, so
+        that other columns are not computed.
+
+        :param cls: class of the listed objects
+        :type cls: type
+        :param fields: fields requested by the caller
+        :type fields: List[str]
+        :param output: output format
+        :type output: str
+        :param filter_function: filter requested by the caller; it may read
+            any column
+        :type filter_function: lambda
+        :param pretty_names_dict: pretty names by column name
+        :type pretty_names_dict: Dict[str, str]
+        :param required: columns needed by the listing itself, e.g. to sort
+        :type required: Tuple[str, ...]
+        :return: column names, or None for all columns
+        :rtype: List[str]
+        """
+        # JSON and list output include every column, and a filter may
+        # look at any of them.
+        if filter_function or Utils._determine_output_type(output) not in (
+            "text",
+            "pandas",
+        ):
+            return None
+        if fields is None and pretty_names_dict:
+            fields = list(pretty_names_dict.keys())
+        columns = cls._columns_for_fields(fields, pretty_names_dict)
+        if columns is None:
+            return None
+        return columns + [c for c in required if c not in columns]
+
     def list_components(
         self,
         output: str = None,
@@ -356,15 +479,18 @@ class Slice:
         :return: table in format specified by output parameter
         :rtype: Object
         """
-        table = []
-        for component in self.get_components(refresh=refresh):
-            table.append(component.toDict())
-
         if pretty_names:
             pretty_names_dict = Component.get_pretty_name_dict()
         else:
             pretty_names_dict = {}
 
+        columns = self._list_columns(
+            Component, fields, output, filter_function, pretty_names_dict
+        )
+        table = []
+        for component in self.get_components(refresh=refresh):
+            table.append(component.toDict(fields=columns))
+
         table = Utils.list_table(
             table,
             fields=fields,
@@ -420,70 +546,27 @@ class Slice:
         :return: table in format specified by output parameter
         :rtype: Object
         """
-        no_ssh = self.get_fablib_manager().get_no_ssh()
-
-        with ThreadPoolExecutor(64) as executor:
-            net_name_threads = {}
-            node_name_threads = {}
-            physical_os_interface_name_threads = {}
-            os_interface_threads = {}
-            for iface in self.get_interfaces(refresh=refresh):
-                if iface.get_network():
-                    log.info(
-                        f"Starting get network name thread for iface {iface.get_name()} "
-                    )
-                    net_name_threads[iface.get_name()] = executor.submit(
-                        iface.get_network().get_name
-                    )
-
-                if iface.get_node():
-                    log.info(
-                        f"Starting get node name thread for iface {iface.get_name()} "
-                    )
-                    node_name_threads[iface.get_name()] = executor.submit(
-                        iface.get_node().get_name
-                    )
-
-                # Skip SSH-dependent interface lookups when no_ssh is set
-                if not no_ssh:
-                    log.info(
-                        f"Starting get physical_os_interface_name_threads for iface {iface.get_name()} "
-                    )
-                    physical_os_interface_name_threads[iface.get_name()] = (
-                        executor.submit(iface.get_physical_os_interface_name)
-                    )
-
-                    log.info(
-                        f"Starting get get_os_interface_threads for iface {iface.get_name()} "
-                    )
-                    os_interface_threads[iface.get_name()] = executor.submit(
-                        iface.get_device_name
-                    )
-
-            table = []
-            for iface in self.get_interfaces():
-                if iface.get_network():
-                    log.info(
-                        f"Getting results from get network name thread for iface {iface.get_name()} "
-                    )
-                    network_name = net_name_threads[iface.get_name()].result()
-                else:
-                    network_name = None
-
-                if iface.get_node():
-                    log.info(
-                        f"Getting results from get node name thread for iface {iface.get_name()} "
-                    )
-                    node_name = node_name_threads[iface.get_name()].result()
-                else:
-                    node_name = None
-
-                table.append(iface.toDict())
         if pretty_names:
             pretty_names_dict = Interface.get_pretty_name_dict()
         else:
             pretty_names_dict = {}
 
+        columns = self._list_columns(
+            Interface, fields, output, filter_function, pretty_names_dict
+        )
+        interfaces = self.get_interfaces(refresh=refresh)
+
+        # Device names and addresses are read from the nodes over SSH, and
+        # only if displayed: one "ip -j addr list" per node resolves all of
+        # its interfaces.
+        ssh_columns = {"physical_dev", "dev", "ip_addr"}
+        if not self.get_fablib_manager().get_no_ssh() and (
+            columns is None or ssh_columns.intersection(columns)
+        ):
+            self._discover_interfaces(interfaces)
+
+        table = [iface.toDict(fields=columns) for iface in interfaces]
+
         table = Utils.list_table(
             table,
             fields=fields,
@@ -496,6 +579,35 @@ class Slice:
 
         return table
 
+    def _discover_interfaces(self, interfaces: List[Interface]):
+        """
+        Not intended for API use.
+
+        Resolve the OS device names and IP addresses of interfaces on
+        active nodes, one SSH call per node, on the fablib SSH thread pool.
+
+        :param interfaces: interfaces to resolve
+        :type interfaces: List[Interface]
+        """
+        interfaces_by_node: Dict[Node, List[Interface]] = {}
+        for iface in interfaces:
+            node = iface.get_node()
+            if isinstance(node, Node) and str(node.get_reservation_state()) == "Active":
+                interfaces_by_node.setdefault(node, []).append(iface)
+
+        executor = self.get_fablib_manager().get_ssh_thread_pool_executor()
+        if executor is None or len(interfaces_by_node) <= 1:
+            for node, node_interfaces in interfaces_by_node.items():
+                node.discover_interfaces(node_interfaces)
+            return
+
+        futures = [
+            executor.submit(node.discover_interfaces, node_interfaces)
+            for node, node_interfaces in interfaces_by_node.items()
+        ]
+        for future in concurrent.futures.as_completed(futures):
+            future.result()
+
     @staticmethod
     def new_slice(
         fablib_manager: FablibManager,
@@ -528,6 +640,7 @@ class Slice:
         fablib_manager: FablibManager,
         sm_slice: SliceDTO,
         user_only: bool = True,
+        lazy: bool = False,
     ):
         """
         Not intended for API use.
@@ -537,6 +650,9 @@ class Slice:
         :param sm_slice:
         :param user_only: True indicates return own slices; False indicates return project slices
         :type user_only: bool
+        :param lazy: True to defer fetching the topology and slivers until
+            the topology is first accessed
+        :type lazy: bool
         :return: Slice
         """
         log.info("slice.get_slice()")
@@ -547,23 +663,112 @@ class Slice:
         if fablib_manager:
             fablib_manager.cache_slice(slice_object=slice)
 
+        if lazy:
+            slice._deferred_load = True
+        else:
+            slice._load_topology_and_slivers()
+
+        return slice
+
+    def _load_topology_and_slivers(self):
+        """
+        Fetch the topology and slivers of an existing slice, logging
+        (rather than raising) any failure.
+        """
+        self._deferred_load = False
+
         try:
-            slice.update_topology()
+            self.update_topology()
         except Exception as e:
             log.error(
-                f"Slice {slice.slice_name} could not update topology: slice.get_slice"
+                f"Slice {self.slice_name} could not update topology: slice.get_slice"
             )
             log.error(e, exc_info=True)
 
         try:
-            slice.update_slivers()
+            self.update_slivers()
         except Exception as e:
             log.error(
-                f"Slice {slice.slice_name} could not update slivers: slice.get_slice"
+                f"Slice {self.slice_name} could not update slivers: slice.get_slice"
             )
             log.error(e, exc_info=True)
 
-        return slice
+    @property
+    def topology(self) -> Optional[ExperimentTopology]:
+        """
+        The slice's FIM topology.
+
+        Slice handles created lazily (see
+        :py:meth:`FablibManager.iter_slices`) fetch their topology and
+        slivers the first time this is read.
+        """
+        if self._deferred_load:
+            self._load_topology_and_slivers()
+        return self._view().topology
+
+    @topology.setter
+    def topology(self, topology: Optional[ExperimentTopology]):
+        # An explicitly assigned topology supersedes any deferred load.
+        self._deferred_load = False
+        self._replace_view(topology=topology)
+
+    def _view(self) -> _SliceSnapshot:
+        """
+        The currently published snapshot.
+        """
+        snapshot = self._snapshot
+        if snapshot is None:
+            snapshot = self._snapshot = _SliceSnapshot()
+        return snapshot
+
+    def _replace_view(self, **fields):
+        """
+        Publish a copy of the current snapshot with some fields replaced.
+
+        :param fields: snapshot attributes to replace
+        """
+        with self._update_lock:
+            current = self._view()
+            snapshot = _SliceSnapshot()
+            for name in _SliceSnapshot.__slots__:
+                setattr(snapshot, name, fields.get(name, getattr(current, name)))
+            self._snapshot = snapshot
+
+    @property
+    def nodes(self) -> Optional[Dict[str, Node]]:
+        """Nodes (and switches) of the published topology, by name."""
+        return self._view().nodes
+
+    @nodes.setter
+    def nodes(self, nodes: Optional[Dict[str, Node]]):
+        self._replace_view(nodes=nodes)
+
+    @property
+    def facilities(self) -> Optional[Dict[str, FacilityPort]]:
+        """Facility ports of the published topology, by name."""
+        return self._view().facilities
+
+    @facilities.setter
+    def facilities(self, facilities: Optional[Dict[str, FacilityPort]]):
+        self._replace_view(facilities=facilities)
+
+    @property
+    def network_services(self) -> Optional[Dict[str, NetworkService]]:
+        """Network services of the published topology, by name."""
+        return self._view().network_services
+
+    @network_services.setter
+    def network_services(self, network_services: Optional[Dict[str, NetworkService]]):
+        self._replace_view(network_services=network_services)
+
+    @property
+    def interfaces(self) -> Optional[Dict[str, Interface]]:
+        """Interfaces of the published topology, by name."""
+        return self._view().interfaces
+
+    @interfaces.setter
+    def interfaces(self, interfaces: Optional[Dict[str, Interface]]):
+        self._replace_view(interfaces=interfaces)
 
     def toJson(self):
         """
@@ -622,17 +827,85 @@ class Slice:
         return rtn_dict
 
     def get_template_context(self, base_object=None, skip=None):
-        """Build a Jinja2 template context for this slice and its nodes."""
+        """Build a Jinja2 template context for this slice and its nodes.
+
+        Everything except ``_self_`` is built once per ``skip`` list and
+        reused until the topology or slice changes (see
+        :py:meth:`_get_shared_template_context`).
+        """
         if skip is None:
             skip = []
 
-        context = {}
+        context = dict(self._get_shared_template_context(skip))
 
         if base_object:
-            context["_self_"] = base_object.generate_template_context(skip=skip)
+            context["_self_"] = base_object.generate_template_context(skip=list(skip))
         else:
             context["_self_"] = {}
 
+        return context
+
+    def _invalidate_template_context(self):
+        """
+        Not intended for API use.
+
+        Drop the cached template contexts.  Called when a node, component,
+        interface or network drops its cached dictionary.
+        """
+        self._template_contexts = None
+
+    def _get_shared_template_context(self, skip: List[str]) -> dict:
+        """
+        Not intended for API use.
+
+        Get the part of the template context shared by all objects of the
+        slice.  Building it walks every node, component, interface and
+        network, so it is cached per ``skip`` list for the published
+        topology and slice state; the cache is not used while the
+        topology has unpublished changes.  The returned dict must not be
+        modified.
+
+        :param skip: field names to exclude
+        :type skip: List[str]
+        :return: template context without ``_self_``
+        :rtype: dict
+        """
+        key = tuple(sorted(set(skip)))
+        owner = (self._view().topology, self.sm_slice)
+        cached = self._template_contexts
+        if (
+            cached is not None
+            and not self._topology_dirty
+            and cached[0] is owner[0]
+            and cached[1] is owner[1]
+        ):
+            context = cached[2].get(key)
+            if context is not None:
+                return context
+        else:
+            cached = None
+
+        context = self._build_template_context(list(skip))
+
+        if not self._topology_dirty:
+            if cached is None:
+                cached = self._template_contexts = (owner[0], owner[1], {})
+            cached[2][key] = context
+        return context
+
+    def _build_template_context(self, skip: List[str]) -> dict:
+        """
+        Not intended for API use.
+
+        Build the template context shared by all objects of the slice.
+
+        :param skip: field names to exclude
+        :type skip: List[str]
+        :return: template context without ``_self_``
+        :rtype: dict
+        """
+        context = {}
+
         context["config"] = self.get_fablib_manager().get_config()
         context["slice"] = self.toDict(skip=skip)
         nodes = None
@@ -643,7 +916,7 @@ class Slice:
         context["nodes"] = {}
         if "nodes" not in skip:
             for node in nodes:
-                node_context = node.generate_template_context(skip=skip)
+                node_context = node.generate_template_context(skip=list(skip))
                 context["nodes"][node.get_name()] = node_context
 
         context["components"] = {}
@@ -670,18 +943,69 @@ class Slice:
 
         return context
 
+    def render_node_templates(
+        self,
+        input_string: str,
+        nodes: Optional[List[Node]] = None,
+        skip: Optional[List[str]] = None,
+    ) -> Dict[str, str]:
+        """
+        Render one Jinja2 template for several nodes.
+
+        The template is compiled once and the slice part of the template
+        context is built once; only ``_self_`` differs between nodes.
+
+        :param input_string: Jinja2 template string to render
+        :type input_string: str
+        :param nodes: nodes to render the template for; all nodes of the
+            slice by default
+        :type nodes: List[Node]
+        :param skip: field names to exclude from the context; defaults to
+            the nodes' default (``ssh_command``)
+        :type skip: List[str]
+        :return: rendered template by node name
+        :rtype: Dict[str, str]
+        """
+        if nodes is None:
+            nodes = self.get_nodes()
+        if not nodes:
+            return {}
+        if skip is None:
+            skip = list(nodes[0]._default_skip or [])
+
+        shared = self._get_shared_template_context(skip)
+        rendered = {}
+        for node in nodes:
+            context = dict(shared)
+            context["_self_"] = node.generate_template_context(skip=list(skip))
+            rendered[node.get_name()] = node.get_template(input_string).render(context)
+        return rendered
+
     def get_fim_topology(self) -> ExperimentTopology:
         """
         Not recommended for most users.
 
         Gets the slice's FABRIC Information Model (fim) topology. This method
-        is used to access data at a lower level than FABlib.
+        is used to access data at a lower level than FABlib.  User data
+        changed through fablib objects is written into the topology first.
 
         :return: FABRIC experiment topology
         :rtype: ExperimentTopology
         """
+        self._flush_user_data()
         return self.topology
 
+    def _flush_user_data(self):
+        """
+        Not intended for API use.
+
+        Write user data changed through fablib objects (e.g. fablib data of
+        nodes and interfaces) into the FIM topology.
+        """
+        cache = UserDataCache.for_topology(self.topology)
+        if cache is not None:
+            cache.flush()
+
     def get_fim(self) -> ExperimentTopology:
         """
         Get FABRIC Information Model (fim) object for the slice.
@@ -741,24 +1065,95 @@ class Slice:
             f"update_topology: {self.get_name()}, count: {self.update_topology_count}"
         )
 
-        slices = self.fablib_manager.get_manager().list_slices(
-            slice_id=self.sm_slice.slice_id, as_self=self.user_only, return_fmt="dto"
-        )
-        if len(slices) == 0:
-            raise ResourceNotFoundError(
-                f"Failed to get slice topology {self.sm_slice.slice_id} from slice manager"
+        topology_cache = self._topology_cache
+        model = topology_cache.get_model(self.sm_slice) if topology_cache else None
+
+        if model is None:
+            slices = self.fablib_manager.get_manager().list_slices(
+                slice_id=self.sm_slice.slice_id,
+                as_self=self.user_only,
+                return_fmt="dto",
+            )
+            if len(slices) == 0:
+                raise ResourceNotFoundError(
+                    f"Failed to get slice topology {self.sm_slice.slice_id} from slice manager"
+                )
+            model = slices[0].model
+            if topology_cache and model:
+                # Fingerprint the metadata returned with the model, which may
+                # be newer than self.sm_slice
+                topology_cache.put(slices[0], model=model)
+        else:
+            log.debug(f"update_topology: {self.get_name()}, using cached topology")
+
+        # FIM keeps loaded graphs in a store shared by graph ID and replaces
+        # a graph in place when the same ID is loaded again, under readers
+        # of the current snapshot.  Each snapshot gets a graph ID of its own;
+        # its graph is dropped from the store once no longer referenced.
+        with self._update_lock:
+            _delete_released_graphs()
+            topology = ExperimentTopology()
+            topology.load(graph_string=model, new_graph_id=str(uuid.uuid4()))
+            weakref.finalize(topology, _released_graphs.append, topology.graph_model)
+            self._publish_topology(topology)
+
+    def _publish_topology(self, topology: ExperimentTopology):
+        """
+        Build the fablib objects for a new topology and publish them.
+
+        Existing Node, FacilityPort and NetworkService objects are reused
+        (https://github.com/fabric-testbed/fabrictestbed-extensions/issues/380)
+        and pointed at the new FIM objects once the new snapshot has been
+        published.  Until then readers see the previous snapshot and
+        objects unchanged.
+
+        :param topology: the new FIM topology
+        :type topology: ExperimentTopology
+        """
+        with self._update_lock:
+            previous = self._view()
+            updates = []
+            snapshot = _SliceSnapshot(topology=topology)
+            snapshot.nodes = self.__build_nodes(topology, previous.nodes or {}, updates)
+            snapshot.facilities = self.__build_facilities(
+                topology, previous.facilities or {}, updates
+            )
+            snapshot.network_services = self.__build_network_services(
+                topology, previous.network_services or {}, updates
             )
 
-        # Set slice attributes
-        self.topology = ExperimentTopology()
-        self.topology.load(graph_string=slices[0].model)
-        # Mark topology as dirty so caches will refresh
-        self._topology_dirty = True
-        self.get_nodes()
-        self.get_facilities()
-        self.get_network_services()
-        self.get_interfaces(refresh=True)
-        self._topology_dirty = False
+            # Interfaces of reused objects come from their prepared state,
+            # those of new objects from their caches
+            prepared = {id(obj): state for obj, state in updates}
+            interfaces = {}
+            for owner in list(snapshot.nodes.values()) + list(
+                snapshot.facilities.values()
+            ):
+                state = prepared.get(id(owner))
+                if state is None:
+                    interfaces.update(self.__build_interfaces([owner]))
+                else:
+                    interfaces.update(state[-1])
+            snapshot.interfaces = interfaces
+
+            self._deferred_load = False
+            self._snapshot = snapshot
+            self._topology_dirty = False
+            self.__apply_updates(updates)
+
+    @staticmethod
+    def __apply_updates(updates: list):
+        """
+        Assign the state prepared for reused objects.
+
+        :param updates: (object, prepared state) pairs
+        :type updates: list
+        """
+        for obj, state in updates:
+            try:
+                obj._apply_update(state)
+            except Exception as e:
+                log.warning(f"Error updating {obj.get_name()}: {e}")
 
     def update_slivers(self):
         """
@@ -776,9 +1171,19 @@ class Slice:
             f"update_slivers: {self.get_name()}, count: {self.update_slivers_count}"
         )
 
-        self.slivers = self.fablib_manager.get_manager().list_slivers(
-            slice_id=self.sm_slice.slice_id, as_self=self.user_only, return_fmt="dto"
-        )
+        topology_cache = self._topology_cache
+        slivers = topology_cache.get_slivers(self.sm_slice) if topology_cache else None
+
+        if slivers is None:
+            slivers = self.fablib_manager.get_manager().list_slivers(
+                slice_id=self.sm_slice.slice_id,
+                as_self=self.user_only,
+                return_fmt="dto",
+            )
+            if topology_cache:
+                topology_cache.put(self.sm_slice, slivers=slivers)
+
+        self.slivers = slivers
         self._sliver_map = {s.sliver_id: s for s in self.slivers}
 
     def get_sliver(self, reservation_id: str) -> SliverDTO:
@@ -821,8 +1226,7 @@ class Slice:
         except Exception as e:
             log.warning(f"slice.update_slivers failed: {e}")
 
-        # Clear interface cache - will be rebuilt on next access
-        self.interfaces = {}
+        # Publishes a new topology snapshot, including interfaces
         self.update_topology()
         # Mark topology as clean after all caches are refreshed
         self._topology_dirty = False
@@ -1655,90 +2059,92 @@ class Slice:
 
     def __initialize_nodes(self, refresh: bool = False):
         """
-        Initializes the node objects for the current topology by populating
-        the self.nodes dictionary with node instances.
+        Initializes the node objects for the current topology.
 
-        - If self.nodes is empty, it initializes it as an empty dictionary.
-        - It iterates through the nodes in the FIM topology and adds them
-          to self.nodes if they do not already exist.
-        - If a node already exists in the dictionary, it updates its
-          fim_node reference to match the current topology.
-        - After processing, it removes any nodes from self.nodes that
-          are no longer present in the current topology.
+        Builds a new nodes dictionary from the FIM topology, reusing
+        existing node objects and updating their fim_node reference, and
+        replaces ``self.nodes`` with it.  Interfaces of nodes that are no
+        longer in the topology are dropped from the interface cache.
 
         https://github.com/fabric-testbed/fabrictestbed-extensions/issues/380
 
-        :param force_refresh: Force refresh even if cache is valid
-        :type force_refresh: bool
+        :param refresh: Force refresh even if cache is valid
+        :type refresh: bool
         :raises: Logs an exception if an error occurs during initialization.
         """
         # Skip if cache is valid and not forcing refresh
         if self.nodes and not self._topology_dirty and not refresh:
             return
 
-        # Initialize nodes dictionary if not already present
-        if not self.nodes:
-            self.nodes = {}
-
         try:
-            # Get the current FIM topology nodes (single access)
-            current_topology_nodes = self.get_fim_topology().nodes
-
-            # Update the nodes dictionary with current topology nodes
-            for node_name, fim_node in current_topology_nodes.items():
-                try:
-                    if node_name not in self.nodes:
-                        if fim_node.type == NodeType.Switch:
-                            node_obj = Switch.get_switch(self, fim_node)
-                        else:
-                            # Add new node to the dictionary if it doesn't exist
-                            node_obj = Node.get_node(self, fim_node)
-                        self.nodes[node_name] = node_obj
-                    else:
-                        # Update existing node's fim_node reference and
-                        # invalidate cached properties (cores, ram, etc.)
-                        self.nodes[node_name].update(fim_node=fim_node)
-                        self.nodes[node_name]._invalidate_cache()
-                except Exception as e:
-                    log.warning(f"Error initializing node {node_name}: {e}")
-
-            # Remove nodes that are no longer present in the current topology
-            self.__remove_deleted_nodes(current_topology_nodes)
-
+            previous = self.nodes or {}
+            updates = []
+            nodes = self.__build_nodes(self.topology, previous, updates)
+            self.__drop_removed_interfaces(previous, nodes)
+            self.nodes = nodes
+            self.__apply_updates(updates)
         except Exception as e:
             log.error(f"Error initializing nodes: {e}")
 
-    def __remove_deleted_nodes(self, current_topology_nodes):
+    def __build_nodes(
+        self, topology: ExperimentTopology, previous: Dict[str, Node], updates: list
+    ) -> Dict[str, Node]:
         """
-        Removes nodes from self.nodes that are not present in the current topology.
+        Build the nodes dictionary for a topology.
+
+        Reused node objects are not modified; the state to assign to them
+        is appended to ``updates`` (see :py:meth:`__apply_updates`).
 
-        :param current_topology_nodes: A dictionary of nodes currently in the topology.
+        :param topology: FIM topology
+        :type topology: ExperimentTopology
+        :param previous: existing node objects by name, reused when present
+        :type previous: Dict[str, Node]
+        :param updates: receives (node, prepared state) pairs
+        :type updates: list
+        :return: node objects by name
+        :rtype: Dict[str, Node]
         """
-        # Create a set of current node names for quick lookup
-        current_node_names = set(current_topology_nodes.keys())
+        nodes = {}
+        for node_name, fim_node in topology.nodes.items():
+            try:
+                node_obj = previous.get(node_name)
+                if node_obj is None:
+                    if fim_node.type == NodeType.Switch:
+                        node_obj = Switch.get_switch(self, fim_node)
+                    else:
+                        node_obj = Node.get_node(self, fim_node)
+                    # Not published yet, so its caches are filled in place
+                    node_obj.update(fim_node=fim_node)
+                else:
+                    updates.append((node_obj, node_obj._prepare_update(fim_node)))
+                nodes[node_name] = node_obj
+            except Exception as e:
+                log.warning(f"Error initializing node {node_name}: {e}")
 
-        # Identify and remove nodes that are not in the current topology
-        nodes_to_remove = [
-            node_name
-            for node_name in self.nodes.keys()
-            if node_name not in current_node_names
-        ]
+        for node_name in previous.keys() - nodes.keys():
+            log.debug(f"Removed extra node: {node_name}")
+        return nodes
 
-        for node_name in nodes_to_remove:
-            # Clean up interfaces from cache.  Use try/except because the
-            # deleted node's FIM reference may point to a graph that was
-            # already replaced by update_topology(), making FIM queries fail.
+    def __drop_removed_interfaces(self, previous: dict, current: dict):
+        """
+        Remove interfaces of nodes or facilities that are in ``previous`` but
+        not in ``current`` from the interface cache.
+        """
+        names = set()
+        for name in previous.keys() - current.keys():
+            # The removed object's FIM reference may point to a graph that
+            # was already replaced, making FIM queries fail.
             try:
-                for ifs in self.nodes[node_name].get_interfaces():
-                    if ifs.get_name() in self.interfaces:
-                        self.interfaces.pop(ifs.get_name())
+                names.update(i.get_name() for i in previous[name].get_interfaces())
             except Exception:
                 log.debug(
-                    f"Could not query interfaces for deleted node {node_name}, "
+                    f"Could not query interfaces for deleted {name}, "
                     f"skipping interface cleanup"
                 )
-            self.nodes.pop(node_name)
-            log.debug(f"Removed extra node: {node_name}")
+        if names and self.interfaces:
+            self.interfaces = {
+                k: v for k, v in self.interfaces.items() if k not in names
+            }
 
     def get_nodes(
         self,
@@ -1761,7 +2167,7 @@ class Slice:
         if not self.nodes or not len(self.nodes):
             refresh = True
         self.__initialize_nodes(refresh=refresh)
-        nodes = list(self.nodes.values())
+        nodes = list((self.nodes or {}).values())
         if site:
             nodes = [n for n in nodes if n.get_site() == site]
         if filter_function:
@@ -1806,9 +2212,9 @@ class Slice:
                 return self.facilities[name]
 
             # Not in cache - get from topology and cache it
-            fim_facility = self.get_fim_topology().facilities[name]
+            fim_facility = self.topology.facilities[name]
             facility = FacilityPort.get_facility_port(self, fim_facility)
-            self.facilities[name] = facility
+            self.facilities = {**(self.facilities or {}), name: facility}
             return facility
         except Exception as e:
             log.info(e, exc_info=True)
@@ -1824,20 +2230,15 @@ class Slice:
         if not self.facilities or not len(self.facilities):
             refresh = True
         self.__initialize_facilities(refresh=refresh)
-        return list(self.facilities.values())
+        return list((self.facilities or {}).values())
 
     def __initialize_facilities(self, refresh: bool = False):
         """
-        Initializes the facilities objects for the current topology by populating
-        the self.facilities dictionary with node instances.
+        Initializes the facility objects for the current topology.
 
-        - If self.facilities is empty, it initializes it as an empty dictionary.
-        - It iterates through the nodes in the FIM topology and adds them
-          to self.facilities if they do not already exist.
-        - If a facility already exists in the dictionary, it updates its
-          fim_node reference to match the current topology.
-        - After processing, it removes any facilities from self.facilities that
-          are no longer present in the current topology.
+        Builds a new facilities dictionary from the FIM topology, reusing
+        existing facility objects and updating their fim_node reference, and
+        replaces ``self.facilities`` with it.
 
         https://github.com/fabric-testbed/fabrictestbed-extensions/issues/380
 
@@ -1849,61 +2250,50 @@ class Slice:
         if self.facilities and not self._topology_dirty and not refresh:
             return
 
-        # Initialize facilities dictionary if not already present
-        if not self.facilities:
-            self.facilities = {}
-
         try:
-            # Get the current FIM topology facilities (single access)
-            current = self.get_fim_topology().facilities
-
-            # Update the facilities dictionary with current topology facilities
-            for fac_name, facility in current.items():
-                try:
-                    if fac_name not in self.facilities:
-                        self.facilities[fac_name] = FacilityPort.get_facility_port(
-                            self, facility
-                        )
-                    else:
-                        # Update existing facility's fim_node reference
-                        self.facilities[fac_name].update(fim_node=facility)
-                except Exception as e:
-                    log.warning(f"Error initializing facility {fac_name}: {e}")
-
-            # Remove facilities that are no longer present in the current topology
-            self.__remove_deleted_facilities(current)
-
+            previous = self.facilities or {}
+            updates = []
+            facilities = self.__build_facilities(self.topology, previous, updates)
+            self.__drop_removed_interfaces(previous, facilities)
+            self.facilities = facilities
+            self.__apply_updates(updates)
         except Exception as e:
             log.error(f"Error initializing facilities: {e}")
 
-    def __remove_deleted_facilities(self, current):
-        """
-        Removes nodes from self.facilities that are not present in the current topology.
-
-        :param current: A dictionary of facilities currently in the topology.
-        """
-        # Create a set of current node names for quick lookup
-        current_names = set(current.keys())
-
-        # Identify and remove nodes that are not in the current topology
-        facilities_to_remove = [
-            fac_name
-            for fac_name in self.facilities.keys()
-            if fac_name not in current_names
-        ]
-
-        for fac_name in facilities_to_remove:
+    def __build_facilities(
+        self,
+        topology: ExperimentTopology,
+        previous: Dict[str, FacilityPort],
+        updates: list,
+    ) -> Dict[str, FacilityPort]:
+        """
+        Build the facilities dictionary for a topology.
+
+        Reused facility objects are not modified; the state to assign to
+        them is appended to ``updates``.
+
+        :param topology: FIM topology
+        :type topology: ExperimentTopology
+        :param previous: existing facility objects by name, reused when present
+        :type previous: Dict[str, FacilityPort]
+        :param updates: receives (facility, prepared state) pairs
+        :type updates: list
+        :return: facility objects by name
+        :rtype: Dict[str, FacilityPort]
+        """
+        facilities = {}
+        for fac_name, facility in topology.facilities.items():
             try:
-                for ifs in self.facilities[fac_name].get_interfaces():
-                    if ifs.get_name() in self.interfaces:
-                        self.interfaces.pop(ifs.get_name())
-            except Exception:
-                log.debug(
-                    f"Could not query interfaces for deleted facility {fac_name}, "
-                    f"skipping interface cleanup"
-                )
-            self.facilities.pop(fac_name)
-            log.debug(f"Removed extra facility: {fac_name}")
+                fac_obj = previous.get(fac_name)
+                if fac_obj is None:
+                    fac_obj = FacilityPort.get_facility_port(self, facility)
+                    fac_obj.update(fim_node=facility)
+                else:
+                    updates.append((fac_obj, fac_obj._prepare_update(facility)))
+                facilities[fac_name] = fac_obj
+            except Exception as e:
+                log.warning(f"Error initializing facility {fac_name}: {e}")
+        return facilities
 
     def get_attestable_switches(self) -> List[Attestable_Switch]:
         """
@@ -1939,10 +2329,10 @@ class Slice:
                     return cached
 
             # Not in cache - get from topology
-            fim_node = self.get_fim_topology().nodes[name]
+            fim_node = self.topology.nodes[name]
             aswitch = Attestable_Switch.get_attestable_switch(self, fim_node)
             # Cache it
-            self.nodes[name] = aswitch
+            self.nodes = {**self.nodes, name: aswitch}
             return aswitch
         except Exception as e:
             log.info(e, exc_info=True)
@@ -1967,14 +2357,14 @@ class Slice:
                 return self.nodes[name]
 
             # Not in cache - get from topology (single access)
-            fim_node = self.get_fim_topology().nodes[name]
+            fim_node = self.topology.nodes[name]
             if fim_node.type == NodeType.Switch:
                 node_obj = Switch.get_switch(self, fim_node)
             else:
                 node_obj = Node.get_node(self, fim_node)
 
             # Cache it for future access
-            self.nodes[name] = node_obj
+            self.nodes = {**self.nodes, name: node_obj}
             return node_obj
         except Exception as e:
             log.info(e, exc_info=True)
@@ -1998,36 +2388,51 @@ class Slice:
         :return: a list of interfaces on this slice
         :rtype: Union[dict[str, Interface], list[Interface]]
         """
-        if self.interfaces and not refresh and not self._topology_dirty:
-            pass
-        else:
-            self.interfaces = {}
-            for node in self.get_nodes(refresh=refresh):
-                log.debug(f"Getting interfaces for node {node.get_name()}")
-                try:
-                    n_ifaces = node.get_interfaces(
-                        include_subs=include_subs, refresh=refresh, output="dict"
-                    )
-                    self.interfaces.update(n_ifaces)
-                except Exception as e:
-                    log.warning(
-                        f"Error getting interfaces for node " f"{node.get_name()}: {e}"
-                    )
-            for fac in self.get_facilities(refresh=refresh):
-                log.debug(f"Getting interfaces for facility {fac.get_name()}")
-                try:
-                    fac_ifaces = fac.get_interfaces(refresh=refresh, output="dict")
-                    self.interfaces.update(fac_ifaces)
-                except Exception as e:
-                    log.warning(
-                        f"Error getting interfaces for facility "
-                        f"{fac.get_name()}: {e}"
-                    )
+        interfaces = self.interfaces
+        if not interfaces or refresh or self._topology_dirty:
+            owners = self.get_nodes(refresh=refresh) + self.get_facilities(
+                refresh=refresh
+            )
+            interfaces = self.__build_interfaces(
+                owners, include_subs=include_subs, refresh=refresh
+            )
+            self.interfaces = interfaces
 
         if output == "dict":
-            return self.interfaces
+            return interfaces
         else:
-            return list(self.interfaces.values())
+            return list(interfaces.values())
+
+    @staticmethod
+    def __build_interfaces(
+        owners: list, include_subs: bool = True, refresh: bool = False
+    ) -> Dict[str, Interface]:
+        """
+        Build the interfaces dictionary from nodes and facilities.
+
+        :param owners: nodes and facility ports
+        :type owners: list
+        :param include_subs: Flag indicating if sub interfaces should be included
+        :type include_subs: bool
+        :param refresh: Refresh the interface objects with latest Fim info
+        :type refresh: bool
+        :return: interfaces by name
+        :rtype: Dict[str, Interface]
+        """
+        interfaces = {}
+        for owner in owners:
+            log.debug(f"Getting interfaces for {owner.get_name()}")
+            try:
+                if isinstance(owner, FacilityPort):
+                    owner_ifaces = owner.get_interfaces(refresh=refresh, output="dict")
+                else:
+                    owner_ifaces = owner.get_interfaces(
+                        include_subs=include_subs, refresh=refresh, output="dict"
+                    )
+                interfaces.update(owner_ifaces)
+            except Exception as e:
+                log.warning(f"Error getting interfaces for {owner.get_name()}: {e}")
+        return interfaces
 
     def get_interface(self, name: str = None, refresh: bool = False) -> Interface:
         """
@@ -2118,44 +2523,59 @@ class Slice:
         :rtype: List[NetworkService]
         """
         # Return cached results if valid
-        if self.network_services and not self._topology_dirty and not force_refresh:
-            return list(self.network_services.values())
+        network_services = self.network_services
+        if network_services and not self._topology_dirty and not force_refresh:
+            return list(network_services.values())
 
         # fails for topology that does not have nodes
         try:
-            # Get topology network services (single access)
-            fim_network_services = self.get_fim_topology().network_services
-            valid_types = NetworkService.get_fim_network_service_types()
-
-            for net_name, net in fim_network_services.items():
-                try:
-                    if str(net.get_property("type")) in valid_types:
-                        if net_name not in self.network_services:
-                            self.network_services[net_name] = NetworkService(
-                                slice=self, fim_network_service=net
-                            )
-                        else:
-                            # Update existing network service's fim reference
-                            self.network_services[net_name].fim_network_service = net
-                except Exception as e:
-                    log.warning(
-                        f"Error initializing network service " f"{net_name}: {e}"
-                    )
-
-            # Remove network services that are no longer in topology
-            current_net_names = set(fim_network_services.keys())
-            nets_to_remove = [
-                name
-                for name in self.network_services.keys()
-                if name not in current_net_names
-            ]
-            for name in nets_to_remove:
-                del self.network_services[name]
-
+            updates = []
+            network_services = self.__build_network_services(
+                self.topology, network_services or {}, updates
+            )
+            self.network_services = network_services
+            self.__apply_updates(updates)
         except Exception as e:
             log.error(e, exc_info=True)
 
-        return list(self.network_services.values())
+        return list((network_services or {}).values())
+
+    def __build_network_services(
+        self,
+        topology: ExperimentTopology,
+        previous: Dict[str, NetworkService],
+        updates: list,
+    ) -> Dict[str, NetworkService]:
+        """
+        Build the network services dictionary for a topology.
+
+        Reused network service objects are not modified; the state to
+        assign to them is appended to ``updates``.
+
+        :param topology: FIM topology
+        :type topology: ExperimentTopology
+        :param previous: existing network service objects by name, reused
+            when present
+        :type previous: Dict[str, NetworkService]
+        :param updates: receives (network service, prepared state) pairs
+        :type updates: list
+        :return: network service objects by name
+        :rtype: Dict[str, NetworkService]
+        """
+        valid_types = NetworkService.get_fim_network_service_types()
+        network_services = {}
+        for net_name, net in topology.network_services.items():
+            try:
+                if str(net.get_property("type")) in valid_types:
+                    net_obj = previous.get(net_name)
+                    if net_obj is None:
+                        net_obj = NetworkService(slice=self, fim_network_service=net)
+                    else:
+                        updates.append((net_obj, net_obj._prepare_update(net)))
+                    network_services[net_name] = net_obj
+            except Exception as e:
+                log.warning(f"Error initializing network service {net_name}: {e}")
+        return network_services
 
     def get_networks(
         self, refresh: bool = True, output: str = "list"
@@ -2230,6 +2650,9 @@ class Slice:
         Iterates through all nodes and closes their cached bastion and
         node SSH connections. Safe to call multiple times.
         """
+        if self._deferred_load:
+            # Nodes were never loaded, so no connections were opened
+            return
         for node in self.get_nodes():
             try:
                 node.close_ssh()
@@ -2253,6 +2676,8 @@ class Slice:
             self.topology = None
             return
         self.fablib_manager.get_manager().delete_slice(slice_id=self.sm_slice.slice_id)
+        if self._topology_cache:
+            self._topology_cache.invalidate(self.sm_slice.slice_id)
         self.topology = None
 
     def renew(self, end_date: str = None, days: int = None, **kwargs):
@@ -2329,47 +2754,16 @@ class Slice:
         :return: the stable slice on the slice manager
         :rtype: SMSlice
         """
-        slice_id = self.sm_slice.slice_id
-
         timeout_start = time.time()
         slice = self.sm_slice
 
         if progress:
             print("Waiting for slice .", end="")
         while time.time() < timeout_start + timeout:
-            slices = self.fablib_manager.get_manager().list_slices(
-                slice_id=self.slice_id,
-                name=self.slice_name,
-                as_self=self.user_only,
-                graph_format="NONE",
-                return_fmt="dto",
-                limit=1,
-            )
-            if slices:
-                slice = slices[0]
-                if slice.state in ("StableOK", "ModifyOK"):
-                    if progress:
-                        print(" Slice state: {}".format(slice.state))
-                    break
-                if slice.state in (
-                    "Closing",
-                    "Dead",
-                    "StableError",
-                    "ModifyError",
-                ):
-                    if progress:
-                        print(" Slice state: {}".format(slice.state))
-                    try:
-                        exception_string = self.build_error_exception_string()
-                    except Exception as e:
-                        exception_string = "Exception while getting error messages"
-
-                    raise SliceStateError(
-                        str(exception_string),
-                        payload=self.get_error_messages(),
-                    )
-            else:
-                print(f"Failure: {slices}")
+            polled, stable = self._poll_state(progress=progress)
+            slice = polled or slice
+            if stable:
+                break
 
             if progress:
                 print(".", end="")
@@ -2387,6 +2781,58 @@ class Slice:
         self.update()
         return slice
 
+    def _poll_state(self, progress: bool = False) -> Tuple[Optional[SliceDTO], bool]:
+        """
+        Not intended for API use.
+
+        Check the slice state once; used by :py:meth:`wait` and by
+        :py:class:`AsyncSlice`.
+
+        :param progress: indicator for whether to print the final state
+        :type progress: bool
+
+        :raises SliceStateError: if the slice has failed
+
+        :return: the slice on the slice manager (None if it was not found)
+            and whether it is stable
+        :rtype: Tuple[SliceDTO, bool]
+        """
+        slices = self.fablib_manager.get_manager().list_slices(
+            slice_id=self.slice_id,
+            name=self.slice_name,
+            as_self=self.user_only,
+            graph_format="NONE",
+            return_fmt="dto",
+            limit=1,
+        )
+        if not slices:
+            print(f"Failure: {slices}")
+            return None, False
+
+        slice = slices[0]
+        if slice.state in ("StableOK", "ModifyOK"):
+            if progress:
+                print(" Slice state: {}".format(slice.state))
+            return slice, True
+        if slice.state in (
+            "Closing",
+            "Dead",
+            "StableError",
+            "ModifyError",
+        ):
+            if progress:
+                print(" Slice state: {}".format(slice.state))
+            try:
+                exception_string = self.build_error_exception_string()
+            except Exception as e:
+                exception_string = "Exception while getting error messages"
+
+            raise SliceStateError(
+                str(exception_string),
+                payload=self.get_error_messages(),
+            )
+        return slice, False
+
     def wait_ssh(self, timeout: int = 1800, interval: int = 20, progress: bool = False):
         """
         Waits for all nodes to be accessible via ssh.
@@ -2474,7 +2920,7 @@ class Slice:
                 return False
         return True
 
-    def post_boot_config(self):
+    def post_boot_config(self, progress: bool = True):
         """
         Run post boot configuration.  Typically, this is run automatically during
         a blocking call to submit.
@@ -2482,6 +2928,9 @@ class Slice:
         Only use this method after a non-blocking submit call and only call it
         once.
 
+        :param progress: print per-node progress
+        :type progress: bool
+
         :raises RuntimeError: if no_ssh mode is enabled
         """
         if self.get_fablib_manager().get_no_ssh():
@@ -2558,22 +3007,25 @@ class Slice:
                     thread = executor.submit(node.config)
                     threads[thread] = node
 
-            print(
-                f"Running post boot config threads ..."
-            )  # ({time.time() - start:.0f} sec)")
+            if progress:
+                print(
+                    f"Running post boot config threads ..."
+                )  # ({time.time() - start:.0f} sec)")
 
             for thread in concurrent.futures.as_completed(threads.keys()):
                 node = threads[thread]
                 try:
                     result = thread.result()
                     # print(result)
-                    print(
-                        f"Post boot config {node.get_name()}, Done! ({time.time() - start:.0f} sec)"
-                    )
+                    if progress:
+                        print(
+                            f"Post boot config {node.get_name()}, Done! ({time.time() - start:.0f} sec)"
+                        )
                 except Exception as e:
-                    print(
-                        f"Post boot config {node.get_name()}, Failed! ({time.time() - start:.0f} sec)"
-                    )
+                    if progress:
+                        print(
+                            f"Post boot config {node.get_name()}, Failed! ({time.time() - start:.0f} sec)"
+                        )
                     log.error(
                         f"Post boot config {node.get_name()}, Failed! ({time.time() - start:.0f} sec) {e}"
                     )
@@ -2581,7 +3033,8 @@ class Slice:
         # print(f"ALL Nodes, Done! ({time.time() - start:.0f} sec)")
 
         # Push updates to user_data
-        print("Saving fablib data... ", end="")
+        if progress:
+            print("Saving fablib data... ", end="")
         self.submit(wait=True, progress=False, post_boot_config=False, wait_ssh=False)
         self.update()
 
@@ -2593,12 +3046,14 @@ class Slice:
                 aswitch = self.get_attestable_switch(name=node.get_name())
                 aswitch.switch_config()
 
-        print(" Done!")
+        if progress:
+            print(" Done!")
 
         # --- CephFS storage configuration ---
         storage_nodes = [n for n in self.get_nodes() if n.has_storage()]
         if storage_nodes:
-            print("Configuring CephFS storage ...")
+            if progress:
+                print("Configuring CephFS storage ...")
             fablib_mgr = self.get_fablib_manager()
 
             # Group by cluster, auto-discover if needed
@@ -2656,7 +3111,8 @@ class Slice:
                     node = futures[future]
                     try:
                         future.result()
-                        print(f"CephFS storage configured on {node.get_name()}")
+                        if progress:
+                            print(f"CephFS storage configured on {node.get_name()}")
                     except Exception as e:
                         print(f"CephFS storage failed on {node.get_name()}: {e}")
                         log.error(
@@ -2664,12 +3120,14 @@ class Slice:
                         )
 
             # Persist storage_cluster in fablib_data back to the orchestrator
-            print("Saving storage metadata... ", end="")
+            if progress:
+                print("Saving storage metadata... ", end="")
             self.submit(
                 wait=True, progress=False, post_boot_config=False, wait_ssh=False
             )
             self.update()
-            print("Done!")
+            if progress:
+                print("Done!")
 
     def validIPAddress(self, IP: str) -> str:
         """
@@ -3170,17 +3628,25 @@ class Slice:
             # return 'color: %s' % color
             return "background-color: %s" % color
 
-        table = []
-        for network in self.get_networks():
-            table.append(network.toDict())
-
-        table = sorted(table, key=lambda x: (x["name"]))
-
         if pretty_names:
             pretty_names_dict = NetworkService.get_pretty_name_dict()
         else:
             pretty_names_dict = {}
 
+        columns = self._list_columns(
+            NetworkService,
+            fields,
+            output,
+            filter_function,
+            pretty_names_dict,
+            required=("name",),
+        )
+        table = []
+        for network in self.get_networks():
+            table.append(network.toDict(fields=columns))
+
+        table = sorted(table, key=lambda x: (x["name"]))
+
         log.debug(f"network service: pretty_names_dict = {pretty_names_dict}")
 
         table = Utils.list_table(
@@ -3282,40 +3748,7 @@ class Slice:
             # return 'color: %s' % color
             return "background-color: %s" % color
 
-        table = []
-        for sliver in self.get_slivers():
-            try:
-                import json
-
-                reservation_info = json.loads(sliver.sliver["ReservationInfo"])
-                error = reservation_info["error_message"]
-            except Exception:
-                error = ""
-
-            if sliver.sliver_type == "NetworkServiceSliver":
-                type = "network"
-            elif sliver.sliver_type == "NodeSliver":
-                type = "node"
-            else:
-                type = sliver.sliver_type
-
-            if "Site" in sliver.sliver:
-                site = sliver.sliver["Site"]
-            else:
-                site = ""
-
-            table.append(
-                {
-                    "id": sliver.sliver_id,
-                    "name": sliver.sliver["Name"],
-                    "site": site,
-                    "type": type,
-                    "state": sliver.state,
-                    "error": error,
-                }
-            )
-
-            log.debug(sliver)
+        table = [dict(row) for row in self._get_sliver_rows()]
         table = sorted(table, key=lambda x: ([-ord(c) for c in x["type"]], x["name"]))
 
         log.debug(f"table: {table}")
@@ -3359,6 +3792,56 @@ class Slice:
 
         return table
 
+    def _get_sliver_rows(self) -> List[Dict[str, str]]:
+        """
+        Not intended for API use.
+
+        Get the rows of :py:meth:`list_slivers`.  The rows are reused until
+        the slivers are fetched again.
+
+        :return: one row per sliver
+        :rtype: List[Dict[str, str]]
+        """
+        slivers = self.get_slivers()
+        cached = self._sliver_rows
+        if cached is not None and cached[0] is slivers:
+            return cached[1]
+
+        rows = []
+        for sliver in slivers:
+            try:
+                reservation_info = json.loads(sliver.sliver["ReservationInfo"])
+                error = reservation_info["error_message"]
+            except Exception:
+                error = ""
+
+            if sliver.sliver_type == "NetworkServiceSliver":
+                type = "network"
+            elif sliver.sliver_type == "NodeSliver":
+                type = "node"
+            else:
+                type = sliver.sliver_type
+
+            if "Site" in sliver.sliver:
+                site = sliver.sliver["Site"]
+            else:
+                site = ""
+
+            rows.append(
+                {
+                    "id": sliver.sliver_id,
+                    "name": sliver.sliver["Name"],
+                    "site": site,
+                    "type": type,
+                    "state": sliver.state,
+                    "error": error,
+                }
+            )
+
+            log.debug(sliver)
+        self._sliver_rows = (slivers, rows)
+        return rows
+
     def list_nodes(
         self,
         output=None,
@@ -3433,17 +3916,25 @@ class Slice:
             # return 'color: %s' % color
             return "background-color: %s" % color
 
-        table = []
-        for node in self.get_nodes():
-            table.append(node.toDict())
-
-        table = sorted(table, key=lambda x: (x["name"]))
-
         if pretty_names:
             pretty_names_dict = Node.get_pretty_name_dict()
         else:
             pretty_names_dict = {}
 
+        columns = self._list_columns(
+            Node,
+            fields,
+            output,
+            filter_function,
+            pretty_names_dict,
+            required=("name",),
+        )
+        table = []
+        for node in self.get_nodes():
+            table.append(node.toDict(fields=columns))
+
+        table = sorted(table, key=lambda x: (x["name"]))
+
         log.debug(f"pretty_names_dict = {pretty_names_dict}")
 
         table = Utils.list_table(
@@ -3710,7 +4201,14 @@ class Slice:
         else:
             return True
 
-    def validate(self, raise_exception: bool = True) -> Tuple[bool, Dict[str, str]]:
+    def validate(
+        self,
+        raise_exception: bool = True,
+        resources: ResourcesV2 = None,
+        allocated: Dict[str, dict] = None,
+        placement=None,
+        pin_hosts: bool = False,
+    ) -> Tuple[bool, Dict[str, str]]:
         """
         Validate the slice w.r.t available resources before submission.
 
@@ -3719,6 +4217,19 @@ class Slice:
 
         :param raise_exception: raise exception if validation fails
         :type raise_exception: bool
+        :param resources: resources snapshot to validate against; fetched
+            if not given (the sites of the slice are re-fetched if they came
+            from the resources cache)
+        :type resources: ResourcesV2
+        :param allocated: host allocations already claimed by other slices
+            validated against the same snapshot; updated in place
+        :type allocated: Dict[str, dict]
+        :param placement: engine assigning the nodes to hosts; best-fit
+            decreasing by default
+        :type placement: PlacementEngine
+        :param pin_hosts: request the hosts chosen during validation for
+            the nodes
+        :type pin_hosts: bool
 
         :return: Tuple indicating status for validation and dictionary of the errors corresponding to
                  each requested node
@@ -3726,12 +4237,26 @@ class Slice:
         """
         from fabrictestbed_extensions.fablib.validator import NodeValidator
 
-        resources = self.get_fablib_manager().get_resources()
         nodes = self.get_nodes()
+        if resources is None:
+            resources = self.get_fablib_manager().get_resources()
+            # Validate against current resources, not a cached summary
+            cached = [
+                site
+                for site in dict.fromkeys(n.get_site() for n in nodes)
+                if resources.is_from_cache(site)
+            ]
+            if cached:
+                resources.refresh_sites(cached)
 
         project_tags = self.get_fablib_manager().get_project_tags()
         all_valid, errors = NodeValidator.validate_nodes(
-            nodes=nodes, resources=resources, project_tags=project_tags
+            nodes=nodes,
+            resources=resources,
+            project_tags=project_tags,
+            allocated=allocated,
+            placement=placement,
+            pin_hosts=pin_hosts,
         )
 
         # Remove invalid nodes
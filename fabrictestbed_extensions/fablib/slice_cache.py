@@ -0,0 +1,300 @@
+#!/usr/bin/env python3
+# MIT License
+#
+# Copyright (c) 2020 FABRIC Testbed
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+"""
+In-memory cache of :class:`Slice` objects.
+
+``FablibManager`` hands out the same ``Slice`` object every time a slice is
+queried (see
+https://github.com/fabric-testbed/fabrictestbed-extensions/issues/379).
+:class:`SliceCache` holds those objects by name and ID.  It can be bounded
+to a number of slices (least recently used slices are evicted first), can
+hold weak references so that slices no longer used by the application are
+garbage collected, and can report the approximate memory held by each
+cached slice.
+"""
+
+from __future__ import annotations
+
+import logging
+import sys
+import threading
+import types
+import weakref
+from collections import OrderedDict, deque
+from typing import TYPE_CHECKING, Any, Callable, Dict, List, Optional
+
+if TYPE_CHECKING:
+    from fabrictestbed_extensions.fablib.slice import Slice
+
+log = logging.getLogger("fablib")
+
+# Objects that are shared with the rest of the process rather than owned by
+# a slice; they are not followed when measuring a slice.
+_SHARED_TYPES = (
+    type,
+    types.ModuleType,
+    types.FunctionType,
+    types.BuiltinFunctionType,
+    types.MethodType,
+    weakref.ref,
+    type(threading.Lock()),
+    type(threading.RLock()),
+    threading.Thread,
+    logging.Logger,
+)
+
+
+def deep_sizeof(obj: Any, exclude: tuple = ()) -> int:
+    """
+    Approximate the memory held by an object and everything it references.
+
+    Objects are counted once.  Types, modules, functions, locks, threads,
+    loggers and the objects in ``exclude`` (and anything only reachable
+    through them) are not counted.
+
+    :param obj: object to measure
+    :type obj: Any
+    :param exclude: objects not to follow, e.g. the owning ``FablibManager``
+    :type exclude: tuple
+    :return: approximate size in bytes
+    :rtype: int
+    """
+    seen = {id(o) for o in exclude}
+    stack = [obj]
+    total = 0
+    while stack:
+        current = stack.pop()
+        if id(current) in seen or isinstance(current, _SHARED_TYPES):
+            continue
+        seen.add(id(current))
+        try:
+            total += sys.getsizeof(current)
+        except TypeError:
+            continue
+
+        if isinstance(current, dict):
+            stack.extend(current.keys())
+            stack.extend(current.values())
+        elif isinstance(current, (list, tuple, set, frozenset)):
+            stack.extend(current)
+        elif not isinstance(current, (str, bytes, int, float, bool)):
+            if hasattr(current, "__dict__"):
+                stack.append(current.__dict__)
+            for slot in getattr(type(current), "__slots__", ()):
+                if hasattr(current, slot):
+                    stack.append(getattr(current, slot))
+    return total
+
+
+class SliceCache:
+    """
+    Thread-safe cache of ``Slice`` objects keyed by slice name and ID.
+    """
+
+    def __init__(self, max_size: Optional[int] = None, weak: bool = False):
+        """
+        :param max_size: maximum number of cached slices; ``None`` for no limit
+        :type max_size: int
+        :param weak: hold weak references, so slices not referenced elsewhere
+            are dropped by the garbage collector
+        :type weak: bool
+        """
+        if max_size is not None and max_size < 1:
+            raise ValueError("max_size must be at least 1")
+        self.max_size = max_size
+        self.weak = weak
+        self.lock = threading.Lock()
+        # name -> slice (or weakref to slice), least recently used first
+        self._by_name: OrderedDict[str, Any] = OrderedDict()
+        # slice ID -> name
+        self._by_id: Dict[str, str] = {}
+        # (name, weakref) of collected slices, purged under the lock.  The
+        # weakref callback may run during garbage collection in a thread
+        # already holding the lock, so it must not take the lock itself.
+        self._collected = deque()
+
+    def __len__(self) -> int:
+        with self.lock:
+            self._purge_locked()
+            return len(self._by_name)
+
+    def _ref(self, slice_object: Slice) -> Any:
+        if not self.weak:
+            return slice_object
+        name = slice_object.get_name()
+        cache_ref = weakref.ref(self)
+
+        def on_collected(ref):
+            cache = cache_ref()
+            if cache is not None:
+                cache._collected.append((name, ref))
+
+        return weakref.ref(slice_object, on_collected)
+
+    def _deref(self, entry: Any) -> Optional[Slice]:
+        return entry() if self.weak else entry
+
+    def _purge_locked(self):
+        """
+        Remove entries of slices that have been garbage collected.
+        """
+        while self._collected:
+            name, ref = self._collected.popleft()
+            if self._by_name.get(name) is ref:
+                self._remove_locked(name)
+
+    def _evict_locked(self):
+        """
+        Evict least recently used slices beyond ``max_size``.
+        """
+        while self.max_size is not None and len(self._by_name) > self.max_size:
+            evicted = next(iter(self._by_name))
+            self._remove_locked(evicted)
+            log.debug(f"Evicted slice {evicted} from the slice cache")
+
+    def _remove_locked(self, name: str):
+        self._by_name.pop(name, None)
+        for slice_id in [k for k, v in self._by_id.items() if v == name]:
+            del self._by_id[slice_id]
+
+    def put(self, slice_object: Slice):
+        """
+        Cache a slice, replacing any cached slice with the same name.
+
+        :param slice_object: slice to cache
+        :type slice_object: Slice
+        """
+        name = slice_object.get_name()
+        slice_id = slice_object.get_slice_id()
+        with self.lock:
+            self._purge_locked()
+            if name in self._by_name:
+                self._remove_locked(name)
+            self._by_name[name] = self._ref(slice_object)
+            if slice_id:
+                self._by_id[slice_id] = name
+            self._evict_locked()
+
+    def update_id(self, slice_object: Slice):
+        """
+        Record the ID of a cached slice (e.g. after submit).
+
+        :param slice_object: slice whose ID was assigned
+        :type slice_object: Slice
+        """
+        name = slice_object.get_name()
+        slice_id = slice_object.get_slice_id()
+        with self.lock:
+            self._purge_locked()
+            if not slice_id or slice_id in self._by_id:
+                return
+            entry = self._by_name.get(name)
+            if entry is not None and self._deref(entry) is slice_object:
+                self._by_id[slice_id] = name
+            else:
+                # Not cached under its name (e.g. evicted); cache it again
+                self._remove_locked(name)
+                self._by_name[name] = self._ref(slice_object)
+                self._by_id[slice_id] = name
+                self._evict_locked()
+
+    def remove(self, slice_object: Slice):
+        """
+        Remove a slice from the cache.
+
+        :param slice_object: slice to remove
+        :type slice_object: Slice
+        """
+        with self.lock:
+            self._purge_locked()
+            name = self._by_id.get(slice_object.get_slice_id())
+            if name is None and slice_object.get_name() in self._by_name:
+                name = slice_object.get_name()
+            if name is not None:
+                self._remove_locked(name)
+
+    def get(self, slice_id: str = None, slice_name: str = None) -> Optional[Slice]:
+        """
+        Get a cached slice by ID or name, marking it as recently used.
+
+        :param slice_id: slice ID
+        :type slice_id: str
+        :param slice_name: slice name; used when ``slice_id`` is not given
+        :type slice_name: str
+        :return: the cached slice, or None
+        :rtype: Slice
+        """
+        with self.lock:
+            self._purge_locked()
+            name = self._by_id.get(slice_id) if slice_id else slice_name
+            if name is None or name not in self._by_name:
+                return None
+            slice_object = self._deref(self._by_name[name])
+            if slice_object is None:
+                self._remove_locked(name)
+                return None
+            self._by_name.move_to_end(name)
+            return slice_object
+
+    def slices(self) -> List[Slice]:
+        """
+        Get the cached slices, least recently used first.
+
+        :return: cached slices
+        :rtype: List[Slice]
+        """
+        with self.lock:
+            entries = list(self._by_name.values())
+        return [s for s in map(self._deref, entries) if s is not None]
+
+    def clear(self):
+        """
+        Remove all slices from the cache.
+        """
+        with self.lock:
+            self._by_name.clear()
+            self._by_id.clear()
+            self._collected.clear()
+
+    def memory_usage(self, sizeof: Callable[[Slice], int] = None) -> Dict[str, int]:
+        """
+        Approximate the memory held by each cached slice.
+
+        The owning ``FablibManager`` is not counted.  This walks every
+        object of every cached slice and is meant for diagnostics.
+
+        :param sizeof: function measuring a slice; defaults to
+            :func:`deep_sizeof` excluding the slice's ``FablibManager``
+        :type sizeof: Callable
+        :return: approximate size in bytes by slice name
+        :rtype: Dict[str, int]
+        """
+        if sizeof is None:
+
+            def sizeof(slice_object):
+                return deep_sizeof(
+                    slice_object, exclude=(slice_object.get_fablib_manager(),)
+                )
+
+        return {s.get_name(): sizeof(s) for s in self.slices()}
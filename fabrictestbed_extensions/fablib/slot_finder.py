@@ -0,0 +1,407 @@
+#!/usr/bin/env python3
+# MIT License
+#
+# Copyright (c) 2020 FABRIC Testbed
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+"""
+Local resource slot search over a resources calendar.
+
+``FablibManager.find_resource_slot()`` asks the orchestrator for every
+query.  :class:`SlotFinder` answers the same queries from one
+``resources_calendar()`` response, so durations, sites and component counts
+can be explored without further requests::
+
+    finder = fablib.get_slot_finder(start=start, end=end)
+    finder.find_resource_slot(duration=4, slice=my_slice, max_results=3)
+
+The calendar is held as arrays of available resources per site (slots x
+cores, RAM, disk and component models), link and facility port.  For a
+duration of ``k`` slots, sliding-window minimums over those arrays give the
+resources available throughout each window; a request fits a window when
+every requirement is below the minimums.  Windows are computed once per
+duration and shared by all queries.
+
+Links and facility ports missing from the calendar are not constrained.
+Confirm the chosen slot with the orchestrator (:py:meth:`SlotFinder.confirm`)
+before relying on it.
+"""
+
+from __future__ import annotations
+
+import datetime
+import logging
+import math
+from typing import Any, Dict, List, Optional
+
+import numpy as np
+from numpy.lib.stride_tricks import sliding_window_view
+
+from fabrictestbed_extensions.fablib.resource_calendar import (
+    INTERVAL_HOURS,
+    component_key,
+    parse_time,
+)
+from fabrictestbed_extensions.fablib.resource_index import BASE_COLUMNS
+
+log = logging.getLogger("fablib")
+
+
+def _available(data: Dict[str, Any], key: str) -> int:
+    """
+    Available amount of a resource: ``<key>_available``, or capacity minus
+    allocated.
+    """
+    available = data.get(f"{key}_available")
+    if available is None:
+        available = (data.get(f"{key}_capacity", 0) or 0) - (
+            data.get(f"{key}_allocated", 0) or 0
+        )
+    return available or 0
+
+
+def _shared(data: Dict[str, Any], key: str) -> Optional[int]:
+    """
+    Available amount of a link or facility port resource, named as in
+    ``resources_summary`` links: ``available_<key>``, or ``<key>`` minus
+    ``allocated_<key>``.
+
+    :return: the amount; None if not given as a number (e.g. VLAN ranges)
+    """
+    available = data.get(f"available_{key}")
+    if available is None:
+        capacity, allocated = data.get(key), data.get(f"allocated_{key}")
+        if not isinstance(capacity, (int, float)):
+            return None
+        if not isinstance(allocated, (int, float)):
+            allocated = 0
+        available = capacity - allocated
+    return int(available) if isinstance(available, (int, float)) else None
+
+
+class SlotFinder:
+    """
+    Answers ``find_resource_slot`` queries from a resources calendar.
+    """
+
+    def __init__(self, calendar_data: Dict[str, Any]):
+        """
+        :param calendar_data: ``resources_calendar()`` response, preferably
+            with ``interval="hour"``
+        :type calendar_data: dict
+        """
+        # Slots without a start cannot be placed in time and are skipped;
+        # windows spanning the gap they leave are not considered
+        timed = []
+        for slot in calendar_data.get("data") or []:
+            start = parse_time(slot.get("start"))
+            if start is None:
+                log.debug(f"Skipping calendar slot without a start: {slot}")
+                continue
+            timed.append((start, parse_time(slot.get("end")), slot))
+        timed.sort(key=lambda item: item[0])
+
+        lengths = [end - start for start, end, _ in timed if end and end > start]
+        self.slot_length = (
+            lengths[0]
+            if lengths
+            else datetime.timedelta(
+                hours=INTERVAL_HOURS.get(calendar_data.get("interval"), 1)
+            )
+        )
+        self.starts = [start for start, _, _ in timed]
+        self.ends = [end or start + self.slot_length for start, end, _ in timed]
+        slots = [slot for _, _, slot in timed]
+        self._start_seconds = np.array([s.timestamp() for s in self.starts])
+
+        self.sites: List[str] = sorted(
+            {site["name"] for slot in slots for site in slot.get("sites") or []}
+        )
+        self._site_ids = {name: i for i, name in enumerate(self.sites)}
+        components = sorted(
+            {
+                component_key(name)
+                for slot in slots
+                for site in slot.get("sites") or []
+                for name in site.get("components") or {}
+            }
+        )
+        self.columns = list(BASE_COLUMNS) + components
+        self._column_ids = {name: i for i, name in enumerate(self.columns)}
+
+        links = sorted(
+            {
+                tuple(sorted(link.get("sites") or []))
+                for slot in slots
+                for link in slot.get("links") or []
+                if len(link.get("sites") or []) == 2
+            }
+        )
+        self._link_ids = {sites: i for i, sites in enumerate(links)}
+        ports = sorted(
+            {
+                port.get("name")
+                for slot in slots
+                for port in slot.get("facility_ports") or []
+                if port.get("name")
+            }
+        )
+        self._port_ids = {name: i for i, name in enumerate(ports)}
+
+        # Available resources per entity and slot.  Missing site entries
+        # are 0; links and ports not reported as a number are unconstrained.
+        self.site_available = np.zeros(
+            (len(self.sites), len(slots), len(self.columns)), dtype=np.int64
+        )
+        unbounded = np.iinfo(np.int64).max
+        self.link_available = np.full((len(links), len(slots)), unbounded)
+        self.port_available = np.full((len(ports), len(slots)), unbounded)
+        for t, slot in enumerate(slots):
+            for site in slot.get("sites") or []:
+                row = self.site_available[self._site_ids[site["name"]], t]
+                for col, key in enumerate(BASE_COLUMNS):
+                    row[col] = _available(site, key)
+                for name, comp in (site.get("components") or {}).items():
+                    row[self._column_ids[component_key(name)]] += comp.get(
+                        "available",
+                        (comp.get("capacity", 0) or 0)
+                        - (comp.get("allocated", 0) or 0),
+                    )
+            for link in slot.get("links") or []:
+                sites = tuple(sorted(link.get("sites") or []))
+                available = _shared(link, "bandwidth")
+                if sites in self._link_ids and available is not None:
+                    self.link_available[self._link_ids[sites], t] = available
+            for port in slot.get("facility_ports") or []:
+                available = _shared(port, "vlans")
+                if port.get("name") in self._port_ids and available is not None:
+                    self.port_available[self._port_ids[port["name"]], t] = available
+
+        # Sliding-window minimums by window length in slots
+        self._windows: Dict[int, tuple] = {}
+
+    def __len__(self) -> int:
+        return len(self.starts)
+
+    def window_slots(self, duration: float) -> int:
+        """
+        Number of calendar slots covering ``duration`` hours.
+
+        :param duration: hours
+        :type duration: float
+        :rtype: int
+        """
+        hours = self.slot_length.total_seconds() / 3600
+        return max(1, math.ceil(duration / hours - 1e-9))
+
+    def window_minimums(self, slots: int) -> tuple:
+        """
+        Resources available throughout each window of ``slots`` slots.
+
+        :param slots: window length in slots
+        :type slots: int
+        :return: (sites, links, facility ports) arrays indexed by entity
+            and window start; empty if the calendar is shorter
+        :rtype: tuple
+        """
+        if slots not in self._windows:
+            count = max(len(self) - slots + 1, 0)
+            if count == 0:
+                minimums = (
+                    np.zeros((len(self.sites), 0, len(self.columns)), np.int64),
+                    np.zeros((len(self._link_ids), 0), np.int64),
+                    np.zeros((len(self._port_ids), 0), np.int64),
+                )
+            else:
+                minimums = (
+                    sliding_window_view(self.site_available, slots, axis=1).min(-1),
+                    sliding_window_view(self.link_available, slots, axis=1).min(-1),
+                    sliding_window_view(self.port_available, slots, axis=1).min(-1),
+                )
+            self._windows[slots] = minimums
+        return self._windows[slots]
+
+    def contiguous(self, slots: int) -> np.ndarray:
+        """
+        Windows of ``slots`` slots without missing slots.
+
+        :param slots: window length in slots
+        :type slots: int
+        :return: boolean array indexed by window start slot
+        :rtype: np.ndarray
+        """
+        count = max(len(self) - slots + 1, 0)
+        seconds = self._start_seconds
+        span = seconds[slots - 1 : slots - 1 + count] - seconds[:count]
+        # Allow for rounding of the slot times
+        return span <= (slots - 1) * self.slot_length.total_seconds() + 1
+
+    def feasible(self, resources: List[Dict[str, Any]], duration: float) -> np.ndarray:
+        """
+        Windows in which all resources are available.
+
+        :param resources: resource requirements in the ``find_resource_slot``
+            format (types ``compute``, ``link`` and ``facility_port``)
+        :type resources: List[Dict[str, Any]]
+        :param duration: hours
+        :type duration: float
+        :return: boolean array indexed by window start slot
+        :rtype: np.ndarray
+        """
+        slots = self.window_slots(duration)
+        sites, links, ports = self.window_minimums(slots)
+        ok = self.contiguous(slots)
+
+        # Compute: one demand row per site, checked against all windows
+        demands: Dict[int, np.ndarray] = {}
+        for r in resources:
+            kind = r.get("type")
+            if kind == "compute":
+                site = self._site_ids.get(r.get("site"))
+                if site is None:
+                    return np.zeros_like(ok)
+                demand = demands.setdefault(
+                    site, np.zeros(len(self.columns), dtype=np.int64)
+                )
+                for col, key in enumerate(BASE_COLUMNS):
+                    demand[col] += r.get(key, 0) or 0
+                for name, count in (r.get("components") or {}).items():
+                    col = self._column_ids.get(component_key(name))
+                    if col is None:
+                        if count:
+                            return np.zeros_like(ok)
+                        continue
+                    demand[col] += count
+            elif kind == "link":
+                link = self._link_ids.get(
+                    tuple(sorted((r.get("site_a"), r.get("site_b"))))
+                )
+                if link is not None:
+                    ok &= links[link] >= (r.get("bandwidth") or 0)
+            elif kind == "facility_port":
+                port = self._port_ids.get(r.get("name"))
+                if port is not None:
+                    ok &= ports[port] >= (r.get("vlans") or 0)
+
+        if demands:
+            rows = np.fromiter(demands, dtype=np.int64)
+            needed = np.stack(list(demands.values()))
+            ok &= (sites[rows] >= needed[:, None, :]).all(axis=(0, 2))
+        return ok
+
+    def find_resource_slot(
+        self,
+        duration: float,
+        resources: Optional[List[Dict[str, Any]]] = None,
+        slice=None,
+        start: Optional[datetime.datetime] = None,
+        end: Optional[datetime.datetime] = None,
+        max_results: int = 1,
+    ) -> Dict[str, Any]:
+        """
+        Find windows where the requested resources are available.
+
+        Takes the same requirements as
+        :py:meth:`FablibManager.find_resource_slot`.
+
+        :param duration: required slot length in hours
+        :type duration: float
+        :param resources: resource requirement dicts
+        :type resources: List[Dict[str, Any]]
+        :param slice: an unsubmitted slice to take the requirements from
+        :type slice: Slice
+        :param start: earliest start; the calendar start by default
+        :type start: datetime.datetime
+        :param end: latest end; the calendar end by default
+        :type end: datetime.datetime
+        :param max_results: maximum number of slots to return
+        :type max_results: int
+        :return: ``{"slots": [{"start": ..., "end": ...}], "total": n}``
+            with ISO times, earliest first; ``total`` counts all matching
+            windows
+        :rtype: dict
+        :raises ValueError: if both or neither of ``slice`` and
+            ``resources`` are provided
+        """
+        from fabrictestbed_extensions.fablib.fablib import FablibManager
+
+        if (slice is None) == (resources is None):
+            raise ValueError("Exactly one of 'slice' or 'resources' must be provided.")
+        if slice is not None:
+            resources = FablibManager._slice_to_resources(slice)
+        resources = FablibManager._normalize_component_keys(resources)
+
+        ok = self.feasible(resources, duration)
+        length = datetime.timedelta(hours=duration)
+        if start is not None:
+            ok &= np.array([s >= start for s in self.starts[: len(ok)]], dtype=bool)
+        if end is not None:
+            ok &= np.array(
+                [s + length <= end for s in self.starts[: len(ok)]], dtype=bool
+            )
+
+        matches = np.flatnonzero(ok)
+        slots = [
+            {
+                "start": self.starts[t].isoformat(),
+                "end": (self.starts[t] + length).isoformat(),
+            }
+            for t in matches[:max_results]
+        ]
+        return {"slots": slots, "total": int(len(matches))}
+
+    def confirm(
+        self,
+        fablib_manager,
+        slot: Dict[str, str],
+        duration: float,
+        resources: Optional[List[Dict[str, Any]]] = None,
+        slice=None,
+    ) -> bool:
+        """
+        Check a slot found locally with the orchestrator.
+
+        :param fablib_manager: the fablib manager
+        :type fablib_manager: FablibManager
+        :param slot: slot returned by :py:meth:`find_resource_slot`
+        :type slot: dict
+        :param duration: slot length in hours
+        :type duration: float
+        :param resources: resource requirement dicts
+        :type resources: List[Dict[str, Any]]
+        :param slice: an unsubmitted slice to take the requirements from
+        :type slice: Slice
+        :return: whether the orchestrator finds the resources available
+            for the slot
+        :rtype: bool
+        """
+        start = parse_time(slot["start"])
+        end = start + max(
+            datetime.timedelta(hours=duration), datetime.timedelta(minutes=60)
+        )
+        result = fablib_manager.find_resource_slot(
+            start=start,
+            end=end,
+            duration=math.ceil(duration),
+            slice=slice,
+            resources=resources,
+            max_results=1,
+        )
+        return bool((result or {}).get("slots"))
@@ -107,10 +107,43 @@ class Switch(Node):
         :type fim_node: FimNode
         """
         if fim_node:
-            self.fim_node = fim_node
-            self._invalidate_cache()
-            self.get_interfaces(refresh=True)
-            self._fim_dirty = False
+            self._apply_update(self._prepare_update(fim_node))
+
+    def _prepare_update(self, fim_node: FimNode) -> tuple:
+        """
+        Build the interfaces of a new FIM node without modifying this
+        switch; see :py:meth:`_apply_update`.
+
+        :param fim_node: the new FIM node
+        :type fim_node: FimNode
+        :return: state for :py:meth:`_apply_update`
+        :rtype: tuple
+        """
+        interfaces = {}
+        try:
+            for name, fim_iface in fim_node.interfaces.items():
+                interfaces[name] = Interface(
+                    node=self, fim_interface=fim_iface, model="NIC_P4"
+                )
+        except Exception as e:
+            log.debug(f"Error getting interfaces: {e}")
+            interfaces = {}
+        return fim_node, interfaces
+
+    def _apply_update(self, state: tuple):
+        """
+        Point this switch at the FIM node prepared by
+        :py:meth:`_prepare_update`, replacing its caches by assignment.
+
+        :param state: state returned by :py:meth:`_prepare_update`
+        :type state: tuple
+        """
+        fim_node, interfaces = state
+        self.fim_node = fim_node
+        self._invalidate_cache()
+        self._interfaces_cache = interfaces
+        self.interfaces = dict(interfaces)
+        self._fim_dirty = False
 
     def __str__(self):
         """
@@ -224,46 +257,38 @@ class Switch(Node):
             "private_ssh_key_file": "Private SSH Key File",
         }
 
-    def toDict(self, skip: list = None):
+    # Columns of toDict(), computed on demand (see TemplateMixin._columns_dict)
+    _dict_columns = {
+        name: Node._dict_columns[name]
+        for name in (
+            "id",
+            "name",
+            "site",
+            "username",
+            "management_ip",
+            "state",
+            "error",
+            "ssh_command",
+            "public_ssh_key_file",
+            "private_ssh_key_file",
+        )
+    }
+
+    def toDict(self, skip: list = None, fields: list = None):
         """
         Returns the node attributes as a dictionary.
 
-        Results are cached. Cache is invalidated when ``_invalidate_cache()``
-        is called.
+        Only the requested attributes are computed. Results are cached.
+        Cache is invalidated when ``_invalidate_cache()`` is called.
 
         :param skip: list of keys to exclude
         :type skip: list
+        :param fields: list of keys to include; all by default
+        :type fields: list
         :return: switch attributes as dictionary
         :rtype: dict
         """
-        if skip is None:
-            skip = []
-
-        if self._cached_dict is None:
-            d = {}
-            d["id"] = str(self.get_reservation_id())
-            d["name"] = str(self.get_name())
-            d["site"] = str(self.get_site())
-            d["username"] = str(self.get_username())
-            d["management_ip"] = (
-                str(self.get_management_ip()).strip()
-                if str(self.get_reservation_state()) == "Active"
-                and self.get_management_ip()
-                else ""
-            )
-            d["state"] = str(self.get_reservation_state())
-            d["error"] = str(self.get_error_message())
-            if str(self.get_reservation_state()) == "Active":
-                d["ssh_command"] = str(self.get_ssh_command())
-            else:
-                d["ssh_command"] = ""
-            d["public_ssh_key_file"] = str(self.get_public_key_file())
-            d["private_ssh_key_file"] = str(self.get_private_key_file())
-            self._cached_dict = d
-
-        if not skip:
-            return dict(self._cached_dict)
-        return {k: v for k, v in self._cached_dict.items() if k not in skip}
+        return self._columns_dict(skip=skip, fields=fields)
 
     def generate_template_context(self, skip: list = None):
         """
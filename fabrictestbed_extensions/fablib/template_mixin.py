@@ -1,14 +1,37 @@
 from __future__ import annotations
 
+import functools
 import json
+import threading
 from abc import abstractmethod
-from typing import List, Optional
+from typing import Any, Callable, Dict, Iterable, List, Optional
 
 import jinja2
-from fabrictestbed.slice_editor import UserData
 
+from fabrictestbed_extensions.fablib.user_data_cache import UserDataCache
 from fabrictestbed_extensions.utils.utils import Utils
 
+# One Jinja2 environment per TemplateMixin subclass, configured by its
+# ``_configure_template_environment`` hook.
+_template_environments: Dict[type, jinja2.Environment] = {}
+_template_environments_lock = threading.Lock()
+
+# Marks toDict() columns not computed yet; None is a valid column value
+_NOT_CACHED = object()
+
+
+@functools.lru_cache(maxsize=256)
+def _compile_template(
+    environment: jinja2.Environment, input_string: str
+) -> jinja2.Template:
+    """
+    Compile a template string, caching the most recently used templates.
+
+    Post boot tasks render the same few templates for every node, so
+    compiling each only once avoids most of the cost of rendering.
+    """
+    return environment.from_string(input_string)
+
 
 class TemplateMixin:
     """Mixin providing Jinja2 template rendering for FABRIC resource classes.
@@ -21,10 +44,26 @@ class TemplateMixin:
       *this* object inside the template namespace.
     * ``_configure_template_environment(environment)`` – hook for
       customising the :class:`jinja2.Environment` before rendering.
+    * ``_dict_columns`` – the columns of ``toDict()``, each computed by a
+      function of the object (see :py:meth:`_columns_dict`).
     """
 
     _default_skip: Optional[List[str]] = None
     _show_title: str = ""
+    _dict_columns: Dict[str, Callable[[Any], str]] = {}
+
+    # Wrappers are created for every node, component and interface of a
+    # slice; slots keep them small.  Subclasses that do not declare slots
+    # get a ``__dict__`` as usual.
+    __slots__ = (
+        "__weakref__",
+        "_fim_dirty",
+        "_cached_reservation_id",
+        "_cached_reservation_state",
+        "_cached_error_message",
+        "_cached_name",
+        "_cached_dict",
+    )
 
     def __init__(self, **kwargs):
         # V2 specific: dirty flag for caching
@@ -48,6 +87,21 @@ class TemplateMixin:
         self._cached_error_message = None
         self._cached_name = None
         self._cached_dict = None
+        self._invalidate_template_context()
+
+    def _invalidate_template_context(self):
+        """
+        Drop the template context cached by the slice, which includes this
+        object's dictionary.
+        """
+        try:
+            slice_object = self.get_slice()
+        except Exception:
+            return
+        if slice_object is not None:
+            invalidate = getattr(slice_object, "_invalidate_template_context", None)
+            if invalidate is not None:
+                invalidate()
 
     @abstractmethod
     def get_fim(self):
@@ -56,7 +110,9 @@ class TemplateMixin:
         """
 
     @abstractmethod
-    def toDict(self, skip: Optional[List[str]]):
+    def toDict(
+        self, skip: Optional[List[str]] = None, fields: Optional[List[str]] = None
+    ):
         """
         Returns the attributes as a dictionary
 
@@ -64,6 +120,85 @@ class TemplateMixin:
         :rtype: dict
         """
 
+    def _columns_dict(
+        self,
+        skip: Optional[Iterable[str]] = None,
+        fields: Optional[Iterable[str]] = None,
+    ) -> dict:
+        """
+        Build the ``toDict()`` dictionary from ``_dict_columns``.
+
+        Only the requested columns are computed.  Computed values are kept
+        in ``_cached_dict`` until ``_invalidate_cache()`` is called, so
+        listing a few columns of many objects, repeatedly, only computes
+        each value once.
+
+        :param skip: columns to exclude
+        :type skip: Iterable[str]
+        :param fields: columns to include; all by default
+        :type fields: Iterable[str]
+        :return: column values, in ``_dict_columns`` order
+        :rtype: dict
+        """
+        cache = self._cached_dict
+        if cache is None:
+            cache = self._cached_dict = {}
+        skip = set(skip) if skip else ()
+        fields = set(fields) if fields is not None else None
+
+        d = {}
+        for name, column in self._dict_columns.items():
+            if name in skip or (fields is not None and name not in fields):
+                continue
+            value = cache.get(name, _NOT_CACHED)
+            if value is _NOT_CACHED:
+                value = cache[name] = column(self)
+            d[name] = value
+        return d
+
+    def _cache_dict_columns(self, **values: str):
+        """
+        Store ``toDict()`` column values that were computed elsewhere, e.g.
+        by a batched lookup.
+
+        :param values: column values by column name
+        :type values: str
+        """
+        cache = self._cached_dict
+        if cache is None:
+            cache = self._cached_dict = {}
+        cache.update(values)
+
+    @classmethod
+    def _columns_for_fields(
+        cls,
+        fields: Optional[List[str]],
+        pretty_names_dict: Optional[Dict[str, str]] = None,
+    ) -> Optional[List[str]]:
+        """
+        Get the ``toDict()`` columns a listing of ``fields`` needs.
+
+        :param fields: fields requested from a ``list_*`` method, as column
+            names or pretty names
+        :type fields: List[str]
+        :param pretty_names_dict: pretty names by column name
+        :type pretty_names_dict: Dict[str, str]
+        :return: column names, or None if all columns are needed
+        :rtype: List[str]
+        """
+        if fields is None:
+            return None
+        columns_by_pretty_name = {v: k for k, v in (pretty_names_dict or {}).items()}
+        columns = []
+        for field in fields:
+            if field in cls._dict_columns:
+                columns.append(field)
+            elif field in columns_by_pretty_name:
+                columns.append(columns_by_pretty_name[field])
+            else:
+                return None
+        return columns
+
     def generate_template_context(self, skip: Optional[List[str]] = None):
         """Return a dict representing this object for template rendering.
 
@@ -93,6 +228,28 @@ class TemplateMixin:
             return self.get_slice().get_template_context(self, skip=effective_skip)
         return self.get_slice().get_template_context(self)
 
+    def get_template(self, input_string: str) -> jinja2.Template:
+        """Get the compiled Jinja2 template for a template string.
+
+        Templates are compiled once per class and template string and kept
+        in a least recently used cache.
+
+        :param input_string: Jinja2 template string.
+        :type input_string: str
+        :return: Compiled template.
+        :rtype: jinja2.Template
+        """
+        cls = type(self)
+        environment = _template_environments.get(cls)
+        if environment is None:
+            with _template_environments_lock:
+                environment = _template_environments.get(cls)
+                if environment is None:
+                    environment = jinja2.Environment()
+                    self._configure_template_environment(environment)
+                    _template_environments[cls] = environment
+        return _compile_template(environment, input_string)
+
     def render_template(self, input_string, skip=None):
         """Render a Jinja2 template string using this object's context.
 
@@ -103,9 +260,7 @@ class TemplateMixin:
         :return: Rendered template output string.
         :rtype: str
         """
-        environment = jinja2.Environment()
-        self._configure_template_environment(environment)
-        template = environment.from_string(input_string)
+        template = self.get_template(input_string)
         return template.render(self.get_template_context(skip=skip))
 
     def get_error_message(self) -> str:
@@ -252,22 +407,35 @@ class TemplateMixin:
         """
         Set user data.
 
+        The data is written into the FIM topology when the slice is
+        submitted or saved.
+
         :param user_data: a ``dict``.
         :type user_data: dict
         """
-        self.get_fim().set_property(
-            pname="user_data", pval=UserData(json.dumps(user_data))
-        )
+        fim = self.get_fim()
+        cache = UserDataCache.for_element(fim)
+        if cache is None:
+            UserDataCache.write(fim, user_data)
+        else:
+            cache.put(fim, user_data)
 
     def get_user_data(self) -> dict:
         """
         Get user data.
 
+        The parsed data is cached per FIM element and a copy is returned;
+        changes must be passed to :py:meth:`set_user_data`.
+
         :return: user data dictionary
         :rtype: dict
         """
         try:
-            return json.loads(str(self.get_fim().get_property(pname="user_data")))
+            fim = self.get_fim()
+            cache = UserDataCache.for_element(fim)
+            if cache is None:
+                return UserDataCache.read(fim)
+            return cache.get(fim)
         except Exception:
             return {}
 
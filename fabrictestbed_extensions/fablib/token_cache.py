@@ -0,0 +1,201 @@
+#!/usr/bin/env python3
+# MIT License
+#
+# Copyright (c) 2020 FABRIC Testbed
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+"""
+Persistent on-disk cache of information derived from an ID token.
+
+Every new process decodes its ID token through the credential manager
+(user, project and project tags) and looks up the bastion username through
+the core API.  :class:`TokenInfoCache` keeps these results under
+``<data_dir>/token_cache`` in a file named after the SHA-256 hash of the
+token, so the token itself is never written.  Entries expire together with
+the token.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+import os
+import threading
+import time
+from typing import Any, Callable, Dict, Optional
+
+from atomicwrites import atomic_write
+from fabrictestbed.external_api.credmgr_client import DecodedTokenDTO
+
+log = logging.getLogger("fablib")
+
+
+class TokenInfoCache:
+    """
+    On-disk cache of token-derived information keyed by token hash.
+    """
+
+    def __init__(self, cache_dir: str):
+        """
+        :param cache_dir: directory holding one JSON file per token
+        :type cache_dir: str
+        """
+        self.cache_dir = cache_dir
+        self.lock = threading.Lock()
+
+    @staticmethod
+    def token_hash(id_token: str) -> str:
+        """
+        Hash identifying a token.
+
+        :param id_token: ID token
+        :type id_token: str
+        :return: hex digest
+        :rtype: str
+        """
+        return hashlib.sha256(id_token.encode("utf-8")).hexdigest()
+
+    def _path(self, id_token: str) -> str:
+        return os.path.join(self.cache_dir, f"{self.token_hash(id_token)}.json")
+
+    def get(self, id_token: str) -> Dict[str, Any]:
+        """
+        Get the cached information for a token.
+
+        :param id_token: ID token
+        :type id_token: str
+        :return: cached fields; empty if not cached or the token has expired
+        :rtype: dict
+        """
+        if not id_token:
+            return {}
+
+        path = self._path(id_token)
+        try:
+            with open(path, "r") as f:
+                entry = json.load(f)
+        except FileNotFoundError:
+            return {}
+        except Exception as e:
+            log.warning(f"Ignoring unreadable token cache entry {path}: {e}")
+            return {}
+
+        if entry.get("expires_at", 0) <= time.time():
+            self._remove(path)
+            return {}
+        return entry.get("fields", {})
+
+    def put(self, id_token: str, expires_at: Optional[float] = None, **fields):
+        """
+        Store information for a token, merging with existing fields.
+
+        :param id_token: ID token
+        :type id_token: str
+        :param expires_at: token expiry as a UNIX timestamp; required when
+            the token has no entry yet
+        :type expires_at: float
+        :param fields: fields to store
+        """
+        if not id_token:
+            return
+
+        path = self._path(id_token)
+        with self.lock:
+            entry = {}
+            if os.path.exists(path):
+                try:
+                    with open(path, "r") as f:
+                        entry = json.load(f)
+                except Exception:
+                    entry = {}
+
+            if expires_at is not None:
+                entry["expires_at"] = expires_at
+            if entry.get("expires_at", 0) <= time.time():
+                return
+            entry.setdefault("fields", {}).update(fields)
+
+            try:
+                os.makedirs(self.cache_dir, mode=0o700, exist_ok=True)
+                with atomic_write(path, overwrite=True) as f:
+                    os.chmod(f.name, 0o600)
+                    json.dump(entry, f)
+            except Exception as e:
+                log.warning(f"Failed to write token cache entry {path}: {e}")
+                return
+
+        self.prune()
+
+    def prune(self):
+        """
+        Remove entries of expired tokens.
+        """
+        try:
+            names = os.listdir(self.cache_dir)
+        except FileNotFoundError:
+            return
+
+        now = time.time()
+        for name in names:
+            path = os.path.join(self.cache_dir, name)
+            try:
+                with open(path, "r") as f:
+                    expires_at = json.load(f).get("expires_at", 0)
+            except Exception:
+                expires_at = 0
+            if expires_at <= now:
+                self._remove(path)
+
+    @staticmethod
+    def _remove(path: str):
+        try:
+            os.remove(path)
+        except FileNotFoundError:
+            pass
+        except Exception as e:
+            log.warning(f"Failed to remove token cache entry {path}: {e}")
+
+    def validate(
+        self, validate: Callable, *, id_token: str, return_fmt: str = "dict"
+    ) -> DecodedTokenDTO | Dict[str, Any]:
+        """
+        Decode a token, serving the result from the cache when possible.
+
+        Wraps :meth:`CredmgrClient.validate`.
+
+        :param validate: the credential manager's validate function
+        :type validate: Callable
+        :param id_token: ID token
+        :type id_token: str
+        :param return_fmt: ``"dict"`` or ``"dto"``
+        :type return_fmt: str
+        :return: decoded token
+        """
+        decoded = self.get(id_token).get("decoded")
+        if decoded is None:
+            decoded = validate(id_token=id_token, return_fmt="dict")
+            expires_at = decoded.get("exp") or decoded.get("token", {}).get("exp")
+            if expires_at:
+                self.put(id_token, expires_at=float(expires_at), decoded=decoded)
+        else:
+            log.debug("Using cached decoded token")
+
+        return decoded if return_fmt == "dict" else DecodedTokenDTO.from_dict(decoded)
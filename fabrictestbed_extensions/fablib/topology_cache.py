@@ -0,0 +1,247 @@
+#!/usr/bin/env python3
+# MIT License
+#
+# Copyright (c) 2020 FABRIC Testbed
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+"""
+Persistent on-disk cache of slice topologies and slivers.
+
+Re-opening a slice normally downloads and parses its full graph model and
+sliver list.  :class:`TopologyCache` keeps the last graph model and sliver
+DTOs of each stable slice under ``<data_dir>/topology_cache`` so that a new
+process can reuse them.  An entry is only served when the slice metadata
+returned by the orchestrator (state and lease times, fetched without the
+graph) still matches the metadata recorded with the entry, the stored
+model still matches its recorded hash, and the model or slivers were
+stored less than ``max_age`` seconds ago.
+
+The orchestrator metadata does not change when another client modifies a
+slice and it returns to a stable state, so such changes are only picked up
+once the entry has expired (or :py:meth:`TopologyCache.invalidate` is
+called); choose ``max_age`` accordingly.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+import os
+import threading
+import time
+from typing import Dict, List, Optional
+
+from atomicwrites import atomic_write
+from fabrictestbed.external_api.orchestrator_client import SliceDTO, SliverDTO
+
+log = logging.getLogger("fablib")
+
+
+class TopologyCache:
+    """
+    On-disk cache of slice graph models and sliver DTOs keyed by slice ID.
+    """
+
+    #: Only slices in these states are cached; any other state means the
+    #: topology may still be changing.
+    CACHEABLE_STATES = ("StableOK", "StableError")
+
+    #: Seconds for which a stored model or sliver list is served by default
+    DEFAULT_MAX_AGE = 600.0
+
+    def __init__(self, cache_dir: str, max_age: Optional[float] = DEFAULT_MAX_AGE):
+        """
+        :param cache_dir: directory holding one JSON file per slice
+        :type cache_dir: str
+        :param max_age: seconds for which a stored model or sliver list is
+            served; ``None`` serves them as long as the slice metadata is
+            unchanged
+        :type max_age: float
+        """
+        self.cache_dir = cache_dir
+        self.max_age = max_age
+        self.lock = threading.Lock()
+
+    def _is_fresh(self, stored_at: Optional[float]) -> bool:
+        """
+        Whether a part stored at ``stored_at`` may still be served.
+        """
+        if self.max_age is None:
+            return True
+        return stored_at is not None and time.time() - stored_at < self.max_age
+
+    @staticmethod
+    def fingerprint(sm_slice: SliceDTO) -> Dict[str, Optional[str]]:
+        """
+        Metadata used to decide whether a cached entry is still current.
+
+        :param sm_slice: slice metadata returned by the orchestrator
+        :type sm_slice: SliceDTO
+        :return: fingerprint dictionary
+        :rtype: dict
+        """
+        return {
+            "state": sm_slice.state,
+            "lease_start_time": sm_slice.lease_start_time,
+            "lease_end_time": sm_slice.lease_end_time,
+            "graph_id": sm_slice.graph_id,
+        }
+
+    @staticmethod
+    def model_hash(model: str) -> str:
+        """
+        Hash of a serialized graph model.
+
+        :param model: serialized graph model
+        :type model: str
+        :return: hex digest
+        :rtype: str
+        """
+        return hashlib.sha256(model.encode("utf-8")).hexdigest()
+
+    def _path(self, slice_id: str) -> str:
+        return os.path.join(self.cache_dir, f"{slice_id}.json")
+
+    def _read(self, sm_slice: SliceDTO) -> Optional[dict]:
+        """
+        Read the entry for a slice if it matches the slice's current metadata.
+        """
+        if not sm_slice or not sm_slice.slice_id:
+            return None
+        if sm_slice.state not in self.CACHEABLE_STATES:
+            return None
+
+        path = self._path(sm_slice.slice_id)
+        try:
+            with open(path, "r") as f:
+                entry = json.load(f)
+        except FileNotFoundError:
+            return None
+        except Exception as e:
+            log.warning(f"Ignoring unreadable topology cache entry {path}: {e}")
+            return None
+
+        if entry.get("fingerprint") != self.fingerprint(sm_slice):
+            log.debug(f"Topology cache entry for {sm_slice.slice_id} is stale")
+            return None
+        return entry
+
+    def get_model(self, sm_slice: SliceDTO) -> Optional[str]:
+        """
+        Get the cached graph model for a slice.
+
+        :param sm_slice: current slice metadata
+        :type sm_slice: SliceDTO
+        :return: serialized graph model, or None if not cached or stale
+        :rtype: str
+        """
+        entry = self._read(sm_slice)
+        if not entry or entry.get("model") is None:
+            return None
+        if not self._is_fresh(entry.get("model_stored_at")):
+            log.debug(f"Topology cache model for {sm_slice.slice_id} has expired")
+            return None
+
+        model = entry["model"]
+        if self.model_hash(model) != entry.get("model_hash"):
+            log.warning(
+                f"Topology cache entry for {sm_slice.slice_id} failed hash check"
+            )
+            return None
+        return model
+
+    def get_slivers(self, sm_slice: SliceDTO) -> Optional[List[SliverDTO]]:
+        """
+        Get the cached slivers for a slice.
+
+        :param sm_slice: current slice metadata
+        :type sm_slice: SliceDTO
+        :return: list of slivers, or None if not cached or stale
+        :rtype: List[SliverDTO]
+        """
+        entry = self._read(sm_slice)
+        if not entry or entry.get("slivers") is None:
+            return None
+        if not self._is_fresh(entry.get("slivers_stored_at")):
+            log.debug(f"Topology cache slivers for {sm_slice.slice_id} have expired")
+            return None
+        return [SliverDTO.from_dict(s) for s in entry["slivers"]]
+
+    def put(
+        self,
+        sm_slice: SliceDTO,
+        model: Optional[str] = None,
+        slivers: Optional[List[SliverDTO]] = None,
+    ):
+        """
+        Store the graph model and/or slivers of a slice.
+
+        Parts not passed are kept from the existing entry when it is still
+        current.  Slices that are not in a stable state are not cached.
+
+        :param sm_slice: current slice metadata
+        :type sm_slice: SliceDTO
+        :param model: serialized graph model
+        :type model: str
+        :param slivers: slivers of the slice
+        :type slivers: List[SliverDTO]
+        """
+        if not sm_slice or not sm_slice.slice_id:
+            return
+        if sm_slice.state not in self.CACHEABLE_STATES:
+            self.invalidate(sm_slice.slice_id)
+            return
+
+        with self.lock:
+            entry = self._read(sm_slice) or {}
+            entry["fingerprint"] = self.fingerprint(sm_slice)
+            if model is not None:
+                entry["model"] = model
+                entry["model_hash"] = self.model_hash(model)
+                entry["model_stored_at"] = time.time()
+            if slivers is not None:
+                entry["slivers"] = [s.to_dict() for s in slivers]
+                entry["slivers_stored_at"] = time.time()
+
+            try:
+                os.makedirs(self.cache_dir, exist_ok=True)
+                with atomic_write(self._path(sm_slice.slice_id), overwrite=True) as f:
+                    json.dump(entry, f)
+            except Exception as e:
+                log.warning(
+                    f"Failed to write topology cache entry for {sm_slice.slice_id}: {e}"
+                )
+
+    def invalidate(self, slice_id: str):
+        """
+        Remove the cached entry for a slice, if any.
+
+        :param slice_id: slice ID
+        :type slice_id: str
+        """
+        if not slice_id:
+            return
+        try:
+            os.remove(self._path(slice_id))
+        except FileNotFoundError:
+            pass
+        except Exception as e:
+            log.warning(f"Failed to remove topology cache entry for {slice_id}: {e}")
@@ -0,0 +1,240 @@
+#!/usr/bin/env python3
+# MIT License
+#
+# Copyright (c) 2020 FABRIC Testbed
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+"""
+Parsed ``user_data`` of FIM topology elements.
+
+Nodes, components, interfaces, networks and facility ports keep their
+``user_data`` (including ``fablib_data``) as a JSON string property in the
+FIM graph.  Reading it meant a graph lookup and ``json.loads`` on every
+call, and writing it a read, ``json.loads``, ``json.dumps`` and graph
+update.  :class:`UserDataCache` keeps the parsed ``user_data`` of each
+element of a topology in memory.  Changes are marked dirty and written back
+into the topology by :py:meth:`UserDataCache.flush`, which ``Slice`` calls
+before submitting or saving the topology and when the topology is requested
+with ``Slice.get_fim_topology()``.
+
+Callers receive copies of the cached data, as they did when it was parsed
+on every call; changing a returned dict in place has no effect until it is
+passed back with ``set_user_data()``.
+
+The cache belongs to the FIM topology rather than to the fablib objects, as
+several fablib objects may wrap the same FIM element; they all see the same
+data.  Replacing the topology (e.g. ``Slice.update()``) starts a new cache.
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+import threading
+import weakref
+from typing import Any, Dict, Optional, Set
+
+from fabrictestbed.slice_editor import UserData
+from fim.graph.abc_property_graph import PropertyGraphQueryException
+
+log = logging.getLogger("fablib")
+
+
+def _copy(value: Any) -> Any:
+    """
+    Copy JSON-like data; faster than ``copy.deepcopy`` for dicts and lists.
+    """
+    if isinstance(value, dict):
+        return {k: _copy(v) for k, v in value.items()}
+    if isinstance(value, list):
+        return [_copy(v) for v in value]
+    return value
+
+
+class _Entry:
+    """Parsed user data of one FIM element."""
+
+    __slots__ = ("data", "dirty", "fim")
+
+    def __init__(self, data: dict, fim: Any):
+        self.data = data
+        self.dirty = False
+        self.fim = fim
+
+
+class UserDataCache:
+    """
+    Parsed ``user_data`` of the elements of one FIM topology, by node ID.
+    """
+
+    _caches = weakref.WeakKeyDictionary()
+    _caches_lock = threading.Lock()
+
+    def __init__(self):
+        self.lock = threading.RLock()
+        self._entries: Dict[str, _Entry] = {}
+        # Node IDs of the entries not written to the topology yet
+        self._dirty: Set[str] = set()
+
+    @classmethod
+    def for_element(cls, fim: Any) -> Optional[UserDataCache]:
+        """
+        Get the cache of the topology a FIM element belongs to.
+
+        :param fim: FIM node, component, interface, network or facility
+        :type fim: Any
+        :return: the cache, or None if the element is not part of a topology
+        :rtype: UserDataCache
+        """
+        topology = getattr(fim, "topo", None)
+        if topology is None or getattr(fim, "node_id", None) is None:
+            return None
+        return cls.for_topology(topology)
+
+    @classmethod
+    def for_topology(cls, topology: Any) -> Optional[UserDataCache]:
+        """
+        Get (or create) the cache of a FIM topology.
+
+        :param topology: FIM topology
+        :type topology: ExperimentTopology
+        :return: the cache, or None if the topology cannot hold one
+        :rtype: UserDataCache
+        """
+        if topology is None:
+            return None
+        with cls._caches_lock:
+            try:
+                cache = cls._caches.get(topology)
+                if cache is None:
+                    cache = cls._caches[topology] = cls()
+            except TypeError:
+                # Not hashable or weakly referenceable
+                return None
+        return cache
+
+    @staticmethod
+    def read(fim: Any) -> dict:
+        """
+        Parse the ``user_data`` property of a FIM element.
+
+        :param fim: FIM element
+        :type fim: Any
+        :return: user data; empty if unset or invalid
+        :rtype: dict
+        """
+        try:
+            return json.loads(str(fim.get_property(pname="user_data")))
+        except Exception:
+            return {}
+
+    @staticmethod
+    def write(fim: Any, user_data: dict):
+        """
+        Set the ``user_data`` property of a FIM element.
+
+        :param fim: FIM element
+        :type fim: Any
+        :param user_data: user data
+        :type user_data: dict
+        """
+        fim.set_property(pname="user_data", pval=UserData(json.dumps(user_data)))
+
+    def get(self, fim: Any) -> dict:
+        """
+        Get the parsed user data of a FIM element.
+
+        The returned dict is a copy of the cached one; pass changes to
+        :py:meth:`put`.
+
+        :param fim: FIM element
+        :type fim: Any
+        :return: user data
+        :rtype: dict
+        """
+        with self.lock:
+            entry = self._entries.get(fim.node_id)
+            if entry is None:
+                entry = self._entries[fim.node_id] = _Entry(self.read(fim), fim)
+            return _copy(entry.data)
+
+    def put(self, fim: Any, user_data: dict):
+        """
+        Replace the user data of a FIM element and mark it dirty.
+
+        The data is checked against FIM's size limit here, so that oversized
+        user data is rejected when it is set rather than when it is flushed.
+
+        :param fim: FIM element
+        :type fim: Any
+        :param user_data: user data
+        :type user_data: dict
+        :raises UserDataError: if the serialized user data is too large
+        """
+        UserData(json.dumps(user_data))
+        user_data = _copy(user_data)
+        with self.lock:
+            entry = self._entries.get(fim.node_id)
+            if entry is None:
+                entry = self._entries[fim.node_id] = _Entry(user_data, fim)
+            entry.data = user_data
+            entry.fim = fim
+            entry.dirty = True
+            self._dirty.add(fim.node_id)
+
+    def is_dirty(self) -> bool:
+        """
+        Whether any user data has not been written to the topology yet.
+
+        :return: True if there are unwritten changes
+        :rtype: bool
+        """
+        with self.lock:
+            return bool(self._dirty)
+
+    def flush(self):
+        """
+        Write changed user data back into the topology.
+
+        Changes of elements that have been removed from the topology are
+        dropped.  On any other error the changes not written yet stay dirty
+        and the error is raised.
+        """
+        with self.lock:
+            dirty = list(self._dirty)
+            for node_id in dirty:
+                entry = self._entries.get(node_id)
+                if entry is not None and entry.dirty:
+                    try:
+                        self.write(entry.fim, entry.data)
+                        entry.dirty = False
+                    except PropertyGraphQueryException as e:
+                        # The element has been removed from the topology
+                        log.debug(f"Dropping user data of {node_id}: {e}")
+                        del self._entries[node_id]
+                self._dirty.discard(node_id)
+
+    def clear(self):
+        """
+        Drop all cached user data, including unwritten changes.
+        """
+        with self.lock:
+            self._entries.clear()
+            self._dirty.clear()
@@ -44,6 +44,12 @@ from fim.user import ComponentType
 
 from fabrictestbed_extensions.fablib.constants import Constants
 from fabrictestbed_extensions.fablib.node import Node
+from fabrictestbed_extensions.fablib.placement import (
+    BestFitDecreasingPlacement,
+    HostCapacity,
+    PlacementEngine,
+    PlacementRequest,
+)
 
 log = logging.getLogger("fablib")
 
@@ -201,53 +207,16 @@ class NodeValidator:
             if allocated is None:
                 allocated = {}
 
-            perm_ok, perm_msg = NodeValidator.check_component_permissions(
-                node=node, project_tags=project_tags
+            status, error, site, hosts = NodeValidator._site_and_hosts(
+                node=node, resources=resources, project_tags=project_tags
             )
-            if not perm_ok:
-                log.error(perm_msg)
-                return False, perm_msg
-
-            site_name = node.get_site()
-            site = resources.get_site(site_name=site_name)
-
-            if not site:
-                log.warning(
-                    f"Ignoring validation: Site: {site_name} not available in resources."
-                )
-                return (
-                    True,
-                    f"Ignoring validation: Site: {site_name} not available in resources.",
-                )
-
-            site_state = site.get("state", "")
-            if site_state != "Active":
-                msg = (
-                    f"Node cannot be allocated on {site_name}, "
-                    f"{site_name} is in {site_state}."
-                )
-                log.error(msg)
-                return False, msg
-
-            hosts = resources.get_hosts_by_site(site_name=site_name)
-            if not hosts:
-                msg = (
-                    f"Node cannot be validated, host information "
-                    f"not available for {site_name}."
-                )
-                log.error(msg)
-                return False, msg
+            if status is not None:
+                if not status:
+                    log.error(error)
+                return status, error
 
             # If a specific host is requested, validate only against it.
             if node.get_host():
-                if node.get_host() not in hosts:
-                    msg = (
-                        f"Invalid Request: Requested Host {node.get_host()} "
-                        f"does not exist on site: {site_name}."
-                    )
-                    log.error(msg)
-                    return False, msg
-
                 host = hosts.get(node.get_host())
                 allocated_comps = allocated.setdefault(node.get_host(), {})
                 status, error = NodeValidator.can_allocate_node_in_host(
@@ -285,32 +254,195 @@ class NodeValidator:
             log.error(traceback.format_exc())
             return False, str(e)
 
+    @staticmethod
+    def _site_and_hosts(
+        node: Node,
+        resources,
+        project_tags: Optional[frozenset] = None,
+    ) -> Tuple[Optional[bool], str, Optional[dict], Optional[dict]]:
+        """Run the checks of a node that do not depend on other nodes.
+
+        :param node: The node to validate
+        :param resources: A ``ResourcesV2`` instance
+        :param project_tags: Optional frozenset of permission tags
+        :return: (status, message, site, hosts); status is None if the node
+            still has to be placed on one of ``hosts``
+        """
+        perm_ok, perm_msg = NodeValidator.check_component_permissions(
+            node=node, project_tags=project_tags
+        )
+        if not perm_ok:
+            return False, perm_msg, None, None
+
+        site_name = node.get_site()
+        site = resources.get_site(site_name=site_name)
+        if not site:
+            msg = f"Ignoring validation: Site: {site_name} not available in resources."
+            log.warning(msg)
+            return True, msg, None, None
+
+        site_state = site.get("state", "")
+        if site_state != "Active":
+            msg = (
+                f"Node cannot be allocated on {site_name}, "
+                f"{site_name} is in {site_state}."
+            )
+            return False, msg, site, None
+
+        hosts = resources.get_hosts_by_site(site_name=site_name)
+        if not hosts:
+            msg = (
+                f"Node cannot be validated, host information "
+                f"not available for {site_name}."
+            )
+            return False, msg, site, None
+
+        if node.get_host() and node.get_host() not in hosts:
+            msg = (
+                f"Invalid Request: Requested Host {node.get_host()} "
+                f"does not exist on site: {site_name}."
+            )
+            return False, msg, site, hosts
+
+        return None, "", site, hosts
+
     @staticmethod
     def validate_nodes(
         nodes: List[Node],
         resources,
         project_tags: Optional[frozenset] = None,
+        allocated: Optional[Dict[str, dict]] = None,
+        placement: Optional[PlacementEngine] = None,
+        pin_hosts: bool = False,
     ) -> Tuple[bool, Dict[str, str]]:
         """Batch-validate multiple nodes sharing a single allocated dict.
 
         Resources are fetched once by the caller and passed in.
         This is the optimised entry point for ``SliceV2.validate()``.
 
+        Nodes with a requested host are checked against that host.  The
+        other nodes of each site are placed on its hosts jointly by the
+        ``placement`` engine, so that e.g. a node without components does
+        not take the only host that fits a GPU node of the same slice.
+
         :param nodes: List of Node objects to validate
         :param resources: A ``ResourcesV2`` instance (pre-fetched)
         :param project_tags: Optional frozenset of permission tags from
             the decoded token.
+        :param allocated: Optional dict tracking cumulative host allocations
+            (see :meth:`validate_node`).  Pass the same dict when validating
+            several slices against one resources snapshot.
+        :param placement: Engine assigning nodes to hosts; best-fit
+            decreasing by default
+        :param pin_hosts: Request the hosts chosen by the placement engine
+            for the nodes (see :meth:`Node.set_host`)
         :return: (all_valid, errors) where errors maps node_name to message
         """
-        allocated: Dict[str, dict] = {}
+        if allocated is None:
+            allocated = {}
+        if placement is None:
+            placement = BestFitDecreasingPlacement()
         errors: Dict[str, str] = {}
+        # Nodes to place, by site
+        pending: Dict[str, Tuple[dict, dict, List[Node]]] = {}
+
         for node in nodes:
-            status, error = NodeValidator.validate_node(
-                node=node,
-                resources=resources,
-                allocated=allocated,
-                project_tags=project_tags,
+            try:
+                status, error, site, hosts = NodeValidator._site_and_hosts(
+                    node=node, resources=resources, project_tags=project_tags
+                )
+                if status is None and node.get_host():
+                    status, error = NodeValidator.can_allocate_node_in_host(
+                        host=hosts.get(node.get_host()),
+                        node=node,
+                        allocated=allocated.setdefault(node.get_host(), {}),
+                        site=site,
+                    )
+                if status is None:
+                    pending.setdefault(node.get_site(), (site, hosts, []))[2].append(
+                        node
+                    )
+                elif not status:
+                    log.error(error)
+                    errors[node.get_name()] = error
+            except Exception as e:
+                log.error(e)
+                log.error(traceback.format_exc())
+                errors[node.get_name()] = str(e)
+
+        for site_name, (site, hosts, site_nodes) in pending.items():
+            errors.update(
+                NodeValidator._place_nodes(
+                    nodes=site_nodes,
+                    site=site,
+                    hosts=hosts,
+                    allocated=allocated,
+                    placement=placement,
+                    pin_hosts=pin_hosts,
+                )
             )
-            if not status:
-                errors[node.get_name()] = error
         return len(errors) == 0, errors
+
+    @staticmethod
+    def _place_nodes(
+        nodes: List[Node],
+        site: dict,
+        hosts: Dict[str, dict],
+        allocated: Dict[str, dict],
+        placement: PlacementEngine,
+        pin_hosts: bool = False,
+    ) -> Dict[str, str]:
+        """Place the nodes of one site on its hosts jointly.
+
+        :param nodes: nodes of the site without a requested host
+        :param site: Site dict from ResourcesV2
+        :param hosts: Host dicts of the site, by name
+        :param allocated: cumulative host allocations; updated in place
+        :param placement: placement engine
+        :param pin_hosts: request the chosen hosts for the nodes
+        :return: errors by node name
+        """
+        errors: Dict[str, str] = {}
+        capacities = [
+            HostCapacity.from_host(host, allocated.get(name, {}), name=name)
+            for name, host in hosts.items()
+            if host.get("state", "") == "Active"
+        ]
+        requests = {node.get_name(): PlacementRequest.from_node(node) for node in nodes}
+        chosen = placement.place(list(requests.values()), capacities)
+
+        for node in nodes:
+            name = node.get_name()
+            host_name = chosen.get(name)
+            error = None
+            if host_name is not None:
+                status, error = NodeValidator.can_allocate_node_in_host(
+                    host=hosts[host_name],
+                    node=node,
+                    allocated=allocated.setdefault(host_name, {}),
+                    site=site,
+                )
+                if status:
+                    if pin_hosts:
+                        node.set_host(host_name)
+                    continue
+            else:
+                # Report why the node does not fit on the last host, as
+                # validate_node() does
+                for other_name, host in hosts.items():
+                    _, error = NodeValidator.can_allocate_node_in_host(
+                        host=host,
+                        node=node,
+                        allocated=dict(allocated.get(other_name, {})),
+                        site=site,
+                    )
+
+            msg = (
+                f"Invalid Request: Requested Node cannot be accommodated "
+                f"by any of the hosts on site: {node.get_site()}."
+            )
+            if error:
+                msg += f" Details: {error}"
+            log.error(msg)
+            errors[name] = msg
+        return errors
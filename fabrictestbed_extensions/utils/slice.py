@@ -25,6 +25,7 @@
 
 
 import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
 
 from fabrictestbed.slice_manager import SliceState, Status
 
@@ -54,13 +55,7 @@ class SliceUtils(AbcUtils):
 
         slices = list(filter(lambda x: string in x.slice_name, slices))
 
-        for slice in slices:
-            return_status, result = slice_manager.delete(slice_object=slice)
-            print(
-                "Deleting Slice: {}.  Response Status {}".format(
-                    slice.slice_name, return_status
-                )
-            )
+        SliceUtils._delete_slices(slice_manager, slices)
 
     @staticmethod
     def delete_all():
@@ -73,13 +68,30 @@ class SliceUtils(AbcUtils):
         if return_status != Status.OK:
             raise Exception("Failed to get slices: {}".format(slices))
 
-        for slice in slices:
-            return_status, result = slice_manager.delete(slice_object=slice)
-            print(
-                "Deleting Slice: {}.  Response Status {}".format(
-                    slice.slice_name, return_status
+        SliceUtils._delete_slices(slice_manager, slices)
+
+    @staticmethod
+    def _delete_slices(slice_manager, slices, max_workers=8):
+        """Issue delete requests for several slices on a bounded thread pool."""
+        if not slices:
+            return
+
+        with ThreadPoolExecutor(max_workers=min(max_workers, len(slices))) as executor:
+            futures = {
+                executor.submit(slice_manager.delete, slice_object=slice): slice
+                for slice in slices
+            }
+            for future in as_completed(futures):
+                slice = futures[future]
+                try:
+                    return_status, result = future.result()
+                except Exception as e:
+                    return_status = e
+                print(
+                    "Deleting Slice: {}.  Response Status {}".format(
+                        slice.slice_name, return_status
+                    )
                 )
-            )
 
     @staticmethod
     def delete_slice(slice_name=None, slice_id=None):
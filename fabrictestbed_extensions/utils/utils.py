@@ -27,7 +27,9 @@ import json
 import logging
 import os
 import socket
-from typing import Any, Callable, Dict, Iterable, List, Union
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple, Union
 
 import pandas as pd
 import yaml
@@ -37,6 +39,7 @@ from IPython.core.display_functions import display
 from tabulate import tabulate
 
 from fabrictestbed_extensions.fablib.constants import Constants
+from fabrictestbed_extensions.fablib.resource_calendar import ResourceCalendar
 
 log = logging.getLogger("fablib")
 
@@ -127,6 +130,87 @@ class Utils:
                 f"Host: {hostname} is not reachable, please check your config file! Details: {e}"
             )
 
+    @staticmethod
+    def are_reachable(
+        *,
+        hosts: Iterable[Tuple[str, int]],
+        cache_file: Optional[str] = None,
+        ttl: float = 0,
+    ) -> bool:
+        """
+        Check whether several remote hosts are reachable via TCP.
+
+        Hosts are probed concurrently with :meth:`is_reachable`.  When
+        ``cache_file`` is given, successful probes are recorded there and
+        hosts that succeeded within the last ``ttl`` seconds are not probed
+        again, so short-lived processes do not repeat the same checks.
+
+        :param hosts: ``(hostname, port)`` pairs to check.
+        :type hosts: Iterable[Tuple[str, int]]
+        :param cache_file: Path of the JSON file recording recent
+            successful probes; ``None`` disables the record.
+        :type cache_file: str
+        :param ttl: Seconds a recorded successful probe remains valid.
+        :type ttl: float
+        :return: ``True`` if all hosts are reachable.
+        :rtype: bool
+        :raises ConnectionError: if any host cannot be resolved or reached.
+        """
+        now = time.time()
+        recent = {}
+        if cache_file and ttl > 0:
+            try:
+                with open(cache_file, "r") as f:
+                    recent = json.load(f)
+                if not isinstance(recent, dict):
+                    raise ValueError(f"expected an object, got {type(recent).__name__}")
+            except FileNotFoundError:
+                pass
+            except Exception as e:
+                log.debug(f"Ignoring unreadable reachability cache {cache_file}: {e}")
+                recent = {}
+
+        pending = []
+        for hostname, port in dict.fromkeys(hosts):
+            checked_at = recent.get(f"{hostname}:{port}")
+            if isinstance(checked_at, (int, float)) and 0 <= now - checked_at < ttl:
+                log.debug(f"Skipping reachability check for {hostname}:{port}")
+                continue
+            pending.append((hostname, port))
+
+        if not pending:
+            return True
+
+        with ThreadPoolExecutor(max_workers=len(pending)) as executor:
+            futures = [
+                executor.submit(Utils.is_reachable, hostname=hostname, port=port)
+                for hostname, port in pending
+            ]
+            errors = []
+            for (hostname, port), future in zip(pending, futures):
+                try:
+                    future.result()
+                    recent[f"{hostname}:{port}"] = now
+                except Exception as e:
+                    errors.append(e)
+
+        if cache_file and ttl > 0:
+            try:
+                os.makedirs(os.path.dirname(cache_file) or ".", exist_ok=True)
+                recent = {
+                    k: v
+                    for k, v in recent.items()
+                    if isinstance(v, (int, float)) and now - v < ttl
+                }
+                with atomic_write(cache_file, overwrite=True) as f:
+                    json.dump(recent, f)
+            except Exception as e:
+                log.debug(f"Failed to write reachability cache {cache_file}: {e}")
+
+        if errors:
+            raise errors[0]
+        return True
+
     @staticmethod
     def save_to_file(file_path: str, data: str):
         """
@@ -718,8 +802,9 @@ class Utils:
 
     @staticmethod
     def calendar_to_rows(
-        calendar_data: Dict[str, Any],
+        calendar_data: Union[Dict[str, Any], ResourceCalendar],
         show: str = "all",
+        fields: Union[List[str], None] = None,
     ) -> List[Dict[str, str]]:
         """
         Flatten a ``resources_calendar()`` response into tabular rows.
@@ -728,63 +813,23 @@ class Utils:
         date, site or host name, cores, ram, disk (as ``"available/capacity"``),
         and one column per component type.
 
-        :param calendar_data: The dict returned by
-            ``fablib.resources_calendar()`` or the orchestrator.
+        :param calendar_data: The dict returned by the orchestrator, or a
+            :class:`ResourceCalendar` built from it.
         :param show: Which resource types to include: ``"sites"``,
             ``"hosts"``, or ``"all"`` (default).
         :type show: str
+        :param fields: Columns to format.  ``None`` means all.
+        :type fields: list[str]
         :return: A list of row dicts suitable for :py:meth:`list_table`.
         :rtype: list[dict]
         """
-        interval = calendar_data.get("interval", "day")
-        include_sites = show in ("all", "sites")
-        include_hosts = show in ("all", "hosts")
-        rows: List[Dict[str, str]] = []
-        for slot in calendar_data.get("data", []):
-            start = slot.get("start", "")
-            end = slot.get("end", "")
-            # Show date only for day/week, datetime for hour
-            if interval in ("day", "week"):
-                slot_label = start[:10] if len(start) >= 10 else start
-            else:
-                slot_label = start[:16] if len(start) >= 16 else start
-
-            if include_sites:
-                for site in slot.get("sites", []):
-                    row: Dict[str, str] = {
-                        "Date": slot_label,
-                        "Type": "site",
-                        "Name": site.get("name", ""),
-                        "Cores (avail/cap)": f"{site.get('cores_available', '—')}/{site.get('cores_capacity', '—')}",
-                        "RAM GB (avail/cap)": f"{site.get('ram_available', '—')}/{site.get('ram_capacity', '—')}",
-                        "Disk GB (avail/cap)": f"{site.get('disk_available', '—')}/{site.get('disk_capacity', '—')}",
-                    }
-                    for comp_name, comp in site.get("components", {}).items():
-                        cap = comp.get("capacity", 0)
-                        if cap and cap > 0:
-                            row[comp_name] = f"{comp.get('available', 0)}/{cap}"
-                    rows.append(row)
-
-            if include_hosts:
-                for host in slot.get("hosts", []):
-                    row: Dict[str, str] = {
-                        "Date": slot_label,
-                        "Type": "host",
-                        "Name": host.get("name", ""),
-                        "Cores (avail/cap)": f"{host.get('cores_available', '—')}/{host.get('cores_capacity', '—')}",
-                        "RAM GB (avail/cap)": f"{host.get('ram_available', '—')}/{host.get('ram_capacity', '—')}",
-                        "Disk GB (avail/cap)": f"{host.get('disk_available', '—')}/{host.get('disk_capacity', '—')}",
-                    }
-                    for comp_name, comp in host.get("components", {}).items():
-                        cap = comp.get("capacity", 0)
-                        if cap and cap > 0:
-                            row[comp_name] = f"{comp.get('available', 0)}/{cap}"
-                    rows.append(row)
-        return rows
+        if not isinstance(calendar_data, ResourceCalendar):
+            calendar_data = ResourceCalendar(calendar_data)
+        return list(calendar_data.to_rows(show=show, fields=fields))
 
     @staticmethod
     def show_calendar(
-        calendar_data: Dict[str, Any],
+        calendar_data: Union[Dict[str, Any], ResourceCalendar],
         show: str = "all",
         fields: Union[List[str], None] = None,
         output: Union[str, None] = None,
@@ -797,8 +842,8 @@ class Utils:
         Converts the ``resources_calendar()`` response into rows and
         renders them using :py:meth:`list_table`.
 
-        :param calendar_data: The dict returned by
-            ``fablib.resources_calendar()``.
+        :param calendar_data: The dict returned by the orchestrator, or a
+            :class:`ResourceCalendar` built from it.
         :param show: Which resource types to include: ``"sites"``,
             ``"hosts"``, or ``"all"`` (default).
         :type show: str
@@ -809,10 +854,18 @@ class Utils:
         :param filter_function: A lambda to filter the flattened rows.
         :return: Formatted table.
         """
-        rows = Utils.calendar_to_rows(calendar_data, show=show)
-        interval = calendar_data.get("interval", "day")
-        q_start = calendar_data.get("query_start", "")[:10]
-        q_end = calendar_data.get("query_end", "")[:10]
+        if not isinstance(calendar_data, ResourceCalendar):
+            calendar_data = ResourceCalendar(calendar_data)
+        # The filter may look at any column, so only format the displayed
+        # ones when there is none
+        rows = Utils.calendar_to_rows(
+            calendar_data,
+            show=show,
+            fields=fields if filter_function is None else None,
+        )
+        interval = calendar_data.interval
+        q_start = calendar_data.query_start[:10]
+        q_end = calendar_data.query_end[:10]
         title = f"Resource Calendar ({interval} interval, {q_start} to {q_end})"
         return Utils.list_table(
             data=rows,
@@ -0,0 +1,169 @@
+#!/usr/bin/env python3
+# MIT License
+#
+# Copyright (c) 2020 FABRIC Testbed
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+"""
+Nodes placed and time taken by the placement engines.
+
+Generates a synthetic ``resources_summary`` host list (by default 300
+partly used hosts, some with GPUs and SmartNICs) and, for a number of
+random slices, places all of their nodes on those hosts with each engine:
+
+* ``first-fit``: nodes in slice order on the first host they fit on, as
+  validation did before placement engines.
+* ``best-fit``: best-fit decreasing, the default engine.
+* ``exact``: best-fit decreasing with a search when it leaves nodes
+  unplaced.
+
+Slices request ``--fill`` of the free cores.  Reported are the slices
+whose nodes were all placed (i.e. that pass validation) and the nodes and
+cores placed.  Run with::
+
+    python tests/benchmarks/placement_benchmark.py --hosts 300 --slices 20
+"""
+
+import argparse
+import random
+import time
+
+from fabrictestbed_extensions.fablib.placement import (
+    BestFitDecreasingPlacement,
+    ExactPlacement,
+    FirstFitPlacement,
+    HostCapacity,
+    PlacementRequest,
+)
+
+GPU = "GPU-Tesla T4"
+SMART_NIC = "SmartNIC-ConnectX-6"
+
+
+def make_hosts(count: int, rng: random.Random) -> list:
+    """
+    Host dicts as found in ``resources_summary``, with part of their
+    resources already in use.
+    """
+    hosts = []
+    for i in range(count):
+        components = {}
+        if i % 4 == 0:
+            components[GPU] = {"capacity": 2, "allocated": rng.randint(0, 2)}
+        if i % 3 == 0:
+            components[SMART_NIC] = {"capacity": 2, "allocated": rng.randint(0, 2)}
+        hosts.append(
+            {
+                "name": f"site-w{i}",
+                "state": "Active",
+                "cores_available": rng.choice([2, 4, 8, 16, 32, 64]),
+                "ram_available": rng.choice([16, 32, 64, 128, 256]),
+                "disk_available": rng.choice([500, 1000, 2000]),
+                "components": components,
+            }
+        )
+    return hosts
+
+
+def make_requests(hosts: list, fill: float, rng: random.Random) -> list:
+    """
+    Random nodes whose total cores are ``fill`` of the free cores.
+    """
+    target = fill * sum(h["cores_available"] for h in hosts)
+    requests = []
+    cores = 0
+    while cores < target:
+        node_cores = rng.choice([2, 2, 4, 4, 8, 16, 32])
+        components = {}
+        roll = rng.random()
+        if roll < 0.1:
+            components[GPU] = 1
+        elif roll < 0.2:
+            components[SMART_NIC] = 1
+        requests.append(
+            PlacementRequest(
+                name=f"node{len(requests)}",
+                cores=node_cores,
+                ram=node_cores * rng.choice([1, 2, 4]),
+                disk=rng.choice([10, 50, 100]),
+                components=components,
+            )
+        )
+        cores += node_cores
+    return requests
+
+
+def run(engine, hosts: list, requests: list) -> tuple:
+    """
+    :return: (nodes placed, cores placed, seconds)
+    """
+    capacities = [HostCapacity.from_host(h, {}) for h in hosts]
+    start = time.perf_counter()
+    placement = engine.place(requests, capacities)
+    elapsed = time.perf_counter() - start
+    cores = sum(r.cores for r in requests if r.name in placement)
+    return len(placement), cores, elapsed
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--hosts", type=int, default=300)
+    parser.add_argument("--slices", type=int, default=20)
+    parser.add_argument("--fill", type=float, default=0.8)
+    parser.add_argument("--seed", type=int, default=1)
+    args = parser.parse_args()
+
+    rng = random.Random(args.seed)
+    engines = {
+        "first-fit": FirstFitPlacement(),
+        "best-fit": BestFitDecreasingPlacement(),
+        "exact": ExactPlacement(),
+    }
+    # Per engine: slices placed completely, nodes placed, cores placed
+    # and seconds
+    results = {name: [0, 0, 0, 0.0] for name in engines}
+    nodes = cores = 0
+    for _ in range(args.slices):
+        hosts = make_hosts(args.hosts, rng)
+        requests = make_requests(hosts, args.fill, rng)
+        nodes += len(requests)
+        cores += sum(r.cores for r in requests)
+        for name, engine in engines.items():
+            placed, placed_cores, elapsed = run(engine, hosts, requests)
+            result = results[name]
+            result[0] += placed == len(requests)
+            result[1] += placed
+            result[2] += placed_cores
+            result[3] += elapsed
+
+    print(
+        f"{args.slices} slices, {nodes} nodes, {cores} cores "
+        f"on {args.hosts} hosts each"
+    )
+    print(f"{'engine':<12}{'complete':>10}{'nodes':>10}{'cores':>10}{'ms/slice':>12}")
+    for name, (complete, placed, placed_cores, elapsed) in results.items():
+        print(
+            f"{name:<12}{complete:>10}{placed:>10}{placed_cores:>10}"
+            f"{1000 * elapsed / args.slices:>12.1f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
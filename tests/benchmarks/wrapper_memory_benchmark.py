@@ -0,0 +1,203 @@
+#!/usr/bin/env python3
+# MIT License
+#
+# Copyright (c) 2020 FABRIC Testbed
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+"""
+Memory used by the Node, Component, Interface and NetworkService wrappers.
+
+Wraps a topology with (by default) 10,000 interfaces twice and reports
+the bytes per wrapper object, both as the size of each object and its
+attribute dict and as all memory allocated while wrapping (which includes
+the per-object dicts, caches and locks the wrappers create):
+
+* ``dict``: subclasses without ``__slots__``, i.e. the layout before the
+  wrappers declared slots.
+* ``slots``: the wrapper classes as shipped.
+
+A small FIM topology is wrapped repeatedly to reach the interface count;
+the FIM objects are shared by both runs and are not counted.  Run with::
+
+    python tests/benchmarks/wrapper_memory_benchmark.py --interfaces 10000
+"""
+
+import argparse
+import gc
+import logging
+import sys
+import tracemalloc
+
+from fabrictestbed.slice_editor import (
+    Capacities,
+    ComponentType,
+    ExperimentTopology,
+    ServiceType,
+)
+
+from fabrictestbed_extensions.fablib.component import Component
+from fabrictestbed_extensions.fablib.interface import Interface
+from fabrictestbed_extensions.fablib.network_service import NetworkService
+from fabrictestbed_extensions.fablib.node import Node
+
+NICS_PER_NODE = 4
+NODES = 2
+
+
+def build_topology() -> ExperimentTopology:
+    """
+    Two nodes with dual-port NICs; each port joins an L2 network with the
+    same port of the other node.
+    """
+    topology = ExperimentTopology()
+    for n in range(NODES):
+        node = topology.add_node(name=f"node{n}", site="RENC")
+        node.set_properties(
+            capacities=Capacities(core=2, ram=8, disk=10),
+            image_type="qcow2",
+            image_ref="default_rocky_9",
+        )
+        for c in range(NICS_PER_NODE):
+            node.add_component(
+                ctype=ComponentType.SmartNIC, model="ConnectX-6", name=f"nic{c}"
+            )
+
+    ports = [
+        [iface for c in node.components.values() for iface in c.interface_list]
+        for node in topology.nodes.values()
+    ]
+    for i, pair in enumerate(zip(*ports)):
+        topology.add_network_service(
+            name=f"net{i}", nstype=ServiceType.L2Bridge, interfaces=list(pair)
+        )
+    return topology
+
+
+def fim_objects(topology: ExperimentTopology) -> tuple:
+    """
+    Read the FIM objects once: FIM lookups scan the whole graph, so they
+    would otherwise dominate (and slow down) the benchmark.
+
+    :return: ([(fim_node, [(fim_component, [fim_interface])])], [fim_network])
+    """
+    nodes = [
+        (
+            fim_node,
+            [(c, c.interface_list) for c in fim_node.components.values()],
+        )
+        for fim_node in topology.nodes.values()
+    ]
+    return nodes, list(topology.network_services.values())
+
+
+def wrap(fim: tuple, classes: dict, interface_count: int) -> dict:
+    """
+    Create wrappers for the FIM objects, repeating the topology until there
+    are ``interface_count`` interface wrappers.
+
+    :return: wrapper objects by class name
+    """
+    fim_nodes, fim_networks = fim
+    objects = {name: [] for name in classes}
+    while len(objects["Interface"]) < interface_count:
+        for fim_node, fim_components in fim_nodes:
+            node = classes["Node"](slice=None, node=fim_node)
+            objects["Node"].append(node)
+            for fim_component, fim_interfaces in fim_components:
+                component = classes["Component"](node=node, fim_component=fim_component)
+                objects["Component"].append(component)
+                for fim_interface in fim_interfaces:
+                    objects["Interface"].append(
+                        classes["Interface"](
+                            component=component, fim_interface=fim_interface
+                        )
+                    )
+        for fim_network in fim_networks:
+            objects["NetworkService"].append(
+                classes["NetworkService"](slice=None, fim_network_service=fim_network)
+            )
+    return objects
+
+
+def object_size(obj) -> int:
+    """
+    Size of a wrapper object and its attribute dict, if it has one.
+    """
+    size = sys.getsizeof(obj)
+    if hasattr(obj, "__dict__"):
+        size += sys.getsizeof(obj.__dict__)
+    return size
+
+
+def measure(fim: tuple, classes: dict, interface_count: int):
+    """
+    Wrap the topology and measure the wrappers.
+
+    :return: (bytes per object by class name, object counts by class name,
+        total bytes allocated while wrapping)
+    """
+    gc.collect()
+    tracemalloc.start()
+    objects = wrap(fim, classes, interface_count)
+    gc.collect()
+    allocated = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+
+    per_object = {
+        name: sum(map(object_size, objs)) / max(1, len(objs))
+        for name, objs in objects.items()
+    }
+    counts = {name: len(objs) for name, objs in objects.items()}
+    return per_object, counts, allocated
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--interfaces", type=int, default=10000)
+    args = parser.parse_args()
+
+    # Without a slice the nodes cannot look up their login user
+    logging.getLogger("fablib").setLevel(logging.CRITICAL)
+    fim = fim_objects(build_topology())
+
+    slotted = {
+        "Node": Node,
+        "Component": Component,
+        "Interface": Interface,
+        "NetworkService": NetworkService,
+    }
+    # Subclasses without __slots__ get a per-instance __dict__ again
+    with_dict = {name: type(name, (cls,), {}) for name, cls in slotted.items()}
+
+    before, counts, before_total = measure(fim, with_dict, args.interfaces)
+    after, _, after_total = measure(fim, slotted, args.interfaces)
+
+    print(f"{'class':<16}{'objects':>10}{'dict B/obj':>14}{'slots B/obj':>14}")
+    for name in slotted:
+        print(f"{name:<16}{counts[name]:>10}{before[name]:>14.0f}{after[name]:>14.0f}")
+    total = sum(counts.values())
+    print(
+        f"{'all (traced)':<16}{total:>10}"
+        f"{before_total / total:>14.0f}{after_total / total:>14.0f}"
+    )
+
+
+if __name__ == "__main__":
+    main()
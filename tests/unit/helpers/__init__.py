@@ -0,0 +1 @@
+"""Fixture factories shared by the unit tests."""
@@ -0,0 +1,77 @@
+"""``resources_calendar`` responses."""
+
+import datetime
+
+START = datetime.datetime(2025, 7, 1, tzinfo=datetime.timezone.utc)
+
+
+def hourly_calendar(hours=24, renc_cores=None, gpus=2, link_bandwidth=None):
+    """
+    Hourly calendar from START for the RENC and TACC sites, one RENC host
+    and the RENC-TACC link.
+
+    RENC has 64 of 128 cores available, renc_cores maps an hour to other
+    values, and ``gpus`` of 4 GPUs; its host has half of its cores.
+    link_bandwidth maps an hour to the available link bandwidth.
+    """
+    data = []
+    for h in range(hours):
+        slot_start = START + datetime.timedelta(hours=h)
+        cores = (renc_cores or {}).get(h, 64)
+        data.append(
+            {
+                "start": slot_start.isoformat(),
+                "end": (slot_start + datetime.timedelta(hours=1)).isoformat(),
+                "sites": [
+                    {
+                        "name": "RENC",
+                        "cores_available": cores,
+                        "cores_capacity": 128,
+                        "ram_available": 256,
+                        "ram_capacity": 512,
+                        "disk_available": 1000,
+                        "components": {
+                            "GPU Tesla T4": {"available": gpus, "capacity": 4},
+                            "SmartNIC ConnectX-6": {"available": 0, "capacity": 0},
+                        },
+                    },
+                    {
+                        "name": "TACC",
+                        "cores_available": 16,
+                        "ram_available": 64,
+                        "disk_available": 500,
+                        "components": {},
+                    },
+                ],
+                "hosts": [
+                    {
+                        "name": "renc-w1.fabric-testbed.net",
+                        "cores_available": cores // 2,
+                        "cores_capacity": 64,
+                        "ram_available": 128,
+                        "ram_capacity": 256,
+                        "disk_available": 500,
+                        "disk_capacity": 1000,
+                        "components": {
+                            "GPU Tesla T4": {"available": 1, "capacity": 2},
+                        },
+                    }
+                ],
+                "links": [
+                    {
+                        "name": "RENC-TACC",
+                        "sites": ["TACC", "RENC"],
+                        "bandwidth": 100,
+                        "allocated_bandwidth": 100 - (link_bandwidth or {}).get(h, 100),
+                    }
+                ],
+                "facility_ports": [],
+            }
+        )
+    return {
+        "data": data,
+        "interval": "hour",
+        "query_start": START.isoformat(),
+        "query_end": (START + datetime.timedelta(hours=hours)).isoformat(),
+        "total": hours,
+    }
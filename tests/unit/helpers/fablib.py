@@ -0,0 +1,56 @@
+"""Offline FablibManager and the orchestrator slice records it reads."""
+
+import os
+import pathlib
+import unittest
+from unittest.mock import MagicMock, patch
+
+from fabrictestbed_extensions.fablib.fablib import FablibManager
+
+DATA_DIR = pathlib.Path(__file__).parent.parent / "data"
+DUMMY_TOKEN_LOCATION = str(DATA_DIR / "dummy-token.json")
+FABRIC_RC_LOCATION = str(DATA_DIR / "dummy_fabric_rc")
+
+
+def make_fablib(**kwargs):
+    """Offline FablibManager with the dummy token and fabric_rc; ``kwargs``
+    are passed on to FablibManager.  Clears the environment first."""
+    os.environ.clear()
+    return FablibManager(
+        token_location=DUMMY_TOKEN_LOCATION,
+        offline=True,
+        project_id="DUMMY_PROJECT_ID",
+        bastion_username="DUMMY_BASTION_USER",
+        fabric_rc=FABRIC_RC_LOCATION,
+        **kwargs,
+    )
+
+
+def make_slice_dto(
+    index, model=None, lease_end_time="2025-07-02 00:00:00 +0000", **attrs
+):
+    """Mock slice record of a StableOK slice named ``slice-<index>``; other
+    record fields are set from ``attrs``."""
+    dto = MagicMock()
+    dto.slice_id = f"slice-id-{index}"
+    dto.name = f"slice-{index}"
+    dto.state = "StableOK"
+    dto.model = model
+    dto.lease_end_time = lease_end_time
+    for name, value in attrs.items():
+        setattr(dto, name, value)
+    return dto
+
+
+class OfflineFablibTestCase(unittest.TestCase):
+    """Offline ``self.fablib`` whose orchestrator is ``self.mock_manager``."""
+
+    def setUp(self):
+        self.fablib = make_fablib()
+        self.mock_manager = MagicMock()
+        self.mock_manager.list_slivers.return_value = []
+        patcher = patch.object(
+            self.fablib, "get_manager", return_value=self.mock_manager
+        )
+        patcher.start()
+        self.addCleanup(patcher.stop)
@@ -0,0 +1,28 @@
+"""Mock nodes and host dicts for placement tests."""
+
+from unittest.mock import MagicMock
+
+
+def make_node(name, site="RENC", cores=2, ram=8, disk=10, host=None):
+    """Mock Node without components."""
+    node = MagicMock()
+    node.get_name.return_value = name
+    node.get_site.return_value = site
+    node.get_host.return_value = host
+    node.get_requested_cores.return_value = cores
+    node.get_requested_ram.return_value = ram
+    node.get_requested_disk.return_value = disk
+    node.get_components.return_value = []
+    return node
+
+
+def make_host(name, cores, ram=256, disk=1000):
+    """Active host dict as returned by ``get_hosts_by_site()``."""
+    return {
+        "name": name,
+        "state": "Active",
+        "cores_available": cores,
+        "ram_available": ram,
+        "disk_available": disk,
+        "components": {},
+    }
@@ -0,0 +1,56 @@
+"""``resources_summary`` responses and ResourcesV2 objects built from them."""
+
+from unittest.mock import MagicMock
+
+from fabrictestbed.fabric_manager_v2 import FabricManagerV2
+
+from fabrictestbed_extensions.fablib.resources_v2 import ResourcesV2
+
+GPU = "GPU-Tesla T4"
+
+
+def summary_host(name, site, cores, ram=64, disk=500, gpus=None, state="Active"):
+    """Host of a summary with 64 cores, 256 GB RAM, 1000 GB disk and,
+    when ``gpus`` is given, that many of 2 GPUs available."""
+    host = {
+        "name": name,
+        "site": site,
+        "state": state,
+        "cores_capacity": 64,
+        "cores_allocated": 64 - cores,
+        "cores_available": cores,
+        "ram_capacity": 256,
+        "ram_allocated": 256 - ram,
+        "ram_available": ram,
+        "disk_capacity": 1000,
+        "disk_allocated": 1000 - disk,
+        "disk_available": disk,
+        "components": {},
+    }
+    if gpus is not None:
+        host["components"][GPU] = {"capacity": 2, "allocated": 2 - gpus}
+    return host
+
+
+def make_resources(hosts, sites=("RENC", "TACC", "UCSD"), down=(), links=None):
+    """ResourcesV2 over a summary of the given hosts, sites and links;
+    sites in ``down`` are in maintenance."""
+    summary = {
+        "sites": [
+            {
+                "name": s,
+                "state": "Maintenance" if s in down else "Active",
+                "cores_available": 0,
+            }
+            for s in sites
+        ],
+        "hosts": hosts,
+    }
+    if links is not None:
+        summary["links"] = links
+    manager = MagicMock(spec=FabricManagerV2)
+    manager.resources_summary.return_value = summary
+    fablib = MagicMock()
+    fablib.get_manager.return_value = manager
+    fablib.get_resources_cache.return_value = None
+    return ResourcesV2(fablib)
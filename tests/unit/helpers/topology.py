@@ -0,0 +1,29 @@
+"""Serialized FIM topologies."""
+
+from fabrictestbed.slice_editor import (
+    Capacities,
+    ComponentType,
+    ExperimentTopology,
+    ServiceType,
+)
+
+
+def make_model(node_count, nic_name="nic"):
+    """Serialized topology: one NIC per node, all on one L2 network."""
+    topology = ExperimentTopology()
+    interfaces = []
+    for i in range(node_count):
+        node = topology.add_node(name=f"node{i}", site="RENC")
+        node.set_properties(
+            capacities=Capacities(core=2, ram=8, disk=10),
+            image_type="qcow2",
+            image_ref="default_rocky_8",
+        )
+        nic = node.add_component(
+            ctype=ComponentType.SharedNIC, model="ConnectX-6", name=f"{nic_name}{i}"
+        )
+        interfaces.append(nic.interface_list[0])
+    topology.add_network_service(
+        name="net", nstype=ServiceType.L2Bridge, interfaces=interfaces
+    )
+    return topology.serialize()
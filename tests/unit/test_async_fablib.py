@@ -0,0 +1,174 @@
+"""
+Unit tests for the asyncio interface to fablib.
+"""
+
+import asyncio
+import threading
+import time
+import unittest
+from unittest.mock import MagicMock
+
+from fabrictestbed_extensions.fablib.async_fablib import (
+    AsyncFablibManager,
+    BoundedExecutor,
+)
+from fabrictestbed_extensions.fablib.exceptions import SliceTimeoutError
+
+
+class TestBoundedExecutor(unittest.TestCase):
+    """Test backpressure and cancellation of pool calls."""
+
+    def test_concurrency_is_bounded(self):
+        executor = BoundedExecutor(max_workers=3)
+        self.addCleanup(executor.shutdown)
+        lock = threading.Lock()
+        state = {"running": 0, "peak": 0}
+
+        def work(i):
+            with lock:
+                state["running"] += 1
+                state["peak"] = max(state["peak"], state["running"])
+            time.sleep(0.01)
+            with lock:
+                state["running"] -= 1
+            return i
+
+        async def main():
+            return await asyncio.gather(*(executor.run(work, i) for i in range(30)))
+
+        self.assertEqual(asyncio.run(main()), list(range(30)))
+        self.assertLessEqual(state["peak"], 3)
+
+    def test_cancelled_waiter_never_runs(self):
+        executor = BoundedExecutor(max_workers=1)
+        self.addCleanup(executor.shutdown)
+        release = threading.Event()
+        started = []
+
+        async def main():
+            first = asyncio.ensure_future(executor.run(release.wait, 5))
+            second = asyncio.ensure_future(executor.run(started.append, "second"))
+            await asyncio.sleep(0.05)
+            # The second call waits for a slot in the event loop
+            second.cancel()
+            release.set()
+            await first
+            with self.assertRaises(asyncio.CancelledError):
+                await second
+            # The slot is free again
+            await executor.run(started.append, "third")
+
+        asyncio.run(main())
+        self.assertEqual(started, ["third"])
+
+    def test_slot_held_until_cancelled_call_finishes(self):
+        executor = BoundedExecutor(max_workers=1)
+        self.addCleanup(executor.shutdown)
+        release = threading.Event()
+
+        async def main():
+            running = asyncio.ensure_future(executor.run(release.wait, 5))
+            await asyncio.sleep(0.05)
+            running.cancel()
+            # The thread is still busy, so no slot is available
+            with self.assertRaises(asyncio.TimeoutError):
+                await asyncio.wait_for(executor.run(lambda: None), 0.1)
+            release.set()
+            await asyncio.wait_for(executor.run(lambda: None), 5)
+
+        asyncio.run(main())
+
+
+class TestAsyncSlice(unittest.TestCase):
+    """Test AsyncSlice against a mocked Slice."""
+
+    def setUp(self):
+        self.fablib = MagicMock()
+        self.fablib.get_no_ssh.return_value = False
+        self.manager = AsyncFablibManager(fablib_manager=self.fablib, max_workers=4)
+        self.addCleanup(self.manager._api.shutdown)
+        self.addCleanup(self.manager._ssh.shutdown)
+
+        self.slice = MagicMock()
+        self.slice.get_fablib_manager.return_value = self.fablib
+        self.slice.is_advanced_allocation.return_value = False
+        self.slice.submit.return_value = "slice-id"
+        self.fablib.get_slice.return_value = self.slice
+
+    def test_get_slice_wraps(self):
+        async_slice = asyncio.run(self.manager.get_slice(name="s1"))
+
+        self.fablib.get_slice.assert_called_once_with(name="s1")
+        self.assertIs(async_slice.get_slice(), self.slice)
+        # Local calls go straight to the slice
+        async_slice.add_node(name="node1")
+        self.slice.add_node.assert_called_once_with(name="node1")
+
+    def test_submit_waits_then_configures(self):
+        states = iter([(MagicMock(state="Configuring"), False)] * 2)
+        self.slice._poll_state.side_effect = lambda: next(
+            states, (MagicMock(state="StableOK"), True)
+        )
+        node = MagicMock()
+        node.test_ssh.return_value = True
+        self.slice.get_nodes.return_value = [node]
+
+        async_slice = self.manager.wrap(self.slice)
+        slice_id = asyncio.run(async_slice.submit(wait_interval=0))
+
+        self.assertEqual(slice_id, "slice-id")
+        self.slice.submit.assert_called_once_with(wait=False, progress=False)
+        self.assertEqual(self.slice._poll_state.call_count, 4)
+        node.test_ssh.assert_called()
+        self.slice.post_boot_config.assert_called_once_with(progress=False)
+
+    def test_submit_accepts_slice_submit_arguments(self):
+        async_slice = self.manager.wrap(self.slice)
+        slice_id = asyncio.run(
+            async_slice.submit(wait=False, progress=True, lease_in_hours=2)
+        )
+
+        self.assertEqual(slice_id, "slice-id")
+        self.slice.submit.assert_called_once_with(
+            wait=False, progress=False, lease_in_hours=2
+        )
+
+    def test_wait_times_out(self):
+        self.slice._poll_state.return_value = (MagicMock(state="Configuring"), False)
+
+        with self.assertRaises(SliceTimeoutError):
+            asyncio.run(self.manager.wrap(self.slice).wait(timeout=0, interval=1))
+
+    def test_wait_is_cancellable(self):
+        self.slice._poll_state.return_value = (MagicMock(state="Configuring"), False)
+
+        async def main():
+            task = asyncio.ensure_future(
+                self.manager.wrap(self.slice).wait(timeout=3600, interval=3600)
+            )
+            await asyncio.sleep(0.05)
+            task.cancel()
+            with self.assertRaises(asyncio.CancelledError):
+                await asyncio.wait_for(task, 1)
+
+        asyncio.run(main())
+        self.slice.update.assert_not_called()
+
+    def test_execute_all_collects_errors(self):
+        good = MagicMock()
+        good.get_name.return_value = "good"
+        good.execute.return_value = ("ok", "")
+        bad = MagicMock()
+        bad.get_name.return_value = "bad"
+        bad.execute.side_effect = RuntimeError("unreachable")
+        self.slice.get_nodes.return_value = [good, bad]
+
+        results = asyncio.run(self.manager.wrap(self.slice).execute_all("hostname"))
+
+        self.assertEqual(results["good"], ("ok", ""))
+        self.assertIsInstance(results["bad"], RuntimeError)
+        good.execute.assert_called_once_with("hostname")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,248 @@
+"""
+Unit tests for FablibManager.delete_slices(), renew_slices() and submit_slices().
+"""
+
+import unittest
+from unittest.mock import MagicMock, patch
+
+from fabrictestbed_extensions.fablib.exceptions import (
+    SliceNotFoundError,
+    SliceStateError,
+    SliceTimeoutError,
+    ValidationError,
+)
+from fabrictestbed_extensions.fablib.slice import Slice
+
+from .helpers.fablib import OfflineFablibTestCase, make_slice_dto
+
+
+class BulkSliceTestBase(OfflineFablibTestCase):
+    """Common setup: offline FablibManager with a mocked orchestrator."""
+
+    def _slices(self, count):
+        return [
+            Slice.get_slice(self.fablib, sm_slice=make_slice_dto(i), lazy=True)
+            for i in range(count)
+        ]
+
+
+class TestDeleteSlices(BulkSliceTestBase):
+    """Test concurrent slice deletion."""
+
+    def test_deletes_all_and_reports_per_slice(self):
+        slices = self._slices(3)
+
+        def delete_slice(slice_id):
+            if slice_id == "slice-id-1":
+                raise Exception("orchestrator error")
+
+        self.mock_manager.delete_slice.side_effect = delete_slice
+
+        results = self.fablib.delete_slices(slices)
+
+        self.assertEqual(self.mock_manager.delete_slice.call_count, 3)
+        self.assertIsNone(results["slice-id-0"])
+        self.assertIsNone(results["slice-id-2"])
+        self.assertIsInstance(results["slice-id-1"], Exception)
+        # Lazy handles are deleted without fetching their topology
+        self.mock_manager.list_slivers.assert_not_called()
+
+    def test_same_name_reported_separately(self):
+        slices = self._slices(2)
+        slices[1].sm_slice.name = slices[0].get_name()
+        self.mock_manager.delete_slice.side_effect = [None, Exception("error")]
+
+        results = self.fablib.delete_slices(slices, max_workers=1)
+
+        self.assertEqual(len(results), 2)
+        self.assertIsNone(results["slice-id-0"])
+        self.assertIsInstance(results["slice-id-1"], Exception)
+
+    def test_unknown_name_reported(self):
+        self.mock_manager.list_slices.return_value = [make_slice_dto(0)]
+
+        results = self.fablib.delete_slices(["slice-0", "missing"])
+
+        self.mock_manager.delete_slice.assert_called_once_with(slice_id="slice-id-0")
+        self.assertIsNone(results["slice-id-0"])
+        self.assertIsInstance(results["missing"], SliceNotFoundError)
+
+    def test_wait_uses_shared_poller(self):
+        slices = self._slices(3)
+        # First poll: one slice still listed; second poll: all gone (Dead)
+        self.mock_manager.list_slices.side_effect = [[make_slice_dto(2)], []]
+
+        with patch("time.sleep"):
+            results = self.fablib.delete_slices(slices, wait=True, interval=0)
+
+        self.assertEqual(self.mock_manager.list_slices.call_count, 2)
+        self.assertEqual(
+            self.mock_manager.list_slices.call_args.kwargs["exclude_states"],
+            ["Dead"],
+        )
+        self.assertTrue(all(error is None for error in results.values()))
+
+    def test_wait_timeout(self):
+        slices = self._slices(1)
+        self.mock_manager.list_slices.return_value = [make_slice_dto(0)]
+
+        results = self.fablib.delete_slices(slices, wait=True, timeout=0)
+
+        self.assertIsInstance(results["slice-id-0"], SliceTimeoutError)
+
+
+class TestRenewSlices(BulkSliceTestBase):
+    """Test concurrent slice renewal."""
+
+    END_DATE = "2025-07-09 00:00:00 +0000"
+
+    def test_renews_with_single_request_per_slice(self):
+        slices = self._slices(3)
+
+        results = self.fablib.renew_slices(slices, end_date=self.END_DATE)
+
+        self.assertEqual(self.mock_manager.renew_slice.call_count, 3)
+        self.mock_manager.renew_slice.assert_any_call(
+            slice_id="slice-id-1", lease_end_time=self.END_DATE
+        )
+        self.mock_manager.create_slice.assert_not_called()
+        self.mock_manager.modify_slice.assert_not_called()
+        self.assertTrue(all(error is None for error in results.values()))
+
+    def test_requires_end_date_or_days(self):
+        with self.assertRaises(ValidationError):
+            self.fablib.renew_slices(self._slices(1))
+
+    def test_invalid_end_date(self):
+        with self.assertRaises(ValueError):
+            self.fablib.renew_slices(self._slices(1), end_date="next week")
+
+    def test_wait_updates_lease_end(self):
+        slices = self._slices(2)
+        self.mock_manager.list_slices.return_value = [
+            make_slice_dto(0, lease_end_time=self.END_DATE),
+            make_slice_dto(1, lease_end_time=self.END_DATE),
+        ]
+
+        results = self.fablib.renew_slices(slices, end_date=self.END_DATE, wait=True)
+
+        self.assertTrue(all(error is None for error in results.values()))
+        self.assertEqual(slices[0].get_lease_end(), self.END_DATE)
+        self.assertEqual(self.mock_manager.list_slices.call_count, 1)
+
+    def test_wait_renew_to_current_end(self):
+        slices = [
+            Slice.get_slice(
+                self.fablib,
+                sm_slice=make_slice_dto(0, lease_end_time=self.END_DATE),
+                lazy=True,
+            )
+        ]
+        self.mock_manager.list_slices.return_value = [
+            make_slice_dto(0, lease_end_time="2025-07-09T00:00:00+00:00")
+        ]
+
+        results = self.fablib.renew_slices(
+            slices, end_date=self.END_DATE, wait=True, timeout=0
+        )
+
+        self.assertIsNone(results["slice-id-0"])
+
+    def test_wait_lease_end_unchanged_times_out(self):
+        slices = self._slices(1)
+        self.mock_manager.list_slices.return_value = [make_slice_dto(0)]
+
+        results = self.fablib.renew_slices(
+            slices, end_date=self.END_DATE, wait=True, timeout=0
+        )
+
+        self.assertIsInstance(results["slice-id-0"], SliceTimeoutError)
+
+
+class TestSubmitSlices(BulkSliceTestBase):
+    """Test concurrent submission of new slices."""
+
+    def _new_slices(self, count):
+        slices = []
+        for i in range(count):
+            slice_obj = MagicMock(spec=Slice)
+            slice_obj.get_name.return_value = f"slice-{i}"
+            slice_obj.get_slice_id.return_value = f"slice-id-{i}"
+            slice_obj.get_state.return_value = "StableOK"
+            slice_obj.user_only = True
+            slice_obj.test_ssh.return_value = True
+            slice_obj.is_advanced_allocation.return_value = False
+            slices.append(slice_obj)
+        return slices
+
+    def test_submit_wait_and_configure(self):
+        slices = self._new_slices(3)
+        self.mock_manager.list_slices.return_value = [
+            make_slice_dto(i) for i in range(3)
+        ]
+
+        with patch.object(self.fablib, "probe_bastion_host") as probe:
+            results = self.fablib.submit_slices(slices, progress=False)
+
+        self.assertTrue(all(error is None for error in results.values()))
+        probe.assert_called_once()
+        # One shared poll for all three slices
+        self.assertEqual(self.mock_manager.list_slices.call_count, 1)
+        for slice_obj in slices:
+            slice_obj.submit.assert_called_once()
+            self.assertFalse(slice_obj.submit.call_args.kwargs["wait"])
+            slice_obj.post_boot_config.assert_called_once_with(progress=False)
+
+    def test_validation_uses_one_snapshot(self):
+        slices = self._new_slices(2)
+        slices[1].validate.side_effect = ValidationError("no capacity")
+
+        with patch.object(self.fablib, "get_resources") as get_resources:
+            results = self.fablib.submit_slices(
+                slices, validate=True, wait=False, progress=False
+            )
+
+        get_resources.assert_called_once()
+        self.assertIs(
+            slices[0].validate.call_args.kwargs["resources"],
+            slices[1].validate.call_args.kwargs["resources"],
+        )
+        self.assertIsNone(results["slice-id-0"])
+        self.assertIsInstance(results["slice-id-1"], ValidationError)
+        slices[0].submit.assert_called_once()
+        slices[1].submit.assert_not_called()
+
+    def test_validation_refreshes_cached_sites(self):
+        slices = self._new_slices(2)
+        for slice_obj, sites in zip(slices, (["RENC", "TACC"], ["TACC", "UCSD"])):
+            nodes = [MagicMock() for _ in sites]
+            for node, site in zip(nodes, sites):
+                node.get_site.return_value = site
+            slice_obj.get_nodes.return_value = nodes
+
+        with patch.object(self.fablib, "get_resources") as get_resources:
+            resources = get_resources.return_value
+            resources.is_from_cache.side_effect = lambda site: site != "UCSD"
+            self.fablib.submit_slices(slices, validate=True, wait=False, progress=False)
+
+        resources.refresh_sites.assert_called_once_with(["RENC", "TACC"])
+
+    def test_unstable_slice_reported(self):
+        slices = self._new_slices(2)
+        slices[1].get_state.return_value = "StableError"
+        slices[1].get_error_messages.return_value = []
+        slices[1].build_error_exception_string.return_value = "boom"
+        self.mock_manager.list_slices.return_value = [
+            make_slice_dto(i) for i in range(2)
+        ]
+
+        with patch.object(self.fablib, "probe_bastion_host"):
+            results = self.fablib.submit_slices(slices, progress=False)
+
+        self.assertIsNone(results["slice-id-0"])
+        self.assertIsInstance(results["slice-id-1"], SliceStateError)
+        slices[1].post_boot_config.assert_not_called()
+
+
+if __name__ == "__main__":
+    unittest.main()
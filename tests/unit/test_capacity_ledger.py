@@ -0,0 +1,89 @@
+"""
+Unit tests for planning several slices against one resources snapshot.
+"""
+
+import unittest
+from unittest.mock import MagicMock
+
+from fabrictestbed_extensions.fablib.capacity_ledger import CapacityLedger
+
+from .helpers.nodes import make_host, make_node
+
+
+def _make_slice(name, *nodes):
+    slice = MagicMock()
+    slice.get_name.return_value = name
+    slice.get_nodes.return_value = list(nodes)
+    return slice
+
+
+def _resources(hosts_by_site):
+    resources = MagicMock()
+    resources.get_site.return_value = {"state": "Active"}
+    resources.get_hosts_by_site.side_effect = lambda site_name: {
+        name: make_host(name, cores)
+        for name, cores in hosts_by_site.get(site_name, {}).items()
+    }
+    return resources
+
+
+class TestCapacityLedger(unittest.TestCase):
+    """Test reservations across slices and rollback."""
+
+    def setUp(self):
+        self.ledger = CapacityLedger(_resources({"RENC": {"h1": 48, "h2": 48}}))
+
+    def test_slices_do_not_oversubscribe(self):
+        slices = [_make_slice(f"s{i}", make_node("n", cores=40)) for i in range(3)]
+
+        results = self.ledger.plan(slices)
+
+        self.assertEqual([bool(e) for e in results.values()], [False, False, True])
+        self.assertTrue(self.ledger.fits("s0"))
+        self.assertFalse(self.ledger.fits("s2"))
+        self.assertIn("cannot be accommodated", results["s2"]["n"])
+        slices[2].get_nodes()[0].delete.assert_not_called()
+        self.assertEqual(
+            {h: c["core"] for h, c in self.ledger.allocated.items()},
+            {"h1": 40, "h2": 40},
+        )
+
+        rows = self.ledger.list_reservations(output="list", quiet=True)
+        self.assertEqual([r["Fits"] for r in rows], [True, True, False])
+        self.assertEqual(rows[0]["Cores"], 40)
+
+    def test_release_and_replan(self):
+        slices = [_make_slice(f"s{i}", make_node("n", cores=40)) for i in range(3)]
+        self.ledger.plan(slices)
+
+        reserved = self.ledger.get_reservation("s0")
+        self.ledger.release("s0")
+        self.assertNotIn(list(reserved)[0], self.ledger.allocated)
+        self.assertTrue(self.ledger.reserve(slices[2])[0])
+
+        # Shrink s1 and plan everything again, in the original order
+        slices[1].get_nodes()[0].get_requested_cores.return_value = 8
+        self.ledger.reserve(slices[0])
+        results = self.ledger.replan()
+        self.assertEqual(list(results), ["s1", "s2", "s0"])
+        self.assertTrue(all(self.ledger.fits(s) for s in ("s0", "s1", "s2")))
+        self.assertEqual(
+            sorted(c["core"] for c in self.ledger.allocated.values()), [40, 48]
+        )
+
+    def test_many_slices_replanned(self):
+        ledger = CapacityLedger(_resources({"RENC": {f"h{i}": 64 for i in range(20)}}))
+        slices = [
+            _make_slice(f"s{i}", *(make_node(f"n{j}", cores=8) for j in range(6)))
+            for i in range(30)
+        ]
+
+        ledger.plan(slices)
+        ledger.replan()
+
+        # 20 hosts take 8 nodes of 8 cores each: 160 nodes, 26 slices
+        self.assertEqual(sum(ledger.fits(s.get_name()) for s in slices), 26)
+
+
+if __name__ == "__main__":
+    unittest.main()
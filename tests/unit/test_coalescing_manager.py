@@ -0,0 +1,234 @@
+"""
+Unit tests for SingleFlight and CoalescingFabricManager.
+"""
+
+import threading
+import time
+import unittest
+from types import SimpleNamespace
+from unittest.mock import patch
+
+from fabrictestbed.fabric_manager_v2 import FabricManagerV2
+
+from fabrictestbed_extensions.fablib.coalescing_manager import (
+    CoalescingFabricManager,
+    SingleFlight,
+)
+
+
+def _run_concurrently(count, target):
+    threads = [threading.Thread(target=target) for _ in range(count)]
+    for t in threads:
+        t.start()
+    return threads
+
+
+class TestSingleFlight(unittest.TestCase):
+    """Test collapsing of concurrent identical calls."""
+
+    def test_concurrent_calls_collapsed(self):
+        single_flight = SingleFlight()
+        release = threading.Event()
+        calls = []
+        results = []
+
+        def func():
+            calls.append(1)
+            release.wait(5)
+            return "result"
+
+        threads = _run_concurrently(
+            5, lambda: results.append(single_flight.call("key", func))
+        )
+        # Wait until the leader is running and the others are queued
+        deadline = time.time() + 5
+        while not calls and time.time() < deadline:
+            time.sleep(0.01)
+        time.sleep(0.05)
+        release.set()
+        for t in threads:
+            t.join(5)
+
+        self.assertEqual(len(calls), 1)
+        self.assertEqual(results, ["result"] * 5)
+
+    def test_error_shared_with_waiters(self):
+        single_flight = SingleFlight()
+        release = threading.Event()
+        errors = []
+
+        def func():
+            release.wait(5)
+            raise ValueError("boom")
+
+        def target():
+            try:
+                single_flight.call("key", func)
+            except ValueError as e:
+                errors.append(e)
+
+        threads = _run_concurrently(3, target)
+        time.sleep(0.05)
+        release.set()
+        for t in threads:
+            t.join(5)
+
+        self.assertEqual(len(errors), 3)
+
+    def test_sequential_calls_not_cached_without_ttl(self):
+        single_flight = SingleFlight()
+        calls = []
+
+        single_flight.call("key", lambda: calls.append(1))
+        single_flight.call("key", lambda: calls.append(1))
+
+        self.assertEqual(len(calls), 2)
+
+    def test_ttl_cache_and_invalidate(self):
+        single_flight = SingleFlight(ttl=60)
+        calls = []
+
+        def func():
+            calls.append(1)
+            return len(calls)
+
+        self.assertEqual(single_flight.call("key", func), 1)
+        self.assertEqual(single_flight.call("key", func), 1)
+        self.assertEqual(single_flight.call("key", func, cacheable=False), 2)
+
+        single_flight.invalidate()
+        self.assertEqual(single_flight.call("key", func), 3)
+
+
+class TestSingleFlightCopies(unittest.TestCase):
+    """Test that only results received by several callers are copied."""
+
+    def test_single_caller_gets_original(self):
+        single_flight = SingleFlight(copy=list)
+        result = ["a"]
+
+        self.assertIs(single_flight.call("key", lambda: result), result)
+
+    def test_cached_results_copied(self):
+        single_flight = SingleFlight(ttl=60, copy=list)
+        result = ["a"]
+
+        first = single_flight.call("key", lambda: result)
+        second = single_flight.call("key", lambda: result)
+
+        self.assertEqual(first, second)
+        self.assertIsNot(first, result)
+        self.assertIsNot(second, result)
+
+    def test_collapsed_callers_get_copies(self):
+        single_flight = SingleFlight(copy=list)
+        release = threading.Event()
+        calls = []
+        results = []
+        result = ["a"]
+
+        def func():
+            calls.append(1)
+            release.wait(5)
+            return result
+
+        threads = _run_concurrently(
+            3, lambda: results.append(single_flight.call("key", func))
+        )
+        deadline = time.time() + 5
+        while not calls and time.time() < deadline:
+            time.sleep(0.01)
+        time.sleep(0.05)
+        release.set()
+        for t in threads:
+            t.join(5)
+
+        self.assertEqual(len(calls), 1)
+        self.assertEqual(results, [result] * 3)
+        self.assertFalse(any(r is result for r in results))
+
+
+class TestCoalescingFabricManager(unittest.TestCase):
+    """Test the FabricManagerV2 subclass used by FablibManager."""
+
+    def setUp(self):
+        self.manager = CoalescingFabricManager(
+            credmgr_host="cm.example.org",
+            orchestrator_host="orch.example.org",
+            core_api_host="core.example.org",
+            am_host="am.example.org",
+            id_token="dummy-token",
+            project_id="DUMMY_PROJECT_ID",
+            auto_refresh=False,
+            no_write=True,
+            response_ttl=60,
+            pool_maxsize=64,
+        )
+
+    def test_is_fabric_manager_v2(self):
+        self.assertIsInstance(self.manager, FabricManagerV2)
+
+    def test_shared_session_pool(self):
+        self.assertIs(self.manager.credmgr.session, self.manager.orch.session)
+        adapter = self.manager.orch.session.get_adapter("https://")
+        self.assertEqual(adapter._pool_maxsize, 64)
+
+    def test_read_calls_cached_and_invalidated_by_writes(self):
+        with (
+            patch.object(
+                FabricManagerV2, "list_slices", return_value=["slice"]
+            ) as list_slices,
+            patch.object(FabricManagerV2, "delete_slice"),
+        ):
+            first = self.manager.list_slices(slice_id="id-1", return_fmt="dto")
+            second = self.manager.list_slices(slice_id="id-1", return_fmt="dto")
+            self.manager.list_slices(slice_id="id-2", return_fmt="dto")
+            self.assertEqual(list_slices.call_count, 2)
+
+            # Callers get private copies of list results
+            self.assertEqual(first, second)
+            self.assertIsNot(first, second)
+
+            self.manager.delete_slice(slice_id="id-1")
+            self.manager.list_slices(slice_id="id-1", return_fmt="dto")
+            self.assertEqual(list_slices.call_count, 3)
+
+    def test_callers_get_private_objects(self):
+        dto = SimpleNamespace(slice_id="id-1", state="StableOK")
+        with patch.object(FabricManagerV2, "list_slices", return_value=[dto]):
+            first = self.manager.list_slices(slice_id="id-1", return_fmt="dto")
+            first[0].state = "Closing"
+            second = self.manager.list_slices(slice_id="id-1", return_fmt="dto")
+
+        self.assertEqual(second[0].state, "StableOK")
+        self.assertEqual(dto.state, "StableOK")
+
+    def test_force_refresh_bypasses_cache(self):
+        with patch.object(
+            FabricManagerV2, "resources_summary", return_value={"sites": []}
+        ) as resources_summary:
+            self.manager.resources_summary(level=2)
+            self.manager.resources_summary(level=2)
+            self.manager.resources_summary(level=2, force_refresh=True)
+
+        self.assertEqual(resources_summary.call_count, 2)
+
+    def test_state_changing_calls_invalidate(self):
+        for name in (
+            "create_ssh_keys",
+            "add_public_key",
+            "create_slice",
+            "tokens_create",
+            "tokens_revoke",
+        ):
+            self.assertIn(name, CoalescingFabricManager.__dict__)
+            with (
+                patch.object(FabricManagerV2, name),
+                patch.object(self.manager.single_flight, "invalidate") as invalidate,
+            ):
+                getattr(self.manager, name)()
+            invalidate.assert_called_once()
+
+
+if __name__ == "__main__":
+    unittest.main()
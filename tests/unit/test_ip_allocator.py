@@ -0,0 +1,205 @@
+"""
+Unit tests for IP address allocation of network services.
+"""
+
+import unittest
+from ipaddress import IPv4Address, IPv4Network, IPv6Address, IPv6Network
+
+from fabrictestbed.slice_editor import ExperimentTopology, ServiceType
+
+from fabrictestbed_extensions.fablib.exceptions import FablibException
+from fabrictestbed_extensions.fablib.ip_allocator import IPAllocator
+from fabrictestbed_extensions.fablib.network_service import NetworkService
+from fabrictestbed_extensions.fablib.user_data_cache import UserDataCache
+
+
+class TestIPAllocator(unittest.TestCase):
+    """Test the range-based allocator."""
+
+    def test_allocates_lowest_free_host(self):
+        allocator = IPAllocator(IPv4Network("10.0.0.0/29"))
+
+        self.assertEqual(allocator.allocate(), IPv4Address("10.0.0.1"))
+        self.assertEqual(
+            allocator.allocate(IPv4Address("10.0.0.3")), IPv4Address("10.0.0.3")
+        )
+        self.assertIsNone(allocator.allocate(IPv4Address("10.0.0.3")))
+        self.assertEqual(allocator.allocate(), IPv4Address("10.0.0.2"))
+        self.assertEqual(allocator.allocate(), IPv4Address("10.0.0.4"))
+        self.assertEqual(allocator.to_ranges(), ["10.0.0.1-10.0.0.4"])
+
+    def test_ipv4_subnet_exhaustion(self):
+        allocator = IPAllocator(IPv4Network("10.0.0.0/30"))
+
+        self.assertEqual(
+            allocator.allocate_many(2),
+            [IPv4Address("10.0.0.1"), IPv4Address("10.0.0.2")],
+        )
+        # Network and broadcast addresses are never handed out
+        self.assertIsNone(allocator.allocate())
+        with self.assertRaises(FablibException):
+            allocator.allocate_many(1)
+
+    def test_allocate_many_fills_gaps_or_nothing(self):
+        allocator = IPAllocator(IPv4Network("10.0.0.0/28"))
+        for last in (2, 5):
+            allocator.allocate(IPv4Address(f"10.0.0.{last}"))
+
+        hosts = allocator.allocate_many(4)
+
+        self.assertEqual(
+            [str(h) for h in hosts], ["10.0.0.1", "10.0.0.3", "10.0.0.4", "10.0.0.6"]
+        )
+        with self.assertRaises(FablibException):
+            allocator.allocate_many(100)
+        self.assertEqual(len(allocator), 6)
+
+    def test_free_splits_range(self):
+        allocator = IPAllocator(IPv4Network("10.0.0.0/24"))
+        allocator.allocate_many(5)
+
+        allocator.free(IPv4Address("10.0.0.3"))
+        allocator.free(IPv4Address("10.0.0.200"))
+
+        self.assertEqual(
+            allocator.to_ranges(), ["10.0.0.1-10.0.0.2", "10.0.0.4-10.0.0.5"]
+        )
+        self.assertEqual(allocator.allocate(), IPv4Address("10.0.0.3"))
+
+    def test_ipv6_64_is_not_enumerated(self):
+        subnet = IPv6Network("2001:db8::/64")
+        allocator = IPAllocator(subnet)
+
+        hosts = allocator.allocate_many(1000)
+        allocator.allocate(subnet.broadcast_address)
+
+        self.assertEqual(hosts[0], IPv6Address("2001:db8::1"))
+        self.assertEqual(len(allocator), 1001)
+        self.assertEqual(
+            allocator.to_ranges(),
+            ["2001:db8::1-2001:db8::3e8", "2001:db8::ffff:ffff:ffff:ffff"],
+        )
+        restored = IPAllocator.from_ranges(subnet, allocator.to_ranges())
+        self.assertEqual(restored.allocate(), IPv6Address("2001:db8::3e9"))
+
+    def test_addresses_without_subnet(self):
+        allocator = IPAllocator(None)
+
+        self.assertIsNone(allocator.allocate())
+        self.assertEqual(allocator.allocate(IPv6Address("::5")), IPv6Address("::5"))
+        self.assertEqual(allocator.to_ranges(), ["::5"])
+
+
+class TestNetworkServiceAllocation(unittest.TestCase):
+    """Test allocation through NetworkService and its fablib data."""
+
+    def setUp(self):
+        self.topology = ExperimentTopology()
+        fim_net = self.topology.add_network_service(
+            name="net1", nstype=ServiceType.L2Bridge, interfaces=[]
+        )
+        self.network = NetworkService(slice=None, fim_network_service=fim_net)
+        self.network.set_subnet(IPv4Network("192.168.1.0/24"))
+
+    def test_allocate_and_free(self):
+        self.assertEqual(self.network.allocate_ip(), IPv4Address("192.168.1.1"))
+        self.assertEqual(
+            self.network.allocate_ips(3),
+            [IPv4Address(f"192.168.1.{i}") for i in (2, 3, 4)],
+        )
+        self.network.free_ip(IPv4Address("192.168.1.2"))
+
+        self.assertEqual(
+            self.network.get_fablib_data()["subnet"]["allocated_ranges"],
+            ["192.168.1.1", "192.168.1.3-192.168.1.4"],
+        )
+        self.assertEqual(self.network.allocate_ip(), IPv4Address("192.168.1.2"))
+
+    def test_wrappers_share_allocations(self):
+        other = NetworkService(slice=None, fim_network_service=self.network.get_fim())
+
+        self.network.allocate_ip()
+
+        self.assertEqual(other.allocate_ip(), IPv4Address("192.168.1.2"))
+        self.assertEqual(len(self.network.get_allocated_ips()), 2)
+
+    def test_reads_legacy_address_list(self):
+        fablib_data = self.network.get_fablib_data()
+        del fablib_data["subnet"]["allocated_ranges"]
+        fablib_data["subnet"]["allocated_ips"] = ["192.168.1.1", "192.168.1.2"]
+        self.network.set_fablib_data(fablib_data)
+
+        self.assertEqual(self.network.allocate_ip(), IPv4Address("192.168.1.3"))
+        UserDataCache.for_topology(self.topology).flush()
+        subnet_data = UserDataCache.read(self.network.get_fim())["fablib_data"][
+            "subnet"
+        ]
+        self.assertEqual(subnet_data["allocated_ranges"], ["192.168.1.1-192.168.1.3"])
+
+    def test_saved_data_readable_by_older_versions(self):
+        self.network.allocate_ips(3)
+        self.network.free_ip(IPv4Address("192.168.1.2"))
+        UserDataCache.for_topology(self.topology).flush()
+
+        # Older versions read and append to the address list directly
+        fablib_data = UserDataCache.read(self.network.get_fim())["fablib_data"]
+        allocated_ips = fablib_data["subnet"]["allocated_ips"]
+        self.assertEqual(allocated_ips, ["192.168.1.1", "192.168.1.3"])
+        allocated_ips.append("192.168.1.2")
+        self.network.set_fablib_data(fablib_data)
+
+        self.assertEqual(self.network.allocate_ip(), IPv4Address("192.168.1.4"))
+
+    def test_large_allocations_keep_truncated_address_list(self):
+        for _ in range(150):
+            self.network.allocate_ip()
+        UserDataCache.for_topology(self.topology).flush()
+
+        subnet_data = UserDataCache.read(self.network.get_fim())["fablib_data"][
+            "subnet"
+        ]
+        self.assertEqual(
+            subnet_data["allocated_ips"],
+            [
+                f"192.168.1.{i}"
+                for i in range(1, NetworkService.max_legacy_allocated_ips + 1)
+            ],
+        )
+        self.assertEqual(subnet_data["allocated_ranges"], ["192.168.1.1-192.168.1.150"])
+        self.assertEqual(len(self.network.get_allocated_ips()), 150)
+
+    def test_addresses_added_by_older_versions_kept_with_ranges(self):
+        for _ in range(40):
+            self.network.allocate_ip()
+
+        # An older version appends to the truncated address list
+        fablib_data = self.network.get_fablib_data()
+        fablib_data["subnet"]["allocated_ips"].append("192.168.1.41")
+        self.network.set_fablib_data(fablib_data)
+
+        self.assertEqual(self.network.allocate_ip(), IPv4Address("192.168.1.42"))
+
+
+class TestUnsubmittedNetworkAllocation(unittest.TestCase):
+    """Test allocation on an L3 network whose subnet is not known yet."""
+
+    def setUp(self):
+        self.topology = ExperimentTopology()
+        fim_net = self.topology.add_network_service(
+            name="net1", nstype=ServiceType.FABNetv4, interfaces=[]
+        )
+        self.network = NetworkService(slice=None, fim_network_service=fim_net)
+
+    def test_no_address_without_subnet(self):
+        self.assertIsNone(self.network.allocate_ip())
+        self.assertEqual(self.network.get_allocated_ips(), [])
+
+    def test_explicit_address_without_subnet(self):
+        addr = IPv4Address("10.128.0.5")
+
+        self.assertEqual(self.network.allocate_ip(addr), addr)
+        self.assertEqual(self.network.get_allocated_ips(), [addr])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,127 @@
+"""
+Unit tests for FablibManager.iter_slices() and the lazy slice handles it yields.
+"""
+
+import unittest
+from unittest.mock import patch
+
+from fabrictestbed_extensions.fablib.slice import Slice
+
+from .helpers.fablib import OfflineFablibTestCase, make_slice_dto
+
+
+def _paged_list_slices(dtos):
+    """Return a list_slices side effect that pages through *dtos*."""
+
+    def list_slices(**kwargs):
+        if kwargs.get("slice_id") and kwargs.get("graph_format") != "NONE":
+            # Full topology request for a single slice
+            index = kwargs["slice_id"].rsplit("-", 1)[-1]
+            return [make_slice_dto(index, model="")]
+        offset = kwargs.get("offset", 0)
+        limit = kwargs.get("limit", 200)
+        return dtos[offset : offset + limit]
+
+    return list_slices
+
+
+class TestIterSlicesPaging(OfflineFablibTestCase):
+    """Test that iter_slices() walks every page."""
+
+    def test_yields_all_pages(self):
+        dtos = [make_slice_dto(i) for i in range(5)]
+        self.mock_manager.list_slices.side_effect = _paged_list_slices(dtos)
+
+        slices = list(self.fablib.iter_slices(page_size=2))
+
+        self.assertEqual([s.get_name() for s in slices], [d.name for d in dtos])
+        offsets = [
+            c.kwargs["offset"] for c in self.mock_manager.list_slices.call_args_list
+        ]
+        self.assertEqual(offsets, [0, 2, 4])
+
+    def test_exact_multiple_of_page_size_stops_on_empty_page(self):
+        dtos = [make_slice_dto(i) for i in range(4)]
+        self.mock_manager.list_slices.side_effect = _paged_list_slices(dtos)
+
+        slices = list(self.fablib.iter_slices(page_size=2))
+
+        self.assertEqual(len(slices), 4)
+        self.assertEqual(self.mock_manager.list_slices.call_count, 3)
+
+    def test_metadata_requested_without_graph(self):
+        self.mock_manager.list_slices.side_effect = _paged_list_slices(
+            [make_slice_dto(0)]
+        )
+
+        list(self.fablib.iter_slices())
+
+        call_kwargs = self.mock_manager.list_slices.call_args.kwargs
+        self.assertEqual(call_kwargs["graph_format"], "NONE")
+        self.assertEqual(call_kwargs["exclude_states"], ["Dead", "Closing"])
+
+    def test_invalid_page_size(self):
+        with self.assertRaises(ValueError):
+            list(self.fablib.iter_slices(page_size=0))
+
+    def test_get_slices_not_truncated(self):
+        dtos = [make_slice_dto(i) for i in range(250)]
+        self.mock_manager.list_slices.side_effect = _paged_list_slices(dtos)
+
+        with patch.object(Slice, "_load_topology_and_slivers") as mock_load:
+            slices = self.fablib.get_slices()
+
+        self.assertEqual(len(slices), 250)
+        self.assertEqual(mock_load.call_count, 250)
+
+
+class TestLazySliceHandles(OfflineFablibTestCase):
+    """Test that slice handles defer topology and sliver loading."""
+
+    def test_handles_do_not_load_until_accessed(self):
+        dtos = [make_slice_dto(i) for i in range(3)]
+        self.mock_manager.list_slices.side_effect = _paged_list_slices(dtos)
+
+        slices = list(self.fablib.iter_slices())
+
+        self.assertEqual(self.mock_manager.list_slices.call_count, 1)
+        self.mock_manager.list_slivers.assert_not_called()
+        self.assertEqual(slices[0].get_state(), "StableOK")
+
+        topology = slices[0].topology
+
+        self.assertIsNotNone(topology)
+        self.mock_manager.list_slivers.assert_called_once()
+        self.assertEqual(self.mock_manager.list_slices.call_count, 2)
+
+        # Second access does not refetch
+        slices[0].get_fim_topology()
+        self.assertEqual(self.mock_manager.list_slices.call_count, 2)
+
+    def test_list_slices_does_not_load_topology(self):
+        dtos = [make_slice_dto(i) for i in range(3)]
+        self.mock_manager.list_slices.side_effect = _paged_list_slices(dtos)
+
+        rows = self.fablib.list_slices(output="list", quiet=True)
+
+        self.assertEqual(len(rows), 3)
+        self.assertEqual(self.mock_manager.list_slices.call_count, 1)
+        self.mock_manager.list_slivers.assert_not_called()
+
+    def test_list_slices_shows_un_submitted(self):
+        self.mock_manager.list_slices.side_effect = _paged_list_slices(
+            [make_slice_dto(0)]
+        )
+        self.fablib.new_slice(name="draft")
+
+        rows = self.fablib.list_slices(output="list", quiet=True, pretty_names=False)
+        self.assertEqual([r["name"] for r in rows], ["slice-0"])
+
+        rows = self.fablib.list_slices(
+            output="list", quiet=True, pretty_names=False, show_un_submitted=True
+        )
+        self.assertEqual([r["name"] for r in rows], ["slice-0", "draft"])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,113 @@
+"""
+Unit tests for joint placement of nodes on hosts.
+"""
+
+import unittest
+from unittest.mock import MagicMock
+
+from fabrictestbed_extensions.fablib.placement import (
+    BestFitDecreasingPlacement,
+    ExactPlacement,
+    FirstFitPlacement,
+    HostCapacity,
+    PlacementRequest,
+)
+from fabrictestbed_extensions.fablib.validator import NodeValidator
+
+from .helpers.nodes import make_host, make_node
+
+
+class TestPlacementEngines(unittest.TestCase):
+    """Test the engines on plain requests and capacities."""
+
+    def test_best_fit_avoids_fragmentation(self):
+        # First fit puts the small node on the large host; the large node
+        # then fits nowhere.
+        requests = [PlacementRequest("small", cores=4), PlacementRequest("big", 16)]
+
+        def hosts():
+            return [HostCapacity("h1", cores=16), HostCapacity("h2", cores=8)]
+
+        self.assertEqual(FirstFitPlacement().place(requests, hosts()), {"small": "h1"})
+        self.assertEqual(
+            BestFitDecreasingPlacement().place(requests, hosts()),
+            {"big": "h1", "small": "h2"},
+        )
+
+    def test_best_fit_keeps_components_free(self):
+        gpu = "GPU-Tesla T4"
+        requests = [PlacementRequest("plain", cores=2)]
+        hosts = [
+            HostCapacity("gpu", cores=8, components={gpu: 1}),
+            HostCapacity("cpu", cores=64),
+        ]
+
+        placement = BestFitDecreasingPlacement().place(requests, hosts)
+
+        self.assertEqual(placement, {"plain": "cpu"})
+        self.assertEqual(hosts[1].cores, 62)
+
+    def test_exact_finds_packing_heuristic_misses(self):
+        # Best fit puts both 5s on h1; 4, 4 and 3 then fill h2 and the last
+        # 3 fits nowhere.  Each host can take 5, 4 and 3.
+        sizes = {"a": 5, "b": 5, "c": 4, "d": 4, "e": 3, "f": 3}
+        requests = [PlacementRequest(n, cores=c) for n, c in sizes.items()]
+
+        def hosts():
+            return [HostCapacity("h1", cores=12), HostCapacity("h2", cores=12)]
+
+        heuristic = BestFitDecreasingPlacement().place(requests, hosts())
+        self.assertLess(len(heuristic), len(requests))
+
+        capacities = hosts()
+        exact = ExactPlacement().place(requests, capacities)
+
+        self.assertEqual(len(exact), len(requests))
+        self.assertEqual([h.cores for h in capacities], [0, 0])
+
+
+class TestValidateNodesPlacement(unittest.TestCase):
+    """Test validate_nodes with a placement engine."""
+
+    def _resources(self, hosts):
+        resources = MagicMock()
+        resources.get_site.return_value = {"state": "Active"}
+        resources.get_hosts_by_site.return_value = {h["name"]: h for h in hosts}
+        return resources
+
+    def test_joint_placement_and_pinning(self):
+        nodes = [
+            make_node("small", cores=4),
+            make_node("big", cores=16),
+            make_node("pinned", cores=2, host="h2"),
+        ]
+        resources = self._resources([make_host("h1", 16), make_host("h2", 10)])
+        allocated = {}
+
+        all_valid, errors = NodeValidator.validate_nodes(
+            nodes=nodes, resources=resources, allocated=allocated, pin_hosts=True
+        )
+
+        self.assertTrue(all_valid, errors)
+        nodes[0].set_host.assert_called_once_with("h2")
+        nodes[1].set_host.assert_called_once_with("h1")
+        nodes[2].set_host.assert_not_called()
+        self.assertEqual(allocated["h1"]["core"], 16)
+        self.assertEqual(allocated["h2"]["core"], 6)
+
+    def test_first_fit_reports_unplaced_node(self):
+        nodes = [make_node("small", cores=4), make_node("big", cores=16)]
+        resources = self._resources([make_host("h1", 16), make_host("h2", 8)])
+
+        all_valid, errors = NodeValidator.validate_nodes(
+            nodes=nodes, resources=resources, placement=FirstFitPlacement()
+        )
+
+        self.assertFalse(all_valid)
+        self.assertEqual(list(errors), ["big"])
+        self.assertIn("cannot be accommodated", errors["big"])
+        nodes[0].set_host.assert_not_called()
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,160 @@
+"""
+Unit tests for the columnar resource calendar.
+"""
+
+import datetime
+import unittest
+
+import numpy as np
+
+from fabrictestbed_extensions.fablib.resource_calendar import ResourceCalendar
+from fabrictestbed_extensions.utils.utils import Utils
+
+from .helpers.calendar import START, hourly_calendar
+
+
+def _legacy_rows(calendar_data, show="all"):
+    """Rows as Utils.calendar_to_rows() built them from the response dict."""
+    interval = calendar_data.get("interval", "day")
+    rows = []
+    for slot in calendar_data.get("data", []):
+        start = slot.get("start", "")
+        if interval in ("day", "week"):
+            slot_label = start[:10] if len(start) >= 10 else start
+        else:
+            slot_label = start[:16] if len(start) >= 16 else start
+        for kind in ("site", "host"):
+            if show not in ("all", f"{kind}s"):
+                continue
+            for entity in slot.get(f"{kind}s", []):
+                row = {"Date": slot_label, "Type": kind, "Name": entity.get("name", "")}
+                for key, label in (
+                    ("cores", "Cores (avail/cap)"),
+                    ("ram", "RAM GB (avail/cap)"),
+                    ("disk", "Disk GB (avail/cap)"),
+                ):
+                    row[label] = (
+                        f"{entity.get(f'{key}_available', '—')}/"
+                        f"{entity.get(f'{key}_capacity', '—')}"
+                    )
+                for comp_name, comp in entity.get("components", {}).items():
+                    cap = comp.get("capacity", 0)
+                    if cap and cap > 0:
+                        row[comp_name] = f"{comp.get('available', 0)}/{cap}"
+                rows.append(row)
+    return rows
+
+
+class TestResourceCalendar(unittest.TestCase):
+    """Test the arrays, aggregations and display rows."""
+
+    def test_rows_formatted_for_display(self):
+        calendar = ResourceCalendar(hourly_calendar(hours=2))
+
+        rows = Utils.calendar_to_rows(calendar)
+
+        self.assertEqual(len(rows), 6)
+        self.assertEqual(
+            rows[0],
+            {
+                "Date": "2025-07-01T00:00",
+                "Type": "site",
+                "Name": "RENC",
+                "Cores (avail/cap)": "64/128",
+                "RAM GB (avail/cap)": "256/512",
+                "Disk GB (avail/cap)": "1000/—",
+                "GPU Tesla T4": "2/4",
+            },
+        )
+        self.assertEqual(rows[1]["Cores (avail/cap)"], "16/—")
+        self.assertEqual(rows[2]["Cores (avail/cap)"], "32/64")
+        self.assertEqual(
+            list(calendar.to_rows(show="hosts", fields=["Name", "GPU Tesla T4"]))[0],
+            {"Name": "renc-w1.fabric-testbed.net", "GPU Tesla T4": "1/2"},
+        )
+
+    def test_rows_match_legacy_format(self):
+        data = hourly_calendar(hours=3)
+        first, second, third = data["data"]
+        first["sites"][0].update(ram_available=7.5, ram_capacity=16, disk_capacity=None)
+        first["hosts"][0]["components"]["GPU Tesla T4"]["available"] = None
+        del first["hosts"][0]["components"]["GPU Tesla T4"]["capacity"]
+        # A host first listed in a later slot, then listed first
+        second["hosts"].append({"name": "renc-w2.fabric-testbed.net"})
+        third["hosts"].insert(
+            0, {"name": "renc-w2.fabric-testbed.net", "cores_available": 3}
+        )
+        third["sites"][0]["components"]["SmartNIC ConnectX-6"]["capacity"] = 2
+
+        calendar = ResourceCalendar(data)
+
+        for show in ("all", "sites", "hosts"):
+            self.assertEqual(
+                Utils.calendar_to_rows(calendar, show=show),
+                _legacy_rows(data, show=show),
+            )
+        rows = Utils.calendar_to_rows(calendar, show="sites")
+        self.assertEqual(rows[0]["RAM GB (avail/cap)"], "7.5/16")
+        self.assertEqual(rows[0]["Disk GB (avail/cap)"], "1000/None")
+
+    def test_slot_without_start(self):
+        data = hourly_calendar(hours=3)
+        del data["data"][0]["start"]
+
+        calendar = ResourceCalendar(data)
+
+        self.assertEqual(calendar.window_slots(2), 2)
+        self.assertEqual(
+            calendar.earliest_window("RENC", cores=64),
+            START + datetime.timedelta(hours=1),
+        )
+        self.assertEqual(Utils.calendar_to_rows(calendar)[0]["Date"], "")
+
+    def test_earliest_window_and_utilization(self):
+        calendar = ResourceCalendar(hourly_calendar(hours=8, renc_cores={1: 10, 4: 10}))
+
+        self.assertEqual(calendar.earliest_window("RENC", cores=64), START)
+        self.assertEqual(
+            calendar.earliest_window("RENC", duration=2, cores=64),
+            START + datetime.timedelta(hours=2),
+        )
+        self.assertEqual(
+            calendar.earliest_window(
+                "RENC", duration=3, cores=64, components={"GPU-Tesla T4": 1}
+            ),
+            START + datetime.timedelta(hours=5),
+        )
+        self.assertIsNone(calendar.earliest_window("RENC", duration=4, cores=64))
+        self.assertIsNone(calendar.earliest_window("RENC", components={"GPU-A40": 1}))
+        self.assertEqual(
+            calendar.earliest_window(
+                "renc-w1.fabric-testbed.net",
+                kind="host",
+                cores=20,
+                after=START + datetime.timedelta(hours=2),
+            ),
+            START + datetime.timedelta(hours=2),
+        )
+
+        utilization = calendar.utilization("cores")
+        self.assertEqual(list(utilization.columns), ["RENC", "TACC"])
+        self.assertAlmostEqual(utilization["RENC"].iloc[1], 1 - 10 / 128)
+        self.assertTrue(utilization["TACC"].isna().all())
+        self.assertTrue(
+            np.isnan(calendar.utilization("SmartNIC-ConnectX-6").to_numpy()).all()
+        )
+
+    def test_to_pandas_shares_memory(self):
+        calendar = ResourceCalendar(hourly_calendar(hours=3))
+
+        df = calendar.to_pandas()
+
+        self.assertEqual(df.shape, (9, len(calendar.columns)))
+        self.assertTrue(np.shares_memory(df.to_numpy(), calendar.available))
+        self.assertEqual(df.xs("host", level="kind")["cores"].tolist(), [32] * 3)
+        allocated = calendar.to_pandas("allocated")
+        self.assertEqual(allocated.xs("RENC", level="name")["cores"].tolist(), [64] * 3)
+
+
+if __name__ == "__main__":
+    unittest.main()
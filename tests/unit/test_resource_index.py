@@ -0,0 +1,182 @@
+"""
+Unit tests for the array index of resources_summary hosts.
+"""
+
+import threading
+import unittest
+from unittest.mock import patch
+
+from fabrictestbed_extensions.fablib.resource_index import ResourceIndex
+
+from .helpers.resources import GPU, make_resources, summary_host
+
+
+class TestResourceIndex(unittest.TestCase):
+    """Test site totals and queries."""
+
+    def setUp(self):
+        self.resources = make_resources(
+            [
+                summary_host("renc-w1", "RENC", cores=16, gpus=1),
+                summary_host("renc-w2", "RENC", cores=32, gpus=2),
+                summary_host("tacc-w1", "TACC", cores=64),
+                summary_host("tacc-w2", "TACC", cores=8, gpus=2, state="Maintenance"),
+                summary_host("ucsd-w1", "UCSD", cores=64, gpus=2),
+            ],
+            down=("UCSD",),
+        )
+
+    def test_site_totals_recomputed(self):
+        self.assertEqual(self.resources.get_core_available("RENC"), 48)
+        self.assertEqual(self.resources.get_core_capacity("TACC"), 128)
+        self.assertEqual(self.resources.get_component_capacity("RENC", GPU), 4)
+        self.assertEqual(self.resources.get_component_available("RENC", GPU), 3)
+        self.assertEqual(self.resources.get_component_available("TACC", GPU), 2)
+        self.assertEqual(
+            list(self.resources.get_hosts_by_site("TACC")), ["tacc-w1", "tacc-w2"]
+        )
+        self.assertEqual(self.resources.get_host("renc-w2")["site"], "RENC")
+
+    def test_query_gpu_nodes(self):
+        # The TACC GPU host and the UCSD site are not active
+        self.assertEqual(
+            self.resources.query(cores=8, components={GPU: 1}, count=3),
+            {"RENC": ["renc-w2", "renc-w1"]},
+        )
+        self.assertEqual(
+            self.resources.query(cores=8, components={GPU: 1}, count=4), {}
+        )
+
+    def test_query_sorted_by_room(self):
+        result = self.resources.query(cores=16, ram=16)
+
+        self.assertEqual(list(result), ["TACC", "RENC"])
+        self.assertEqual(
+            self.resources.query(cores=16, sites=["RENC"]),
+            {"RENC": ["renc-w2", "renc-w1"]},
+        )
+        self.assertEqual(self.resources.query(components={"FPGA-Xilinx-U280": 1}), {})
+
+
+class TestRefreshSites(unittest.TestCase):
+    """Test refreshing the resources of some sites only."""
+
+    def setUp(self):
+        self.resources = make_resources(
+            [
+                summary_host("renc-w1", "RENC", cores=16, gpus=1),
+                summary_host("tacc-w1", "TACC", cores=64),
+                summary_host("ucsd-w1", "UCSD", cores=64, gpus=2),
+            ],
+            down=("UCSD",),
+        )
+        self.manager = self.resources.get_fablib_manager().get_manager()
+
+    def test_refresh_merges_sites(self):
+        fpga = summary_host("renc-w2", "RENC", cores=8)
+        fpga["components"]["FPGA-Xilinx-U280"] = {"capacity": 1, "allocated": 0}
+        self.manager.resources_summary.return_value = {
+            "sites": [
+                {"name": "RENC", "state": "Active"},
+                {"name": "UCSD", "state": "Active"},
+            ],
+            "hosts": [summary_host("renc-w1", "RENC", cores=4, gpus=0), fpga],
+        }
+        tacc = self.resources.get_site("TACC")
+        before = self.resources.get_fetched_at("TACC")
+
+        self.resources.refresh_sites(["RENC", "UCSD"])
+
+        self.assertEqual(
+            self.manager.resources_summary.call_args.kwargs["includes"],
+            ["RENC", "UCSD"],
+        )
+        self.assertEqual(self.resources.get_core_available("RENC"), 12)
+        self.assertEqual(self.resources.get_component_available("RENC", GPU), 0)
+        self.assertEqual(list(self.resources.get_hosts_by_site("UCSD")), [])
+        self.assertIs(self.resources.get_site("TACC"), tacc)
+        self.assertEqual(self.resources.get_fetched_at("TACC"), before)
+        self.assertGreaterEqual(self.resources.get_fetched_at("RENC"), before)
+        self.assertEqual(
+            self.resources.query(components={"FPGA-Xilinx-U280": 1}),
+            {"RENC": ["renc-w2"]},
+        )
+        self.assertEqual(self.resources.query(components={GPU: 1}), {})
+        self.assertEqual(list(self.resources.query(cores=32)), ["TACC"])
+
+    def test_readers_see_whole_states(self):
+        self.manager.resources_summary.return_value = {
+            "sites": [{"name": "RENC", "state": "Active"}],
+            "hosts": [summary_host("renc-w2", "RENC", cores=4)],
+        }
+        replace_sites = ResourceIndex.replace_sites
+        seen = []
+
+        def replace_and_read(index, hosts, sites, site_names=()):
+            # A reader running while the refresh builds the new state
+            seen.append(
+                (
+                    list(self.resources.get_hosts_by_site("RENC")),
+                    self.resources.get_core_available("RENC"),
+                    self.resources.query(cores=16, sites=["RENC"]),
+                )
+            )
+            return replace_sites(index, hosts, sites, site_names)
+
+        with patch.object(ResourceIndex, "replace_sites", replace_and_read):
+            self.resources.refresh_sites(["RENC"])
+
+        self.assertEqual(seen, [(["renc-w1"], 16, {"RENC": ["renc-w1"]})])
+        self.assertEqual(list(self.resources.get_hosts_by_site("RENC")), ["renc-w2"])
+        self.assertEqual(self.resources.get_core_available("RENC"), 4)
+        self.assertEqual(self.resources.query(cores=16, sites=["RENC"]), {})
+
+    def test_missing_sites_dropped_from_index(self):
+        self.manager.resources_summary.return_value = {
+            "sites": [{"name": "RENC", "state": "Active"}],
+            "hosts": [summary_host("renc-w1", "RENC", cores=16)],
+        }
+
+        self.resources.refresh_sites(["RENC", "TACC"])
+
+        self.assertEqual(self.resources.get_site_names(), ["RENC", "UCSD"])
+        self.assertEqual(self.resources.query(cores=4), {"RENC": ["renc-w1"]})
+        self.assertEqual(len(self.resources.get_index().site_hosts("TACC")), 0)
+
+    def test_update_waits_for_refresh(self):
+        summary = self.manager.resources_summary.return_value
+        refreshing = threading.Event()
+        release = threading.Event()
+        calls = []
+
+        def resources_summary(**kwargs):
+            calls.append(kwargs.get("includes"))
+            if kwargs.get("includes") == ["RENC"]:
+                refreshing.set()
+                release.wait(5)
+                return {
+                    "sites": [{"name": "RENC", "state": "Active"}],
+                    "hosts": [summary_host("renc-w1", "RENC", cores=4)],
+                }
+            return summary
+
+        self.manager.resources_summary.side_effect = resources_summary
+        refresh = threading.Thread(target=self.resources.refresh_sites, args=[["RENC"]])
+        refresh.start()
+        refreshing.wait(5)
+        update = threading.Thread(target=self.resources.update)
+        update.start()
+        update.join(0.2)
+
+        # The update fetches only after the refresh has been published
+        self.assertEqual(calls, [["RENC"]])
+        release.set()
+        refresh.join(5)
+        update.join(5)
+
+        self.assertEqual(calls, [["RENC"], None])
+        self.assertEqual(self.resources.get_core_available("RENC"), 16)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,116 @@
+"""
+Unit tests for the persistent resources_summary cache.
+"""
+
+import os
+import tempfile
+import time
+import unittest
+from datetime import datetime, timezone
+from unittest.mock import MagicMock
+
+from fabrictestbed.fabric_manager_v2 import FabricManagerV2
+
+from fabrictestbed_extensions.fablib.resources_cache import ResourcesSummaryCache
+from fabrictestbed_extensions.fablib.resources_v2 import ResourcesV2
+
+
+def _summary(cores):
+    return {
+        "sites": [{"name": "RENC", "state": "Active"}],
+        "hosts": [
+            {
+                "name": "renc-w1",
+                "site": "RENC",
+                "state": "Active",
+                "cores_available": cores,
+            }
+        ],
+    }
+
+
+class TestResourcesSummaryCache(unittest.TestCase):
+    """Test serving, revalidating and bypassing cached summaries."""
+
+    def setUp(self):
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmpdir.cleanup)
+        self.cache = ResourcesSummaryCache(
+            cache_dir=os.path.join(self.tmpdir.name, "rc"), max_age=300
+        )
+
+    def test_key_depends_on_parameters(self):
+        start = datetime(2026, 1, 1, tzinfo=timezone.utc)
+
+        self.assertEqual(
+            self.cache.key(level=2, includes=["RENC", "TACC"], start=start),
+            self.cache.key(level=2, includes=["TACC", "RENC"], start=start),
+        )
+        self.assertNotEqual(
+            self.cache.key(level=2, includes=["RENC"]),
+            self.cache.key(level=2, excludes=["RENC"]),
+        )
+
+    def test_fresh_entry_served_and_revalidated(self):
+        key = self.cache.key(level=2)
+        self.cache.put(key, _summary(8), fetched_at=time.time() - 60)
+        fetch = MagicMock(return_value=_summary(16))
+
+        summary, _ = self.cache.fetch(key, fetch)
+        self.cache.wait(timeout=5)
+
+        self.assertEqual(summary, _summary(8))
+        fetch.assert_called_once_with()
+        self.assertEqual(self.cache.get(key)[1], _summary(16))
+
+    def test_old_entry_and_max_age_zero_fetch_now(self):
+        key = self.cache.key(level=2)
+        self.cache.put(key, _summary(8), fetched_at=time.time() - 600)
+        fetch = MagicMock(side_effect=[_summary(16), _summary(32)])
+
+        self.assertEqual(self.cache.fetch(key, fetch)[0], _summary(16))
+        self.assertEqual(self.cache.fetch(key, fetch, max_age=0)[0], _summary(32))
+        self.assertEqual(self.cache.get(key)[1], _summary(32))
+
+    def test_malformed_entry_ignored(self):
+        key = self.cache.key(level=2)
+        self.cache.put(key, _summary(8))
+        fetch = MagicMock(return_value=_summary(16))
+
+        for content in ("[]", '{"fetched_at": "now", "summary": {}}', '{"summary": 1}'):
+            with open(self.cache._path(key), "w") as f:
+                f.write(content)
+            self.assertIsNone(self.cache.get(key))
+            summary, _ = self.cache.fetch(key, fetch)
+            self.assertEqual(summary, _summary(16))
+
+    def test_resources_served_from_cache(self):
+        manager = MagicMock(spec=FabricManagerV2)
+        manager.resources_summary.return_value = _summary(8)
+        fablib = MagicMock()
+        fablib.get_manager.return_value = manager
+        fablib.get_orchestrator_host.return_value = "orchestrator"
+        fablib.get_project_id.return_value = "project"
+        fablib.get_resources_cache.return_value = self.cache
+
+        first = ResourcesV2(fablib)
+        manager.resources_summary.return_value = _summary(16)
+        second = ResourcesV2(fablib)
+        self.cache.wait(timeout=5)
+
+        self.assertFalse(first.is_from_cache())
+        self.assertTrue(second.is_from_cache())
+        self.assertEqual(second.get_core_available("RENC"), 8)
+        self.assertTrue(second.is_from_cache("RENC"))
+
+        second.refresh_sites(["RENC"])
+        self.assertFalse(second.is_from_cache("RENC"))
+        self.assertEqual(second.get_core_available("RENC"), 16)
+
+        second.update(max_age=0)
+        self.assertFalse(second.is_from_cache())
+        self.assertEqual(second.get_core_available("RENC"), 16)
+
+
+if __name__ == "__main__":
+    unittest.main()
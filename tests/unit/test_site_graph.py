@@ -0,0 +1,143 @@
+"""
+Unit tests for the site adjacency graph and ERO path validation.
+"""
+
+import unittest
+from unittest.mock import MagicMock
+
+from fabrictestbed.fabric_manager_v2 import FabricManagerV2
+
+from fabrictestbed_extensions.fablib.resources_v2 import ResourcesV2
+from fabrictestbed_extensions.fablib.site_graph import SiteGraph
+
+# RENC - WASH - NEWY - STAR - TACC and a shortcut WASH - STAR, UCSD isolated
+LINKS = [
+    {"name": "l1", "sites": ["RENC", "WASH"], "bandwidth": 100},
+    {"name": "l2", "sites": ["WASH", "NEWY"], "bandwidth": 100},
+    {"name": "l3", "sites": ["NEWY", "STAR"], "bandwidth": 100},
+    {"name": "l4", "sites": ["STAR", "TACC"], "bandwidth": 100},
+    {"name": "l5", "sites": ["WASH", "STAR"], "bandwidth": 400},
+    {"name": "bad", "sites": "RENC"},
+]
+SITES = [{"name": s} for s in ("RENC", "WASH", "NEWY", "STAR", "TACC", "UCSD")]
+
+
+def _grid_links(size=7):
+    """Links of a size x size grid of sites G<row><column>."""
+    links = []
+    for r in range(size):
+        for c in range(size):
+            if c + 1 < size:
+                links.append(
+                    {"name": f"h{r}{c}", "sites": [f"G{r}{c}", f"G{r}{c + 1}"]}
+                )
+            if r + 1 < size:
+                links.append(
+                    {"name": f"v{r}{c}", "sites": [f"G{r}{c}", f"G{r + 1}{c}"]}
+                )
+    return links
+
+
+# A grid with a leaf site and a pocket of two sites only reachable via G33
+GRID_LINKS = _grid_links() + [
+    {"name": "leaf", "sites": ["G33", "LEAF"]},
+    {"name": "p1", "sites": ["G33", "A1"]},
+    {"name": "p2", "sites": ["G33", "A2"]},
+    {"name": "p3", "sites": ["A1", "A2"]},
+]
+
+
+class TestSiteGraph(unittest.TestCase):
+    """Test adjacency, distances and path search."""
+
+    def setUp(self):
+        self.graph = SiteGraph(LINKS, SITES)
+
+    def test_distances_and_reachability(self):
+        self.assertEqual(len(self.graph), 6)
+        self.assertEqual(sorted(self.graph.neighbors("WASH")), ["NEWY", "RENC", "STAR"])
+        self.assertEqual(self.graph.hop_distance("RENC", "TACC"), 3)
+        self.assertEqual(self.graph.hop_distance("renc", "NEWY"), 2)
+        self.assertFalse(self.graph.reachable("RENC", "UCSD"))
+        self.assertEqual(
+            [l["name"] for l in self.graph.links_between("STAR", "WASH")], ["l5"]
+        )
+
+    def test_find_path_through_hops(self):
+        self.assertEqual(
+            self.graph.find_path("RENC", "TACC"), ["RENC", "WASH", "STAR", "TACC"]
+        )
+        self.assertEqual(
+            self.graph.find_path("RENC", "TACC", hops=["newy"]),
+            ["RENC", "WASH", "NEWY", "STAR", "TACC"],
+        )
+        self.assertEqual(self.graph.find_path("RENC", "TACC", ["NEWY"], max_hops=3), [])
+        # Going back through WASH would loop
+        self.assertEqual(self.graph.find_path("NEWY", "STAR", hops=["RENC"]), [])
+        self.assertEqual(self.graph.find_path("RENC", "UCSD"), [])
+
+    def test_infeasible_hops_on_grid(self):
+        graph = SiteGraph(GRID_LINKS)
+
+        self.assertEqual(
+            len(graph.find_path("G00", "G66", hops=["G33"], max_steps=100)), 13
+        )
+        # A site with a single link can only be an end of the path
+        self.assertEqual(graph.find_path("G00", "G66", ["LEAF"], max_steps=1), [])
+        self.assertEqual(len(graph.find_path("G00", "LEAF", ["G66"])), 20)
+        # The pocket can only be left the way it was entered
+        self.assertIsNone(graph.find_path("G00", "G66", ["A1"], max_steps=500))
+
+
+class TestValidateEroPath(unittest.TestCase):
+    """Test ERO validation on ResourcesV2 without the FIM topology."""
+
+    def _resources(self, links):
+        manager = MagicMock(spec=FabricManagerV2)
+        manager.resources_summary.return_value = {
+            "sites": SITES,
+            "hosts": [],
+            "links": links,
+        }
+        fablib = MagicMock()
+        fablib.get_manager.return_value = manager
+        fablib.get_resources_cache.return_value = None
+        return ResourcesV2(fablib), manager
+
+    def test_validated_on_site_graph(self):
+        resources, manager = self._resources(LINKS)
+
+        resources.validate_requested_ero_path(source="RENC", end="TACC", hops=["NEWY"])
+        with self.assertRaisesRegex(Exception, "is invalid"):
+            resources.validate_requested_ero_path(
+                source="NEWY", end="STAR", hops=["RENC"]
+            )
+        with self.assertRaisesRegex(Exception, "Hop: MARS is not found"):
+            resources.validate_requested_ero_path(
+                source="RENC", end="TACC", hops=["MARS"]
+            )
+
+        manager.resources.assert_not_called()
+
+    def test_search_abandoned(self):
+        resources, manager = self._resources(GRID_LINKS)
+
+        with self.assertRaisesRegex(Exception, "is invalid"):
+            resources.validate_requested_ero_path(
+                source="G00", end="G66", hops=["LEAF"]
+            )
+        with self.assertRaisesRegex(Exception, "could not be validated"):
+            resources.validate_requested_ero_path(source="G00", end="G66", hops=["A1"])
+
+    def test_topology_loaded_without_links(self):
+        resources, manager = self._resources([])
+        manager.resources.side_effect = RuntimeError("topology requested")
+
+        with self.assertRaisesRegex(RuntimeError, "topology requested"):
+            resources.validate_requested_ero_path(
+                source="RENC", end="TACC", hops=["NEWY"]
+            )
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,133 @@
+"""
+Unit tests for choosing the sites of all nodes of a slice.
+"""
+
+import unittest
+from unittest.mock import MagicMock, patch
+
+from fabrictestbed_extensions.fablib.placement import PlacementRequest
+from fabrictestbed_extensions.fablib.site_selection import SiteSelector
+
+from .helpers.fablib import make_fablib
+from .helpers.nodes import make_node
+from .helpers.resources import GPU, make_resources, summary_host
+
+
+def _resources():
+    """RENC has the most room, UCSD the GPUs; UCSD-RENC has little bandwidth."""
+    return make_resources(
+        [
+            summary_host("renc-w1", "RENC", 64, ram=256, disk=1000),
+            summary_host("renc-w2", "RENC", 64, ram=256, disk=1000),
+            summary_host("tacc-w1", "TACC", 32, ram=256, disk=1000),
+            summary_host("ucsd-w1", "UCSD", 8, ram=256, disk=1000, gpus=2),
+        ],
+        links=[
+            {"name": "l1", "sites": ["UCSD", "TACC"], "bandwidth": 100},
+            {
+                "name": "l2",
+                "sites": ["UCSD", "RENC"],
+                "bandwidth": 100,
+                "allocated_bandwidth": 90,
+            },
+            {"name": "l3", "sites": ["RENC", "TACC"], "available_bandwidth": 40},
+        ],
+    )
+
+
+class TestSiteSelector(unittest.TestCase):
+    """Test feasibility, ranking and pruning."""
+
+    def setUp(self):
+        self.selector = SiteSelector(_resources())
+
+    def test_ranked_by_headroom(self):
+        result = self.selector.suggest([PlacementRequest("n1", cores=16)], count=5)
+
+        self.assertEqual(
+            [r["sites"]["n1"] for r in result], ["RENC", "TACC"]
+        )  # UCSD has only 8 cores
+        self.assertAlmostEqual(result[0]["score"], 112 / 128)
+        self.assertAlmostEqual(result[1]["score"], 0.5)
+
+    def test_components_and_link_bandwidth(self):
+        requests = [
+            PlacementRequest("gpu", cores=4, components={GPU: 1}),
+            PlacementRequest("cpu", cores=16),
+        ]
+
+        result = self.selector.suggest(
+            requests, networks=[(["gpu", "cpu"], 50)], count=5
+        )
+
+        # RENC has more room but only 10 Gbps to UCSD
+        self.assertEqual(result[0]["sites"], {"gpu": "UCSD", "cpu": "TACC"})
+        self.assertEqual(len(result), 1)
+        self.assertAlmostEqual(result[0]["score"], 0.5)
+
+        # A 5 Gbps network also fits the RENC link
+        result = self.selector.suggest(requests, networks=[(["gpu", "cpu"], 5)])
+        self.assertEqual(sorted(r["sites"]["cpu"] for r in result), ["RENC", "TACC"])
+
+    def test_fixed_and_same_site(self):
+        requests = [PlacementRequest(n, cores=20) for n in ("a", "b", "c")]
+
+        result = self.selector.suggest(
+            requests, fixed={"a": "TACC"}, same_site=[["b", "c"]], count=5
+        )
+
+        self.assertEqual(
+            [r["sites"] for r in result], [{"a": "TACC", "b": "RENC", "c": "RENC"}]
+        )
+        self.assertEqual(self.selector.suggest(requests, fixed={"a": "MARS"}), [])
+
+    def test_identical_nodes_searched_once(self):
+        requests = [PlacementRequest(f"n{i}", cores=4) for i in range(30)]
+        # Orderings of identical nodes are not searched again, so 30 nodes
+        # over 3 sites finish well within the step limit
+        selector = SiteSelector(_resources(), max_steps=2000)
+
+        with self.assertNoLogs("fablib", level="INFO"):
+            result = selector.suggest(requests)
+
+        self.assertEqual(len(result), 3)
+        best = list(result[0]["sites"].values())
+        self.assertLessEqual(best.count("TACC") * 4, 32)
+        self.assertLessEqual(best.count("UCSD") * 4, 8)
+
+
+class TestSuggestSites(unittest.TestCase):
+    """Test FablibManager.suggest_sites() on a draft slice."""
+
+    def setUp(self):
+        self.fablib = make_fablib()
+
+    def test_slice_networks_constrain_sites(self):
+        nodes = [
+            make_node("n1", "UCSD", 4, host="ucsd-w1"),
+            make_node("n2", "UCSD", 16),
+        ]
+        ifaces = []
+        for node in nodes:
+            iface = MagicMock()
+            iface.get_node.return_value = node
+            ifaces.append(iface)
+        net = MagicMock()
+        net.get_type.return_value = "L2PTP"
+        net.get_interfaces.return_value = ifaces
+        net.get_bandwidth.return_value = 20
+        slice = MagicMock()
+        slice.get_nodes.return_value = nodes
+        slice.get_network_services.return_value = [net]
+
+        with patch.object(self.fablib, "get_resources", return_value=_resources()):
+            result = self.fablib.suggest_sites(slice)
+
+        # n1 is pinned to its host; only TACC has the bandwidth to UCSD
+        self.assertEqual(result[0]["sites"], {"n1": "UCSD", "n2": "TACC"})
+        self.assertEqual(len(result), 1)
+        nodes[1].set_site.assert_not_called()
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,137 @@
+"""
+Unit tests for the bounded, optionally weak SliceCache.
+"""
+
+import gc
+import unittest
+
+from fabrictestbed_extensions.fablib.slice_cache import SliceCache, deep_sizeof
+
+from .helpers.fablib import make_fablib
+
+
+class FakeSlice:
+    """Minimal stand-in for Slice with the attributes the cache uses."""
+
+    def __init__(self, name, slice_id=None, manager=None, payload=None):
+        self.name = name
+        self.slice_id = slice_id
+        self.manager = manager
+        self.payload = payload or []
+
+    def get_name(self):
+        return self.name
+
+    def get_slice_id(self):
+        return self.slice_id
+
+    def get_fablib_manager(self):
+        return self.manager
+
+
+class TestSliceCache(unittest.TestCase):
+    """Test lookup, LRU eviction, weak references and memory accounting."""
+
+    def test_lookup_by_name_and_id(self):
+        cache = SliceCache()
+        slice_a = FakeSlice("a", "id-a")
+        cache.put(slice_a)
+
+        self.assertIs(cache.get(slice_name="a"), slice_a)
+        self.assertIs(cache.get(slice_id="id-a"), slice_a)
+        self.assertIsNone(cache.get(slice_name="b"))
+
+    def test_replace_same_name_drops_old_id(self):
+        cache = SliceCache()
+        cache.put(FakeSlice("a", "id-old"))
+        new = FakeSlice("a", "id-new")
+        cache.put(new)
+
+        self.assertIsNone(cache.get(slice_id="id-old"))
+        self.assertIs(cache.get(slice_id="id-new"), new)
+        self.assertEqual(len(cache), 1)
+
+    def test_update_id_after_submit(self):
+        cache = SliceCache()
+        slice_a = FakeSlice("a")
+        cache.put(slice_a)
+
+        slice_a.slice_id = "id-a"
+        cache.update_id(slice_a)
+
+        self.assertIs(cache.get(slice_id="id-a"), slice_a)
+
+    def test_remove(self):
+        cache = SliceCache()
+        slice_a = FakeSlice("a", "id-a")
+        cache.put(slice_a)
+
+        cache.remove(slice_a)
+
+        self.assertIsNone(cache.get(slice_name="a"))
+        self.assertIsNone(cache.get(slice_id="id-a"))
+
+    def test_lru_eviction(self):
+        cache = SliceCache(max_size=2)
+        cache.put(FakeSlice("a", "id-a"))
+        cache.put(FakeSlice("b", "id-b"))
+        # Touch "a" so "b" becomes least recently used
+        cache.get(slice_name="a")
+        cache.put(FakeSlice("c", "id-c"))
+
+        self.assertIsNotNone(cache.get(slice_name="a"))
+        self.assertIsNone(cache.get(slice_name="b"))
+        self.assertIsNone(cache.get(slice_id="id-b"))
+        self.assertIsNotNone(cache.get(slice_name="c"))
+        self.assertEqual(len(cache), 2)
+
+    def test_invalid_max_size(self):
+        with self.assertRaises(ValueError):
+            SliceCache(max_size=0)
+
+    def test_weak_references(self):
+        cache = SliceCache(weak=True)
+        kept = FakeSlice("kept", "id-kept")
+        cache.put(kept)
+        cache.put(FakeSlice("dropped", "id-dropped"))
+        gc.collect()
+
+        self.assertIs(cache.get(slice_name="kept"), kept)
+        self.assertIsNone(cache.get(slice_id="id-dropped"))
+        self.assertEqual(len(cache), 1)
+
+    def test_memory_usage_excludes_manager(self):
+        manager = FakeSlice("manager", payload=["x" * 100000])
+        cache = SliceCache()
+        cache.put(FakeSlice("small", manager=manager))
+        cache.put(FakeSlice("large", manager=manager, payload=["y" * 50000]))
+
+        usage = cache.memory_usage()
+
+        self.assertLess(usage["small"], 10000)
+        self.assertGreater(usage["large"], 50000)
+        self.assertLess(usage["large"], 100000)
+
+    def test_deep_sizeof_handles_cycles(self):
+        parent = FakeSlice("parent")
+        child = FakeSlice("child", payload=[parent])
+        parent.payload.append(child)
+
+        self.assertGreater(deep_sizeof(parent), 0)
+
+
+class TestFablibManagerSliceCache(unittest.TestCase):
+    """Test that FablibManager sizes its slice cache from its arguments."""
+
+    def test_bounded_cache(self):
+        fablib = make_fablib(slice_cache_size=1)
+        fablib.cache_slice(FakeSlice("a", "id-a"))
+        fablib.cache_slice(FakeSlice("b", "id-b"))
+
+        self.assertIsNone(fablib._get_slice_from_cache(slice_name="a"))
+        self.assertIsNotNone(fablib._get_slice_from_cache(slice_id="id-b"))
+        self.assertEqual(fablib.get_slice_cache().max_size, 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
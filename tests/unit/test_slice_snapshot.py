@@ -0,0 +1,188 @@
+"""
+Concurrency tests for Slice topology snapshots.
+
+Readers iterate a slice's nodes, interfaces and networks while writers
+repeatedly call ``Slice.update()`` with topologies of different sizes.
+Readers must never fail or observe a partially updated slice.
+"""
+
+import gc
+import threading
+import unittest
+from unittest.mock import patch
+
+from fabrictestbed.slice_editor import ExperimentTopology
+from fim.graph.networkx_property_graph import NetworkXGraphStorage
+
+from fabrictestbed_extensions.fablib.slice import Slice
+
+from .helpers.fablib import OfflineFablibTestCase, make_slice_dto
+from .helpers.topology import make_model
+
+
+class TestSliceSnapshots(OfflineFablibTestCase):
+    """Test concurrent readers and writers on one Slice object."""
+
+    SIZES = (2, 4)
+
+    def setUp(self):
+        super().setUp()
+        self.models = {size: make_model(size) for size in self.SIZES}
+        self.sm_slice = make_slice_dto(0, model=self.models[2])
+        self.mock_manager.list_slices.side_effect = lambda **kwargs: [self.sm_slice]
+
+        self.slice = Slice.get_slice(self.fablib, sm_slice=self.sm_slice)
+
+    def test_update_publishes_new_topology(self):
+        node0 = self.slice.get_node("node0")
+
+        self.sm_slice.model = self.models[4]
+        self.slice.update()
+
+        self.assertEqual(len(self.slice.get_nodes()), 4)
+        self.assertEqual(len(self.slice.get_interfaces()), 4)
+        # Existing node objects are reused (issue #380)
+        self.assertIs(self.slice.get_node("node0"), node0)
+
+        self.sm_slice.model = self.models[2]
+        self.slice.update()
+
+        self.assertEqual(
+            sorted(n.get_name() for n in self.slice.get_nodes()), ["node0", "node1"]
+        )
+        self.assertEqual(len(self.slice.get_interfaces(output="dict")), 2)
+
+    def test_objects_unchanged_until_published(self):
+        node0 = self.slice.get_node("node0")
+        fim_node = node0.get_fim()
+        components = [c.get_name() for c in node0.get_components()]
+        interfaces = [i.get_name() for i in self.slice.get_interfaces()]
+        build = self.slice._Slice__build_network_services
+        seen = []
+
+        def read_during_update(*args):
+            # Runs after nodes were rebuilt, before the snapshot is published
+            node = self.slice.get_node("node0")
+            seen.append(
+                (
+                    node.get_fim() is fim_node,
+                    [c.get_name() for c in node.get_components()],
+                    [i.get_name() for i in node.get_interfaces()],
+                    [i.get_name() for i in self.slice.get_interfaces()],
+                )
+            )
+            return build(*args)
+
+        self.sm_slice.model = make_model(2, nic_name="eth")
+        with patch.object(
+            self.slice,
+            "_Slice__build_network_services",
+            side_effect=read_during_update,
+        ):
+            self.slice.update()
+
+        self.assertEqual(seen, [(True, components, interfaces[:1], interfaces)])
+        self.assertIs(self.slice.get_node("node0"), node0)
+        self.assertIsNot(node0.get_fim(), fim_node)
+        self.assertEqual([c.get_name() for c in node0.get_components()], ["eth0"])
+        self.assertEqual(
+            sorted(self.slice.get_interfaces(output="dict")), ["eth0-p1", "eth1-p1"]
+        )
+
+    def test_replaced_graphs_deleted(self):
+        storage = NetworkXGraphStorage().storage_instance
+
+        def graph_ids():
+            return {data.get("GraphID") for _, data in storage.graphs.nodes(data=True)}
+
+        for _ in range(3):
+            self.slice.update()
+        gc.collect()
+        self.slice.update()
+        before = graph_ids()
+        for _ in range(5):
+            self.slice.update()
+        gc.collect()
+        self.slice.update()
+
+        # Only the current graph and the one it replaced are kept
+        self.assertLessEqual(len(graph_ids()), len(before))
+        self.assertIn(self.slice.get_fim_topology().graph_model.graph_id, graph_ids())
+
+    def test_assignment_publishes_new_snapshot(self):
+        snapshot = self.slice._snapshot
+        topology = snapshot.topology
+
+        self.slice.topology = ExperimentTopology()
+        self.slice.nodes = {}
+
+        self.assertIs(snapshot.topology, topology)
+        self.assertEqual(len(snapshot.nodes), 2)
+        self.assertIsNot(self.slice.topology, topology)
+        self.assertEqual(self.slice.nodes, {})
+
+    def _run_readers_and_writers(self, sizes):
+        stop = threading.Event()
+        errors = []
+        reads = []
+
+        def reader():
+            count = 0
+            try:
+                while not stop.is_set():
+                    nodes = self.slice.get_nodes()
+                    self.assertIn(len(nodes), sizes)
+                    for node in nodes:
+                        self.assertEqual(len(node.get_interfaces()), 1)
+
+                    interfaces = self.slice.get_interfaces(output="dict")
+                    self.assertIn(len(interfaces), sizes)
+                    for name, interface in interfaces.items():
+                        self.assertEqual(interface.get_name(), name)
+
+                    networks = self.slice.get_network_services()
+                    self.assertEqual([n.get_name() for n in networks], ["net"])
+
+                    topology = self.slice.get_fim_topology()
+                    self.assertIn(len(topology.nodes), sizes)
+                    count += 1
+            except Exception as e:
+                errors.append(e)
+            finally:
+                reads.append(count)
+
+        def writer(index):
+            try:
+                for i in range(15):
+                    size = sizes[(i + index) % len(sizes)]
+                    self.sm_slice.model = self.models[size]
+                    self.slice.update()
+            except Exception as e:
+                errors.append(e)
+
+        readers = [threading.Thread(target=reader) for _ in range(8)]
+        writers = [threading.Thread(target=writer, args=(i,)) for i in range(2)]
+        for t in readers + writers:
+            t.start()
+        for t in writers:
+            t.join(120)
+        stop.set()
+        for t in readers:
+            t.join(30)
+
+        self.assertEqual(errors, [])
+        self.assertTrue(all(count > 0 for count in reads))
+
+    def test_concurrent_readers_and_writers(self):
+        self._run_readers_and_writers(self.SIZES)
+
+    def test_concurrent_readers_and_same_graph_updates(self):
+        # Slice.update() normally reloads a model with the slice's graph ID
+        self.sm_slice.model = self.models[4]
+        self.slice.update()
+
+        self._run_readers_and_writers((4,))
+
+
+if __name__ == "__main__":
+    unittest.main()
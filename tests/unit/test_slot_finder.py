@@ -0,0 +1,148 @@
+"""
+Unit tests for the local resource slot finder.
+"""
+
+import datetime
+import unittest
+from unittest.mock import MagicMock, patch
+
+from fabrictestbed_extensions.fablib.slot_finder import SlotFinder
+
+from .helpers.calendar import START, hourly_calendar
+from .helpers.fablib import make_fablib
+
+
+def _compute(site, cores=2, ram=8, disk=10, components=None):
+    r = {"type": "compute", "site": site, "cores": cores, "ram": ram, "disk": disk}
+    if components:
+        r["components"] = components
+    return r
+
+
+class TestSlotFinder(unittest.TestCase):
+    """Test sliding-window feasibility over a calendar."""
+
+    def test_window_must_avoid_busy_hours(self):
+        finder = SlotFinder(hourly_calendar(hours=12, renc_cores={3: 4, 4: 4}))
+
+        result = finder.find_resource_slot(
+            duration=4, resources=[_compute("RENC", cores=32)], max_results=2
+        )
+
+        # Windows starting at hours 0..8; those covering hours 3-4 fail
+        self.assertEqual(result["total"], 4)
+        self.assertEqual(
+            [s["start"] for s in result["slots"]],
+            [(START + datetime.timedelta(hours=h)).isoformat() for h in (5, 6)],
+        )
+        self.assertEqual(
+            result["slots"][0]["end"], (START + datetime.timedelta(hours=9)).isoformat()
+        )
+
+    def test_requirements_combined(self):
+        finder = SlotFinder(hourly_calendar(hours=6, link_bandwidth={0: 10}))
+        resources = [
+            _compute("RENC", components={"GPU-Tesla T4": 2}),
+            _compute("TACC", cores=8),
+            _compute("TACC", cores=8),
+            {"type": "link", "site_a": "RENC", "site_b": "TACC", "bandwidth": 25},
+        ]
+
+        result = finder.find_resource_slot(duration=2, resources=resources)
+        self.assertEqual(result["total"], 4)
+        self.assertEqual(
+            result["slots"][0]["start"],
+            (START + datetime.timedelta(hours=1)).isoformat(),
+        )
+
+        resources[1]["cores"] = 9
+        self.assertEqual(
+            finder.find_resource_slot(duration=2, resources=resources)["total"], 0
+        )
+        self.assertEqual(
+            finder.find_resource_slot(
+                duration=1, resources=[_compute("RENC", components={"GPU-A40": 1})]
+            )["total"],
+            0,
+        )
+
+    def test_search_window_and_many_queries(self):
+        finder = SlotFinder(hourly_calendar(hours=24 * 7))
+        begin = START + datetime.timedelta(hours=30)
+
+        result = finder.find_resource_slot(
+            duration=6,
+            resources=[_compute("RENC")],
+            start=begin,
+            end=begin + datetime.timedelta(hours=8),
+            max_results=5,
+        )
+        self.assertEqual(result["total"], 3)
+        self.assertEqual(result["slots"][0]["start"], begin.isoformat())
+
+        queries = [
+            [_compute("RENC", cores=c, components={"GPU-Tesla T4": 1})]
+            for c in range(1, 301)
+        ]
+        totals = [
+            finder.find_resource_slot(duration=d % 24 + 1, resources=q)["total"]
+            for d, q in enumerate(queries)
+        ]
+        self.assertEqual(totals[63], 168 - (63 % 24))
+        self.assertEqual(totals[64], 0)
+
+    def test_slots_without_times(self):
+        data = hourly_calendar(hours=8)
+        del data["data"][2]["start"]
+        del data["data"][5]["end"]
+        finder = SlotFinder(data)
+
+        self.assertEqual(len(finder), 7)
+        result = finder.find_resource_slot(
+            duration=2, resources=[_compute("RENC")], max_results=10
+        )
+        # Windows across the missing hour 2 are skipped
+        self.assertEqual(
+            [s["start"] for s in result["slots"]],
+            [
+                (START + datetime.timedelta(hours=h)).isoformat()
+                for h in (0, 3, 4, 5, 6)
+            ],
+        )
+
+
+class TestGetSlotFinder(unittest.TestCase):
+    """Test fetching the calendar once and confirming with the server."""
+
+    def setUp(self):
+        self.fablib = make_fablib()
+
+    def test_calendar_fetched_once_and_slot_confirmed(self):
+        manager = MagicMock()
+        manager.resources_calendar.return_value = hourly_calendar(hours=24)
+        manager.find_resource_slot.return_value = {"slots": [{"start": "x"}]}
+        resources = [_compute("TACC", cores=4)]
+
+        with patch.object(self.fablib, "get_manager", return_value=manager):
+            finder = self.fablib.get_slot_finder(
+                start=START, end=START + datetime.timedelta(days=1)
+            )
+            for duration in (1, 2, 4, 8):
+                slot = finder.find_resource_slot(duration=duration, resources=resources)
+            confirmed = finder.confirm(
+                self.fablib, slot["slots"][0], duration=8, resources=resources
+            )
+
+        manager.resources_calendar.assert_called_once()
+        self.assertEqual(
+            manager.resources_calendar.call_args.kwargs["interval"], "hour"
+        )
+        self.assertTrue(confirmed)
+        kwargs = manager.find_resource_slot.call_args.kwargs
+        self.assertEqual(kwargs["start"], START)
+        self.assertEqual(kwargs["end"], START + datetime.timedelta(hours=8))
+        self.assertEqual(kwargs["duration"], 8)
+
+
+if __name__ == "__main__":
+    unittest.main()
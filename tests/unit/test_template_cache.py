@@ -0,0 +1,74 @@
+"""
+Unit tests for compiled template and slice template context caching.
+"""
+
+import unittest
+from unittest.mock import patch
+
+from fabrictestbed_extensions.fablib.slice import Slice
+from fabrictestbed_extensions.fablib.template_mixin import _compile_template
+
+from .helpers.fablib import OfflineFablibTestCase, make_slice_dto
+from .helpers.topology import make_model
+
+
+class TestTemplateCache(OfflineFablibTestCase):
+    """Test that templates and contexts are reused until the slice changes."""
+
+    def setUp(self):
+        super().setUp()
+        self.sm_slice = make_slice_dto(0, model=make_model(2))
+        self.mock_manager.list_slices.side_effect = lambda **kwargs: [self.sm_slice]
+
+        self.slice = Slice.get_slice(self.fablib, sm_slice=self.sm_slice)
+
+    def test_template_compiled_once(self):
+        node = self.slice.get_node("node0")
+        _compile_template.cache_clear()
+
+        node.render_template("{{ _self_.name }}")
+        node.render_template("{{ _self_.name }}")
+
+        info = _compile_template.cache_info()
+        self.assertEqual((info.misses, info.hits), (1, 1))
+
+    def test_context_reused_until_update(self):
+        node0 = self.slice.get_node("node0")
+        node1 = self.slice.get_node("node1")
+
+        with patch.object(
+            self.slice,
+            "_build_template_context",
+            wraps=self.slice._build_template_context,
+        ) as build:
+            self.assertEqual(node0.render_template("{{ _self_.name }}"), "node0")
+            self.assertEqual(node1.render_template("{{ _self_.name }}"), "node1")
+            self.assertEqual(build.call_count, 1)
+
+            self.sm_slice.model = make_model(3)
+            self.slice.update()
+            template = "{{ nodes | length }} {{ interfaces | length }}"
+            self.assertEqual(node0.render_template(template), "3 3")
+            self.assertEqual(build.call_count, 2)
+
+    def test_context_dropped_when_object_invalidated(self):
+        node0 = self.slice.get_node("node0")
+        node0.render_template("{{ _self_.name }}")
+        self.assertIsNotNone(self.slice._template_contexts)
+
+        self.slice.get_interfaces()[0]._invalidate_cache()
+
+        self.assertIsNone(self.slice._template_contexts)
+
+    def test_render_node_templates(self):
+        rendered = self.slice.render_node_templates(
+            "{{ _self_.name }}@{{ _self_.site }} of {{ nodes | length }}"
+        )
+
+        self.assertEqual(
+            rendered, {"node0": "node0@RENC of 2", "node1": "node1@RENC of 2"}
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
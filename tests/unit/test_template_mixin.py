@@ -5,6 +5,7 @@ import unittest
 from unittest.mock import MagicMock, PropertyMock
 
 from fabrictestbed_extensions.fablib.template_mixin import TemplateMixin
+from fabrictestbed_extensions.fablib.user_data_cache import UserDataCache
 
 
 class ConcreteTemplate(TemplateMixin):
@@ -187,6 +188,11 @@ class TestTemplateMixinUserData(unittest.TestCase):
     def test_set_user_data(self):
         obj = ConcreteTemplate()
         obj.set_user_data({"key": "val"})
+        # Written into the FIM element only when flushed
+        obj._fim.set_property.assert_not_called()
+        self.assertEqual(obj.get_user_data(), {"key": "val"})
+
+        UserDataCache.for_element(obj._fim).flush()
         obj._fim.set_property.assert_called_once()
 
     def test_get_user_data_empty(self):
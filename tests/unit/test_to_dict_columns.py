@@ -0,0 +1,183 @@
+"""
+Unit tests for column-projected, cached toDict().
+"""
+
+import unittest
+from concurrent.futures import ThreadPoolExecutor
+from unittest.mock import MagicMock, patch
+
+from fabrictestbed.slice_editor import (
+    Capacities,
+    ComponentType,
+    ExperimentTopology,
+    ServiceType,
+)
+
+from fabrictestbed_extensions.fablib.component import Component
+from fabrictestbed_extensions.fablib.interface import Interface
+from fabrictestbed_extensions.fablib.network_service import NetworkService
+from fabrictestbed_extensions.fablib.node import Node
+from fabrictestbed_extensions.fablib.slice import Slice
+
+
+class TestToDictColumns(unittest.TestCase):
+    """Test that toDict() computes only requested columns, once."""
+
+    def setUp(self):
+        topology = ExperimentTopology()
+        fim_node = topology.add_node(name="node1", site="RENC")
+        fim_node.set_properties(
+            capacities=Capacities(core=2, ram=8, disk=10),
+            image_type="qcow2",
+            image_ref="default_rocky_9",
+        )
+        fim_nic = fim_node.add_component(
+            ctype=ComponentType.SharedNIC, model="ConnectX-6", name="nic1"
+        )
+        fim_net = topology.add_network_service(
+            name="net1",
+            nstype=ServiceType.L2Bridge,
+            interfaces=fim_nic.interface_list,
+        )
+
+        self.node = Node(slice=MagicMock(), node=fim_node)
+        self.component = Component(node=self.node, fim_component=fim_nic)
+        self.interface = Interface(
+            component=self.component, fim_interface=fim_nic.interface_list[0]
+        )
+        self.network = NetworkService(slice=None, fim_network_service=fim_net)
+
+    def test_only_requested_columns_computed(self):
+        with patch.object(Node, "get_image", return_value="img") as get_image:
+            d = self.node.toDict(fields=["name", "site"])
+            get_image.assert_not_called()
+
+            self.assertEqual(d, {"name": "node1", "site": "RENC"})
+            self.assertEqual(self.node.toDict()["image"], "img")
+            get_image.assert_called_once()
+
+    def test_columns_cached_until_invalidated(self):
+        with patch.object(Node, "get_cores", return_value=2) as get_cores:
+            self.node.toDict(fields=["cores"])
+            self.node.toDict()
+            self.node.toDict(skip=["name"])
+            self.assertEqual(get_cores.call_count, 1)
+
+            self.node._invalidate_cache()
+            self.node.toDict(fields=["cores"])
+            self.assertEqual(get_cores.call_count, 2)
+
+    def test_none_values_cached(self):
+        column = MagicMock(return_value=None)
+        with patch.dict(Node._dict_columns, {"image": column}):
+            self.assertIsNone(self.node.toDict(fields=["image"])["image"])
+            self.assertIsNone(self.node.toDict()["image"])
+        column.assert_called_once_with(self.node)
+
+    def test_full_dict_keeps_column_order(self):
+        self.assertEqual(list(self.node.toDict()), list(Node._dict_columns))
+        self.assertEqual(
+            list(self.interface.toDict(skip=["mac"])),
+            [c for c in Interface._dict_columns if c != "mac"],
+        )
+        self.assertEqual(
+            self.component.toDict(fields=["model"]), {"model": "NIC_Basic"}
+        )
+        self.assertEqual(self.network.toDict(fields=["name"]), {"name": "net1"})
+
+    def test_inactive_interface_skips_ssh_columns(self):
+        with patch.object(Interface, "get_device_name") as get_device_name:
+            d = self.interface.toDict(fields=["dev", "ip_addr"])
+
+        get_device_name.assert_not_called()
+        self.assertEqual(d, {"dev": "", "ip_addr": ""})
+
+
+class TestInterfaceDiscovery(unittest.TestCase):
+    """Test resolving interfaces with one ip addr list per node."""
+
+    ADDRS = [
+        {"ifname": "lo", "address": "00:00:00:00:00:00", "addr_info": []},
+        {
+            "ifname": "ens7",
+            "address": "0a:0b:0c:0d:0e:0f",
+            "addr_info": [{"local": "10.0.0.2"}],
+        },
+    ]
+
+    def setUp(self):
+        topology = ExperimentTopology()
+        fim_node = topology.add_node(name="node1", site="RENC")
+        fim_nic = fim_node.add_component(
+            ctype=ComponentType.SharedNIC, model="ConnectX-6", name="nic1"
+        )
+        self.node = Node(slice=MagicMock(), node=fim_node)
+        component = Component(node=self.node, fim_component=fim_nic)
+        self.interface = Interface(
+            component=component,
+            fim_interface=fim_nic.interface_list[0],
+        )
+
+    def test_discover_from_one_listing(self):
+        with (
+            patch.object(Node, "ip_addr_list", return_value=self.ADDRS) as ip_addr_list,
+            patch.object(Interface, "get_mac", return_value="0A:0B:0C:0D:0E:0F"),
+            patch.object(Node, "get_reservation_state", return_value="Active"),
+            patch.object(Node, "execute") as execute,
+        ):
+            self.node.discover_interfaces([self.interface])
+            d = self.interface.toDict(fields=["physical_dev", "dev", "ip_addr"])
+
+        ip_addr_list.assert_called_once_with(output="json", update=True)
+        execute.assert_not_called()
+        self.assertEqual(
+            d, {"physical_dev": "ens7", "dev": "ens7", "ip_addr": "10.0.0.2"}
+        )
+
+    def test_slice_discovers_once_per_node(self):
+        nodes = [MagicMock(spec=Node), MagicMock(spec=Node), MagicMock(spec=Node)]
+        for node in nodes:
+            node.get_reservation_state.return_value = "Active"
+        nodes[2].get_reservation_state.return_value = "Ticketed"
+        interfaces = [MagicMock(spec=Interface) for _ in range(4)]
+        for iface, node in zip(interfaces, [nodes[0], nodes[0], nodes[1], nodes[2]]):
+            iface.get_node.return_value = node
+
+        fablib = MagicMock()
+        executor = ThreadPoolExecutor(2)
+        self.addCleanup(executor.shutdown)
+        fablib.get_ssh_thread_pool_executor.return_value = executor
+        slice_object = Slice(fablib_manager=fablib, name="slice")
+
+        slice_object._discover_interfaces(interfaces)
+
+        nodes[0].discover_interfaces.assert_called_once_with(interfaces[:2])
+        nodes[1].discover_interfaces.assert_called_once_with(interfaces[2:3])
+        nodes[2].discover_interfaces.assert_not_called()
+
+
+class TestListColumns(unittest.TestCase):
+    """Test mapping of list_* fields to toDict() columns."""
+
+    def test_pretty_names_mapped(self):
+        pretty = Node.get_pretty_name_dict()
+
+        columns = Slice._list_columns(
+            Node, ["Site", "state"], "text", None, pretty, required=("name",)
+        )
+
+        self.assertEqual(columns, ["site", "state", "name"])
+
+    def test_all_columns_when_needed(self):
+        pretty = Node.get_pretty_name_dict()
+
+        self.assertIsNone(Slice._list_columns(Node, ["site"], "json", None, pretty))
+        self.assertIsNone(
+            Slice._list_columns(Node, ["site"], "text", lambda row: True, pretty)
+        )
+        self.assertIsNone(Slice._list_columns(Node, ["unknown"], "text", None, {}))
+        self.assertIsNone(Slice._list_columns(Node, None, "text", None, {}))
+
+
+if __name__ == "__main__":
+    unittest.main()
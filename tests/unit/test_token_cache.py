@@ -0,0 +1,158 @@
+"""
+Unit tests for the persistent TokenInfoCache.
+"""
+
+import os
+import tempfile
+import time
+import unittest
+from unittest.mock import MagicMock, patch
+
+from fabrictestbed.external_api.credmgr_client import CredmgrClient, DecodedTokenDTO
+
+from fabrictestbed_extensions.fablib.coalescing_manager import CoalescingFabricManager
+from fabrictestbed_extensions.fablib.token_cache import TokenInfoCache
+
+from .helpers.fablib import make_fablib
+
+TOKEN = "header.payload.signature"
+
+
+def _decoded(exp=None):
+    exp = exp if exp is not None else int(time.time()) + 3600
+    return {
+        "token": {
+            "uuid": "user-1",
+            "email": "user@example.org",
+            "exp": exp,
+            "projects": [
+                {
+                    "uuid": "project-1",
+                    "name": "Project One",
+                    "tags": ["Component.GPU"],
+                    "memberships": {"is_token_holder": True},
+                }
+            ],
+        }
+    }
+
+
+class TestTokenInfoCache(unittest.TestCase):
+    """Test storing, expiring and validating through the cache."""
+
+    def setUp(self):
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmpdir.cleanup)
+        self.cache = TokenInfoCache(cache_dir=os.path.join(self.tmpdir.name, "tc"))
+
+    def test_round_trip_and_merge(self):
+        self.cache.put(TOKEN, expires_at=time.time() + 60, bastion_login="user_0001")
+        self.cache.put(TOKEN, project="p")
+
+        self.assertEqual(
+            self.cache.get(TOKEN), {"bastion_login": "user_0001", "project": "p"}
+        )
+
+    def test_token_not_written(self):
+        self.cache.put(TOKEN, expires_at=time.time() + 60, bastion_login="user_0001")
+
+        for name in os.listdir(self.cache.cache_dir):
+            self.assertNotIn(TOKEN, name)
+            with open(os.path.join(self.cache.cache_dir, name)) as f:
+                self.assertNotIn(TOKEN, f.read())
+
+    def test_put_without_expiry_ignored(self):
+        self.cache.put(TOKEN, bastion_login="user_0001")
+
+        self.assertEqual(self.cache.get(TOKEN), {})
+
+    def test_expired_entry_removed(self):
+        self.cache.put(TOKEN, expires_at=time.time() + 60, bastion_login="user_0001")
+
+        with patch("time.time", return_value=time.time() + 120):
+            self.assertEqual(self.cache.get(TOKEN), {})
+        self.assertFalse(os.path.exists(self.cache._path(TOKEN)))
+
+    def test_validate_decodes_once(self):
+        validate = MagicMock(return_value=_decoded())
+
+        first = self.cache.validate(validate, id_token=TOKEN, return_fmt="dict")
+        second = self.cache.validate(validate, id_token=TOKEN, return_fmt="dto")
+
+        validate.assert_called_once_with(id_token=TOKEN, return_fmt="dict")
+        self.assertEqual(first, _decoded(exp=first["token"]["exp"]))
+        self.assertIsInstance(second, DecodedTokenDTO)
+
+    def test_validate_expired_token_not_cached(self):
+        validate = MagicMock(return_value=_decoded(exp=int(time.time()) - 10))
+
+        self.cache.validate(validate, id_token=TOKEN)
+        self.cache.validate(validate, id_token=TOKEN)
+
+        self.assertEqual(validate.call_count, 2)
+
+
+class TestManagerUsesTokenCache(unittest.TestCase):
+    """Test that a new manager with a cached token skips the credential manager."""
+
+    def _make_manager(self, cache):
+        return CoalescingFabricManager(
+            credmgr_host="cm.example.org",
+            orchestrator_host="orch.example.org",
+            core_api_host="core.example.org",
+            id_token=TOKEN,
+            auto_refresh=False,
+            no_write=True,
+            token_cache=cache,
+        )
+
+    def test_project_info_served_from_cache(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            cache = TokenInfoCache(cache_dir=tmpdir)
+            with patch.object(
+                CredmgrClient, "validate", return_value=_decoded()
+            ) as validate:
+                first = self._make_manager(cache)
+                second = self._make_manager(cache)
+
+            validate.assert_called_once()
+            for manager in (first, second):
+                self.assertEqual(manager.get_project_id(), "project-1")
+                self.assertEqual(manager.get_project_name(), "Project One")
+                self.assertEqual(manager.get_user_id(), "user-1")
+
+
+class TestBastionUsernameCache(unittest.TestCase):
+    """Test that the bastion username is looked up once per token."""
+
+    def _make_fablib(self, data_dir):
+        fablib = make_fablib(data_dir=data_dir, token_cache=True)
+        fablib.set_bastion_username(bastion_username=None)
+        fablib.manager = MagicMock()
+        fablib.manager.get_id_token.return_value = TOKEN
+        fablib.manager.get_user_info.return_value = {"bastion_login": "user_0001"}
+        return fablib
+
+    def test_bastion_username_cached(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            first = self._make_fablib(tmpdir)
+            # The entry is created when the token is decoded
+            first._token_cache.put(TOKEN, expires_at=time.time() + 60)
+            first.determine_bastion_username()
+
+            second = self._make_fablib(tmpdir)
+            second.determine_bastion_username()
+
+            first.manager.get_user_info.assert_called_once()
+            second.manager.get_user_info.assert_not_called()
+            self.assertEqual(second.get_bastion_username(), "user_0001")
+
+    def test_cache_disabled_by_default(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            fablib = make_fablib(data_dir=tmpdir)
+            self.assertIsNone(fablib._token_cache)
+            self.assertFalse(os.path.exists(os.path.join(tmpdir, "token_cache")))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,168 @@
+"""
+Unit tests for the persistent slice TopologyCache.
+"""
+
+import json
+import os
+import tempfile
+import time
+import unittest
+from unittest.mock import MagicMock, patch
+
+from fabrictestbed.external_api.orchestrator_client import SliceDTO, SliverDTO
+
+from fabrictestbed_extensions.fablib.slice import Slice
+from fabrictestbed_extensions.fablib.topology_cache import TopologyCache
+
+MODEL = "<graphml>model</graphml>"
+
+
+def _make_slice_dto(state="StableOK", lease_end="2025-07-02 00:00:00 +0000"):
+    return SliceDTO(
+        slice_id="slice-1",
+        name="test-slice",
+        state=state,
+        lease_start_time="2025-07-01 00:00:00 +0000",
+        lease_end_time=lease_end,
+        graph_id="graph-1",
+    )
+
+
+def _make_sliver_dto(sliver_id):
+    return SliverDTO.from_dict(
+        {
+            "sliver_id": sliver_id,
+            "slice_id": "slice-1",
+            "state": "Active",
+            "sliver": {"Name": f"node-{sliver_id}", "Site": "RENC"},
+        }
+    )
+
+
+class TestTopologyCache(unittest.TestCase):
+    """Test storing, validating and invalidating cache entries."""
+
+    def setUp(self):
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmpdir.cleanup)
+        self.cache = TopologyCache(cache_dir=os.path.join(self.tmpdir.name, "tc"))
+
+    def test_round_trip(self):
+        sm_slice = _make_slice_dto()
+        slivers = [_make_sliver_dto("a"), _make_sliver_dto("b")]
+
+        self.cache.put(sm_slice, model=MODEL)
+        self.cache.put(sm_slice, slivers=slivers)
+
+        self.assertEqual(self.cache.get_model(sm_slice), MODEL)
+        cached = self.cache.get_slivers(sm_slice)
+        self.assertEqual([s.sliver_id for s in cached], ["a", "b"])
+        self.assertEqual(cached[0].name, "node-a")
+        self.assertEqual(cached[0].site, "RENC")
+
+    def test_miss_when_not_cached(self):
+        self.assertIsNone(self.cache.get_model(_make_slice_dto()))
+        self.assertIsNone(self.cache.get_slivers(_make_slice_dto()))
+
+    def test_stale_when_lease_changes(self):
+        self.cache.put(_make_slice_dto(), model=MODEL)
+
+        renewed = _make_slice_dto(lease_end="2025-07-09 00:00:00 +0000")
+        self.assertIsNone(self.cache.get_model(renewed))
+
+    def test_unstable_states_not_cached(self):
+        self.cache.put(_make_slice_dto(state="Configuring"), model=MODEL)
+
+        self.assertFalse(os.path.exists(self.cache._path("slice-1")))
+        self.assertIsNone(self.cache.get_model(_make_slice_dto(state="Configuring")))
+
+    def test_hash_mismatch_rejected(self):
+        sm_slice = _make_slice_dto()
+        self.cache.put(sm_slice, model=MODEL)
+
+        path = self.cache._path("slice-1")
+        with open(path) as f:
+            entry = json.load(f)
+        entry["model"] = "<graphml>tampered</graphml>"
+        with open(path, "w") as f:
+            json.dump(entry, f)
+
+        self.assertIsNone(self.cache.get_model(sm_slice))
+
+    def test_expired_entries_not_served(self):
+        sm_slice = _make_slice_dto()
+        self.cache.put(sm_slice, model=MODEL)
+        self.cache.put(sm_slice, slivers=[_make_sliver_dto("a")])
+
+        now = time.time()
+        with patch("time.time", return_value=now + TopologyCache.DEFAULT_MAX_AGE):
+            self.assertIsNone(self.cache.get_model(sm_slice))
+            self.assertIsNone(self.cache.get_slivers(sm_slice))
+
+        unbounded = TopologyCache(cache_dir=self.cache.cache_dir, max_age=None)
+        with patch("time.time", return_value=now + 86400):
+            self.assertEqual(unbounded.get_model(sm_slice), MODEL)
+
+    def test_invalidate(self):
+        sm_slice = _make_slice_dto()
+        self.cache.put(sm_slice, model=MODEL)
+
+        self.cache.invalidate("slice-1")
+
+        self.assertIsNone(self.cache.get_model(sm_slice))
+
+
+class TestSliceUsesTopologyCache(unittest.TestCase):
+    """Test that Slice.update_slivers() is served from the cache when current."""
+
+    def _make_slice(self, cache):
+        s = Slice.__new__(Slice)
+        s.sm_slice = _make_slice_dto()
+        s.slice_id = "slice-1"
+        s.slice_name = "test-slice"
+        s.fablib_manager = MagicMock()
+        s.user_only = True
+        s.update_slivers_count = 0
+        s.slivers = []
+        s._sliver_map = {}
+        s._topology_cache = cache
+        return s
+
+    def test_update_slivers_populates_and_uses_cache(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            cache = TopologyCache(cache_dir=tmpdir)
+
+            first = self._make_slice(cache)
+            list_slivers = first.fablib_manager.get_manager.return_value.list_slivers
+            list_slivers.return_value = [_make_sliver_dto("a")]
+            first.update_slivers()
+            list_slivers.assert_called_once()
+
+            second = self._make_slice(cache)
+            second.update_slivers()
+
+            second.fablib_manager.get_manager.assert_not_called()
+            self.assertIn("a", second._sliver_map)
+
+    def test_update_topology_fingerprints_fetched_metadata(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            cache = TopologyCache(cache_dir=tmpdir)
+            s = self._make_slice(cache)
+            s.update_topology_count = 0
+            renewed = _make_slice_dto(lease_end="2025-07-09 00:00:00 +0000")
+            renewed.model = MODEL
+            list_slices = s.fablib_manager.get_manager.return_value.list_slices
+            list_slices.return_value = [renewed]
+
+            with (
+                patch("fabrictestbed_extensions.fablib.slice.ExperimentTopology"),
+                patch.object(Slice, "_publish_topology"),
+            ):
+                s.update_topology()
+
+            self.assertEqual(cache.get_model(renewed), MODEL)
+            self.assertIsNone(cache.get_model(_make_slice_dto()))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,161 @@
+"""
+Unit tests for the parsed user_data cache and its write-back.
+"""
+
+import os
+import tempfile
+import unittest
+from unittest.mock import patch
+
+from fabrictestbed.slice_editor import Capacities, ComponentType, ExperimentTopology
+from fim.slivers.json_data import UserDataError
+from fim.user.node import Node as FimNode
+
+from fabrictestbed_extensions.fablib.component import Component
+from fabrictestbed_extensions.fablib.interface import Interface
+from fabrictestbed_extensions.fablib.node import Node
+from fabrictestbed_extensions.fablib.user_data_cache import UserDataCache
+
+from .helpers.fablib import make_fablib
+
+
+class TestUserDataCache(unittest.TestCase):
+    """Test parsing once, sharing between wrappers and flushing."""
+
+    def setUp(self):
+        self.topology = ExperimentTopology()
+        self.fim_node = self.topology.add_node(name="node1", site="RENC")
+        self.fim_node.set_properties(
+            capacities=Capacities(core=2, ram=8, disk=10),
+            image_type="qcow2",
+            image_ref="default_rocky_9",
+        )
+        self.fim_nic = self.fim_node.add_component(
+            ctype=ComponentType.SharedNIC, model="ConnectX-6", name="nic1"
+        )
+        self.node = Node(slice=None, node=self.fim_node)
+        self.component = Component(node=self.node, fim_component=self.fim_nic)
+
+    def _interface(self):
+        return Interface(
+            component=self.component, fim_interface=self.fim_nic.interface_list[0]
+        )
+
+    def test_parsed_once(self):
+        self.node.set_fablib_data({"instantiated": "True"})
+        UserDataCache.for_topology(self.topology).flush()
+        node = Node(slice=None, node=self.fim_node)
+
+        with patch.object(
+            FimNode, "get_property", autospec=True, side_effect=FimNode.get_property
+        ) as get_property:
+            for _ in range(10):
+                self.assertEqual(node.get_fablib_data(), {"instantiated": "True"})
+
+        user_data_reads = [
+            c for c in get_property.call_args_list if c.kwargs == {"pname": "user_data"}
+        ]
+        self.assertLessEqual(len(user_data_reads), 1)
+
+    def test_wrappers_share_data(self):
+        first = self._interface()
+        first.set_fablib_data({"mode": "auto"})
+
+        # A new wrapper of the same FIM interface sees the change
+        self.assertEqual(self._interface().get_fablib_data(), {"mode": "auto"})
+
+    def test_callers_get_copies(self):
+        self.node.set_fablib_data({"routes": ["10.0.0.0/24"]})
+
+        data = self.node.get_fablib_data()
+        data["routes"].append("10.0.1.0/24")
+
+        self.assertEqual(self.node.get_fablib_data(), {"routes": ["10.0.0.0/24"]})
+        self.assertIsNot(self.node.get_fablib_data(), self.node.get_fablib_data())
+
+    def test_written_back_on_flush(self):
+        self.node.set_fablib_data({"instantiated": "True"})
+        cache = UserDataCache.for_topology(self.topology)
+
+        self.assertTrue(cache.is_dirty())
+        self.assertNotIn("fablib_data", UserDataCache.read(self.fim_node))
+
+        cache.flush()
+
+        self.assertFalse(cache.is_dirty())
+        self.assertEqual(
+            UserDataCache.read(self.fim_node)["fablib_data"], {"instantiated": "True"}
+        )
+
+    def test_removed_element_dropped_on_flush(self):
+        self._interface().set_fablib_data({"mode": "auto"})
+        self.topology.remove_node(name="node1")
+
+        cache = UserDataCache.for_topology(self.topology)
+        cache.flush()
+
+        self.assertFalse(cache.is_dirty())
+
+    def test_oversized_data_rejected_on_set(self):
+        self.node.set_fablib_data({"instantiated": "True"})
+
+        with self.assertRaises(UserDataError):
+            self.node.set_fablib_data({"routes": ["10.0.0.0/24"] * 500})
+
+        # The previous data is kept and still written back
+        self.assertEqual(self.node.get_fablib_data(), {"instantiated": "True"})
+        UserDataCache.for_topology(self.topology).flush()
+        self.assertEqual(
+            UserDataCache.read(self.fim_node)["fablib_data"], {"instantiated": "True"}
+        )
+
+    def test_dirty_data_kept_on_write_error(self):
+        self.node.set_fablib_data({"instantiated": "True"})
+        cache = UserDataCache.for_topology(self.topology)
+
+        with patch.object(UserDataCache, "write", side_effect=RuntimeError):
+            with self.assertRaises(RuntimeError):
+                cache.flush()
+
+        self.assertTrue(cache.is_dirty())
+        cache.flush()
+        self.assertEqual(
+            UserDataCache.read(self.fim_node)["fablib_data"], {"instantiated": "True"}
+        )
+
+
+class TestSliceSaveWritesBack(unittest.TestCase):
+    """Test that saving a slice writes cached user data into the topology."""
+
+    def test_save(self):
+        fablib = make_fablib()
+        slice_object = fablib.new_slice(name="slice1")
+        node = slice_object.add_node(name="node1", site="RENC")
+        node.set_fablib_data({"key": "value"})
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            path = os.path.join(tmpdir, "slice.graphml")
+            slice_object.save(path)
+
+            topology = ExperimentTopology()
+            topology.load(file_name=path)
+
+        self.assertEqual(
+            UserDataCache.read(topology.nodes["node1"])["fablib_data"], {"key": "value"}
+        )
+
+    def test_fim_topology_includes_pending_changes(self):
+        fablib = make_fablib()
+        slice_object = fablib.new_slice(name="slice1")
+        node = slice_object.add_node(name="node1", site="RENC")
+        node.set_fablib_data({"key": "value"})
+
+        topology = slice_object.get_fim_topology()
+
+        self.assertEqual(
+            UserDataCache.read(topology.nodes["node1"])["fablib_data"], {"key": "value"}
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,6 +1,11 @@
 """Unit tests for utility modules."""
 
+import os
+import tempfile
 import unittest
+from unittest.mock import patch
+
+from fabrictestbed_extensions.utils.utils import Utils
 
 
 class TestNodeUtilsIPValidation(unittest.TestCase):
@@ -128,3 +133,67 @@ class TestConfigRequiredAttrs(unittest.TestCase):
 
         token_props = Config.REQUIRED_ATTRS[Constants.TOKEN_LOCATION]
         self.assertIn(Constants.DEFAULT, token_props)
+
+
+class TestUtilsAreReachable(unittest.TestCase):
+    """Tests for Utils.are_reachable."""
+
+    HOSTS = [("cm.example.org", 443), ("orch.example.org", 443)]
+
+    def setUp(self):
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmpdir.cleanup)
+        self.cache_file = os.path.join(self.tmpdir.name, "reachability.json")
+
+    def test_probes_all_hosts(self):
+        with patch.object(Utils, "is_reachable", return_value=True) as probe:
+            self.assertTrue(Utils.are_reachable(hosts=self.HOSTS))
+
+        self.assertEqual(probe.call_count, 2)
+        probe.assert_any_call(hostname="orch.example.org", port=443)
+
+    def test_recent_success_skips_probe(self):
+        with patch.object(Utils, "is_reachable", return_value=True) as probe:
+            Utils.are_reachable(hosts=self.HOSTS, cache_file=self.cache_file, ttl=60)
+            Utils.are_reachable(hosts=self.HOSTS, cache_file=self.cache_file, ttl=60)
+
+        self.assertEqual(probe.call_count, 2)
+
+    def test_expired_record_probes_again(self):
+        with patch.object(Utils, "is_reachable", return_value=True) as probe:
+            Utils.are_reachable(hosts=self.HOSTS, cache_file=self.cache_file, ttl=60)
+            with patch("time.time", return_value=4102444800):
+                Utils.are_reachable(
+                    hosts=self.HOSTS, cache_file=self.cache_file, ttl=60
+                )
+
+        self.assertEqual(probe.call_count, 4)
+
+    def test_failure_raised_and_not_recorded(self):
+        def is_reachable(hostname, port):
+            if hostname == "orch.example.org":
+                raise ConnectionError("unreachable")
+            return True
+
+        with patch.object(Utils, "is_reachable", side_effect=is_reachable):
+            with self.assertRaises(ConnectionError):
+                Utils.are_reachable(
+                    hosts=self.HOSTS, cache_file=self.cache_file, ttl=60
+                )
+
+        with patch.object(Utils, "is_reachable", return_value=True) as probe:
+            Utils.are_reachable(hosts=self.HOSTS, cache_file=self.cache_file, ttl=60)
+
+        probe.assert_called_once_with(hostname="orch.example.org", port=443)
+
+    def test_record_not_an_object_ignored(self):
+        for content in ("[]", '"text"', '{"cm.example.org:443": "yesterday"}'):
+            with open(self.cache_file, "w") as f:
+                f.write(content)
+            with patch.object(Utils, "is_reachable", return_value=True) as probe:
+                self.assertTrue(
+                    Utils.are_reachable(
+                        hosts=self.HOSTS, cache_file=self.cache_file, ttl=60
+                    )
+                )
+            self.assertEqual(probe.call_count, 2)
@@ -0,0 +1,71 @@
+"""
+Unit tests for the slot-based layout of the slice wrapper classes.
+"""
+
+import unittest
+
+from fabrictestbed.slice_editor import (
+    Capacities,
+    ComponentType,
+    ExperimentTopology,
+    ServiceType,
+)
+
+from fabrictestbed_extensions.fablib.component import Component
+from fabrictestbed_extensions.fablib.interface import Interface
+from fabrictestbed_extensions.fablib.network_service import NetworkService
+from fabrictestbed_extensions.fablib.node import Node
+from fabrictestbed_extensions.fablib.switch import Switch
+
+
+class TestWrapperSlots(unittest.TestCase):
+    """Test that wrappers have no per-instance dict and still work."""
+
+    def setUp(self):
+        topology = ExperimentTopology()
+        fim_node = topology.add_node(name="node1", site="RENC")
+        fim_node.set_properties(
+            capacities=Capacities(core=2, ram=8, disk=10),
+            image_type="qcow2",
+            image_ref="default_rocky_9",
+        )
+        fim_nic = fim_node.add_component(
+            ctype=ComponentType.SharedNIC, model="ConnectX-6", name="nic1"
+        )
+        fim_net = topology.add_network_service(
+            name="net1",
+            nstype=ServiceType.L2Bridge,
+            interfaces=fim_nic.interface_list,
+        )
+
+        self.node = Node(slice=None, node=fim_node)
+        self.component = Component(node=self.node, fim_component=fim_nic)
+        self.interface = Interface(
+            component=self.component, fim_interface=fim_nic.interface_list[0]
+        )
+        self.network = NetworkService(slice=None, fim_network_service=fim_net)
+
+    def test_no_instance_dict(self):
+        for obj in (self.node, self.component, self.interface, self.network):
+            self.assertFalse(hasattr(obj, "__dict__"), type(obj).__name__)
+
+    def test_invalidate_and_read(self):
+        for obj in (self.node, self.component, self.interface, self.network):
+            obj._invalidate_cache()
+
+        self.assertEqual(self.node.get_name(), "node1")
+        self.assertEqual(self.node.get_site(), "RENC")
+        self.assertEqual(self.component.get_name(), "nic1")
+        self.assertEqual(self.network.get_name(), "net1")
+
+    def test_network_services_share_ip_lock(self):
+        other = NetworkService(slice=None, fim_network_service=None)
+
+        self.assertIs(self.network.lock, other.lock)
+
+    def test_subclass_keeps_dict(self):
+        self.assertIn("__dict__", dir(Switch))
+
+
+if __name__ == "__main__":
+    unittest.main()